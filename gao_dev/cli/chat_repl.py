@@ -108,6 +108,8 @@ class ChatREPL:
         from gao_dev.core.services.ai_analysis_service import AIAnalysisService
         from gao_dev.core.config_loader import ConfigLoader
         from gao_dev.core.services.process_executor import ProcessExecutor
+        from gao_dev.core.providers.scheduler import RequestPriority
+        from gao_dev.orchestrator.orchestrator_factory import configure_scheduler
         from gao_dev.cli.command_router import CommandRouter
         from gao_dev.cli.help_system import HelpSystem
         from gao_dev.cli.subcommand_parser import SubcommandParser
@@ -116,6 +118,7 @@ class ChatREPL:
 
         # Create services
         config_loader = ConfigLoader(self.project_root)
+        configure_scheduler(config_loader)
         workflow_registry = WorkflowRegistry(config_loader)
 
         # Story 35.6: Interactive provider selection
@@ -135,7 +138,8 @@ class ChatREPL:
                 executor = ProcessExecutor(
                     self.project_root,
                     provider_name=provider_config['provider'],
-                    provider_config=provider_config.get('config', {})
+                    provider_config=provider_config.get('config', {}),
+                    priority=RequestPriority.INTERACTIVE
                 )
 
             except ProviderSelectionCancelled:
@@ -148,7 +152,7 @@ class ChatREPL:
                 sys.exit(1)
         else:
             # Use existing default ProcessExecutor creation
-            executor = ProcessExecutor(self.project_root)
+            executor = ProcessExecutor(self.project_root, priority=RequestPriority.INTERACTIVE)
 
         analysis_service = AIAnalysisService(executor)
 
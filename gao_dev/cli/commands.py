@@ -99,30 +99,49 @@ See: docs/migration/deprecated-commands.md"""
         console.print("  Redirecting now...   ")
         console.print()
 
-from ..core import (
-    ConfigLoader,
-    WorkflowRegistry,
-    WorkflowExecutor,
-    GitManager,
-    HealthCheck,
-)
-from ..orchestrator import GAODevOrchestrator
-from .sandbox_commands import sandbox
-from .lifecycle_commands import lifecycle
-from .state_commands import state
-from .context_commands import context
-from .db_commands import db
-from .migration_commands import migrate_group
-from .ceremony_commands import ceremony
-from .learning_commands import learning
-from .create_feature_command import create_feature
-from .list_features_command import list_features
-from .validate_structure_command import validate_structure
-from .web_commands import web
-from .unlock_command import unlock
-
-
-@click.group()
+from .lazy_group import LazyGroup
+
+# Command groups living in their own modules, imported only when invoked
+# so that e.g. `gao-dev --version` does not load the orchestrator, web
+# server or reporting stacks.
+LAZY_SUBCOMMANDS = {
+    "sandbox": "gao_dev.cli.sandbox_commands:sandbox",
+    "lifecycle": "gao_dev.cli.lifecycle_commands:lifecycle",
+    "state": "gao_dev.cli.state_commands:state",
+    "context": "gao_dev.cli.context_commands:context",
+    "db": "gao_dev.cli.db_commands:db",
+    "migrate": "gao_dev.cli.migration_commands:migrate_group",
+    "ceremony": "gao_dev.cli.ceremony_commands:ceremony",
+    "learning": "gao_dev.cli.learning_commands:learning",
+    "create-feature": "gao_dev.cli.create_feature_command:create_feature",
+    "list-features": "gao_dev.cli.list_features_command:list_features",
+    "validate-structure": "gao_dev.cli.validate_structure_command:validate_structure",
+    "web": "gao_dev.cli.web_commands:web",
+    "unlock": "gao_dev.cli.unlock_command:unlock",
+    "daemon": "gao_dev.cli.daemon_commands:daemon",
+}
+
+# Names this module used to import eagerly, still importable from it
+_LAZY_ATTRIBUTES = {
+    "ConfigLoader": "gao_dev.core",
+    "WorkflowRegistry": "gao_dev.core",
+    "WorkflowExecutor": "gao_dev.core",
+    "GitManager": "gao_dev.core",
+    "HealthCheck": "gao_dev.core",
+    "GAODevOrchestrator": "gao_dev.orchestrator",
+}
+
+
+def __getattr__(name: str):
+    """Resolve formerly eager imports on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version="1.0.0")
 def cli():
     """
@@ -205,6 +224,8 @@ def init(name: str, no_wait: bool, quiet: bool):
 @click.option("--format", type=click.Choice(["json", "markdown"]), default="markdown")
 def health(format: str):
     """Run system health check."""
+    from ..core import ConfigLoader, HealthCheck
+
     project_root = Path.cwd()
     config = ConfigLoader(project_root)
     health_check = HealthCheck(config)
@@ -236,6 +257,8 @@ def health(format: str):
 @click.option("--phase", type=int, help="Filter by phase (0-4)")
 def list_workflows_cmd(phase: int):
     """List available workflows."""
+    from ..core import ConfigLoader, WorkflowRegistry
+
     project_root = Path.cwd()
     config = ConfigLoader(project_root)
     registry = WorkflowRegistry(config)
@@ -273,6 +296,8 @@ def list_workflows_cmd(phase: int):
 @click.option("--param", "-p", multiple=True, help="Parameters (key=value)")
 def execute(workflow_name: str, param: tuple):
     """Execute a workflow."""
+    from ..core import ConfigLoader, WorkflowRegistry, WorkflowExecutor
+
     project_root = Path.cwd()
     config = ConfigLoader(project_root)
     registry = WorkflowRegistry(config)
@@ -322,6 +347,8 @@ def execute(workflow_name: str, param: tuple):
 @cli.command("list-agents")
 def list_agents_cmd():
     """List available agent personas."""
+    from ..core import ConfigLoader
+
     project_root = Path.cwd()
     config = ConfigLoader(project_root)
     agents_path = config.get_agents_path()
@@ -360,6 +387,8 @@ def create_prd(name: str):
     click.echo(f"\n>> Creating PRD for: {name}")
     click.echo(">> Delegating to John (Product Manager)...\n")
 
+    from ..orchestrator import GAODevOrchestrator
+
     project_root = Path.cwd()
     orchestrator = GAODevOrchestrator.create_default(project_root)
 
@@ -390,6 +419,8 @@ def create_story(epic: int, story: int, title: str):
         click.echo(f">> Title: {title}")
     click.echo(">> Delegating to Bob (Scrum Master)...\n")
 
+    from ..orchestrator import GAODevOrchestrator
+
     project_root = Path.cwd()
     orchestrator = GAODevOrchestrator.create_default(project_root)
 
@@ -417,6 +448,8 @@ def implement_story(epic: int, story: int):
     click.echo(f"\n>> Implementing Story {epic}.{story}")
     click.echo(">> Coordinating Bob (Scrum Master) and Amelia (Developer)...\n")
 
+    from ..orchestrator import GAODevOrchestrator
+
     project_root = Path.cwd()
     orchestrator = GAODevOrchestrator.create_default(project_root)
 
@@ -443,6 +476,8 @@ def create_architecture(name: str):
     click.echo(f"\n>> Creating architecture for: {name}")
     click.echo(">> Delegating to Winston (Technical Architect)...\n")
 
+    from ..orchestrator import GAODevOrchestrator
+
     project_root = Path.cwd()
     orchestrator = GAODevOrchestrator.create_default(project_root)
 
@@ -468,6 +503,8 @@ def run_health_check():
     click.echo("\n>> Running autonomous health check...")
     click.echo(">> Using GAO-Dev orchestrator...\n")
 
+    from ..orchestrator import GAODevOrchestrator
+
     project_root = Path.cwd()
     orchestrator = GAODevOrchestrator(project_root)
 
@@ -651,34 +688,6 @@ def health_check(verbose: bool, project: Optional[Path]):
         sys.exit(1)
 
 
-# ============================================================================
-# SANDBOX COMMANDS
-# ============================================================================
-
-# Register sandbox command group
-cli.add_command(sandbox)
-
-# ============================================================================
-# LIFECYCLE COMMANDS
-# ============================================================================
-
-# Register lifecycle command group
-cli.add_command(lifecycle)
-
-# ============================================================================
-# STATE COMMANDS
-# ============================================================================
-
-# Register state command group
-cli.add_command(state)
-
-# ============================================================================
-# CONTEXT COMMANDS
-# ============================================================================
-
-# Register context command group
-cli.add_command(context)
-
 @cli.command("start")
 @click.option("--project", type=Path, help="Project path (default: current directory)")
 @click.option("--headless", is_flag=True, help="Force headless mode (no wizards, env vars only)")
@@ -895,51 +904,22 @@ def start_chat(
         sys.exit(1)
 
 
-# ============================================================================
-# Register db command group
-# ============================================================================
-cli.add_command(db)
-
-# ============================================================================
-# MIGRATION COMMANDS
-# ============================================================================
-
-# Register migration command group (migrate, consistency-check, consistency-repair)
-cli.add_command(migrate_group, name="migrate")
-
-# ============================================================================
-# CEREMONY COMMANDS
-# ============================================================================
-
-# Register ceremony command group
-cli.add_command(ceremony)
-
-# ============================================================================
-# LEARNING COMMANDS
-# ============================================================================
-
-# Register learning command group
-cli.add_command(learning)
-
-# ============================================================================
-# FEATURE COMMANDS (Epic 33)
-# ============================================================================
-
-# Register feature command group
-cli.add_command(create_feature)
-cli.add_command(list_features)
-cli.add_command(validate_structure)
-
-# ============================================================================
-# WEB INTERFACE COMMANDS (Epic 39)
-# ============================================================================
+def main():
+    """
+    Entry point of the gao-dev executable.
 
-# Register web command group
-cli.add_command(web)
+    Forwards the invocation to a running daemon (see gao_dev.cli.daemon)
+    and runs it in-process when no daemon is available.
+    """
+    from .daemon import forward, should_forward
 
-# Register unlock command
-cli.add_command(unlock)
+    argv = sys.argv[1:]
+    if should_forward(argv):
+        exit_code = forward(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+    cli()
 
 
 if __name__ == "__main__":
-    cli()
+    main()
@@ -0,0 +1,405 @@
+"""Optional local daemon that runs gao-dev commands in a warm process.
+
+Every ``gao-dev`` invocation otherwise starts a fresh interpreter and pays
+again for imports, configuration parsing, document registry migrations and
+provider setup. The daemon keeps one process alive with all of that loaded
+and serves commands over a Unix socket; the ``gao-dev`` entry point acts as a
+thin client that forwards its arguments when a daemon is running and falls
+back to running in-process when none is reachable.
+
+Protocol: the client sends one JSON line and the daemon answers with one
+JSON line on the same connection.
+
+- ``{"op": "ping"}`` -> ``{"ok": true, "version": ..., "pid": ...}``
+- ``{"op": "run", "version", "argv", "cwd", "env", "color"}`` ->
+  ``{"ok": true, "exit_code", "stdout", "stderr"}``
+- ``{"op": "shutdown"}`` -> ``{"ok": true}``
+
+A daemon that will not run a command (other version, or busy with another
+command for longer than RUN_LOCK_TIMEOUT_SECONDS) answers
+``{"ok": false, "declined": true, "error"}`` and the client runs it
+in-process. Any other failure after the request was sent is reported and
+the client exits non-zero, since the command may already have run.
+
+Commands run one at a time, in the client's working directory and
+environment. Forwarded commands get an empty stdin, so only invocations
+whose stdin is empty (e.g. ``/dev/null``) are forwarded: the client runs
+in-process when stdin is a terminal, a pipe or a file, for
+LOCAL_ONLY_COMMANDS, and when ``GAO_DEV_DAEMON=0``.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+import structlog
+
+from ..__version__ import __version__
+
+logger = structlog.get_logger(__name__)
+
+# Constants
+SOCKET_ENV_VAR = "GAO_DEV_DAEMON_SOCKET"
+DISABLE_ENV_VAR = "GAO_DEV_DAEMON"
+DEFAULT_SOCKET_PATH = Path.home() / ".gao-dev" / "daemon.sock"
+CONNECT_TIMEOUT_SECONDS = 0.5
+RUN_LOCK_TIMEOUT_SECONDS = 1.0
+
+# Commands that are interactive, long-running or manage the daemon itself
+LOCAL_ONLY_COMMANDS = frozenset({"daemon", "start", "chat", "init", "web"})
+
+
+def is_supported() -> bool:
+    """Check whether the platform has Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path() -> Path:
+    """Get the daemon socket path (GAO_DEV_DAEMON_SOCKET or ~/.gao-dev/daemon.sock)."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    return Path(override).expanduser() if override else DEFAULT_SOCKET_PATH
+
+
+def _connect(path: Path) -> socket.socket:
+    """Connect to the daemon socket."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(
+    sock: socket.socket, message: Dict[str, Any], timeout: Optional[float]
+) -> Dict[str, Any]:
+    """Send one request line on a connected socket and read one response line."""
+    sock.settimeout(timeout)
+    with sock.makefile("rwb") as stream:
+        stream.write(json.dumps(message).encode("utf-8") + b"\n")
+        stream.flush()
+        line = stream.readline()
+    if not line:
+        raise ConnectionError("daemon closed the connection")
+    return json.loads(line)
+
+
+def _request(path: Path, message: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+    """Connect, send one request line and read one response line."""
+    with _connect(path) as sock:
+        return _exchange(sock, message, timeout)
+
+
+def _stdin_is_empty() -> bool:
+    """Check whether stdin is a non-terminal character device such as /dev/null."""
+    try:
+        fd = sys.stdin.fileno()
+        return not os.isatty(fd) and stat.S_ISCHR(os.fstat(fd).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def ping(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    Check whether a daemon is listening.
+
+    Args:
+        path: Socket path (default: socket_path())
+
+    Returns:
+        Daemon info (version, pid, socket) or None if no daemon answers
+    """
+    if not is_supported():
+        return None
+    try:
+        return _request(path or socket_path(), {"op": "ping"}, CONNECT_TIMEOUT_SECONDS)
+    except (OSError, ValueError):
+        return None
+
+
+def stop(path: Optional[Path] = None) -> bool:
+    """
+    Ask a running daemon to exit.
+
+    Args:
+        path: Socket path (default: socket_path())
+
+    Returns:
+        True if a daemon acknowledged the request
+    """
+    if not is_supported():
+        return False
+    try:
+        return bool(_request(path or socket_path(), {"op": "shutdown"}, 5.0).get("ok"))
+    except (OSError, ValueError):
+        return False
+
+
+def should_forward(argv: List[str]) -> bool:
+    """
+    Decide whether an invocation may run in the daemon.
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        True if the invocation reads no stdin and is not local-only
+    """
+    if not is_supported():
+        return False
+    if os.environ.get(DISABLE_ENV_VAR, "").lower() in ("0", "false", "off", "no"):
+        return False
+    # The daemon cannot see the client's terminal or piped input
+    if not _stdin_is_empty():
+        return False
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    return command not in LOCAL_ONLY_COMMANDS
+
+
+def forward(
+    argv: List[str],
+    path: Optional[Path] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """
+    Run a command in the daemon, if one is available.
+
+    Args:
+        argv: Command line arguments (without the program name)
+        path: Socket path (default: socket_path())
+        stdout: Stream for the command's output (default: sys.stdout)
+        stderr: Stream for the command's errors (default: sys.stderr)
+
+    Returns:
+        The command's exit code (1 if the daemon failed after the request
+        was sent), or None if the command was not run (no daemon, or the
+        daemon declined it) and should run in-process
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    message = {
+        "op": "run",
+        "version": __version__,
+        "argv": list(argv),
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "color": stdout.isatty(),
+    }
+    try:
+        sock = _connect(path or socket_path())
+    except OSError:
+        return None
+
+    # From here on the daemon may have started the command; never re-run it
+    try:
+        with sock:
+            response = _exchange(sock, message, None)
+    except (OSError, ValueError) as e:
+        stderr.write(f"[ERROR] Lost connection to the gao-dev daemon: {e}\n")
+        stderr.flush()
+        return 1
+
+    if response.get("declined"):
+        logger.debug("daemon_forward_declined", error=response.get("error"))
+        return None
+    if not response.get("ok"):
+        stderr.write(f"[ERROR] gao-dev daemon failed: {response.get('error')}\n")
+        stderr.flush()
+        return 1
+
+    stdout.write(response["stdout"])
+    stdout.flush()
+    stderr.write(response["stderr"])
+    stderr.flush()
+    return int(response["exit_code"])
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Handle one request line."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            message = json.loads(line)
+            response = self.server.dispatch(message)
+        except Exception as e:
+            logger.exception("daemon_request_failed")
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix socket server running gao-dev commands in this process.
+
+    Requests are accepted concurrently so ping and shutdown stay responsive,
+    but commands run one at a time: each one temporarily takes over the
+    process's working directory and environment. A command that cannot start
+    within RUN_LOCK_TIMEOUT_SECONDS is declined so its client runs it
+    in-process instead of waiting.
+
+    Example:
+        ```python
+        server = DaemonServer(Path("/tmp/gao-dev.sock"))
+        server.preload()
+        server.serve_forever()
+        ```
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path):
+        """
+        Initialize daemon server and bind its socket.
+
+        Args:
+            path: Socket path; its directory is created owner-only and a
+                stale socket left by a dead daemon is replaced
+
+        Raises:
+            RuntimeError: If another daemon is already listening on path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.path.exists():
+            if ping(self.path) is not None:
+                raise RuntimeError(f"A gao-dev daemon is already running on {self.path}")
+            self.path.unlink()
+
+        self._run_lock = threading.Lock()
+        self.commands_run = 0
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def preload(self) -> None:
+        """Import every subcommand so the first forwarded command is fast."""
+        import click
+
+        from .commands import cli
+
+        ctx = click.Context(cli)
+        for name in cli.list_commands(ctx):
+            cli.get_command(ctx, name)
+
+    def dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a decoded request.
+
+        Args:
+            message: Request object
+
+        Returns:
+            Response object
+        """
+        op = message.get("op")
+        if op == "ping":
+            return {
+                "ok": True,
+                "version": __version__,
+                "pid": os.getpid(),
+                "socket": str(self.path),
+                "commands_run": self.commands_run,
+            }
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        if op == "run":
+            if message.get("version") != __version__:
+                return {
+                    "ok": False,
+                    "declined": True,
+                    "error": f"version mismatch (daemon {__version__})",
+                }
+            return self._run(message["argv"], message["cwd"], message["env"], message.get("color", False))
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+    def _run(self, argv: List[str], cwd: str, env: Dict[str, str], color: bool) -> Dict[str, Any]:
+        """Run one command with the client's working directory and environment."""
+        from click.testing import CliRunner
+
+        from .commands import cli
+
+        # Unset variables the client does not have
+        overlay: Dict[str, Optional[str]] = {key: None for key in os.environ if key not in env}
+        overlay.update(env)
+
+        try:
+            runner = CliRunner(mix_stderr=False)
+        except TypeError:
+            # click >= 8.2 always captures stderr separately
+            runner = CliRunner()
+
+        if not self._run_lock.acquire(timeout=RUN_LOCK_TIMEOUT_SECONDS):
+            return {"ok": False, "declined": True, "error": "busy running another command"}
+        try:
+            previous_cwd = os.getcwd()
+            try:
+                os.chdir(cwd)
+                result = runner.invoke(cli, argv, env=overlay, color=color, prog_name="gao-dev")
+            finally:
+                os.chdir(previous_cwd)
+            self.commands_run += 1
+        finally:
+            self._run_lock.release()
+
+        if result.exception is not None and not isinstance(result.exception, SystemExit):
+            logger.warning("daemon_command_failed", argv=argv, error=str(result.exception))
+        return {
+            "ok": True,
+            "exit_code": result.exit_code,
+            "stdout": result.stdout_bytes.decode("utf-8", errors="replace"),
+            "stderr": (result.stderr_bytes or b"").decode("utf-8", errors="replace"),
+        }
+
+    def server_close(self) -> None:
+        """Close the socket and remove its file."""
+        super().server_close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def serve(path: Optional[Path] = None) -> None:
+    """
+    Run the daemon in the foreground until stopped.
+
+    Args:
+        path: Socket path (default: socket_path())
+    """
+    server = DaemonServer(path or socket_path())
+    server.preload()
+
+    def _terminate(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _terminate)
+    logger.info("daemon_started", socket=str(server.path), pid=os.getpid(), version=__version__)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info("daemon_stopped", socket=str(server.path), commands_run=server.commands_run)
+
+
+if __name__ == "__main__":
+    serve(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,100 @@
+"""CLI commands for the gao-dev daemon."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from . import daemon as daemon_module
+
+START_TIMEOUT_SECONDS = 30.0
+
+
+@click.group()
+def daemon():
+    """Run gao-dev commands in a warm background process."""
+    pass
+
+
+@daemon.command("start")
+@click.option("--foreground", is_flag=True, help="Run in this terminal instead of detaching")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path),
+    help="Socket path (default: $GAO_DEV_DAEMON_SOCKET or ~/.gao-dev/daemon.sock)",
+)
+def start_daemon(foreground: bool, socket_path: Optional[Path]):
+    """
+    Start the daemon.
+
+    While it runs, non-interactive gao-dev invocations are executed by the
+    daemon instead of a fresh interpreter. Set GAO_DEV_DAEMON=0 to bypass it.
+
+    Examples:
+        gao-dev daemon start
+        gao-dev daemon start --foreground
+    """
+    if not daemon_module.is_supported():
+        click.echo("[ERROR] The daemon needs Unix domain sockets, which this platform lacks", err=True)
+        sys.exit(1)
+
+    path = socket_path or daemon_module.socket_path()
+    info = daemon_module.ping(path)
+    if info is not None:
+        click.echo(f"Daemon already running (pid {info['pid']}, {path})")
+        return
+
+    if foreground:
+        click.echo(f"Daemon listening on {path} (Ctrl+C to stop)")
+        daemon_module.serve(path)
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "gao_dev.cli.daemon", str(path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        info = daemon_module.ping(path)
+        if info is not None:
+            click.echo(f"Daemon started (pid {info['pid']}, {path})")
+            return
+        time.sleep(0.1)
+
+    click.echo(f"[ERROR] Daemon did not start within {START_TIMEOUT_SECONDS:.0f}s", err=True)
+    sys.exit(1)
+
+
+@daemon.command("stop")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), help="Socket path")
+def stop_daemon(socket_path: Optional[Path]):
+    """Stop the daemon."""
+    path = socket_path or daemon_module.socket_path()
+    if daemon_module.stop(path):
+        click.echo("Daemon stopped")
+    else:
+        click.echo("No daemon running")
+
+
+@daemon.command("status")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), help="Socket path")
+def daemon_status(socket_path: Optional[Path]):
+    """Show whether the daemon is running."""
+    path = socket_path or daemon_module.socket_path()
+    info = daemon_module.ping(path)
+    if info is None:
+        click.echo("No daemon running")
+        sys.exit(1)
+
+    click.echo(f"Daemon running (pid {info['pid']})")
+    click.echo(f"  Socket: {info['socket']}")
+    click.echo(f"  Version: {info['version']}")
+    click.echo(f"  Commands run: {info['commands_run']}")
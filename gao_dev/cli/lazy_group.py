@@ -0,0 +1,59 @@
+"""Click group that imports its subcommands on first use."""
+
+import importlib
+from typing import Dict, List, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported only when invoked.
+
+    Subcommands are registered by import path instead of by object, so
+    running one command (or just ``--version``) does not import the modules,
+    and their dependencies, of every other command. Listing the commands in
+    ``--help`` still loads them all, to show their help text.
+
+    Example:
+        ```python
+        @click.group(
+            cls=LazyGroup,
+            lazy_subcommands={"web": "gao_dev.cli.web_commands:web"},
+        )
+        def cli():
+            pass
+        ```
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Initialize lazy group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to "module:attribute"
+            *args: Passed to click.Group
+            **kwargs: Passed to click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager and lazy command names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a command, importing it if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a lazy command and cache it as a regular subcommand."""
+        module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}:{attr} is not a click command")
+        self.add_command(command, cmd_name)
+        del self.lazy_subcommands[cmd_name]
+        return command
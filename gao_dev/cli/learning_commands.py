@@ -49,7 +49,12 @@ def learning():
 @learning.command()
 @click.option("--dry-run", is_flag=True, help="Preview changes without committing")
 @click.option("--verbose", is_flag=True, help="Show detailed output")
-def maintain(dry_run: bool, verbose: bool):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only process learnings indexed or applied since the last run",
+)
+def maintain(dry_run: bool, verbose: bool, incremental: bool):
     """
     Run learning maintenance job.
 
@@ -68,7 +73,9 @@ def maintain(dry_run: bool, verbose: bool):
 
     try:
         job = LearningMaintenanceJob(db_path=db_path)
-        report = job.run_maintenance(dry_run=dry_run, verbose=verbose)
+        report = job.run_maintenance(
+            dry_run=dry_run, verbose=verbose, incremental=incremental
+        )
 
         # Display results
         if RICH_AVAILABLE:
@@ -8,8 +8,9 @@ Story: 33.3 - CLI Commands
 """
 
 import click
+import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 try:
     from rich.console import Console
@@ -55,6 +56,16 @@ def _init_state_coordinator(project_root: Path) -> StateCoordinator:
     return coordinator
 
 
+def _story_progress(rollup: Optional[Dict[str, Any]]) -> str:
+    """Format a feature rollup as 'completed/total (pct%)'."""
+    if not rollup or not rollup["story_count"]:
+        return "—"
+    return (
+        f"{rollup['completed_count']}/{rollup['story_count']} "
+        f"({rollup['progress_percentage']:.0f}%)"
+    )
+
+
 @click.command("list-features")
 @click.option(
     "--scope",
@@ -104,6 +115,13 @@ def list_features(scope: Optional[str], status: Optional[str]):
             status=status_filter
         )
 
+        # Story progress for all listed features in one aggregate query
+        try:
+            rollups = coordinator.get_feature_rollups([f.name for f in features])
+        except sqlite3.OperationalError:
+            # Project database has no epic/story state tables yet
+            rollups = {}
+
         # Display results
         if not features:
             if RICH_AVAILABLE:
@@ -122,6 +140,7 @@ def list_features(scope: Optional[str], status: Optional[str]):
             table.add_column("Status", style="green")
             table.add_column("Scale", justify="right")
             table.add_column("Owner")
+            table.add_column("Stories", justify="right")
             table.add_column("Created")
 
             for feature in features:
@@ -131,6 +150,7 @@ def list_features(scope: Optional[str], status: Optional[str]):
                     feature.status.value,
                     str(feature.scale_level),
                     feature.owner or "—",
+                    _story_progress(rollups.get(feature.name)),
                     feature.created_at[:10]  # Just date
                 )
 
@@ -139,9 +159,12 @@ def list_features(scope: Optional[str], status: Optional[str]):
         else:
             # Plain text output
             click.echo(f"\nFeatures ({len(features)} total)")
-            click.echo("-" * 80)
-            click.echo(f"{'Name':<30} {'Scope':<10} {'Status':<12} {'Scale':<8} {'Owner':<15} {'Created'}")
-            click.echo("-" * 80)
+            click.echo("-" * 96)
+            click.echo(
+                f"{'Name':<30} {'Scope':<10} {'Status':<12} {'Scale':<8} "
+                f"{'Owner':<15} {'Stories':<15} {'Created'}"
+            )
+            click.echo("-" * 96)
             for feature in features:
                 click.echo(
                     f"{feature.name:<30} "
@@ -149,6 +172,7 @@ def list_features(scope: Optional[str], status: Optional[str]):
                     f"{feature.status.value:<12} "
                     f"{feature.scale_level:<8} "
                     f"{(feature.owner or '—'):<15} "
+                    f"{_story_progress(rollups.get(feature.name)):<15} "
                     f"{feature.created_at[:10]}"
                 )
             click.echo()
@@ -186,10 +186,17 @@ def migrate_project(
     default=False,
     help="Show detailed issue information"
 )
+@click.option(
+    "--full",
+    is_flag=True,
+    default=False,
+    help="Check every file and record instead of changes since the last clean check"
+)
 def check_consistency(
     project: Path | None,
     db_path: Path | None,
-    verbose: bool
+    verbose: bool,
+    full: bool
 ):
     """
     Check file-database consistency using git awareness.
@@ -203,10 +210,16 @@ def check_consistency(
       3. Unregistered files (file exists but not in DB)
       4. State mismatches (DB state != git-inferred state)
 
+    After a clean check, later checks only re-examine files changed since
+    that commit. Use --full to check everything.
+
     Examples:
         # Check current project
         gao-dev consistency-check
 
+        # Check every file and record
+        gao-dev consistency-check --full
+
         # Check specific project
         gao-dev consistency-check --project /path/to/project
 
@@ -246,7 +259,7 @@ def check_consistency(
         click.echo("Checking consistency...")
         click.echo("-" * 70)
 
-        report: ConsistencyReport = checker.check_consistency()
+        report: ConsistencyReport = checker.check_consistency(full_scan=full)
 
         # Display results
         click.echo()
@@ -348,9 +361,9 @@ def repair_consistency(
             project_path=project_path
         )
 
-        # Run check first
+        # Run full check first (repair never relies on the watermark)
         click.echo("Checking consistency...")
-        report: ConsistencyReport = checker.check_consistency()
+        report: ConsistencyReport = checker.check_consistency(full_scan=True)
 
         if not report.has_issues:
             click.echo("\n[OK] No consistency issues found. Nothing to repair.")
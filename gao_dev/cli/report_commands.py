@@ -41,6 +41,13 @@ def report_group():
     is_flag=True,
     help="Skip chart generation (faster)",
 )
+@click.option(
+    "--chart-format",
+    type=click.Choice(["png", "svg", "json"]),
+    default="png",
+    show_default=True,
+    help="Chart output; json renders charts in the browser",
+)
 @click.option(
     "--open",
     "open_browser",
@@ -51,6 +58,7 @@ def report_run(
     run_id: str,
     output: Optional[str],
     no_charts: bool,
+    chart_format: str,
     open_browser: bool
 ) -> None:
     """
@@ -73,7 +81,7 @@ def report_run(
             console.print("[red]Error: Metrics database not found. Have you run any benchmarks?[/red]")
             raise click.Abort()
 
-        generator = ReportGenerator(metrics_db)
+        generator = ReportGenerator(metrics_db, chart_format=chart_format)
 
         console.print(f"[cyan]Generating report for run: {run_id}[/cyan]")
 
@@ -122,6 +130,13 @@ def report_run(
     is_flag=True,
     help="Skip chart generation (faster)",
 )
+@click.option(
+    "--chart-format",
+    type=click.Choice(["png", "svg", "json"]),
+    default="png",
+    show_default=True,
+    help="Chart output; json renders charts in the browser",
+)
 @click.option(
     "--open",
     "open_browser",
@@ -134,6 +149,7 @@ def report_compare(
     output: Optional[str],
     threshold: float,
     no_charts: bool,
+    chart_format: str,
     open_browser: bool
 ) -> None:
     """
@@ -159,7 +175,7 @@ def report_compare(
             console.print("[red]Error: Metrics database not found.[/red]")
             raise click.Abort()
 
-        generator = ReportGenerator(metrics_db)
+        generator = ReportGenerator(metrics_db, chart_format=chart_format)
 
         console.print(
             f"[cyan]Comparing runs:[/cyan]\n"
@@ -229,6 +245,13 @@ def report_compare(
     is_flag=True,
     help="Skip chart generation (faster)",
 )
+@click.option(
+    "--chart-format",
+    type=click.Choice(["png", "svg", "json"]),
+    default="png",
+    show_default=True,
+    help="Chart output; json renders charts in the browser",
+)
 @click.option(
     "--open",
     "open_browser",
@@ -242,6 +265,7 @@ def report_trend(
     last_n: Optional[int],
     output: Optional[str],
     no_charts: bool,
+    chart_format: str,
     open_browser: bool
 ) -> None:
     """
@@ -282,7 +306,7 @@ def report_trend(
         output_path = Path(output)
 
         # Initialize report generator
-        generator = ReportGenerator(metrics_db)
+        generator = ReportGenerator(metrics_db, chart_format=chart_format)
 
         console.print("[cyan]Generating trend analysis report...[/cyan]")
 
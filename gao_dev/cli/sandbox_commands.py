@@ -8,12 +8,18 @@ from typing import Optional
 from datetime import datetime
 import os
 
+from .lazy_group import LazyGroup
+
 # Fix Windows console encoding issues
 if sys.platform == "win32":
     os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    # Report commands pull in the charting stack; import them only when used
+    lazy_subcommands={"report": "gao_dev.cli.report_commands:report_group"},
+)
 def sandbox():
     """
     Manage sandbox projects for testing and benchmarking.
@@ -58,6 +64,11 @@ def sandbox():
     default="",
     help="Project description",
 )
+@click.option(
+    "--boilerplate-cache",
+    is_flag=True,
+    help="Create the project from a local mirror of the boilerplate (cloned once, refreshed hourly)",
+)
 def init(
     project_name: str,
     config: Optional[str],
@@ -65,6 +76,7 @@ def init(
     no_git: bool,
     tags: tuple,
     description: str,
+    boilerplate_cache: bool,
 ):
     """
     Initialize a new sandbox project.
@@ -77,6 +89,7 @@ def init(
         gao-dev sandbox init todo-app-001
         gao-dev sandbox init my-project --boilerplate https://github.com/user/starter
         gao-dev sandbox init test-project --tags experiment --tags nextjs
+        gao-dev sandbox init app-002 --boilerplate https://github.com/user/starter --boilerplate-cache
     """
     try:
         from ..sandbox import SandboxManager, ProjectExistsError, InvalidProjectNameError
@@ -85,7 +98,9 @@ def init(
 
         # Get sandbox root (current directory/sandbox)
         sandbox_root = Path.cwd() / "sandbox"
-        manager = SandboxManager(sandbox_root)
+        manager = SandboxManager(
+            sandbox_root, boilerplate_cache=_boilerplate_cache(sandbox_root, boilerplate_cache)
+        )
 
         # Check if project already exists
         if manager.project_exists(project_name):
@@ -348,6 +363,32 @@ def list(status: str, format: str, verbose: bool):
         sys.exit(1)
 
 
+@sandbox.command()
+def reindex():
+    """
+    Rebuild the sandbox project index.
+
+    Project listings are served from an index of the .sandbox.yaml files,
+    which is kept up to date automatically. Use this to rebuild it from
+    scratch, e.g. after restoring projects from a backup.
+
+    Examples:
+        gao-dev sandbox reindex
+    """
+    try:
+        from ..sandbox import SandboxManager
+
+        sandbox_root = Path.cwd() / "sandbox"
+        manager = SandboxManager(sandbox_root)
+
+        count = manager.reindex_projects()
+        click.echo(f"[OK] Indexed {count} project(s)")
+
+    except Exception as e:
+        click.echo(f"\n[ERROR] Failed to rebuild project index: {e}", err=True)
+        sys.exit(1)
+
+
 @sandbox.command()
 @click.argument("benchmark_config", type=click.Path(exists=True))
 @click.option(
@@ -372,12 +413,18 @@ def list(status: str, format: str, verbose: bool):
     is_flag=True,
     help="Setup project but don't execute (for testing)",
 )
+@click.option(
+    "--boilerplate-cache",
+    is_flag=True,
+    help="Create the project from a local mirror of the boilerplate (cloned once, refreshed hourly)",
+)
 def run(
     benchmark_config: str,
     project: Optional[str],
     timeout: int,
     api_key: Optional[str],
     dry_run: bool,
+    boilerplate_cache: bool,
 ):
     """
     Execute a benchmark run with auto-generated run ID.
@@ -424,7 +471,9 @@ def run(
 
         # Initialize sandbox manager
         sandbox_root = Path.cwd() / "sandbox"
-        manager = SandboxManager(sandbox_root)
+        manager = SandboxManager(
+            sandbox_root, boilerplate_cache=_boilerplate_cache(sandbox_root, boilerplate_cache)
+        )
 
         # Check if using existing project or creating new one
         if project:
@@ -823,6 +872,16 @@ def delete(project_name: str, force: bool):
 # ============================================================================
 
 
+def _boilerplate_cache(sandbox_root: Path, enabled: bool):
+    """Create the sandbox's boilerplate mirror cache, if enabled."""
+    if not enabled:
+        return None
+
+    from ..sandbox.boilerplate_cache import BoilerplateCache, DEFAULT_CACHE_SUBDIR
+
+    return BoilerplateCache(sandbox_root / DEFAULT_CACHE_SUBDIR)
+
+
 def _create_project_readme(project_path: Path, metadata, boilerplate_url: Optional[str]) -> None:
     """Create README.md file for sandbox project."""
     from ..sandbox import ProjectMetadata
@@ -1050,11 +1109,3 @@ def _print_simple(projects: list) -> None:
     for project in projects_list:
         click.echo(project.name)
 
-
-# ============================================================================
-# REPORT COMMANDS
-# ============================================================================
-
-# Import and register report commands
-from .report_commands import report_group  # noqa: E402
-sandbox.add_command(report_group)
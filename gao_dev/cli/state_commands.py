@@ -75,11 +75,15 @@ def init(force: bool, migrate: bool):
 
     # Create schema using migrations
     from ..core.state.migrations.migration_001_create_state_schema import Migration001
+    from ..core.state.migrations.migration_003_add_workflow_rollups import (
+        Migration003 as AddWorkflowRollups,
+    )
     from ..core.context.migrations.migration_003_unify_database import Migration003
 
     try:
         # Create base state schema
         Migration001.upgrade(db_path)
+        AddWorkflowRollups.upgrade(db_path)
         click.echo(f"[OK] Base schema created: {db_path}")
 
         # Run unification migration to add context tables and migrate data
@@ -299,7 +303,8 @@ def sprint(sprint_num: Optional[int], format: str):
 
 @state.command()
 @click.option("--stories-dir", multiple=True, type=click.Path(exists=True, path_type=Path))
-def sync(stories_dir):
+@click.option("--force", is_flag=True, help="Re-read all files, ignoring the sync manifest")
+def sync(stories_dir, force):
     """Manually trigger markdown sync."""
     try:
         tracker = get_state_tracker()
@@ -320,7 +325,7 @@ def sync(stories_dir):
                 continue
 
             click.echo(f"Syncing {dir_path}...")
-            report = syncer.sync_directory(dir_path)
+            report = syncer.sync_directory(dir_path, force=force)
 
             total_created += report.stories_created
             total_updated += report.stories_updated
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import structlog
 
+from .catalog_cache import CatalogCache, get_catalog_cache
 from .models.agent_config import AgentConfig
 from .schema_validator import SchemaValidator, SchemaValidationError
 
@@ -45,16 +46,29 @@ class AgentConfigLoader:
         ```
     """
 
-    def __init__(self, agents_dir: Path, validator: Optional[SchemaValidator] = None):
+    def __init__(
+        self,
+        agents_dir: Path,
+        validator: Optional[SchemaValidator] = None,
+        catalog: Optional[CatalogCache] = None,
+        project_root: Optional[Path] = None,
+    ):
         """
         Initialize agent configuration loader.
 
         Args:
             agents_dir: Path to directory containing agent YAML and .md files
             validator: Optional SchemaValidator for config validation
+            catalog: Parsed-file catalog (defaults to the shared catalog of
+                project_root)
+            project_root: Root the shared catalog is kept for (defaults to
+                agents_dir)
         """
         self.agents_dir = Path(agents_dir)
         self.validator = validator
+        self.catalog = catalog if catalog is not None else get_catalog_cache(
+            project_root or self.agents_dir
+        )
 
         if not self.agents_dir.exists():
             logger.warning(
@@ -103,8 +117,7 @@ class AgentConfigLoader:
 
         # Load YAML
         try:
-            with open(yaml_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = self.catalog.get_yaml(yaml_path)
         except yaml.YAMLError as e:
             logger.error(
                 "yaml_parse_error",
@@ -205,7 +218,7 @@ class AgentConfigLoader:
                 )
 
             try:
-                return persona_path.read_text(encoding="utf-8")
+                return self.catalog.get_text(persona_path)
             except Exception as e:
                 logger.error(
                     "persona_read_error",
@@ -225,7 +238,7 @@ class AgentConfigLoader:
         default_persona_path = self.agents_dir / f"{agent_name}.md"
         if default_persona_path.exists():
             try:
-                return default_persona_path.read_text(encoding="utf-8")
+                return self.catalog.get_text(default_persona_path)
             except Exception as e:
                 logger.error(
                     "default_persona_read_error",
@@ -325,6 +338,8 @@ class AgentConfigLoader:
                     f"Failed to load agent '{agent_name}' during bulk load: {e}"
                 ) from e
 
+        self.catalog.flush()
+
         logger.info(
             "all_agents_loaded",
             count=len(configs),
@@ -0,0 +1,342 @@
+"""Precompiled catalog of parsed workflow, prompt, agent and checklist files.
+
+WorkflowRegistry, PromptRegistry, AgentConfigLoader and ChecklistLoader used to
+``yaml.safe_load`` every file on every process start. The catalog keeps the
+parsed content of those files (YAML documents, persona markdown, workflow
+instructions and templates) in a single JSON file in the per-user cache
+directory, validated by a manifest of file mtimes and sizes:
+
+- The whole catalog is loaded with one read on first use
+- A file is re-parsed only when its mtime or size changed
+- The catalog is written back atomically, and only when something changed
+
+Files modified within the last ``RACY_WINDOW_SECONDS`` are parsed but not
+persisted, so a rewrite within the same mtime tick that keeps the file size
+cannot be mistaken for an unchanged file.
+
+The catalog only ever holds plain data and lives outside the project tree
+(``~/.gao-dev/cache/catalogs/<hash of project root>.json``), so a cloned or
+shared project cannot plant a catalog file that is loaded on start-up.
+Documents that JSON cannot represent exactly (e.g. YAML dates) are served
+from memory and re-parsed in the next process.
+
+Example:
+    ```python
+    catalog = get_catalog_cache(project_root)
+    data = catalog.get_yaml(workflow_dir / "workflow.yaml")
+    instructions = catalog.get_text(workflow_dir / "instructions.md")
+    catalog.flush()
+    ```
+"""
+
+import atexit
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import structlog
+import yaml
+
+logger = structlog.get_logger()
+
+# Bump when the entry layout or parsing semantics change
+CATALOG_CACHE_VERSION = 2
+
+# Overrides the per-user cache directory (~/.gao-dev/cache)
+CACHE_DIR_ENV_VAR = "GAO_DEV_CACHE_DIR"
+
+# Files modified more recently than this are not persisted (racy mtime window)
+RACY_WINDOW_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class _CatalogEntry:
+    """Parsed content of one file, keyed by its stat signature."""
+
+    mtime_ns: int
+    size: int
+    kind: str
+    value: Any
+
+
+class CatalogCache:
+    """
+    Stat-validated cache of parsed catalog files.
+
+    Values returned by get_yaml() are deep copies, so callers may mutate
+    them freely without affecting other registries sharing the catalog.
+
+    Attributes:
+        cache_path: JSON file backing the catalog (None for memory only)
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        Initialize catalog cache.
+
+        Args:
+            cache_path: JSON file to load from and flush to. None keeps the
+                catalog in memory only.
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._entries: Dict[str, _CatalogEntry] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_yaml(self, path: Path) -> Any:
+        """
+        Get parsed YAML document for a file.
+
+        Args:
+            path: YAML file path
+
+        Returns:
+            Parsed document (deep copy of the cached value)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            yaml.YAMLError: If the file cannot be parsed
+        """
+        return copy.deepcopy(self._get(path, "yaml"))
+
+    def get_text(self, path: Path) -> str:
+        """
+        Get text content of a file (personas, instructions, templates).
+
+        Args:
+            path: Text file path
+
+        Returns:
+            File content
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        return self._get(path, "text")
+
+    def flush(self) -> bool:
+        """
+        Write the catalog to disk if it changed.
+
+        Returns:
+            True if the catalog file was written
+        """
+        with self._lock:
+            if not self._dirty or self.cache_path is None:
+                return False
+
+            payload = {
+                "version": CATALOG_CACHE_VERSION,
+                "entries": {
+                    key: [e.mtime_ns, e.size, e.kind, e.value]
+                    for key, e in self._entries.items()
+                    if e.kind == "text" or _is_json_data(e.value)
+                },
+            }
+            try:
+                self.cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=self.cache_path.parent, prefix=".catalog-", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(payload, f, separators=(",", ":"))
+                    os.replace(tmp_name, self.cache_path)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(
+                    "catalog_cache_write_failed", path=str(self.cache_path), error=str(e)
+                )
+                return False
+
+            self._dirty = False
+            logger.debug(
+                "catalog_cache_written", path=str(self.cache_path), entries=len(self._entries)
+            )
+            return True
+
+    def clear(self) -> None:
+        """Drop all cached entries and remove the catalog file."""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._dirty = False
+            if self.cache_path is not None:
+                self.cache_path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    def _get(self, path: Path, kind: str) -> Any:
+        """
+        Get cached value for a file, parsing it if missing or stale.
+
+        Args:
+            path: File path
+            kind: "yaml" or "text"
+
+        Returns:
+            Cached (not copied) value
+        """
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            with self._lock:
+                self._ensure_loaded()
+                if self._entries.pop(key, None) is not None:
+                    self._dirty = True
+            raise
+
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.kind == kind
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                self.hits += 1
+                return entry.value
+
+        # Parse outside the lock; concurrent misses on one file are harmless
+        with open(key, "r", encoding="utf-8") as f:
+            value = yaml.safe_load(f) if kind == "yaml" else f.read()
+
+        with self._lock:
+            self.misses += 1
+            if time.time() - stat.st_mtime_ns / 1e9 >= RACY_WINDOW_SECONDS:
+                self._entries[key] = _CatalogEntry(
+                    stat.st_mtime_ns, stat.st_size, kind, value
+                )
+                self._dirty = True
+            elif self._entries.pop(key, None) is not None:
+                self._dirty = True
+        return value
+
+    def _ensure_loaded(self) -> None:
+        """Load the catalog file once (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != CATALOG_CACHE_VERSION:
+                logger.info("catalog_cache_version_mismatch", path=str(self.cache_path))
+                self._dirty = True
+                return
+            self._entries = {
+                str(key): _CatalogEntry(int(mtime_ns), int(size), str(kind), value)
+                for key, (mtime_ns, size, kind, value) in payload["entries"].items()
+            }
+        except Exception as e:
+            # Corrupt or incompatible cache: start over
+            logger.warning(
+                "catalog_cache_load_failed", path=str(self.cache_path), error=str(e)
+            )
+            self._entries = {}
+            self._dirty = True
+
+
+def _is_json_data(value: Any) -> bool:
+    """Check that a parsed document survives a JSON round trip unchanged."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_data(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json_data(item) for key, item in value.items()
+        )
+    return False
+
+
+_catalogs: Dict[Optional[Path], CatalogCache] = {}
+_catalogs_lock = threading.Lock()
+
+
+@atexit.register
+def _flush_shared_catalogs() -> None:
+    """Persist shared catalogs that changed since their last flush."""
+    with _catalogs_lock:
+        catalogs = list(_catalogs.values())
+    for catalog in catalogs:
+        catalog.flush()
+
+
+def user_cache_dir() -> Path:
+    """
+    Get the per-user cache directory.
+
+    Returns:
+        $GAO_DEV_CACHE_DIR if set, otherwise ``~/.gao-dev/cache``
+    """
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    return Path(override).expanduser() if override else Path.home() / ".gao-dev" / "cache"
+
+
+def default_catalog_path(project_root: Union[str, os.PathLike]) -> Path:
+    """
+    Resolve the catalog file location for a project.
+
+    Catalogs are kept in the per-user cache directory, one file per project
+    keyed by a hash of its resolved root, never inside the project itself.
+
+    Args:
+        project_root: Project (or configuration) root directory
+
+    Returns:
+        Path to the catalog JSON file
+    """
+    root = str(Path(project_root).resolve())
+    key = hashlib.sha256(root.encode("utf-8")).hexdigest()[:16]
+    return user_cache_dir() / "catalogs" / f"{key}.json"
+
+
+def get_catalog_cache(project_root: Optional[Union[str, os.PathLike]] = None) -> CatalogCache:
+    """
+    Get the process-wide catalog for a project.
+
+    The CLI, web server and tools share one catalog instance per cache file,
+    so each file is parsed at most once per process. Shared catalogs are
+    also flushed at interpreter exit.
+
+    Args:
+        project_root: Project root. Without one (or for values that are not
+            paths, e.g. from a stub config loader) the shared catalog is kept
+            in memory only.
+
+    Returns:
+        Shared CatalogCache
+    """
+    cache_path = (
+        default_catalog_path(project_root)
+        if isinstance(project_root, (str, os.PathLike))
+        else None
+    )
+    with _catalogs_lock:
+        catalog = _catalogs.get(cache_path)
+        if catalog is None:
+            catalog = CatalogCache(cache_path)
+            _catalogs[cache_path] = catalog
+        return catalog
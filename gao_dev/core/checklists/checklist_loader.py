@@ -11,8 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 import structlog
-import yaml
 
+from gao_dev.core.catalog_cache import CatalogCache, get_catalog_cache
 from gao_dev.core.checklists.exceptions import (
     ChecklistInheritanceError,
     ChecklistNotFoundError,
@@ -42,6 +42,8 @@ class ChecklistLoader:
         checklist_dirs: List[Path],
         schema_path: Path,
         plugin_manager: Optional["ChecklistPluginManager"] = None,
+        catalog: Optional[CatalogCache] = None,
+        project_root: Optional[Path] = None,
     ):
         """
         Initialize the checklist loader.
@@ -51,6 +53,10 @@ class ChecklistLoader:
                            (searched in order: first match wins)
             schema_path: Path to JSON Schema file for validation
             plugin_manager: Optional plugin manager for loading plugin checklists
+            catalog: Parsed-file catalog (defaults to the shared catalog of
+                     project_root)
+            project_root: Root the shared catalog is kept for (defaults to
+                          the first checklist directory)
 
         Example:
             >>> from pathlib import Path
@@ -63,6 +69,10 @@ class ChecklistLoader:
         self.checklist_dirs = checklist_dirs
         self.validator = ChecklistSchemaValidator(schema_path)
         self.plugin_manager = plugin_manager
+        if catalog is None:
+            root = project_root or (checklist_dirs[0] if checklist_dirs else None)
+            catalog = get_catalog_cache(root)
+        self.catalog = catalog
         self._cache: Dict[str, Checklist] = {}
         self._source_map: Dict[str, str] = {}  # checklist_name -> source
 
@@ -113,8 +123,7 @@ class ChecklistLoader:
                     )
 
                     # Load and validate
-                    with open(checklist_path, "r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
+                    data = self.catalog.get_yaml(checklist_path)
 
                     is_valid, errors = self.validator.validate(data)
                     if not is_valid:
@@ -159,8 +168,7 @@ class ChecklistLoader:
         logger.info("loading_core_checklist", name=name)
 
         # Load YAML
-        with open(checklist_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = self.catalog.get_yaml(checklist_path)
 
         # Validate against schema
         is_valid, errors = self.validator.validate(data)
@@ -178,6 +186,29 @@ class ChecklistLoader:
         self._source_map[name] = "core"
         return checklist
 
+    def preload_checklists(self) -> Dict[str, Checklist]:
+        """
+        Load every available checklist and persist the catalog once.
+
+        Checklists that fail to load are logged and skipped.
+
+        Returns:
+            Dictionary of checklist name to Checklist
+        """
+        checklists: Dict[str, Checklist] = {}
+        for name, _source in self.list_checklists():
+            try:
+                checklists[name] = self.load_checklist(name)
+            except (
+                ChecklistNotFoundError,
+                ChecklistValidationError,
+                ChecklistInheritanceError,
+            ) as e:
+                logger.warning("checklist_preload_failed", name=name, error=str(e))
+
+        self.catalog.flush()
+        return checklists
+
     def _find_checklist(self, name: str) -> Path:
         """
         Find checklist file in search directories.
@@ -275,8 +306,7 @@ class ChecklistLoader:
                 f"Parent checklist not found: {parent_name}"
             )
 
-        with open(parent_path, "r", encoding="utf-8") as f:
-            parent_data = yaml.safe_load(f)
+        parent_data = self.catalog.get_yaml(parent_path)
 
         # Validate parent
         is_valid, errors = self.validator.validate(parent_data)
@@ -109,7 +109,9 @@ class DatabaseConfig:
 
         # Initialize with schema
         from .state.migrations.migration_001_create_state_schema import Migration001
+        from .state.migrations.migration_003_add_workflow_rollups import Migration003
         Migration001.upgrade(self.db_path)
+        Migration003.upgrade(self.db_path)
 
     def __repr__(self) -> str:
         return f"DatabaseConfig(db_path={self.db_path})"
@@ -1,12 +1,29 @@
 """Configuration loader with defaults and user overrides."""
 
+import copy
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 import yaml
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Parsed YAML per file, reused while the file is unchanged, so long-lived
+# processes (e.g. the CLI daemon) do not re-parse config on every command
+_yaml_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a YAML file, reusing the parsed result while mtime and size match."""
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = (key, yaml.safe_load(f))
+        _yaml_cache[path] = cached
+    return copy.deepcopy(cached[1])
+
 
 class ConfigLoader:
     """Load and manage GAO-Dev configuration."""
@@ -22,15 +39,13 @@ class ConfigLoader:
 
         # Load embedded defaults
         defaults_path = Path(__file__).parent.parent / "config" / "defaults.yaml"
-        with open(defaults_path, "r", encoding="utf-8") as f:
-            self.defaults = yaml.safe_load(f) or {}
+        self.defaults = _load_yaml(defaults_path) or {}
 
         # Load user config if it exists
         self.user_config = {}
-        user_config_path = project_root / "gao-dev.yaml"
+        user_config_path = Path(project_root) / "gao-dev.yaml"
         if user_config_path.exists():
-            with open(user_config_path, "r", encoding="utf-8") as f:
-                self.user_config = yaml.safe_load(f) or {}
+            self.user_config = _load_yaml(user_config_path.resolve()) or {}
 
     def get(self, key: str, default: Any = None) -> Any:
         """
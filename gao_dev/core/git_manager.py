@@ -7,7 +7,7 @@ Unified git management supporting both:
 
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Generator, List, Optional, Dict, Any
 from datetime import datetime
 
 try:
@@ -1198,6 +1198,132 @@ class GitManager:
             )
             raise
 
+    def get_changed_files_since(self, since: str, until: str = "HEAD") -> List[Dict[str, str]]:
+        """
+        Get files changed between two refs with a single ``git diff``.
+
+        Renames are reported as a delete plus an add so callers only need
+        to handle the A/M/D/T status letters.
+
+        Args:
+            since: Starting ref (exclusive)
+            until: Ending ref (inclusive) (default: "HEAD")
+
+        Returns:
+            List[Dict]: List of dicts with keys: status, path (relative to repo root)
+
+        Raises:
+            subprocess.CalledProcessError: If either ref is unknown
+
+        Example:
+            >>> git = GitManager(Path("/project"))
+            >>> for change in git.get_changed_files_since("abc1234"):
+            ...     print(f"{change['status']} {change['path']}")
+
+        See Also:
+            - get_commits_since(): Get commits in a range
+        """
+        try:
+            result = self._run_git_command(
+                ["-c", "core.quotepath=off", "diff", "--name-status", "--no-renames",
+                 since, until, "--"]
+            )
+        except subprocess.CalledProcessError as e:
+            self._log(
+                "warning", "get_changed_files_since_failed", since=since, error=str(e.stderr)
+            )
+            raise
+
+        changes = []
+        for line in result.splitlines():
+            parts = line.split("\t", 1)
+            if len(parts) != 2:
+                continue
+            changes.append({"status": parts[0].strip()[:1], "path": parts[1].strip()})
+
+        self._log("debug", "retrieved_changed_files", since=since, until=until, count=len(changes))
+        return changes
+
+    def get_last_commits_for_files(
+        self, paths: List[Path], chunk_size: int = 200
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the last commit for many files using one ``git log`` per chunk.
+
+        Batch counterpart of get_last_commit_for_file(): walks history once
+        (newest first) and records the first commit seen for each path. The
+        log is read as git writes it and git is stopped as soon as every path
+        of the chunk has been found, so recently changed files do not cost a
+        walk of the whole history.
+
+        Args:
+            paths: Paths to files (relative to repo root or absolute)
+            chunk_size: Maximum pathspecs per git invocation (default: 200)
+
+        Returns:
+            Dict mapping repo-relative POSIX path to commit info dict with keys:
+            sha, full_sha, message, author, date. Files without history are omitted.
+
+        Example:
+            >>> git = GitManager(Path("/project"))
+            >>> commits = git.get_last_commits_for_files([Path("docs/a.md"), Path("docs/b.md")])
+            >>> commits.get("docs/a.md", {}).get("message")
+        """
+        relative_paths = []
+        for path in paths:
+            path = Path(path)
+            if path.is_absolute():
+                try:
+                    path = path.relative_to(self.project_path)
+                except ValueError:
+                    self._log("warning", "file_outside_repo", path=str(path))
+                    continue
+            relative_paths.append(path.as_posix())
+
+        found: Dict[str, Dict[str, Any]] = {}
+        ordered = sorted(set(relative_paths))
+
+        for start in range(0, len(ordered), chunk_size):
+            pending = set(ordered[start:start + chunk_size])
+            lines = self._iter_git_output(
+                ["-c", "core.quotepath=off", "log", "--format=%x00%H|%s|%an|%aI",
+                 "--name-only", "--"] + sorted(pending)
+            )
+
+            commit_info: Optional[Dict[str, Any]] = None
+            try:
+                for line in lines:
+                    if line.startswith("\x00"):
+                        parts = line[1:].split("|", 3)
+                        commit_info = None
+                        if len(parts) == 4:
+                            full_sha, message, author, date = parts
+                            commit_info = {
+                                "sha": full_sha[:7],
+                                "full_sha": full_sha,
+                                "message": message,
+                                "author": author,
+                                "date": date,
+                            }
+                        continue
+
+                    name = line.strip()
+                    if commit_info and name in pending:
+                        found[name] = commit_info
+                        pending.discard(name)
+                        if not pending:
+                            break
+            except subprocess.CalledProcessError as e:
+                self._log("warning", "get_last_commits_failed", error=str(e.stderr))
+            finally:
+                # Stops git if the walk ended early
+                lines.close()
+
+        self._log(
+            "debug", "retrieved_file_commits", requested=len(relative_paths), found=len(found)
+        )
+        return found
+
     def get_commit_history(
         self,
         limit: int = 50,
@@ -1599,6 +1725,43 @@ logs/
         )
         return result.stdout
 
+    def _iter_git_output(self, args: List[str]) -> Generator[str, None, None]:
+        """
+        Run a git command and yield its stdout lines as they are written.
+
+        Closing the iterator before the end terminates git, so callers can
+        stop reading once they have what they need.
+
+        Args:
+            args: Git command arguments (e.g., ['log', '--name-only'])
+
+        Yields:
+            Output lines without the trailing newline
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails (raised once
+                the output has been read to the end)
+        """
+        cmd = ["git"] + args
+        process = subprocess.Popen(
+            cmd,
+            cwd=self.project_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        finished = False
+        try:
+            for line in process.stdout:
+                yield line.rstrip("\n")
+            finished = True
+        finally:
+            if not finished:
+                process.kill()
+            _, stderr = process.communicate()
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr)
+
     def _has_commits(self) -> bool:
         """Check if repository has any commits."""
         try:
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import yaml
 
+from ..template_engine import compile_template
+
 
 @dataclass
 class PromptTemplate:
@@ -94,16 +96,8 @@ class PromptTemplate:
         # Merge template defaults with provided variables
         merged = {**self.variables, **variables}
 
-        # Start with user prompt
-        prompt = self.user_prompt
-
-        # Replace all {{variable}} placeholders
-        for key, value in merged.items():
-            placeholder = f"{{{{{key}}}}}"
-            if placeholder in prompt:
-                prompt = prompt.replace(placeholder, str(value))
-
-        return prompt
+        # Single-pass render of the compiled (cached) user prompt
+        return compile_template(self.user_prompt).render(merged)
 
     def render_system_prompt(self, variables: Dict[str, Any]) -> Optional[str]:
         """
@@ -121,16 +115,8 @@ class PromptTemplate:
         # Merge template defaults with provided variables
         merged = {**self.variables, **variables}
 
-        # Start with system prompt
-        prompt = self.system_prompt
-
-        # Replace all {{variable}} placeholders
-        for key, value in merged.items():
-            placeholder = f"{{{{{key}}}}}"
-            if placeholder in prompt:
-                prompt = prompt.replace(placeholder, str(value))
-
-        return prompt
+        # Single-pass render of the compiled (cached) system prompt
+        return compile_template(self.system_prompt).render(merged)
 
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> "PromptTemplate":
@@ -176,16 +162,33 @@ class PromptTemplate:
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {yaml_path}: {e}")
 
+        return cls.from_dict(data, yaml_path)
+
+    @classmethod
+    def from_dict(cls, data: Any, source: Path) -> "PromptTemplate":
+        """
+        Create prompt template from a parsed YAML document.
+
+        Args:
+            data: Parsed YAML document
+            source: File the document was loaded from (for error messages)
+
+        Returns:
+            PromptTemplate instance
+
+        Raises:
+            ValueError: If the document is empty or missing required fields
+        """
         if not data:
-            raise ValueError(f"Empty YAML file: {yaml_path}")
+            raise ValueError(f"Empty YAML file: {source}")
 
         # Validate required fields
         if "name" not in data:
-            raise ValueError(f"Missing 'name' field in {yaml_path}")
+            raise ValueError(f"Missing 'name' field in {source}")
         if "description" not in data:
-            raise ValueError(f"Missing 'description' field in {yaml_path}")
+            raise ValueError(f"Missing 'description' field in {source}")
         if "user_prompt" not in data:
-            raise ValueError(f"Missing 'user_prompt' field in {yaml_path}")
+            raise ValueError(f"Missing 'user_prompt' field in {source}")
 
         # Extract response configuration
         response_config = data.get("response", {})
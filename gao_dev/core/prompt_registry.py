@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import structlog
 
+from .catalog_cache import CatalogCache, get_catalog_cache
 from .models.prompt_template import PromptTemplate
 from .prompt_loader import PromptLoader
 from .config_loader import ConfigLoader
@@ -63,7 +64,8 @@ class PromptRegistry:
         self,
         prompts_dir: Path,
         config_loader: Optional[ConfigLoader] = None,
-        cache_enabled: bool = True
+        cache_enabled: bool = True,
+        catalog: Optional[CatalogCache] = None
     ):
         """
         Initialize prompt registry.
@@ -72,10 +74,14 @@ class PromptRegistry:
             prompts_dir: Directory containing prompt YAML files
             config_loader: Optional config loader for reference resolution
             cache_enabled: Whether to enable caching in loader
+            catalog: Parsed-file catalog (defaults to the shared project catalog)
         """
         self.prompts_dir = prompts_dir
         self.config_loader = config_loader
         self.cache_enabled = cache_enabled
+        self.catalog = catalog if catalog is not None else get_catalog_cache(
+            getattr(config_loader, "project_root", None)
+        )
 
         # Create prompt loader
         self.loader = PromptLoader(
@@ -124,7 +130,9 @@ class PromptRegistry:
                 continue
 
             try:
-                template = PromptTemplate.from_yaml(prompt_file)
+                template = PromptTemplate.from_dict(
+                    self.catalog.get_yaml(prompt_file), prompt_file
+                )
                 self._prompts[template.name] = template
                 logger.debug("prompt_indexed", name=template.name, path=str(prompt_file))
             except Exception as e:
@@ -134,6 +142,7 @@ class PromptRegistry:
                     error=str(e)
                 )
 
+        self.catalog.flush()
         self._indexed = True
         logger.info("prompts_indexed", count=len(self._prompts))
 
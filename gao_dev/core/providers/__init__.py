@@ -90,8 +90,22 @@ from .selection import (
 )
 from .selector import ProviderSelector
 from .performance_tracker import ProviderPerformanceTracker
-from .health_check import ProviderHealthChecker
+from .health_check import (
+    CircuitBreaker,
+    CircuitState,
+    ProviderHealthChecker,
+    ProviderHealthProber,
+    get_health_checker,
+)
 from .cache import ProviderCache, hash_config
+from .scheduler import (
+    LLMScheduler,
+    ProviderLimits,
+    RequestCancelledError,
+    RequestPriority,
+    get_scheduler,
+    priority_scope,
+)
 
 __all__ = [
     # Core interface
@@ -120,11 +134,23 @@ __all__ = [
     "ProviderSelector",
     "ProviderPerformanceTracker",
     "ProviderHealthChecker",
+    "ProviderHealthProber",
+    "CircuitBreaker",
+    "CircuitState",
+    "get_health_checker",
 
     # Performance optimization
     "ProviderCache",
     "hash_config",
 
+    # Request scheduling
+    "LLMScheduler",
+    "ProviderLimits",
+    "RequestCancelledError",
+    "RequestPriority",
+    "get_scheduler",
+    "priority_scope",
+
     # Models
     "AgentContext",
 
@@ -281,6 +281,48 @@ class ProviderFactory:
 
         return sorted(providers)
 
+    def create_fallback_providers(
+        self,
+        fallback_chain: List[str],
+        exclude: Optional[str] = None,
+        provider_configs: Optional[Dict[str, Dict]] = None,
+    ) -> List[IAgentProvider]:
+        """
+        Create the providers of a fallback chain, skipping unusable ones.
+
+        A bare "direct-api" entry resolves to the direct-api-<provider>
+        variant named by its config (default: anthropic).
+
+        Args:
+            fallback_chain: Provider names in order of preference
+            exclude: Provider name to leave out (usually the primary)
+            provider_configs: Per-provider configuration keyed by chain name
+
+        Returns:
+            Created providers, in chain order
+        """
+        provider_configs = provider_configs or {}
+        providers: List[IAgentProvider] = []
+        for name in fallback_chain:
+            config = dict(provider_configs.get(name) or {})
+            if name.lower() == "direct-api":
+                name = f"direct-api-{config.pop('provider', 'anthropic')}"
+                config = {
+                    k: v for k, v in config.items()
+                    if k in {"api_key", "base_url", "max_retries", "retry_delay", "timeout"}
+                }
+            if exclude and name.lower() == exclude.lower():
+                continue
+            try:
+                providers.append(self.create_provider(name, config=config or None))
+            except (ProviderNotFoundError, ProviderCreationError) as e:
+                logger.debug(
+                    "fallback_provider_unavailable",
+                    provider=name,
+                    error=str(e),
+                )
+        return providers
+
     def provider_exists(self, provider_name: str) -> bool:
         """
         Check if a provider is registered.
@@ -1,7 +1,31 @@
-"""Provider health checking."""
+"""Provider health checking.
 
-from typing import Dict
+Health is tracked per provider from two sources:
+- probes: ProviderHealthProber periodically calls validate_configuration()
+  on each configured provider and records latency and outcome
+- real traffic: ProcessExecutor records the outcome of every task it runs
+
+Each provider has a CircuitBreaker. After ``failure_threshold`` consecutive
+failures the circuit opens and the provider is reported unhealthy, so
+selection strategies and ProcessExecutor fail over to the next provider in
+the fallback chain before a task starts instead of waiting for it to time
+out. After ``recovery_timeout`` seconds the circuit half-opens and admits a
+single trial request; its outcome closes or re-opens the circuit.
+
+Probes only check local configuration, so a failed probe counts toward
+opening a circuit but a successful one never closes it: only a real task
+can prove a provider has recovered.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
 import structlog
 
 from gao_dev.core.providers.base import IAgentProvider
@@ -9,52 +33,277 @@ from gao_dev.core.providers.base import IAgentProvider
 logger = structlog.get_logger(__name__)
 
 
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker.
+
+    Not thread-safe on its own; ProviderHealthChecker calls it under its lock.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds an open circuit waits before half-opening
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit half-opens once its timeout passes."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Failures since the last success."""
+        return self._failures
+
+    def allow_request(self) -> bool:
+        """Whether a request may start now.
+
+        A half-open circuit admits one trial request at a time.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """Give back a half-open trial whose outcome says nothing about health."""
+        self._trial_in_flight = False
+
+
+@dataclass
+class ProviderHealth:
+    """Rolling health statistics for one provider.
+
+    Attributes:
+        samples: Recent (succeeded, latency_seconds) outcomes, oldest first
+        last_error: Message of the most recent failure
+        last_checked: When the last outcome was recorded
+    """
+
+    samples: Deque[Tuple[bool, Optional[float]]] = field(default_factory=deque)
+    last_error: Optional[str] = None
+    last_checked: Optional[datetime] = None
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of recent outcomes that failed."""
+        if not self.samples:
+            return 0.0
+        return sum(1 for ok, _ in self.samples if not ok) / len(self.samples)
+
+    @property
+    def avg_latency_ms(self) -> Optional[float]:
+        """Mean latency of recent successful outcomes."""
+        latencies = [lat for ok, lat in self.samples if ok and lat is not None]
+        if not latencies:
+            return None
+        return sum(latencies) / len(latencies) * 1000
+
+
 class ProviderHealthChecker:
     """Checks and caches provider health status."""
 
-    def __init__(self, cache_duration: int = 300):
+    def __init__(
+        self,
+        cache_duration: int = 300,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+        probe_timeout: float = 10.0,
+        window: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize health checker.
 
         Args:
             cache_duration: Cache duration in seconds (default 5 minutes)
+            failure_threshold: Consecutive failures that open a circuit
+            recovery_timeout: Seconds before an open circuit admits a trial
+            probe_timeout: Seconds a probe may take before counting as failed
+            window: Outcomes kept per provider for error rate and latency
+            clock: Monotonic time source for circuit breakers
         """
         self.cache_duration = cache_duration
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.probe_timeout = probe_timeout
+        self.window = window
+        self._clock = clock
         self._health_cache: Dict[str, tuple[bool, datetime]] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._stats: Dict[str, ProviderHealth] = {}
+        self._lock = threading.Lock()
+
+    def _breaker(self, provider_name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider_name)
+        if breaker is None:
+            breaker = self._breakers[provider_name] = CircuitBreaker(
+                self.failure_threshold, self.recovery_timeout, self._clock
+            )
+        return breaker
 
     def is_healthy(self, provider_name: str) -> bool:
         """
         Check if provider is healthy.
 
+        A provider whose circuit is open is unhealthy. Otherwise the latest
+        probe result is used while fresh; with no fresh result the provider
+        is assumed healthy until a probe or a real task says otherwise.
+
         Args:
             provider_name: Name of provider
 
         Returns:
             True if healthy, False otherwise
         """
-        # Check cache
-        if provider_name in self._health_cache:
-            is_healthy, checked_at = self._health_cache[provider_name]
-            age = (datetime.now() - checked_at).total_seconds()
-
-            if age < self.cache_duration:
-                logger.debug(
-                    "health_check_cache_hit",
-                    provider=provider_name,
-                    is_healthy=is_healthy,
-                )
-                return is_healthy
-
-        # Cache miss or expired - always return True for now
-        # TODO: Implement actual health check
-        logger.debug(
-            "health_check_cache_miss",
-            provider=provider_name,
-        )
+        with self._lock:
+            breaker = self._breakers.get(provider_name)
+            if breaker is not None and breaker.state is CircuitState.OPEN:
+                logger.debug("health_check_circuit_open", provider=provider_name)
+                return False
+
+            # Check cache
+            if provider_name in self._health_cache:
+                is_healthy, checked_at = self._health_cache[provider_name]
+                age = (datetime.now() - checked_at).total_seconds()
+
+                if age < self.cache_duration:
+                    logger.debug(
+                        "health_check_cache_hit",
+                        provider=provider_name,
+                        is_healthy=is_healthy,
+                    )
+                    return is_healthy
+
+            # Cache miss or expired - nothing known against the provider
+            logger.debug(
+                "health_check_cache_miss",
+                provider=provider_name,
+            )
+
+            # Update cache
+            self._health_cache[provider_name] = (True, datetime.now())
+            return True
+
+    def allow_request(self, provider_name: str) -> bool:
+        """
+        Whether a task may start on the provider now.
+
+        Unlike is_healthy(), this claims the single trial slot of a
+        half-open circuit, so callers must report the outcome with
+        record_result() or release().
+
+        Args:
+            provider_name: Name of provider
+
+        Returns:
+            True if the circuit admits the request
+        """
+        with self._lock:
+            return self._breaker(provider_name).allow_request()
+
+    def release(self, provider_name: str) -> None:
+        """Return a trial slot without recording an outcome."""
+        with self._lock:
+            self._breaker(provider_name).release()
+
+    def record_result(
+        self,
+        provider_name: str,
+        success: bool,
+        latency_seconds: Optional[float] = None,
+        error: Optional[str] = None,
+        probe: bool = False,
+    ) -> None:
+        """
+        Record the outcome of a probe or task.
+
+        Args:
+            provider_name: Name of provider
+            success: Whether the provider responded correctly
+            latency_seconds: Time the call took
+            error: Failure description
+            probe: Outcome of a background probe rather than a real task; a
+                successful probe updates stats but leaves the circuit alone
+        """
+        with self._lock:
+            breaker = self._breaker(provider_name)
+            previous = breaker.state
+            if not success:
+                breaker.record_failure()
+            elif not probe:
+                breaker.record_success()
 
-        # Update cache
-        self._health_cache[provider_name] = (True, datetime.now())
-        return True
+            stats = self._stats.setdefault(provider_name, ProviderHealth())
+            stats.samples.append((success, latency_seconds))
+            while len(stats.samples) > self.window:
+                stats.samples.popleft()
+            stats.last_checked = datetime.now()
+            if not success:
+                stats.last_error = error
+            self._health_cache[provider_name] = (success, stats.last_checked)
+            state = breaker.state
+
+        if state is not previous:
+            logger.info(
+                "provider_circuit_state_changed",
+                provider=provider_name,
+                previous=previous.value,
+                state=state.value,
+                error=error,
+            )
+
+    def circuit_state(self, provider_name: str) -> CircuitState:
+        """Current circuit state of a provider."""
+        with self._lock:
+            return self._breaker(provider_name).state
 
     async def check_provider_health(
         self, provider: IAgentProvider
@@ -62,18 +311,25 @@ class ProviderHealthChecker:
         """
         Perform actual health check on provider.
 
+        The check is the provider's validate_configuration(), bounded by
+        probe_timeout. Its outcome and latency are recorded as a probe: a
+        failure counts toward opening the circuit, a success does not close it.
+
         Args:
             provider: Provider instance
 
         Returns:
             True if healthy, False otherwise
         """
+        started = time.perf_counter()
+        error = None
         try:
             # Use provider's validate method
-            is_healthy = await provider.validate_configuration()
-
-            # Update cache
-            self._health_cache[provider.name] = (is_healthy, datetime.now())
+            is_healthy = bool(await asyncio.wait_for(
+                provider.validate_configuration(), timeout=self.probe_timeout
+            ))
+            if not is_healthy:
+                error = "configuration invalid"
 
             logger.info(
                 "health_check_completed",
@@ -81,7 +337,10 @@ class ProviderHealthChecker:
                 is_healthy=is_healthy,
             )
 
-            return is_healthy
+        except asyncio.TimeoutError:
+            is_healthy = False
+            error = f"probe timed out after {self.probe_timeout}s"
+            logger.warning("health_check_timed_out", provider=provider.name)
 
         except Exception as e:
             logger.error(
@@ -89,10 +348,42 @@ class ProviderHealthChecker:
                 provider=provider.name,
                 error=str(e),
             )
+            is_healthy = False
+            error = str(e)
 
-            # Update cache as unhealthy
-            self._health_cache[provider.name] = (False, datetime.now())
-            return False
+        self.record_result(
+            provider.name,
+            is_healthy,
+            latency_seconds=time.perf_counter() - started,
+            error=error,
+            probe=True,
+        )
+        return is_healthy
+
+    def get_health_snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        Summarize health of every provider seen so far.
+
+        Returns:
+            Mapping of provider name to circuit state, error rate, mean
+            latency, consecutive failures and last error
+        """
+        with self._lock:
+            names = set(self._breakers) | set(self._stats)
+            snapshot = {}
+            for name in sorted(names):
+                breaker = self._breaker(name)
+                stats = self._stats.get(name, ProviderHealth())
+                latency = stats.avg_latency_ms
+                snapshot[name] = {
+                    "state": breaker.state.value,
+                    "error_rate": round(stats.error_rate, 3),
+                    "avg_latency_ms": round(latency, 1) if latency is not None else None,
+                    "consecutive_failures": breaker.consecutive_failures,
+                    "last_error": stats.last_error,
+                    "last_checked": stats.last_checked.isoformat() if stats.last_checked else None,
+                }
+            return snapshot
 
     def mark_unhealthy(self, provider_name: str):
         """
@@ -108,3 +399,92 @@ class ProviderHealthChecker:
         """Clear health cache."""
         self._health_cache.clear()
         logger.debug("health_cache_cleared")
+
+
+class ProviderHealthProber:
+    """Probes providers on a background thread.
+
+    The thread runs each round of probes on its own event loop, so it works
+    alongside both the CLI and the web server.
+    """
+
+    def __init__(
+        self,
+        checker: ProviderHealthChecker,
+        providers: Sequence[IAgentProvider],
+        interval: float = 60.0,
+    ):
+        """
+        Initialize prober.
+
+        Args:
+            checker: Health checker that receives probe results
+            providers: Providers to probe
+            interval: Seconds between probe rounds
+        """
+        self.checker = checker
+        self.providers: List[IAgentProvider] = list(providers)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    async def probe_once(self) -> Dict[str, bool]:
+        """
+        Probe every provider concurrently.
+
+        Returns:
+            Mapping of provider name to probe result
+        """
+        results = await asyncio.gather(
+            *(self.checker.check_provider_health(p) for p in self.providers)
+        )
+        return {p.name: ok for p, ok in zip(self.providers, results)}
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                asyncio.run(self.probe_once())
+            except Exception as e:
+                logger.error("health_probe_round_failed", error=str(e))
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Start probing; the first round runs immediately."""
+        if self.is_running() or not self.providers:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="provider-health-prober", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "health_prober_started",
+            providers=[p.name for p in self.providers],
+            interval=self.interval,
+        )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop probing and wait for the current round to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            logger.info("health_prober_stopped")
+
+    def is_running(self) -> bool:
+        """Whether the probe thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+
+_health_checker: Optional[ProviderHealthChecker] = None
+_health_checker_lock = threading.Lock()
+
+
+def get_health_checker() -> ProviderHealthChecker:
+    """Return the process-wide health checker, creating it on first use."""
+    global _health_checker
+    if _health_checker is None:
+        with _health_checker_lock:
+            if _health_checker is None:
+                _health_checker = ProviderHealthChecker()
+    return _health_checker
@@ -0,0 +1,537 @@
+"""Process-wide admission control for provider requests.
+
+Every IAgentProvider.execute_task call made through ProcessExecutor passes
+through a single LLMScheduler, so interactive chat, workflow execution and
+background work (benchmarks, ceremonies) share one view of each provider's
+capacity instead of bursting independently.
+
+Per provider the scheduler enforces:
+- a token-bucket rate limit (requests per minute with a burst allowance)
+- a maximum number of requests in flight
+
+Waiting requests are admitted by priority class (interactive before workflow
+before background) and FIFO within a class. Queue time is recorded per
+provider, and queued requests can be cancelled either by cancelling the
+awaiting task or in bulk through cancel_queued().
+
+The scheduler is loop-agnostic: state is guarded by a threading lock and
+waiters are woken on their own event loop, because the CLI runs a fresh loop
+per command while the web server keeps one long-lived loop.
+
+Example:
+    ```python
+    from gao_dev.core.providers.scheduler import RequestPriority, get_scheduler
+
+    scheduler = get_scheduler()
+    async for message in scheduler.stream(
+        provider, RequestPriority.INTERACTIVE,
+        task="Summarize", context=context, model="sonnet-4.5", tools=[],
+    ):
+        print(message)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterator, List, Optional
+
+import structlog
+
+from .exceptions import ProviderError, ProviderErrorType
+
+logger = structlog.get_logger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Priority classes, lowest value admitted first."""
+
+    INTERACTIVE = 0
+    WORKFLOW = 1
+    BACKGROUND = 2
+
+
+_current_priority: ContextVar[Optional[RequestPriority]] = ContextVar(
+    "gao_dev_request_priority", default=None
+)
+
+
+@contextmanager
+def priority_scope(priority: RequestPriority) -> Iterator[None]:
+    """Run provider requests made in this context at the given priority.
+
+    Args:
+        priority: Priority applied to requests that do not set one explicitly
+
+    Example:
+        ```python
+        with priority_scope(RequestPriority.BACKGROUND):
+            await runner.run()
+        ```
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> Optional[RequestPriority]:
+    """Priority set by the innermost priority_scope, if any."""
+    return _current_priority.get()
+
+
+class RequestCancelledError(ProviderError):
+    """Raised in a queued request removed by LLMScheduler.cancel_queued()."""
+
+    def __init__(self, provider_name: str, message: str = "Request cancelled while queued"):
+        super().__init__(
+            error_type=ProviderErrorType.UNKNOWN_ERROR,
+            message=message,
+            provider_name=provider_name,
+        )
+
+
+@dataclass
+class ProviderLimits:
+    """Admission limits for one provider.
+
+    Attributes:
+        max_in_flight: Maximum concurrent requests
+        requests_per_minute: Sustained admission rate (None = unlimited)
+        burst: Requests admitted back to back before the rate applies
+    """
+
+    max_in_flight: int = 4
+    requests_per_minute: Optional[float] = 60.0
+    burst: int = 4
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProviderLimits":
+        """Create limits from a config mapping, defaulting missing keys."""
+        defaults = cls()
+        return cls(
+            max_in_flight=int(data.get("max_in_flight", defaults.max_in_flight)),
+            requests_per_minute=data.get("requests_per_minute", defaults.requests_per_minute),
+            burst=int(data.get("burst", defaults.burst)),
+        )
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate.
+
+    Not thread-safe on its own; LLMScheduler calls it under its lock.
+    """
+
+    def __init__(self, rate_per_second: Optional[float], capacity: int):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate_per_second: Refill rate (None = unlimited)
+            capacity: Maximum stored tokens
+        """
+        self.rate = rate_per_second
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            self.tokens = float(self.capacity)
+        else:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Seconds until a token is available (0.0 if one is available now)."""
+        self._refill(time.monotonic())
+        if self.tokens >= 1 or self.rate is None:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        """Take one token; callers check delay() first."""
+        self._refill(time.monotonic())
+        self.tokens -= 1
+
+
+@dataclass
+class ProviderQueueStats:
+    """Counters and queue-time metrics for one provider.
+
+    Attributes:
+        submitted: Requests that entered the queue
+        admitted: Requests granted a slot
+        completed: Admitted requests that released their slot
+        cancelled: Requests cancelled while queued
+        in_flight: Requests currently holding a slot
+        queued: Requests currently waiting
+        total_queue_seconds: Sum of queue time over admitted requests
+        max_queue_seconds: Longest queue time seen
+        queue_seconds_by_priority: Sum of queue time per priority name
+        admitted_by_priority: Admitted requests per priority name
+    """
+
+    submitted: int = 0
+    admitted: int = 0
+    completed: int = 0
+    cancelled: int = 0
+    in_flight: int = 0
+    queued: int = 0
+    total_queue_seconds: float = 0.0
+    max_queue_seconds: float = 0.0
+    queue_seconds_by_priority: Dict[str, float] = field(default_factory=dict)
+    admitted_by_priority: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_queue_seconds(self) -> float:
+        """Average queue time of admitted requests."""
+        return self.total_queue_seconds / self.admitted if self.admitted else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for logging and status endpoints."""
+        return {
+            "submitted": self.submitted,
+            "admitted": self.admitted,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "mean_queue_seconds": round(self.mean_queue_seconds, 4),
+            "max_queue_seconds": round(self.max_queue_seconds, 4),
+            "queue_seconds_by_priority": dict(self.queue_seconds_by_priority),
+            "admitted_by_priority": dict(self.admitted_by_priority),
+        }
+
+
+@dataclass(eq=False)
+class _Waiter:
+    priority: RequestPriority
+    seq: int
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    enqueued_at: float
+    granted: bool = False
+    done: bool = False
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _ProviderState:
+    def __init__(self, limits: ProviderLimits):
+        self.limits = limits
+        self.bucket = _bucket_for(limits)
+        self.heap: List[_Waiter] = []
+        self.stats = ProviderQueueStats()
+        self.timer: Optional[threading.Timer] = None
+
+
+def _bucket_for(limits: ProviderLimits) -> TokenBucket:
+    rate = limits.requests_per_minute
+    return TokenBucket(rate / 60.0 if rate else None, limits.burst)
+
+
+def _wake(waiter: _Waiter, exc: Optional[BaseException] = None) -> None:
+    """Resolve a waiter's future on its own loop (thread-safe)."""
+
+    def _resolve() -> None:
+        if waiter.future.done():
+            return
+        if exc is None:
+            waiter.future.set_result(None)
+        else:
+            waiter.future.set_exception(exc)
+
+    try:
+        waiter.loop.call_soon_threadsafe(_resolve)
+    except RuntimeError:
+        # Loop already closed; nobody is waiting any more
+        pass
+
+
+class LLMScheduler:
+    """Priority-aware, rate-limited admission control for provider requests."""
+
+    def __init__(
+        self,
+        default_limits: Optional[ProviderLimits] = None,
+        provider_limits: Optional[Dict[str, ProviderLimits]] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            default_limits: Limits for providers without explicit limits
+            provider_limits: Per-provider limits keyed by provider name
+        """
+        self.default_limits = default_limits or ProviderLimits()
+        self._limits: Dict[str, ProviderLimits] = dict(provider_limits or {})
+        self._states: Dict[str, _ProviderState] = {}
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+
+    def configure(self, provider_name: str, limits: ProviderLimits) -> None:
+        """Set limits for a provider; applies to requests admitted from now on.
+
+        Re-applying the current limits is a no-op, so the provider's token
+        bucket keeps its state.
+
+        Args:
+            provider_name: Provider name (e.g., 'claude-code')
+            limits: New limits
+        """
+        with self._lock:
+            if self._limits.get(provider_name) == limits:
+                return
+            self._limits[provider_name] = limits
+            state = self._states.get(provider_name)
+            if state is not None:
+                state.limits = limits
+                state.bucket = _bucket_for(limits)
+                self._dispatch(state)
+
+    def configure_from_dict(self, config: Dict[str, Any]) -> None:
+        """Apply a ``providers.scheduler`` config block.
+
+        The ``default`` key sets limits for unlisted providers; every other
+        key is a provider name.
+
+        Args:
+            config: Mapping of provider name to limit settings
+        """
+        for name, settings in (config or {}).items():
+            limits = ProviderLimits.from_dict(settings or {})
+            if name == "default":
+                with self._lock:
+                    self.default_limits = limits
+            else:
+                self.configure(name, limits)
+
+    def _state(self, provider_name: str) -> _ProviderState:
+        state = self._states.get(provider_name)
+        if state is None:
+            limits = self._limits.get(provider_name, self.default_limits)
+            state = self._states[provider_name] = _ProviderState(limits)
+        return state
+
+    def _dispatch(self, state: _ProviderState) -> None:
+        """Admit waiters while capacity allows. Caller holds the lock.
+
+        When the head waiter is blocked only by the rate limit, a timer
+        re-dispatches once the next token is due.
+        """
+        while state.heap and state.stats.in_flight < state.limits.max_in_flight:
+            waiter = state.heap[0]
+            if waiter.done:
+                heapq.heappop(state.heap)
+                continue
+            delay = state.bucket.delay()
+            if delay > 0:
+                if state.timer is None:
+                    state.timer = threading.Timer(delay, self._on_timer, args=(state,))
+                    state.timer.daemon = True
+                    state.timer.start()
+                return
+            heapq.heappop(state.heap)
+            state.bucket.consume()
+            waiter.granted = True
+            state.stats.in_flight += 1
+            state.stats.queued -= 1
+            _wake(waiter)
+
+    def _on_timer(self, state: _ProviderState) -> None:
+        with self._lock:
+            state.timer = None
+            self._dispatch(state)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider_name: str,
+        priority: Optional[RequestPriority] = None,
+    ) -> AsyncIterator[float]:
+        """Wait for admission and hold a request slot for the block's duration.
+
+        Args:
+            provider_name: Provider the request goes to
+            priority: Priority class (default: current priority_scope or WORKFLOW)
+
+        Yields:
+            Seconds spent queued
+
+        Raises:
+            RequestCancelledError: If cancel_queued() removed the request
+            asyncio.CancelledError: If the awaiting task was cancelled
+        """
+        if priority is None:
+            priority = current_priority()
+        if priority is None:
+            priority = RequestPriority.WORKFLOW
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            priority=priority,
+            seq=next(self._seq),
+            loop=loop,
+            future=loop.create_future(),
+            enqueued_at=time.monotonic(),
+        )
+
+        with self._lock:
+            state = self._state(provider_name)
+            heapq.heappush(state.heap, waiter)
+            state.stats.submitted += 1
+            state.stats.queued += 1
+            self._dispatch(state)
+
+        try:
+            await waiter.future
+        except BaseException:
+            with self._lock:
+                if waiter.granted:
+                    self._release(state)
+                elif not waiter.done:
+                    waiter.done = True
+                    state.stats.queued -= 1
+                    state.stats.cancelled += 1
+                    self._dispatch(state)
+            raise
+
+        queue_seconds = time.monotonic() - waiter.enqueued_at
+        with self._lock:
+            stats = state.stats
+            stats.admitted += 1
+            stats.total_queue_seconds += queue_seconds
+            stats.max_queue_seconds = max(stats.max_queue_seconds, queue_seconds)
+            stats.queue_seconds_by_priority[priority.name] = (
+                stats.queue_seconds_by_priority.get(priority.name, 0.0) + queue_seconds
+            )
+            stats.admitted_by_priority[priority.name] = (
+                stats.admitted_by_priority.get(priority.name, 0) + 1
+            )
+
+        logger.debug(
+            "llm_request_admitted",
+            provider=provider_name,
+            priority=priority.name,
+            queue_ms=round(queue_seconds * 1000, 1),
+        )
+
+        try:
+            yield queue_seconds
+        finally:
+            with self._lock:
+                self._release(state)
+
+    def _release(self, state: _ProviderState) -> None:
+        """Free a slot and admit the next waiter. Caller holds the lock."""
+        state.stats.in_flight -= 1
+        state.stats.completed += 1
+        self._dispatch(state)
+
+    async def stream(
+        self,
+        provider: Any,
+        priority: Optional[RequestPriority] = None,
+        **execute_kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        """Run provider.execute_task once admitted, holding the slot while streaming.
+
+        Args:
+            provider: IAgentProvider instance
+            priority: Priority class (default: current priority_scope or WORKFLOW)
+            **execute_kwargs: Arguments for provider.execute_task
+
+        Yields:
+            Messages from the provider
+        """
+        async with self.slot(provider.name, priority):
+            async for message in provider.execute_task(**execute_kwargs):
+                yield message
+
+    def cancel_queued(
+        self,
+        provider_name: Optional[str] = None,
+        priority: Optional[RequestPriority] = None,
+    ) -> int:
+        """Cancel requests that are still waiting for admission.
+
+        In-flight requests are not affected. Each cancelled request raises
+        RequestCancelledError in its caller.
+
+        Args:
+            provider_name: Only cancel requests for this provider
+            priority: Only cancel requests of this priority
+
+        Returns:
+            Number of requests cancelled
+        """
+        cancelled = 0
+        with self._lock:
+            for name, state in self._states.items():
+                if provider_name is not None and name != provider_name:
+                    continue
+                for waiter in state.heap:
+                    if waiter.done or waiter.granted:
+                        continue
+                    if priority is not None and waiter.priority != priority:
+                        continue
+                    waiter.done = True
+                    state.stats.queued -= 1
+                    state.stats.cancelled += 1
+                    cancelled += 1
+                    _wake(waiter, RequestCancelledError(name))
+        if cancelled:
+            logger.info(
+                "llm_requests_cancelled",
+                provider=provider_name,
+                priority=priority.name if priority is not None else None,
+                count=cancelled,
+            )
+        return cancelled
+
+    def get_stats(self, provider_name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Snapshot queue metrics.
+
+        Args:
+            provider_name: Only include this provider
+
+        Returns:
+            Mapping of provider name to ProviderQueueStats.to_dict()
+        """
+        with self._lock:
+            return {
+                name: state.stats.to_dict()
+                for name, state in self._states.items()
+                if provider_name is None or name == provider_name
+            }
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """Return the process-wide scheduler, creating it on first use."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = LLMScheduler()
+    return _scheduler
+
+
+def reset_scheduler() -> None:
+    """Drop the process-wide scheduler (for tests)."""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = None
@@ -58,20 +58,29 @@ class AutoDetectStrategy(IProviderSelectionStrategy):
     1. Claude Code CLI (if installed)
     2. OpenCode CLI (if installed)
     3. Direct API (if API key available)
+
+    With a health checker, providers reported unhealthy (e.g. open circuit)
+    are skipped so selection fails over to the next provider in the chain.
     """
 
-    def __init__(self, fallback_chain: Optional[List[str]] = None):
+    def __init__(
+        self,
+        fallback_chain: Optional[List[str]] = None,
+        health_checker=None,
+    ):
         """
         Initialize auto-detect strategy.
 
         Args:
             fallback_chain: Provider names in order of preference
+            health_checker: Optional ProviderHealthChecker for failover
         """
         self.fallback_chain = fallback_chain or [
             "claude-code",
             "opencode",
             "direct-api",
         ]
+        self.health_checker = health_checker
 
     def select_provider(
         self,
@@ -92,6 +101,12 @@ class AutoDetectStrategy(IProviderSelectionStrategy):
             for provider in available_providers:
                 # Try exact match or prefix match
                 if provider.name == provider_name or provider.name.startswith(provider_name + "-"):
+                    if self.health_checker and not self.health_checker.is_healthy(provider.name):
+                        logger.info(
+                            "auto_detect_skipped_unhealthy_provider",
+                            provider=provider.name,
+                        )
+                        continue
                     logger.info(
                         "auto_detect_selected_provider",
                         provider=provider.name,
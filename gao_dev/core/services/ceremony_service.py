@@ -7,12 +7,9 @@ Epic: 24 - State Tables & Tracker
 Story: 24.5 - Implement CeremonyService
 
 Design Pattern: Service Layer
-Dependencies: sqlite3, structlog
+Dependencies: StateEngine, structlog
 """
 
-import sqlite3
-import threading
-from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -20,6 +17,8 @@ import json
 
 import structlog
 
+from gao_dev.core.services.state_engine import StateEngine
+
 logger = structlog.get_logger()
 
 
@@ -46,29 +45,16 @@ class CeremonyService:
         ```
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, engine: Optional[StateEngine] = None):
         """Initialize ceremony service."""
         self.db_path = Path(db_path)
-        self._local = threading.local()
+        self._owns_engine = engine is None
+        self.engine = engine or StateEngine(self.db_path)
         self.logger = logger.bind(service="ceremony")
 
-    @contextmanager
     def _get_connection(self):
-        """Get thread-local database connection with transaction handling."""
-        if not hasattr(self._local, "conn"):
-            self._local.conn = sqlite3.connect(
-                str(self.db_path), check_same_thread=False
-            )
-            self._local.conn.row_factory = sqlite3.Row
-            self._local.conn.execute("PRAGMA foreign_keys = ON")
-
-        try:
-            yield self._local.conn
-        except Exception:
-            self._local.conn.rollback()
-            raise
-        else:
-            self._local.conn.commit()
+        """Get database connection from the state engine with transaction handling."""
+        return self.engine.connection()
 
     def create_summary(
         self,
@@ -192,13 +178,9 @@ class CeremonyService:
             return [dict(row) for row in cursor.fetchall()]
 
     def close(self) -> None:
-        """Close database connection for current thread."""
-        if hasattr(self._local, "conn"):
-            try:
-                self._local.conn.close()
-            except Exception:
-                pass
-            delattr(self._local, "conn")
+        """Close database connection for current thread (unless the engine is shared)."""
+        if self._owns_engine:
+            self.engine.close()
 
     def __enter__(self):
         """Context manager entry."""
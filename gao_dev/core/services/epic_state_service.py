@@ -7,12 +7,10 @@ Epic: 24 - State Tables & Tracker
 Story: 24.2 - Implement EpicStateService
 
 Design Pattern: Service Layer
-Dependencies: sqlite3, structlog
+Dependencies: StateEngine, structlog
 """
 
 import sqlite3
-import threading
-from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -20,6 +18,8 @@ import json
 
 import structlog
 
+from gao_dev.core.services.state_engine import StateEngine
+
 logger = structlog.get_logger()
 
 
@@ -64,34 +64,22 @@ class EpicStateService:
         ```
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, engine: Optional[StateEngine] = None):
         """
         Initialize epic state service.
 
         Args:
             db_path: Path to SQLite database file
+            engine: Shared StateEngine (default: a private engine for db_path)
         """
         self.db_path = Path(db_path)
-        self._local = threading.local()
+        self._owns_engine = engine is None
+        self.engine = engine or StateEngine(self.db_path)
         self.logger = logger.bind(service="epic_state")
 
-    @contextmanager
     def _get_connection(self):
-        """Get thread-local database connection with transaction handling."""
-        if not hasattr(self._local, "conn"):
-            self._local.conn = sqlite3.connect(
-                str(self.db_path), check_same_thread=False
-            )
-            self._local.conn.row_factory = sqlite3.Row
-            self._local.conn.execute("PRAGMA foreign_keys = ON")
-
-        try:
-            yield self._local.conn
-        except Exception:
-            self._local.conn.rollback()
-            raise
-        else:
-            self._local.conn.commit()
+        """Get database connection from the state engine with transaction handling."""
+        return self.engine.connection()
 
     def create(
         self,
@@ -358,6 +346,29 @@ class EpicStateService:
 
             return [dict(row) for row in cursor.fetchall()]
 
+    def list_by_feature(self, feature: str) -> List[Dict[str, Any]]:
+        """
+        List epics belonging to a feature (metadata "feature" key).
+
+        Args:
+            feature: Feature name
+
+        Returns:
+            List of epic records for the feature
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT * FROM epic_state
+                WHERE json_extract(metadata, '$.feature') = ?
+                ORDER BY epic_num ASC
+                """,
+                (feature,),
+            )
+
+            return [dict(row) for row in cursor.fetchall()]
+
     def list(self) -> List[Dict[str, Any]]:
         """
         List all epics (including archived).
@@ -397,13 +408,9 @@ class EpicStateService:
             self.logger.info("epic_deleted", epic_num=epic_num)
 
     def close(self) -> None:
-        """Close database connection for current thread."""
-        if hasattr(self._local, "conn"):
-            try:
-                self._local.conn.close()
-            except Exception:
-                pass
-            delattr(self._local, "conn")
+        """Close database connection for current thread (unless the engine is shared)."""
+        if self._owns_engine:
+            self.engine.close()
 
     def __enter__(self):
         """Context manager entry."""
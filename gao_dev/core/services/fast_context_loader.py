@@ -135,13 +135,20 @@ class FastContextLoader:
 
         # Calculate summary (if requested)
         if include_summary:
-            stories = context["stories"] if include_stories else self.coordinator.story_service.list_by_epic(epic_num)
-
-            # Calculate summary statistics
-            total = len(stories)
-            completed = sum(1 for s in stories if s["status"] == "completed")
-            in_progress = sum(1 for s in stories if s["status"] == "in_progress")
-            blocked = sum(1 for s in stories if s["status"] == "blocked")
+            if include_stories:
+                # Stories are already loaded - count them
+                stories = context["stories"]
+                total = len(stories)
+                completed = sum(1 for s in stories if s["status"] == "completed")
+                in_progress = sum(1 for s in stories if s["status"] == "in_progress")
+                blocked = sum(1 for s in stories if s["status"] == "blocked")
+            else:
+                # Aggregate in SQL rather than loading every story
+                rollup = self.coordinator.rollup_service.get_epic_rollup(epic_num)
+                total = rollup["story_count"]
+                completed = rollup["completed_count"]
+                in_progress = rollup["in_progress_count"]
+                blocked = rollup["blocked_count"]
             progress = (completed / total * 100.0) if total > 0 else 0.0
 
             context["summary"] = {
@@ -7,12 +7,10 @@ Epic: 32 - State Service Integration
 Story: 32.1 - Create FeatureStateService
 
 Design Pattern: Service Layer (following Epic 24 pattern)
-Dependencies: sqlite3, structlog
+Dependencies: StateEngine, structlog
 """
 
 import sqlite3
-import threading
-from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -22,6 +20,8 @@ import json
 
 import structlog
 
+from gao_dev.core.services.state_engine import StateEngine
+
 logger = structlog.get_logger()
 
 
@@ -116,36 +116,25 @@ class FeatureStateService:
         ```
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, engine: Optional[StateEngine] = None):
         """
         Initialize feature state service.
 
         Args:
             project_root: Project root directory
+            engine: Shared StateEngine (default: a private engine for the
+                project database)
         """
         self.project_root = Path(project_root)
         self.db_path = self.project_root / ".gao-dev" / "documents.db"
-        self._local = threading.local()
+        self._owns_engine = engine is None
+        self.engine = engine or StateEngine(self.db_path)
         self.logger = logger.bind(service="feature_state")
         self._ensure_table()
 
-    @contextmanager
     def _get_connection(self):
-        """Get thread-local database connection with transaction handling."""
-        if not hasattr(self._local, "conn"):
-            self._local.conn = sqlite3.connect(
-                str(self.db_path), check_same_thread=False
-            )
-            self._local.conn.row_factory = sqlite3.Row
-            self._local.conn.execute("PRAGMA foreign_keys = ON")
-
-        try:
-            yield self._local.conn
-        except Exception:
-            self._local.conn.rollback()
-            raise
-        else:
-            self._local.conn.commit()
+        """Get database connection from the state engine with transaction handling."""
+        return self.engine.connection()
 
     def _ensure_table(self) -> None:
         """Create features table if not exists.
@@ -456,13 +445,9 @@ class FeatureStateService:
             return True
 
     def close(self) -> None:
-        """Close database connection for current thread."""
-        if hasattr(self._local, "conn"):
-            try:
-                self._local.conn.close()
-            except Exception:
-                pass
-            delattr(self._local, "conn")
+        """Close database connection for current thread (unless the engine is shared)."""
+        if self._owns_engine:
+            self.engine.close()
 
     def __enter__(self):
         """Context manager entry."""
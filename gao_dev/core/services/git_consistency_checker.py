@@ -16,6 +16,14 @@ Consistency Checks:
     3. Unregistered files (file exists but not in DB)
     4. State mismatches (DB state != git-inferred state)
 
+Incremental Checks:
+    After a check that finds no orphaned, unregistered or mismatched records,
+    the HEAD commit and check time are stored as a watermark. The next check
+    only re-examines files changed since the watermark (one
+    ``git diff --name-status <watermark> HEAD`` plus the working tree status)
+    and records updated in the database since the watermark time. Pass
+    ``full_scan=True`` (as repair does) to examine everything.
+
 Repair Strategy:
     - File is source of truth
     - Register untracked files
@@ -46,18 +54,32 @@ Example:
     ```
 """
 
+import json
+import re
+import sqlite3
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import structlog
 
 from gao_dev.core.git_manager import GitManager
+from gao_dev.core.services.git_migration_manager import infer_state_from_commit_message
 from gao_dev.core.state_coordinator import StateCoordinator
+from gao_dev.lifecycle.migrations.migration_008_epic_feature_index import Migration008
 
 logger = structlog.get_logger()
 
+WATERMARK_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS consistency_check_watermark (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    commit_sha TEXT NOT NULL,
+    checked_at TEXT NOT NULL
+)
+"""
+
 
 @dataclass
 class ConsistencyIssue:
@@ -85,6 +107,8 @@ class ConsistencyReport:
     unregistered_files: List[ConsistencyIssue] = field(default_factory=list)
     state_mismatches: List[ConsistencyIssue] = field(default_factory=list)
     all_issues: List[ConsistencyIssue] = field(default_factory=list)
+    full_scan: bool = True
+    since_commit: Optional[str] = None  # Watermark commit for incremental checks
 
     def __post_init__(self):
         """Calculate total issues after initialization."""
@@ -102,6 +126,15 @@ class GitAwareConsistencyCheckerError(Exception):
     pass
 
 
+@dataclass
+class _CheckScope:
+    """Files and records to re-examine in an incremental check."""
+
+    since_commit: str
+    since_time: str
+    paths: Set[str]
+
+
 class GitAwareConsistencyChecker:
     """
     Git-aware consistency checker for file-database sync validation.
@@ -185,8 +218,14 @@ class GitAwareConsistencyChecker:
                 if not cursor.fetchone():
                     missing_tables.append(table)
 
+            # Databases that applied Migration 005 before Migration 008 existed
+            feature_index_missing = not missing_tables and not Migration008.is_applied(conn)
+
             conn.close()
 
+            if feature_index_missing:
+                self._apply_missing_migrations()
+
             # If tables missing, apply migrations
             if missing_tables:
                 self.logger.warning(
@@ -223,7 +262,8 @@ class GitAwareConsistencyChecker:
         """
         Apply missing database migrations.
 
-        Runs Migration 005 (state tables) if not already applied.
+        Runs Migration 005 (state tables) and Migration 008 (epic feature
+        index) if not already applied.
         """
         import sqlite3
         import importlib
@@ -284,6 +324,13 @@ class GitAwareConsistencyChecker:
                     migration="005_add_state_tables"
                 )
 
+            if not Migration008.is_applied(conn):
+                Migration008.up(conn)
+                self.logger.info(
+                    "migration_applied",
+                    migration="008_epic_feature_index"
+                )
+
             conn.close()
 
         except Exception as e:
@@ -308,7 +355,7 @@ class GitAwareConsistencyChecker:
     # CONSISTENCY CHECKING
     # ============================================================================
 
-    def check_consistency(self) -> ConsistencyReport:
+    def check_consistency(self, full_scan: bool = False) -> ConsistencyReport:
         """
         Check file-database consistency using git awareness.
 
@@ -318,6 +365,15 @@ class GitAwareConsistencyChecker:
         3. Unregistered files (file exists but not in DB)
         4. State mismatches (DB state != git-inferred state)
 
+        Checks 2-4 are incremental when a watermark from a previous clean
+        check exists: only files changed since the watermark commit (or
+        uncommitted) and records updated since the watermark time are
+        examined. Without a watermark, or when the watermark commit is no
+        longer reachable, a full scan is performed.
+
+        Args:
+            full_scan: Examine every file and record, ignoring the watermark
+
         Returns:
             ConsistencyReport with all detected issues
 
@@ -331,17 +387,25 @@ class GitAwareConsistencyChecker:
                     print(f"[{issue.severity}] {issue.description}")
             ```
         """
-        self.logger.info("checking_consistency")
+        self.logger.info("checking_consistency", full_scan=full_scan)
 
         report = ConsistencyReport(
             timestamp=datetime.now(),
             has_issues=False,
         )
 
+        # Captured up front so changes made during the check are re-examined
+        head_sha = self._get_head_commit()
+        started_at = datetime.utcnow().isoformat()
+
         # Check 1: Uncommitted changes
         uncommitted = self._check_uncommitted_changes()
         report.uncommitted_changes = uncommitted
 
+        scope = None if full_scan else self._get_incremental_scope(uncommitted)
+        report.full_scan = scope is None
+        report.since_commit = scope.since_commit if scope else None
+
         if uncommitted:
             for file in uncommitted:
                 issue = ConsistencyIssue(
@@ -353,17 +417,17 @@ class GitAwareConsistencyChecker:
                 report.all_issues.append(issue)
 
         # Check 2: Orphaned DB records
-        orphaned = self._check_orphaned_records()
+        orphaned = self._check_orphaned_records(scope)
         report.orphaned_records = orphaned
         report.all_issues.extend(orphaned)
 
         # Check 3: Unregistered files
-        unregistered = self._check_unregistered_files()
+        unregistered = self._check_unregistered_files(scope)
         report.unregistered_files = unregistered
         report.all_issues.extend(unregistered)
 
         # Check 4: State mismatches
-        mismatches = self._check_state_mismatches()
+        mismatches = self._check_state_mismatches(scope)
         report.state_mismatches = mismatches
         report.all_issues.extend(mismatches)
 
@@ -371,8 +435,15 @@ class GitAwareConsistencyChecker:
         report.total_issues = len(report.all_issues)
         report.has_issues = report.total_issues > 0
 
+        # Uncommitted files are re-examined on every check, so only DB issues
+        # hold the watermark back
+        if head_sha and not (orphaned or unregistered or mismatches):
+            self._save_watermark(head_sha, started_at)
+
         self.logger.info(
             "consistency_check_complete",
+            full_scan=report.full_scan,
+            since_commit=report.since_commit,
             total_issues=report.total_issues,
             uncommitted=len(uncommitted),
             orphaned=len(orphaned),
@@ -493,10 +564,15 @@ class GitAwareConsistencyChecker:
             self.logger.error("check_uncommitted_failed", error=str(e))
             return []
 
-    def _check_orphaned_records(self) -> List[ConsistencyIssue]:
+    def _check_orphaned_records(
+        self, scope: Optional[_CheckScope] = None
+    ) -> List[ConsistencyIssue]:
         """
         Check for orphaned DB records (file deleted from filesystem).
 
+        Args:
+            scope: Incremental check scope (None checks every record)
+
         Returns:
             List of ConsistencyIssue for orphaned records
         """
@@ -507,11 +583,9 @@ class GitAwareConsistencyChecker:
             epics = self.coordinator.epic_service.list()
 
             for epic in epics:
-                file_path = epic.get("metadata", {}).get("file_path")
-
-                if file_path:
-                    full_path = self.project_path / file_path if not Path(file_path).is_absolute() else Path(file_path)
+                full_path = self._get_record_file_path(epic)
 
+                if full_path and self._in_scope(epic, full_path, scope):
                     # Check if file exists
                     if not full_path.exists():
                         # Check if file was deleted in git history
@@ -530,11 +604,9 @@ class GitAwareConsistencyChecker:
             stories = self.coordinator.story_service.list()
 
             for story in stories:
-                file_path = story.get("metadata", {}).get("file_path")
-
-                if file_path:
-                    full_path = self.project_path / file_path if not Path(file_path).is_absolute() else Path(file_path)
+                full_path = self._get_record_file_path(story)
 
+                if full_path and self._in_scope(story, full_path, scope):
                     if not full_path.exists():
                         was_deleted = self.git_manager.file_deleted_in_history(full_path)
 
@@ -557,35 +629,55 @@ class GitAwareConsistencyChecker:
             self.logger.error("check_orphaned_failed", error=str(e))
             return []
 
-    def _check_unregistered_files(self) -> List[ConsistencyIssue]:
+    def _check_unregistered_files(
+        self, scope: Optional[_CheckScope] = None
+    ) -> List[ConsistencyIssue]:
         """
         Check for unregistered files (file exists but not in DB).
 
+        Args:
+            scope: Incremental check scope (None scans all of docs/)
+
         Returns:
             List of ConsistencyIssue for unregistered files
         """
         issues = []
 
         try:
-            # Find all epic files
             docs_dir = self.project_path / "docs"
             if not docs_dir.exists():
                 return issues
 
+            if scope is None:
+                epic_files = sorted(docs_dir.rglob("epic-*.md"))
+                story_files = sorted(docs_dir.rglob("story-*.md"))
+            else:
+                # Only files added or modified since the watermark
+                candidates = sorted(
+                    self.project_path / path
+                    for path in scope.paths
+                    if Path(path).parts[:1] == ("docs",)
+                )
+                epic_files = [p for p in candidates if p.match("epic-*.md")]
+                story_files = [p for p in candidates if p.match("story-*.md")]
+
+            registered_epics = {
+                epic["epic_num"] for epic in self.coordinator.epic_service.list()
+            }
+            registered_stories = {
+                (story["epic_num"], story["story_num"])
+                for story in self.coordinator.story_service.list()
+            }
+
             # Check epic files
-            for epic_file in docs_dir.rglob("epic-*.md"):
+            for epic_file in epic_files:
                 if epic_file.is_file():
                     # Parse epic number from filename
-                    import re
                     match = re.search(r"epic-(\d+)", epic_file.name)
                     if match:
                         epic_num = int(match.group(1))
 
-                        # Check if in database
-                        try:
-                            self.coordinator.epic_service.get(epic_num)
-                        except Exception:
-                            # Not in database
+                        if epic_num not in registered_epics:
                             issues.append(ConsistencyIssue(
                                 issue_type="unregistered_file",
                                 severity="warning",
@@ -595,20 +687,15 @@ class GitAwareConsistencyChecker:
                             ))
 
             # Check story files
-            for story_file in docs_dir.rglob("story-*.md"):
+            for story_file in story_files:
                 if story_file.is_file():
                     # Parse story number from filename
-                    import re
                     match = re.search(r"story-(\d+)\.(\d+)", story_file.name)
                     if match:
                         epic_num = int(match.group(1))
                         story_num = int(match.group(2))
 
-                        # Check if in database
-                        try:
-                            self.coordinator.story_service.get(epic_num, story_num)
-                        except Exception:
-                            # Not in database
+                        if (epic_num, story_num) not in registered_stories:
                             issues.append(ConsistencyIssue(
                                 issue_type="unregistered_file",
                                 severity="warning",
@@ -627,42 +714,47 @@ class GitAwareConsistencyChecker:
             self.logger.error("check_unregistered_failed", error=str(e))
             return []
 
-    def _check_state_mismatches(self) -> List[ConsistencyIssue]:
+    def _check_state_mismatches(
+        self, scope: Optional[_CheckScope] = None
+    ) -> List[ConsistencyIssue]:
         """
         Check for state mismatches (DB state != git-inferred state).
 
+        Args:
+            scope: Incremental check scope (None checks every story)
+
         Returns:
             List of ConsistencyIssue for state mismatches
         """
         issues = []
 
         try:
-            # Check story states
-            stories = self.coordinator.story_service.list()
-
-            for story in stories:
-                file_path = story.get("metadata", {}).get("file_path")
-
-                if file_path:
-                    full_path = self.project_path / file_path if not Path(file_path).is_absolute() else Path(file_path)
-
-                    if full_path.exists():
-                        # Infer state from git
-                        git_state = self._infer_state_from_git(full_path)
-                        db_state = story["status"]
-
-                        # Check for mismatch
-                        if git_state != db_state:
-                            issues.append(ConsistencyIssue(
-                                issue_type="state_mismatch",
-                                severity="warning",
-                                description=f"Story {story['epic_num']}.{story['story_num']} state mismatch",
-                                file_path=full_path,
-                                epic_num=story["epic_num"],
-                                story_num=story["story_num"],
-                                db_state=db_state,
-                                git_state=git_state
-                            ))
+            # Collect stories to check, then infer all states in one git walk
+            candidates = []
+            for story in self.coordinator.story_service.list():
+                full_path = self._get_record_file_path(story)
+
+                if full_path and self._in_scope(story, full_path, scope) and full_path.exists():
+                    candidates.append((story, full_path))
+
+            git_states = self._infer_states_from_git([path for _, path in candidates])
+
+            for story, full_path in candidates:
+                git_state = git_states[full_path]
+                db_state = story["status"]
+
+                # Check for mismatch
+                if git_state != db_state:
+                    issues.append(ConsistencyIssue(
+                        issue_type="state_mismatch",
+                        severity="warning",
+                        description=f"Story {story['epic_num']}.{story['story_num']} state mismatch",
+                        file_path=full_path,
+                        epic_num=story["epic_num"],
+                        story_num=story["story_num"],
+                        db_state=db_state,
+                        git_state=git_state
+                    ))
 
             if issues:
                 self.logger.warning("state_mismatches_detected", count=len(issues))
@@ -721,8 +813,6 @@ class GitAwareConsistencyChecker:
                 content = issue.file_path.read_text(encoding="utf-8")
 
                 # Parse story metadata
-                import re
-
                 title_match = re.search(r"^#\s+Story\s+\d+\.\d+[:\s]+(.+)$", content, re.MULTILINE | re.IGNORECASE)
                 title = title_match.group(1).strip() if title_match else f"Story {issue.epic_num}.{issue.story_num}"
 
@@ -749,8 +839,6 @@ class GitAwareConsistencyChecker:
                 content = issue.file_path.read_text(encoding="utf-8")
 
                 # Parse epic metadata
-                import re
-
                 title_match = re.search(r"^#\s+Epic\s+\d+[:\s]+(.+)$", content, re.MULTILINE | re.IGNORECASE)
                 title = title_match.group(1).strip() if title_match else f"Epic {issue.epic_num}"
 
@@ -821,23 +909,186 @@ class GitAwareConsistencyChecker:
         try:
             commit_info = self.git_manager.get_last_commit_for_file(path)
 
-            if not commit_info:
-                return "pending"
+            return infer_state_from_commit_message(
+                commit_info["message"] if commit_info else None
+            )
 
-            message = commit_info["message"].lower()
+        except Exception:
+            return "pending"
 
-            # Check for completion keywords
-            if any(keyword in message for keyword in ["complete", "done", "finished", "feat("]):
-                return "completed"
+    def _infer_states_from_git(self, paths: List[Path]) -> Dict[Path, str]:
+        """
+        Infer states for many files with a single batched git log.
 
-            # Check for in-progress keywords
-            if any(keyword in message for keyword in ["wip", "progress", "working", "chore("]):
-                return "in_progress"
+        Args:
+            paths: Paths to files
 
-            return "pending"
+        Returns:
+            Dict mapping each path to "completed", "in_progress", or "pending"
+        """
+        if not paths:
+            return {}
 
+        try:
+            commits = self.git_manager.get_last_commits_for_files(paths)
         except Exception:
-            return "pending"
+            return {path: self._infer_state_from_git(path) for path in paths}
+
+        states = {}
+        for path in paths:
+            commit_info = commits.get(self._relative_key(path))
+            states[path] = infer_state_from_commit_message(
+                commit_info["message"] if commit_info else None
+            )
+        return states
+
+    def _get_record_file_path(self, record: Dict[str, Any]) -> Optional[Path]:
+        """
+        Get the absolute file path recorded in an epic/story record.
+
+        Args:
+            record: Row from epic_state/story_state (metadata may be a JSON string)
+
+        Returns:
+            Absolute path, or None if the record has no file_path
+        """
+        metadata = record.get("metadata")
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except ValueError:
+                return None
+
+        if not isinstance(metadata, dict) or not metadata.get("file_path"):
+            return None
+
+        path = Path(metadata["file_path"])
+        return path if path.is_absolute() else self.project_path / path
+
+    def _relative_key(self, path: Path) -> str:
+        """Return path relative to the repo root in POSIX form (git's path format)."""
+        try:
+            return Path(path).resolve().relative_to(self.git_manager.project_path).as_posix()
+        except ValueError:
+            return Path(path).as_posix()
+
+    def _in_scope(
+        self, record: Dict[str, Any], full_path: Path, scope: Optional[_CheckScope]
+    ) -> bool:
+        """Check whether a record must be examined in this check."""
+        if scope is None:
+            return True
+
+        if self._relative_key(full_path) in scope.paths:
+            return True
+
+        # Records changed in the database since the watermark
+        return (record.get("updated_at") or "") >= scope.since_time
+
+    # ============================================================================
+    # WATERMARK
+    # ============================================================================
+
+    def get_watermark(self) -> Optional[Dict[str, str]]:
+        """
+        Get the watermark of the last clean consistency check.
+
+        Returns:
+            Dict with keys: commit_sha, checked_at; None if no clean check yet
+        """
+        try:
+            with closing(sqlite3.connect(str(self.db_path))) as conn:
+                conn.execute(WATERMARK_TABLE_SQL)
+                row = conn.execute(
+                    "SELECT commit_sha, checked_at FROM consistency_check_watermark WHERE id = 1"
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning("watermark_read_failed", error=str(e))
+            return None
+
+        if not row:
+            return None
+
+        return {"commit_sha": row[0], "checked_at": row[1]}
+
+    def reset_watermark(self) -> None:
+        """Forget the watermark so the next check is a full scan."""
+        try:
+            with closing(sqlite3.connect(str(self.db_path))) as conn:
+                conn.execute(WATERMARK_TABLE_SQL)
+                conn.execute("DELETE FROM consistency_check_watermark")
+                conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning("watermark_reset_failed", error=str(e))
+
+    def _save_watermark(self, commit_sha: str, checked_at: str) -> None:
+        """Record a clean check at commit_sha / checked_at."""
+        try:
+            with closing(sqlite3.connect(str(self.db_path))) as conn:
+                conn.execute(WATERMARK_TABLE_SQL)
+                conn.execute(
+                    """
+                    INSERT INTO consistency_check_watermark (id, commit_sha, checked_at)
+                    VALUES (1, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        commit_sha = excluded.commit_sha,
+                        checked_at = excluded.checked_at
+                    """,
+                    (commit_sha, checked_at)
+                )
+                conn.commit()
+            self.logger.debug("watermark_saved", commit_sha=commit_sha[:7])
+        except sqlite3.Error as e:
+            self.logger.warning("watermark_save_failed", error=str(e))
+
+    def _get_head_commit(self) -> Optional[str]:
+        """Get full HEAD SHA, or None if the repo has no commits."""
+        try:
+            return self.git_manager.get_head_sha(short=False)
+        except Exception:
+            return None
+
+    def _get_incremental_scope(self, uncommitted: List[str]) -> Optional[_CheckScope]:
+        """
+        Build the incremental check scope from the watermark.
+
+        Args:
+            uncommitted: Working tree paths from the uncommitted changes check
+
+        Returns:
+            _CheckScope, or None if a full scan is required
+        """
+        watermark = self.get_watermark()
+        if watermark is None:
+            self.logger.info("no_consistency_watermark", message="Performing full scan")
+            return None
+
+        try:
+            changes = self.git_manager.get_changed_files_since(watermark["commit_sha"])
+        except Exception as e:
+            # Watermark commit gone (rebase, reset, gc) - start over
+            self.logger.warning(
+                "watermark_unreachable",
+                commit_sha=watermark["commit_sha"],
+                error=str(e),
+                message="Performing full scan"
+            )
+            return None
+
+        paths = {change["path"] for change in changes}
+        paths.update(uncommitted)
+
+        self.logger.info(
+            "incremental_consistency_scope",
+            since_commit=watermark["commit_sha"][:7],
+            changed_files=len(paths)
+        )
+
+        return _CheckScope(
+            since_commit=watermark["commit_sha"],
+            since_time=watermark["checked_at"],
+            paths=paths
+        )
 
     # ============================================================================
     # CONTEXT MANAGEMENT
@@ -11,7 +11,7 @@ Design Pattern: Orchestrator + Transaction
 Dependencies: GitManager, StateCoordinator, Migration005, structlog
 
 Migration Phases:
-    1. Create state tables (run Migration 005) - Commit checkpoint
+    1. Create state tables (run Migrations 005 and 008) - Commit checkpoint
     2. Backfill epics from filesystem - Commit checkpoint
     3. Backfill stories from filesystem (infer state from git) - Commit checkpoint
     4. Validate migration completeness - Commit checkpoint
@@ -52,9 +52,38 @@ import structlog
 
 from gao_dev.core.git_manager import GitManager
 from gao_dev.core.state_coordinator import StateCoordinator
+from gao_dev.lifecycle.migrations.migration_008_epic_feature_index import Migration008
 
 logger = structlog.get_logger()
 
+# Commit message keywords used to infer story state from git history
+COMPLETED_KEYWORDS = ("complete", "done", "finished", "feat(")
+IN_PROGRESS_KEYWORDS = ("wip", "progress", "working", "chore(")
+
+
+def infer_state_from_commit_message(message: Optional[str]) -> str:
+    """
+    Infer story state from the subject of the last commit touching its file.
+
+    Args:
+        message: Commit subject, or None if the file has no history
+
+    Returns:
+        Inferred status: "completed", "in_progress", or "pending"
+    """
+    if not message:
+        return "pending"
+
+    message = message.lower()
+
+    if any(keyword in message for keyword in COMPLETED_KEYWORDS):
+        return "completed"
+
+    if any(keyword in message for keyword in IN_PROGRESS_KEYWORDS):
+        return "in_progress"
+
+    return "pending"
+
 
 @dataclass
 class MigrationResult:
@@ -290,6 +319,7 @@ class GitMigrationManager:
             conn = sqlite3.connect(str(self.db_path))
             try:
                 Migration005.up(conn)
+                Migration008.up(conn)
                 conn.commit()
             finally:
                 conn.close()
@@ -424,13 +454,15 @@ class GitMigrationManager:
 
             self.logger.info("phase_3_found_story_files", count=len(story_files))
 
+            # Infer all story states from one batched git log walk
+            inferred_states = self._infer_story_states_from_git(story_files)
+
             # Process each story
             for story_file in story_files:
                 story_data = self._parse_story_file(story_file)
 
                 if story_data:
-                    # Infer state from git history
-                    inferred_status = self._infer_story_state_from_git(story_file)
+                    inferred_status = inferred_states.get(story_file, "pending")
 
                     # Create story in database
                     self.coordinator.create_story(
@@ -833,23 +865,10 @@ class GitMigrationManager:
             # Get last commit for file
             commit_info = self.git_manager.get_last_commit_for_file(path)
 
-            if not commit_info:
-                # No git history, assume pending
-                return "pending"
-
-            # Check commit message for keywords
-            message = commit_info["message"].lower()
-
-            # Check for completion keywords
-            if any(keyword in message for keyword in ["complete", "done", "finished", "feat("]):
-                return "completed"
-
-            # Check for in-progress keywords
-            if any(keyword in message for keyword in ["wip", "progress", "working", "chore("]):
-                return "in_progress"
-
-            # Default to pending
-            return "pending"
+            # No git history, assume pending
+            return infer_state_from_commit_message(
+                commit_info["message"] if commit_info else None
+            )
 
         except Exception as e:
             self.logger.warning(
@@ -859,6 +878,44 @@ class GitMigrationManager:
             )
             return "pending"
 
+    def _infer_story_states_from_git(self, paths: List[Path]) -> Dict[Path, str]:
+        """
+        Infer story states for many files with a single git history walk.
+
+        Same keyword logic as _infer_story_state_from_git(), but looks up the
+        last commit for every file in one batched ``git log`` instead of one
+        subprocess per story.
+
+        Args:
+            paths: Paths to story files
+
+        Returns:
+            Dict mapping each path to its inferred status
+        """
+        try:
+            commits = self.git_manager.get_last_commits_for_files(paths)
+        except Exception as e:
+            self.logger.warning("batch_state_inference_failed", error=str(e))
+            return {path: self._infer_story_state_from_git(path) for path in paths}
+
+        states = {}
+        for path in paths:
+            commit_info = commits.get(self._repo_relative_key(path))
+            states[path] = infer_state_from_commit_message(
+                commit_info["message"] if commit_info else None
+            )
+        return states
+
+    def _repo_relative_key(self, path: Path) -> str:
+        """Return path relative to the repo root in POSIX form (batch lookup key)."""
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.project_path / path
+        try:
+            return path.resolve().relative_to(self.git_manager.project_path).as_posix()
+        except ValueError:
+            return path.as_posix()
+
     # ============================================================================
     # CONTEXT MANAGEMENT
     # ============================================================================
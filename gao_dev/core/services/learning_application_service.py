@@ -7,9 +7,10 @@ Epic: 29 - Self-Learning Feedback Loop
 Story: 29.2 - LearningApplicationService
 
 Design Pattern: Service Layer
-Dependencies: LearningIndexService, sqlite3, structlog
+Dependencies: LearningIndexService, LearningRelevanceIndex, sqlite3, structlog
 """
 
+import json
 import math
 import sqlite3
 import threading
@@ -20,6 +21,13 @@ from typing import Optional, List, Dict, Any, NamedTuple
 
 import structlog
 
+from gao_dev.core.services.learning_relevance_index import (
+    ANY_PHASES,
+    CATEGORY_SCORES,
+    DEFAULT_CATEGORY_SCORE,
+    GENERAL_PROJECT_TYPES,
+    LearningRelevanceIndex,
+)
 from gao_dev.methodologies.adaptive_agile.scale_levels import ScaleLevel
 
 logger = structlog.get_logger()
@@ -82,6 +90,7 @@ class LearningApplicationService:
         """Initialize learning application service."""
         self.db_path = Path(db_path)
         self._local = threading.local()
+        self._index = LearningRelevanceIndex()
         self.logger = logger.bind(service="learning_application")
 
     @contextmanager
@@ -112,8 +121,9 @@ class LearningApplicationService:
         """
         Get relevant learnings with calculated relevance scores.
 
-        Query candidates (up to 50), score each using additive formula,
-        filter by threshold (>0.2), sort by score, return top N.
+        Scores every active learning in one vectorized pass over the in-memory
+        LearningRelevanceIndex (refreshed only when learning_index changed),
+        filters by threshold (>0.2) and returns the top N by score.
 
         Args:
             scale_level: Current project scale level
@@ -126,68 +136,57 @@ class LearningApplicationService:
         """
         start_time = datetime.now()
 
-        # Query candidate learnings (active only, limit 50 for performance)
-        category = context.get("category")
         with self._get_connection() as conn:
-            query = """
-                SELECT
-                    id, topic, category, learning, relevance_score,
-                    success_rate, confidence_score, application_count,
-                    indexed_at, metadata, tags
-                FROM learning_index
-                WHERE status = 'active'
-            """
-            params: List[Any] = []
-
-            if category:
-                query += " AND category = ?"
-                params.append(category)
-
-            query += " LIMIT 50"
-
-            cursor = conn.execute(query, params)
-            candidates = [dict(row) for row in cursor.fetchall()]
-
-        # Score each candidate
-        scored_learnings: List[tuple[float, ScoredLearning]] = []
-        for learning_dict in candidates:
-            # Parse JSON fields
-            import json
-
-            metadata = json.loads(learning_dict.get("metadata", "{}"))
-            tags = json.loads(learning_dict.get("tags", "[]"))
-
-            # Calculate relevance score
-            score = self._calculate_relevance_score(
-                learning_dict, scale_level, project_type, context
-            )
-
-            # Filter by threshold (lowered to 0.2 from 0.3)
-            if score > 0.2:
-                scored_learning = ScoredLearning(
-                    learning_id=learning_dict["id"],
-                    topic=learning_dict["topic"],
-                    category=learning_dict["category"],
-                    learning=learning_dict["learning"],
+            self._refresh_index(conn)
+
+            # Score all candidates at once (threshold lowered to 0.2 from 0.3)
+            ids, scores = self._index.score(scale_level, project_type, context)
+            top = LearningRelevanceIndex.top_k(ids, scores, k=limit, threshold=0.2)
+
+            # Load full rows only for the selected learnings
+            rows: Dict[int, sqlite3.Row] = {}
+            if top:
+                placeholders = ", ".join("?" for _ in top)
+                cursor = conn.execute(
+                    f"""
+                    SELECT
+                        id, topic, category, learning,
+                        success_rate, confidence_score, application_count,
+                        indexed_at, metadata, tags
+                    FROM learning_index
+                    WHERE id IN ({placeholders})
+                    """,
+                    [learning_id for learning_id, _ in top],
+                )
+                rows = {row["id"]: row for row in cursor.fetchall()}
+
+        results = []
+        for learning_id, score in top:
+            row = rows.get(learning_id)
+            if row is None:
+                continue  # Deleted since the index was refreshed
+
+            results.append(
+                ScoredLearning(
+                    learning_id=row["id"],
+                    topic=row["topic"],
+                    category=row["category"],
+                    learning=row["learning"],
                     relevance_score=score,
-                    success_rate=learning_dict["success_rate"],
-                    confidence_score=learning_dict["confidence_score"],
-                    application_count=learning_dict["application_count"],
-                    indexed_at=learning_dict["indexed_at"],
-                    metadata=metadata,
-                    tags=tags,
+                    success_rate=row["success_rate"],
+                    confidence_score=row["confidence_score"],
+                    application_count=row["application_count"],
+                    indexed_at=row["indexed_at"],
+                    metadata=json.loads(row["metadata"] or "{}"),
+                    tags=json.loads(row["tags"] or "[]"),
                 )
-                scored_learnings.append((score, scored_learning))
-
-        # Sort by score descending and return top N
-        scored_learnings.sort(key=lambda x: x[0], reverse=True)
-        results = [sl for _, sl in scored_learnings[:limit]]
+            )
 
         # Log performance
         elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
         self.logger.info(
             "get_relevant_learnings_completed",
-            candidates_evaluated=len(candidates),
+            candidates_evaluated=len(ids),
             results_returned=len(results),
             elapsed_ms=round(elapsed_ms, 2),
             scale_level=scale_level.value,
@@ -196,6 +195,24 @@ class LearningApplicationService:
 
         return results
 
+    def _refresh_index(self, conn: sqlite3.Connection) -> None:
+        """
+        Refresh the relevance index if learning_index may have changed.
+
+        PRAGMA data_version changes whenever another connection commits, so
+        an unchanged value means the index is current (this service's own
+        writes are applied to the index directly in record_application()).
+
+        Args:
+            conn: This thread's database connection
+        """
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if getattr(self._local, "index_data_version", None) == data_version:
+            return
+
+        self._index.refresh(conn)
+        self._local.index_data_version = data_version
+
     def _calculate_relevance_score(
         self,
         learning: Dict[str, Any],
@@ -301,7 +318,6 @@ class LearningApplicationService:
             Context similarity score in range [0.0, 1.0]
         """
         score = 0.0
-        import json
 
         # Parse metadata and tags
         metadata = json.loads(learning.get("metadata", "{}"))
@@ -327,7 +343,7 @@ class LearningApplicationService:
         learning_type = metadata.get("project_type")
         if learning_type == project_type:
             score += 0.20  # Exact match
-        elif learning_type in ["any", "general"]:
+        elif learning_type in GENERAL_PROJECT_TYPES:
             score += 0.15  # General learnings apply broadly
 
         # Tag overlap (30% weight) - Jaccard similarity with asymmetric handling (C11 Fix)
@@ -349,15 +365,7 @@ class LearningApplicationService:
 
         # Category relevance (15% weight) - Smart scoring
         learning_category = learning.get("category")
-        category_scores = {
-            "quality": 0.15,  # Always relevant
-            "architectural": 0.15,
-            "process": 0.12,
-            "technical": 0.10,
-            "communication": 0.08,
-            "tooling": 0.05,
-        }
-        score += category_scores.get(learning_category, 0.05)
+        score += CATEGORY_SCORES.get(learning_category, DEFAULT_CATEGORY_SCORE)
 
         # Temporal context (10% weight) - Similar phases
         learning_phase = metadata.get("phase")
@@ -365,7 +373,7 @@ class LearningApplicationService:
         if learning_phase and context_phase:
             if learning_phase == context_phase:
                 score += 0.10
-            elif learning_phase in ["any", "all_phases"]:
+            elif learning_phase in ANY_PHASES:
                 score += 0.05
 
         return min(score, 1.0)
@@ -432,6 +440,9 @@ class LearningApplicationService:
                 (stats["count"], stats["success_rate"], stats["confidence"], learning_id),
             )
 
+        # Keep the relevance index current without a full refresh
+        self._index.update_stats(learning_id, stats["success_rate"], stats["confidence"])
+
         # Log performance
         elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
         self.logger.info(
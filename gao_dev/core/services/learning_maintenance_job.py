@@ -4,6 +4,11 @@ This service performs automated maintenance on learning index to keep it relevan
 and performant through decay updates, low confidence deactivation, supersession,
 and old data pruning.
 
+Each step is set-based: decay and deactivation are single UPDATE statements,
+supersession is a sort-and-sweep over each category followed by one batched
+update. Incremental runs only consider learnings indexed or applied since the
+last completed run.
+
 Epic: 29 - Self-Learning Feedback Loop
 Story: 29.6 - Learning Decay & Confidence
 
@@ -17,7 +22,7 @@ import threading
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import NamedTuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import structlog
 
@@ -33,6 +38,7 @@ class MaintenanceReport(NamedTuple):
     pruned_applications: int
     execution_time_ms: float
     timestamp: str
+    incremental: bool = False
 
 
 class LearningMaintenanceJob:
@@ -47,6 +53,11 @@ class LearningMaintenanceJob:
 
     Performance target: <5 seconds for 1000 learnings
 
+    Every completed run is recorded in learning_maintenance_runs. With
+    incremental=True, deactivation and supersession only look at learnings
+    indexed or applied since the previous run started, and decay factors are
+    only rewritten where the value actually changed.
+
     Example:
         ```python
         job = LearningMaintenanceJob(db_path=Path(".gao-dev/documents.db"))
@@ -57,9 +68,35 @@ class LearningMaintenanceJob:
 
         # Dry run to preview changes
         report = job.run_maintenance(dry_run=True)
+
+        # Nightly run: only what changed since last time
+        report = job.run_maintenance(incremental=True)
         ```
     """
 
+    # Categories considered for supersession
+    SUPERSEDE_CATEGORIES = (
+        "quality", "process", "architectural", "technical", "team", "communication"
+    )
+
+    # Newer learning must beat an older one by more than this to supersede it
+    SUPERSEDE_MARGIN = 0.2
+
+    # Learnings indexed or applied since :since
+    _CHANGED_SINCE = """
+        (indexed_at >= :since OR EXISTS (
+            SELECT 1 FROM learning_applications a
+            WHERE a.learning_id = learning_index.id AND a.applied_at >= :since
+        ))
+    """
+
+    _LOW_CONFIDENCE = """
+        status = 'active'
+          AND confidence_score < 0.2
+          AND success_rate < 0.3
+          AND application_count >= 5
+    """
+
     def __init__(self, db_path: Path):
         """Initialize learning maintenance job."""
         self.db_path = Path(db_path)
@@ -75,6 +112,7 @@ class LearningMaintenanceJob:
             )
             self._local.conn.row_factory = sqlite3.Row
             self._local.conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn.create_function("learning_decay", 1, self._calculate_decay)
 
         try:
             yield self._local.conn
@@ -85,7 +123,7 @@ class LearningMaintenanceJob:
             self._local.conn.commit()
 
     def run_maintenance(
-        self, dry_run: bool = False, verbose: bool = False
+        self, dry_run: bool = False, verbose: bool = False, incremental: bool = False
     ) -> MaintenanceReport:
         """
         Run full maintenance cycle.
@@ -93,6 +131,8 @@ class LearningMaintenanceJob:
         Args:
             dry_run: If True, preview changes without committing
             verbose: If True, log detailed information
+            incremental: If True, only process learnings changed since the
+                last completed run (full run if there is none)
 
         Returns:
             MaintenanceReport with execution statistics
@@ -103,16 +143,19 @@ class LearningMaintenanceJob:
             "maintenance_started",
             dry_run=dry_run,
             verbose=verbose,
+            incremental=incremental,
             timestamp=start_time.isoformat(),
         )
 
         if dry_run:
             # Use separate connection for dry run (read-only queries)
             with self._get_connection() as conn:
+                since = self._last_run_started(conn) if incremental else None
+
                 # Preview changes without committing
-                decay_updates = self._count_decay_updates(conn)
-                deactivated = self._count_low_confidence_learnings(conn)
-                superseded = self._count_supersede_candidates(conn)
+                decay_updates = self._count_decay_updates(conn, since)
+                deactivated = self._count_low_confidence_learnings(conn, since)
+                superseded = self._count_supersede_candidates(conn, since)
                 pruned = self._count_old_applications(conn)
 
                 elapsed = (datetime.now() - start_time).total_seconds() * 1000
@@ -124,6 +167,7 @@ class LearningMaintenanceJob:
                     pruned_applications=pruned,
                     execution_time_ms=elapsed,
                     timestamp=start_time.isoformat(),
+                    incremental=since is not None,
                 )
 
                 if verbose:
@@ -133,21 +177,28 @@ class LearningMaintenanceJob:
 
         # Run actual maintenance
         with self._get_connection() as conn:
-            decay_updates = self._update_decay_factors(conn, verbose)
-            deactivated = self._deactivate_low_confidence_learnings(conn, verbose)
-            superseded = self._supersede_outdated_learnings(conn, verbose)
+            self._ensure_run_table(conn)
+            since = self._last_run_started(conn) if incremental else None
+            if incremental and since is None:
+                self.logger.info("maintenance_no_previous_run", fallback="full")
+
+            decay_updates = self._update_decay_factors(conn, verbose, since)
+            deactivated = self._deactivate_low_confidence_learnings(conn, verbose, since)
+            superseded = self._supersede_outdated_learnings(conn, verbose, since)
             pruned = self._prune_old_applications(conn, verbose)
 
-        elapsed = (datetime.now() - start_time).total_seconds() * 1000
+            elapsed = (datetime.now() - start_time).total_seconds() * 1000
 
-        report = MaintenanceReport(
-            decay_updates=decay_updates,
-            deactivated_count=deactivated,
-            superseded_count=superseded,
-            pruned_applications=pruned,
-            execution_time_ms=elapsed,
-            timestamp=start_time.isoformat(),
-        )
+            report = MaintenanceReport(
+                decay_updates=decay_updates,
+                deactivated_count=deactivated,
+                superseded_count=superseded,
+                pruned_applications=pruned,
+                execution_time_ms=elapsed,
+                timestamp=start_time.isoformat(),
+                incremental=since is not None,
+            )
+            self._record_run(conn, report)
 
         self.logger.info(
             "maintenance_completed",
@@ -156,6 +207,7 @@ class LearningMaintenanceJob:
             superseded_count=superseded,
             pruned_applications=pruned,
             execution_time_ms=round(elapsed, 2),
+            incremental=report.incremental,
         )
 
         if verbose:
@@ -163,61 +215,51 @@ class LearningMaintenanceJob:
 
         return report
 
-    def _update_decay_factors(self, conn: sqlite3.Connection, verbose: bool) -> int:
+    def _update_decay_factors(
+        self, conn: sqlite3.Connection, verbose: bool, since: Optional[str] = None
+    ) -> int:
         """
         Update decay factors for all active learnings (C10 Fix).
 
         Uses smooth exponential decay: decay = 0.5 + 0.5 * exp(-days/180)
         Results: 0d=1.0, 30d=0.92, 90d=0.81, 180d=0.68, 365d=0.56
 
+        Decay depends on age, so every active learning is considered; the
+        update is a single statement using the learning_decay() SQL function.
+
         Args:
             conn: Database connection
             verbose: If True, log detailed information
+            since: Incremental run marker; when set, rows whose decay factor is
+                already current are not rewritten
 
         Returns:
             Number of decay factors updated
         """
-        cursor = conn.cursor()
+        where = "status = 'active'"
+        if since is not None:
+            where += " AND decay_factor IS NOT learning_decay(indexed_at)"
 
-        # Get all active learnings
-        cursor.execute(
-            """
-            SELECT id, indexed_at
-            FROM learning_index
-            WHERE status = 'active'
-            """
-        )
-        learnings = cursor.fetchall()
-
-        updated_count = 0
-        for row in learnings:
-            learning_id = row["id"]
-            indexed_at = row["indexed_at"]
-
-            # Calculate decay factor
-            decay = self._calculate_decay(indexed_at)
-
-            # Update decay factor
-            cursor.execute(
-                """
-                UPDATE learning_index
-                SET decay_factor = ?
-                WHERE id = ?
-                """,
-                (decay, learning_id),
-            )
-
-            updated_count += 1
-
-            if verbose and updated_count <= 5:
+        if verbose:
+            for row in conn.execute(
+                f"SELECT id, indexed_at, learning_decay(indexed_at) AS decay "
+                f"FROM learning_index WHERE {where} LIMIT 5"
+            ):
                 self.logger.debug(
                     "decay_updated",
-                    learning_id=learning_id,
-                    decay_factor=round(decay, 3),
-                    indexed_at=indexed_at,
+                    learning_id=row["id"],
+                    decay_factor=round(row["decay"], 3),
+                    indexed_at=row["indexed_at"],
                 )
 
-        return updated_count
+        cursor = conn.execute(
+            f"""
+            UPDATE learning_index
+            SET decay_factor = learning_decay(indexed_at)
+            WHERE {where}
+            """
+        )
+        return cursor.rowcount
 
     def _calculate_decay(self, indexed_at: str) -> float:
         """
@@ -248,7 +290,7 @@ class LearningMaintenanceJob:
         return max(decay, 0.5)  # Floor at 0.5
 
     def _deactivate_low_confidence_learnings(
-        self, conn: sqlite3.Connection, verbose: bool
+        self, conn: sqlite3.Connection, verbose: bool, since: Optional[str] = None
     ) -> int:
         """
         Deactivate learnings with low confidence after sufficient applications.
@@ -261,71 +303,53 @@ class LearningMaintenanceJob:
         Args:
             conn: Database connection
             verbose: If True, log detailed information
+            since: Only consider learnings changed at or after this timestamp
 
         Returns:
             Number of learnings deactivated
         """
-        cursor = conn.cursor()
+        where = self._LOW_CONFIDENCE
+        if since is not None:
+            where += f" AND {self._CHANGED_SINCE}"
 
-        # Find learnings matching criteria
-        cursor.execute(
-            """
-            SELECT id, topic, confidence_score, success_rate, application_count
-            FROM learning_index
-            WHERE status = 'active'
-              AND confidence_score < 0.2
-              AND success_rate < 0.3
-              AND application_count >= 5
-            """
-        )
-        learnings = cursor.fetchall()
-
-        deactivated_count = 0
-        for row in learnings:
-            learning_id = row["id"]
-
-            # Get current metadata or create new
-            import json
-
-            cursor.execute("SELECT metadata FROM learning_index WHERE id = ?", (learning_id,))
-            current_metadata = cursor.fetchone()["metadata"]
-
-            if current_metadata:
-                metadata_dict = json.loads(current_metadata)
-            else:
-                metadata_dict = {}
-
-            # Add deactivation info
-            metadata_dict["deactivated_reason"] = "Low confidence after 5+ applications"
-            metadata_dict["deactivated_at"] = datetime.now().isoformat()
-
-            # Deactivate learning
-            cursor.execute(
-                """
-                UPDATE learning_index
-                SET status = 'inactive',
-                    metadata = ?
-                WHERE id = ?
+        if verbose:
+            for row in conn.execute(
+                f"""
+                SELECT id, topic, confidence_score, success_rate, application_count
+                FROM learning_index WHERE {where}
                 """,
-                (json.dumps(metadata_dict), learning_id),
-            )
-
-            deactivated_count += 1
-
-            if verbose:
+                {"since": since},
+            ):
                 self.logger.info(
                     "learning_deactivated",
-                    learning_id=learning_id,
+                    learning_id=row["id"],
                     topic=row["topic"],
                     confidence=round(row["confidence_score"], 3),
                     success_rate=round(row["success_rate"], 3),
                     applications=row["application_count"],
                 )
 
-        return deactivated_count
+        cursor = conn.execute(
+            f"""
+            UPDATE learning_index
+            SET status = 'inactive',
+                metadata = json_set(
+                    COALESCE(NULLIF(metadata, ''), '{{}}'),
+                    '$.deactivated_reason', :reason,
+                    '$.deactivated_at', :now
+                )
+            WHERE {where}
+            """,
+            {
+                "since": since,
+                "reason": "Low confidence after 5+ applications",
+                "now": datetime.now().isoformat(),
+            },
+        )
+        return cursor.rowcount
 
     def _supersede_outdated_learnings(
-        self, conn: sqlite3.Connection, verbose: bool
+        self, conn: sqlite3.Connection, verbose: bool, since: Optional[str] = None
     ) -> int:
         """
         Mark older learnings superseded by newer ones.
@@ -337,64 +361,123 @@ class LearningMaintenanceJob:
         Args:
             conn: Database connection
             verbose: If True, log detailed information
+            since: Only consider learnings changed at or after this timestamp
 
         Returns:
             Number of learnings superseded
         """
-        cursor = conn.cursor()
+        supersessions = self._find_supersessions(conn, since)
 
-        superseded_count = 0
+        conn.executemany(
+            """
+            UPDATE learning_index
+            SET superseded_by = ?,
+                status = 'superseded'
+            WHERE id = ?
+            """,
+            [(newer["id"], older["id"]) for older, newer in supersessions],
+        )
 
-        # Get all categories
-        categories = ["quality", "process", "architectural", "technical", "team", "communication"]
+        if verbose:
+            for older, newer in supersessions:
+                self.logger.info(
+                    "learning_superseded",
+                    old_id=older["id"],
+                    old_topic=older["topic"],
+                    old_confidence=round(older["confidence_score"], 3),
+                    new_id=newer["id"],
+                    new_topic=newer["topic"],
+                    new_confidence=round(newer["confidence_score"], 3),
+                    confidence_delta=round(
+                        newer["confidence_score"] - older["confidence_score"], 3
+                    ),
+                )
+
+        return len(supersessions)
+
+    def _find_supersessions(
+        self, conn: sqlite3.Connection, since: Optional[str] = None
+    ) -> List[Tuple[sqlite3.Row, sqlite3.Row]]:
+        """
+        Find (older, newer) supersession pairs with a sort-and-sweep.
+
+        Each category is walked newest first while tracking the most confident
+        learning seen so far. A learning is superseded when that learning beats
+        it by more than SUPERSEDE_MARGIN, and it then points at that learning
+        (the strongest newer replacement) rather than at an intermediate one.
+
+        In incremental mode only categories with changed learnings are
+        walked, and only up to the newest changed learning in each; anything
+        newer can only act as the replacement, so it seeds the sweep with a
+        single MAX() lookup.
 
-        for category in categories:
-            # Get learnings in this category, ordered by indexed_at DESC
-            cursor.execute(
-                """
-                SELECT id, topic, confidence_score, indexed_at
+        Args:
+            conn: Database connection
+            since: Only consider learnings changed at or after this timestamp
+
+        Returns:
+            List of (older, newer) rows with id, topic and confidence_score
+        """
+        active = "status = 'active' AND superseded_by IS NULL"
+        candidates = f"category = :category AND {active}"
+        supersessions = []
+
+        # Newest changed learning per category (None: walk the whole category)
+        cutoffs: Dict[str, Optional[str]] = dict.fromkeys(self.SUPERSEDE_CATEGORIES)
+        if since is not None:
+            changed = dict(
+                conn.execute(
+                    f"""
+                    SELECT category, MAX(indexed_at) FROM learning_index
+                    WHERE {active} AND {self._CHANGED_SINCE}
+                    GROUP BY category
+                    """,
+                    {"since": since},
+                ).fetchall()
+            )
+            cutoffs = {
+                category: changed[category]
+                for category in self.SUPERSEDE_CATEGORIES
+                if changed.get(category) is not None
+            }
+
+        for category, cutoff in cutoffs.items():
+            params = {"category": category, "since": since}
+            sweep = candidates
+            best = None
+
+            if cutoff is not None:
+                params["cutoff"] = cutoff
+                sweep += " AND indexed_at <= :cutoff"
+                seed = conn.execute(
+                    f"""
+                    SELECT id, topic, MAX(confidence_score) AS confidence_score
+                    FROM learning_index
+                    WHERE {candidates} AND indexed_at > :cutoff
+                    """,
+                    params,
+                ).fetchone()
+                if seed["id"] is not None:
+                    best = seed
+
+            for row in conn.execute(
+                f"""
+                SELECT id, topic, confidence_score
                 FROM learning_index
-                WHERE category = ?
-                  AND status = 'active'
-                  AND superseded_by IS NULL
-                ORDER BY indexed_at DESC
+                WHERE {sweep}
+                ORDER BY indexed_at DESC, id DESC
                 """,
-                (category,),
-            )
-            learnings = cursor.fetchall()
-
-            # Compare newer learnings with older ones
-            for i, newer in enumerate(learnings):
-                for older in learnings[i + 1 :]:
-                    # Check if newer clearly outperforms older
-                    confidence_delta = newer["confidence_score"] - older["confidence_score"]
-                    if confidence_delta > 0.2:
-                        # Supersede older learning
-                        cursor.execute(
-                            """
-                            UPDATE learning_index
-                            SET superseded_by = ?,
-                                status = 'superseded'
-                            WHERE id = ?
-                            """,
-                            (newer["id"], older["id"]),
-                        )
-
-                        superseded_count += 1
-
-                        if verbose:
-                            self.logger.info(
-                                "learning_superseded",
-                                old_id=older["id"],
-                                old_topic=older["topic"],
-                                old_confidence=round(older["confidence_score"], 3),
-                                new_id=newer["id"],
-                                new_topic=newer["topic"],
-                                new_confidence=round(newer["confidence_score"], 3),
-                                confidence_delta=round(confidence_delta, 3),
-                            )
-
-        return superseded_count
+                params,
+            ):
+                if (
+                    best is not None
+                    and best["confidence_score"] - row["confidence_score"] > self.SUPERSEDE_MARGIN
+                ):
+                    supersessions.append((row, best))
+                elif best is None or row["confidence_score"] > best["confidence_score"]:
+                    best = row
+
+        return supersessions
 
     def _prune_old_applications(self, conn: sqlite3.Connection, verbose: bool) -> int:
         """
@@ -412,17 +495,6 @@ class LearningMaintenanceJob:
         # Calculate cutoff date (1 year ago)
         cutoff_date = (datetime.now() - timedelta(days=365)).isoformat()
 
-        # Count applications to be deleted
-        cursor.execute(
-            """
-            SELECT COUNT(*) as count
-            FROM learning_applications
-            WHERE applied_at < ?
-            """,
-            (cutoff_date,),
-        )
-        count = cursor.fetchone()["count"]
-
         # Delete old applications
         cursor.execute(
             """
@@ -431,6 +503,7 @@ class LearningMaintenanceJob:
             """,
             (cutoff_date,),
         )
+        count = cursor.rowcount
 
         if verbose and count > 0:
             self.logger.info(
@@ -443,51 +516,36 @@ class LearningMaintenanceJob:
 
     # Dry-run preview methods
 
-    def _count_decay_updates(self, conn: sqlite3.Connection) -> int:
+    def _count_decay_updates(
+        self, conn: sqlite3.Connection, since: Optional[str] = None
+    ) -> int:
         """Count active learnings that would have decay updated."""
+        where = "status = 'active'"
+        if since is not None:
+            where += " AND decay_factor IS NOT learning_decay(indexed_at)"
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT COUNT(*) as count
-            FROM learning_index
-            WHERE status = 'active'
-            """
-        )
+        cursor.execute(f"SELECT COUNT(*) as count FROM learning_index WHERE {where}")
         return cursor.fetchone()["count"]
 
-    def _count_low_confidence_learnings(self, conn: sqlite3.Connection) -> int:
+    def _count_low_confidence_learnings(
+        self, conn: sqlite3.Connection, since: Optional[str] = None
+    ) -> int:
         """Count learnings that would be deactivated."""
+        where = self._LOW_CONFIDENCE
+        if since is not None:
+            where += f" AND {self._CHANGED_SINCE}"
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT COUNT(*) as count
-            FROM learning_index
-            WHERE status = 'active'
-              AND confidence_score < 0.2
-              AND success_rate < 0.3
-              AND application_count >= 5
-            """
+            f"SELECT COUNT(*) as count FROM learning_index WHERE {where}",
+            {"since": since},
         )
         return cursor.fetchone()["count"]
 
-    def _count_supersede_candidates(self, conn: sqlite3.Connection) -> int:
-        """Count learnings that would be superseded (approximate)."""
-        # This is an approximation since actual count requires complex logic
-        # For dry-run purposes, we'll count potentially supersedable learnings
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT category, COUNT(*) as count
-            FROM learning_index
-            WHERE status = 'active'
-              AND superseded_by IS NULL
-            GROUP BY category
-            HAVING count > 1
-            """
-        )
-        # Estimate ~10% might be superseded
-        total = sum(row["count"] for row in cursor.fetchall())
-        return int(total * 0.1)
+    def _count_supersede_candidates(
+        self, conn: sqlite3.Connection, since: Optional[str] = None
+    ) -> int:
+        """Count learnings that would be superseded."""
+        return len(self._find_supersessions(conn, since))
 
     def _count_old_applications(self, conn: sqlite3.Connection) -> int:
         """Count applications older than 1 year."""
@@ -503,6 +561,56 @@ class LearningMaintenanceJob:
         )
         return cursor.fetchone()["count"]
 
+    # Run bookkeeping
+
+    def _ensure_run_table(self, conn: sqlite3.Connection) -> None:
+        """Create the maintenance run log if it does not exist."""
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS learning_maintenance_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at TEXT NOT NULL,
+                completed_at TEXT NOT NULL,
+                incremental INTEGER NOT NULL,
+                decay_updates INTEGER NOT NULL,
+                deactivated_count INTEGER NOT NULL,
+                superseded_count INTEGER NOT NULL,
+                pruned_applications INTEGER NOT NULL
+            )
+            """
+        )
+
+    def _last_run_started(self, conn: sqlite3.Connection) -> Optional[str]:
+        """Start time of the last completed run, or None if there is none."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'learning_maintenance_runs'"
+        ).fetchone()
+        if not exists:
+            return None
+        return conn.execute(
+            "SELECT MAX(started_at) FROM learning_maintenance_runs"
+        ).fetchone()[0]
+
+    def _record_run(self, conn: sqlite3.Connection, report: MaintenanceReport) -> None:
+        """Record a completed run (in the same transaction as its changes)."""
+        conn.execute(
+            """
+            INSERT INTO learning_maintenance_runs (
+                started_at, completed_at, incremental, decay_updates,
+                deactivated_count, superseded_count, pruned_applications
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                report.timestamp,
+                datetime.now().isoformat(),
+                int(report.incremental),
+                report.decay_updates,
+                report.deactivated_count,
+                report.superseded_count,
+                report.pruned_applications,
+            ),
+        )
+
     def _log_report(self, report: MaintenanceReport, dry_run: bool) -> None:
         """Log detailed report information."""
         mode = "DRY RUN" if dry_run else "COMPLETED"
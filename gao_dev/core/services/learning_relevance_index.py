@@ -0,0 +1,447 @@
+"""Learning Relevance Index - Columnar view of learning_index for vectorized scoring.
+
+Holds the scoring inputs of every active learning as NumPy arrays (base
+scores, indexed_at timestamps, encoded metadata and tag bitsets) so
+LearningApplicationService can score all candidates in a single vectorized
+pass instead of parsing JSON and scoring row by row.
+
+The arrays are rebuilt from learning_index on refresh, but JSON metadata
+and tags are only parsed for rows that are new or whose raw columns changed.
+
+Epic: 29 - Self-Learning Feedback Loop
+
+Design Pattern: Repository (in-memory read model)
+Dependencies: numpy, sqlite3, structlog
+"""
+
+import json
+import math
+import sqlite3
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import structlog
+
+from gao_dev.methodologies.adaptive_agile.scale_levels import ScaleLevel
+
+logger = structlog.get_logger()
+
+# Category relevance contribution to context similarity (15% weight)
+CATEGORY_SCORES = {
+    "quality": 0.15,  # Always relevant
+    "architectural": 0.15,
+    "process": 0.12,
+    "technical": 0.10,
+    "communication": 0.08,
+    "tooling": 0.05,
+}
+DEFAULT_CATEGORY_SCORE = 0.05
+
+GENERAL_PROJECT_TYPES = ("any", "general")
+ANY_PHASES = ("any", "all_phases")
+
+_EPOCH = datetime(1970, 1, 1)
+_SECONDS_PER_DAY = 86400.0
+
+
+def _naive_seconds(indexed_at: Any) -> float:
+    """Convert an ISO timestamp to naive seconds since epoch (NaN if invalid)."""
+    try:
+        indexed = datetime.fromisoformat(indexed_at)
+    except (TypeError, ValueError):
+        return math.nan
+    if indexed.tzinfo is not None:
+        indexed = indexed.astimezone().replace(tzinfo=None)
+    return (indexed - _EPOCH).total_seconds()
+
+
+def _hashable(value: Any) -> Hashable:
+    """Return value if hashable, else its JSON text (for vocabulary encoding)."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return json.dumps(value, sort_keys=True, default=str)
+
+
+@dataclass(frozen=True)
+class _RowFeatures:
+    """Parsed, context-independent features of one learning."""
+
+    raw: Tuple[Any, Any, Any]  # (indexed_at, metadata, tags) as stored
+    indexed_seconds: float
+    scale_level: float  # NaN when unknown
+    project_type: int
+    phase: int  # -1 when the learning has no phase
+    tags: np.ndarray  # Tag vocabulary indices
+
+
+@dataclass(frozen=True)
+class _Columns:
+    """Immutable snapshot of the scoring columns (one entry per active learning)."""
+
+    ids: np.ndarray
+    base_relevance: np.ndarray
+    success_rate: np.ndarray
+    confidence: np.ndarray
+    indexed_seconds: np.ndarray
+    scale_level: np.ndarray
+    project_type: np.ndarray
+    is_general_type: np.ndarray
+    phase: np.ndarray
+    is_any_phase: np.ndarray
+    category: np.ndarray
+    category_score: np.ndarray
+    tag_bits: np.ndarray  # (rows, words) uint64 bitsets
+    tag_counts: np.ndarray
+
+
+class LearningRelevanceIndex:
+    """
+    In-memory columnar index of active learnings.
+
+    Scores computed by score() match
+    LearningApplicationService._calculate_relevance_score() for every row.
+    Refreshing and scoring are thread-safe: refresh() swaps in a new
+    immutable snapshot that concurrent score() calls never observe half-built.
+
+    Example:
+        ```python
+        index = LearningRelevanceIndex()
+        index.refresh(conn)
+        ids, scores = index.score(ScaleLevel.LEVEL_2_SMALL_FEATURE, "web_app", {"tags": ["react"]})
+        top_ids = index.top_k(ids, scores, k=5, threshold=0.2)
+        ```
+    """
+
+    def __init__(self):
+        """Initialize empty index."""
+        self._lock = threading.Lock()
+        self._features: Dict[int, _RowFeatures] = {}
+        self._project_types: Dict[Hashable, int] = {}
+        self._phases: Dict[Hashable, int] = {}
+        self._categories: Dict[Hashable, int] = {}
+        self._tags: Dict[Hashable, int] = {}
+        self._columns = self._build_columns([], [], [], [], [], [])
+        self.logger = logger.bind(service="learning_relevance_index")
+
+    def __len__(self) -> int:
+        """Number of active learnings in the index."""
+        return len(self._columns.ids)
+
+    # ============================================================================
+    # REFRESH
+    # ============================================================================
+
+    def refresh(self, conn: sqlite3.Connection) -> int:
+        """
+        Rebuild the columns from the active rows of learning_index.
+
+        Numeric columns are re-read for every row; metadata and tags are only
+        parsed for rows that are new or whose raw values changed.
+
+        Args:
+            conn: Database connection
+
+        Returns:
+            Number of rows whose metadata/tags were (re)parsed
+        """
+        cursor = conn.execute(
+            """
+            SELECT id, category, relevance_score, success_rate, confidence_score,
+                   indexed_at, metadata, tags
+            FROM learning_index
+            WHERE status = 'active'
+            ORDER BY id
+            """
+        )
+        rows = cursor.fetchall()
+
+        with self._lock:
+            features: Dict[int, _RowFeatures] = {}
+            parsed = 0
+            for row in rows:
+                learning_id = row[0]
+                raw = (row[5], row[6], row[7])
+                cached = self._features.get(learning_id)
+                if cached is None or cached.raw != raw:
+                    cached = self._parse_row(raw)
+                    parsed += 1
+                features[learning_id] = cached
+            self._features = features
+
+            self._columns = self._build_columns(
+                [row[0] for row in rows],
+                [row[1] for row in rows],
+                [row[2] for row in rows],
+                [row[3] for row in rows],
+                [row[4] for row in rows],
+                [features[row[0]] for row in rows],
+            )
+
+        self.logger.debug("learning_relevance_index_refreshed", rows=len(rows), parsed=parsed)
+        return parsed
+
+    def update_stats(self, learning_id: int, success_rate: float, confidence: float) -> None:
+        """
+        Apply updated application statistics for one learning.
+
+        Lets the owning service keep the index current after its own writes
+        without a refresh.
+
+        Args:
+            learning_id: Learning ID
+            success_rate: New success rate
+            confidence: New confidence score
+        """
+        with self._lock:
+            columns = self._columns
+            positions = np.flatnonzero(columns.ids == learning_id)
+            if positions.size == 0:
+                return
+
+            success = columns.success_rate.copy()
+            confidence_scores = columns.confidence.copy()
+            success[positions] = success_rate
+            confidence_scores[positions] = confidence
+            self._columns = replace(columns, success_rate=success, confidence=confidence_scores)
+
+    def _parse_row(self, raw: Tuple[Any, Any, Any]) -> _RowFeatures:
+        """Parse indexed_at, metadata and tags of one row into encoded features."""
+        indexed_at, metadata_raw, tags_raw = raw
+
+        metadata = json.loads(metadata_raw) if metadata_raw else {}
+        if not isinstance(metadata, dict):
+            metadata = {}
+        tags = json.loads(tags_raw) if isinstance(tags_raw, str) else (tags_raw or [])
+
+        scale = metadata.get("scale_level")
+        if isinstance(scale, (int, float)):
+            scale_level = float(scale)
+        else:
+            scale_level = math.nan
+
+        phase = metadata.get("phase")
+        tag_indices = sorted({self._encode(self._tags, _hashable(tag)) for tag in tags})
+
+        return _RowFeatures(
+            raw=raw,
+            indexed_seconds=_naive_seconds(indexed_at),
+            scale_level=scale_level,
+            project_type=self._encode(self._project_types, _hashable(metadata.get("project_type"))),
+            phase=self._encode(self._phases, _hashable(phase)) if phase else -1,
+            tags=np.asarray(tag_indices, dtype=np.int64),
+        )
+
+    @staticmethod
+    def _encode(vocabulary: Dict[Hashable, int], value: Hashable) -> int:
+        """Return the vocabulary code for value, adding it if new."""
+        code = vocabulary.get(value)
+        if code is None:
+            code = vocabulary[value] = len(vocabulary)
+        return code
+
+    def _build_columns(
+        self,
+        ids: List[int],
+        categories: List[Any],
+        base_relevance: List[Optional[float]],
+        success_rate: List[Optional[float]],
+        confidence: List[Optional[float]],
+        features: List[_RowFeatures],
+    ) -> _Columns:
+        """Assemble the column arrays from row values (NULLs get column defaults)."""
+        count = len(ids)
+        general_codes = [self._project_types[t] for t in GENERAL_PROJECT_TYPES if t in self._project_types]
+        any_phase_codes = [self._phases[p] for p in ANY_PHASES if p in self._phases]
+
+        category_codes = np.fromiter(
+            (self._encode(self._categories, _hashable(c)) for c in categories), dtype=np.int64, count=count
+        )
+        category_score = np.fromiter(
+            (CATEGORY_SCORES.get(c, DEFAULT_CATEGORY_SCORE) if isinstance(c, str) else DEFAULT_CATEGORY_SCORE
+             for c in categories),
+            dtype=np.float64,
+            count=count,
+        )
+
+        project_type = np.fromiter((f.project_type for f in features), dtype=np.int64, count=count)
+        phase = np.fromiter((f.phase for f in features), dtype=np.int64, count=count)
+
+        # Tag bitsets: bit t of row i set when learning i has tag t
+        words = max(1, (len(self._tags) + 63) // 64)
+        tag_bits = np.zeros((count, words), dtype=np.uint64)
+        tag_counts = np.fromiter((f.tags.size for f in features), dtype=np.int64, count=count)
+        if count and tag_counts.any():
+            tag_index = np.concatenate([f.tags for f in features])
+            row_index = np.repeat(np.arange(count), tag_counts)
+            np.bitwise_or.at(
+                tag_bits,
+                (row_index, tag_index >> 6),
+                np.left_shift(np.uint64(1), (tag_index & 63).astype(np.uint64)),
+            )
+
+        return _Columns(
+            ids=np.asarray(ids, dtype=np.int64),
+            base_relevance=self._float_column(base_relevance, 0.5),
+            success_rate=self._float_column(success_rate, 1.0),
+            confidence=self._float_column(confidence, 0.5),
+            indexed_seconds=np.fromiter((f.indexed_seconds for f in features), dtype=np.float64, count=count),
+            scale_level=np.fromiter((f.scale_level for f in features), dtype=np.float64, count=count),
+            project_type=project_type,
+            is_general_type=np.isin(project_type, general_codes),
+            phase=phase,
+            is_any_phase=np.isin(phase, any_phase_codes),
+            category=category_codes,
+            category_score=category_score,
+            tag_bits=tag_bits,
+            tag_counts=tag_counts,
+        )
+
+    @staticmethod
+    def _float_column(values: List[Optional[float]], default: float) -> np.ndarray:
+        """Convert values to a float64 array, substituting default for NULL."""
+        return np.fromiter(
+            (default if v is None else v for v in values), dtype=np.float64, count=len(values)
+        )
+
+    # ============================================================================
+    # SCORING
+    # ============================================================================
+
+    def score(
+        self,
+        scale_level: ScaleLevel,
+        project_type: str,
+        context: Dict[str, Any],
+        now: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every indexed learning (optionally filtered by context category).
+
+        Uses the same additive formula as
+        LearningApplicationService._calculate_relevance_score().
+
+        Args:
+            scale_level: Current project scale level
+            project_type: Project type
+            context: Execution context with tags, phase, category
+            now: Reference time for decay (default: datetime.now())
+
+        Returns:
+            Tuple of (learning ids, relevance scores) arrays in id order
+        """
+        columns = self._columns
+
+        category = context.get("category")
+        if category:
+            code = self._categories.get(_hashable(category), -1)
+            selected = np.flatnonzero(columns.category == code)
+        else:
+            selected = slice(None)
+
+        # Decay: 0.5 + 0.5 * exp(-days/180), whole days as timedelta.days
+        now_seconds = ((now or datetime.now()) - _EPOCH).total_seconds()
+        days_old = np.floor((now_seconds - columns.indexed_seconds[selected]) / _SECONDS_PER_DAY)
+        decay = 0.5 + 0.5 * np.exp(-days_old / 180)
+        decay = np.where(np.isnan(decay), 0.5, decay)  # Unparseable indexed_at: oldest
+
+        similarity = self._context_similarity(columns, selected, scale_level, project_type, context)
+
+        scores = (
+            0.30 * columns.base_relevance[selected]
+            + 0.20 * columns.success_rate[selected]
+            + 0.20 * columns.confidence[selected]
+            + 0.15 * decay
+            + 0.15 * similarity
+        )
+        return columns.ids[selected], np.clip(scores, 0.0, 1.0)
+
+    def _context_similarity(
+        self,
+        columns: _Columns,
+        selected: Any,
+        scale_level: ScaleLevel,
+        project_type: str,
+        context: Dict[str, Any],
+    ) -> np.ndarray:
+        """Vectorized LearningApplicationService._context_similarity()."""
+        # Scale level match (25%): exact/adjacent/near, unknown gets base score
+        scale = columns.scale_level[selected]
+        distance = np.abs(scale - scale_level.value)
+        score = np.select(
+            [np.isnan(scale), distance == 0, distance == 1, distance == 2],
+            [0.10, 0.25, 0.15, 0.05],
+            default=0.0,
+        )
+
+        # Project type match (20%)
+        type_code = self._project_types.get(_hashable(project_type), -2)
+        score = score + np.where(
+            columns.project_type[selected] == type_code,
+            0.20,
+            np.where(columns.is_general_type[selected], 0.15, 0.0),
+        )
+
+        # Tag overlap (30%): Jaccard with asymmetric handling
+        context_tags = {_hashable(tag) for tag in context.get("tags", [])}
+        learning_counts = columns.tag_counts[selected]
+        if context_tags:
+            bits = columns.tag_bits[selected]
+            overlap = np.zeros(len(learning_counts), dtype=np.int64)
+            for tag in context_tags:
+                index = self._tags.get(tag)
+                if index is not None and (index >> 6) < bits.shape[1]:
+                    overlap += ((bits[:, index >> 6] >> np.uint64(index & 63)) & np.uint64(1)).astype(np.int64)
+            union = learning_counts + len(context_tags) - overlap
+            jaccard = overlap / np.maximum(union, 1)
+            score = score + np.where(learning_counts > 0, 0.30 * jaccard, 0.10)
+        else:
+            score = score + np.where(learning_counts > 0, 0.05, 0.15)
+
+        # Category relevance (15%)
+        score = score + columns.category_score[selected]
+
+        # Temporal context (10%): same phase bonus
+        context_phase = context.get("phase")
+        if context_phase:
+            phases = columns.phase[selected]
+            phase_code = self._phases.get(_hashable(context_phase), -2)
+            score = score + np.where(
+                phases == phase_code,
+                0.10,
+                np.where(columns.is_any_phase[selected], 0.05, 0.0),
+            )
+
+        return np.minimum(score, 1.0)
+
+    @staticmethod
+    def top_k(ids: np.ndarray, scores: np.ndarray, k: int, threshold: float) -> List[Tuple[int, float]]:
+        """
+        Select the k highest scores above threshold.
+
+        Ties are broken by position (id order), matching a stable sort.
+
+        Args:
+            ids: Learning ids
+            scores: Relevance scores aligned with ids
+            k: Maximum number of results
+            threshold: Exclusive minimum score
+
+        Returns:
+            List of (learning_id, score) sorted by score descending
+        """
+        if k <= 0:
+            return []
+
+        candidates = np.flatnonzero(scores > threshold)
+        if candidates.size > k:
+            kth_score = -np.partition(-scores[candidates], k - 1)[k - 1]
+            candidates = candidates[scores[candidates] >= kth_score]
+
+        order = np.lexsort((candidates, -scores[candidates]))[:k]
+        chosen = candidates[order]
+        return [(int(ids[i]), float(scores[i])) for i in chosen]
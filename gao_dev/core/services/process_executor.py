@@ -5,6 +5,8 @@ Refactored in Epic 11, Story 11.4 to use provider abstraction while maintaining
 
 Responsibilities:
 - Execute agent tasks via provider abstraction
+- Admit provider requests through the process-wide LLMScheduler
+- Fail over to healthy fallback providers when circuit breaking is enabled
 - Stream output to caller
 - Handle process timeouts
 - Validate provider configuration
@@ -15,6 +17,9 @@ Design Pattern: Strategy Pattern (provider abstraction)
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 import structlog
 from typing import AsyncGenerator, Optional, List, Dict
 from pathlib import Path
@@ -72,7 +77,11 @@ class ProcessExecutor:
         provider_config: Optional[Dict] = None,
         # Legacy parameters (deprecated but supported)
         cli_path: Optional[Path] = None,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        priority: Optional["RequestPriority"] = None,
+        scheduler: Optional["LLMScheduler"] = None,
+        health_checker: Optional["ProviderHealthChecker"] = None,
+        fallback_providers: Optional[List["IAgentProvider"]] = None,
     ):
         """
         Initialize executor with provider.
@@ -89,6 +98,14 @@ class ProcessExecutor:
             provider_config: Provider-specific configuration
             cli_path: DEPRECATED - Use provider_config instead
             api_key: DEPRECATED - Use provider_config instead
+            priority: Default scheduler priority for this executor's requests
+                (None = current priority_scope, else WORKFLOW)
+            scheduler: Scheduler to admit requests through (default: the
+                process-wide scheduler)
+            health_checker: Enables circuit breaking: task outcomes are
+                recorded here and providers with an open circuit are skipped
+            fallback_providers: Providers tried in order when the primary
+                provider's circuit is open (requires health_checker)
 
         Environment Variables:
             AGENT_PROVIDER: Provider name (e.g., "opencode-sdk", "claude-code", "opencode-cli")
@@ -121,6 +138,10 @@ class ProcessExecutor:
             ```
         """
         self.project_root = project_root
+        self.priority = priority
+        self._scheduler = scheduler
+        self.health_checker = health_checker
+        self.fallback_providers = list(fallback_providers or [])
 
         # Store legacy attributes for backward compatibility with existing tests
         self.cli_path = cli_path
@@ -196,16 +217,24 @@ class ProcessExecutor:
         task: str,
         model: str = "sonnet-4.5",
         tools: Optional[List[str]] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        priority: Optional["RequestPriority"] = None,
     ) -> AsyncGenerator[str, None]:
         """
         Execute agent task via configured provider.
 
+        The provider call waits for admission by the LLMScheduler and holds
+        its slot until the stream is exhausted. With a health checker, the
+        first provider in [provider, *fallback_providers] whose circuit
+        admits the request is used, and the outcome is recorded.
+
         Args:
             task: Task description/prompt
             model: Canonical model name (provider translates)
             tools: List of tool names to enable
             timeout: Optional timeout in seconds
+            priority: Scheduler priority (default: priority_scope, then the
+                executor's priority, then WORKFLOW)
 
         Yields:
             Progress messages and results
@@ -214,43 +243,60 @@ class ProcessExecutor:
             ValueError: If provider not properly configured
             ProviderExecutionError: If execution fails
             ProviderTimeoutError: If execution times out
+            ProviderUnavailableError: If every candidate provider's circuit is open
         """
         # Import here to avoid circular dependencies
         from ..providers import AgentContext
+        from ..providers.scheduler import RequestPriority, current_priority, get_scheduler
 
-        # Validate provider configuration
-        is_valid = await self.provider.validate_configuration()
-        if not is_valid:
-            logger.error(
-                "provider_not_configured",
-                provider=self.provider.name
-            )
-            raise ValueError(
-                f"Provider '{self.provider.name}' not properly configured. "
-                f"Check API keys and CLI installation. "
-                f"See: gao-dev providers validate"
-            )
+        provider = self._select_provider()
+        started = time.perf_counter()
 
-        # Initialize provider if needed (SDK providers require explicit initialization)
-        if hasattr(self.provider, 'initialize') and not getattr(self.provider, '_initialized', False):
-            logger.info("initializing_provider", provider=self.provider.name)
-            await self.provider.initialize()
-            logger.info("provider_initialized", provider=self.provider.name)
+        try:
+            # Validate provider configuration
+            is_valid = await provider.validate_configuration()
+            if not is_valid:
+                logger.error(
+                    "provider_not_configured",
+                    provider=provider.name
+                )
+                raise ValueError(
+                    f"Provider '{provider.name}' not properly configured. "
+                    f"Check API keys and CLI installation. "
+                    f"See: gao-dev providers validate"
+                )
+
+            # Initialize provider if needed (SDK providers require explicit initialization)
+            if hasattr(provider, 'initialize') and not getattr(provider, '_initialized', False):
+                logger.info("initializing_provider", provider=provider.name)
+                await provider.initialize()
+                logger.info("provider_initialized", provider=provider.name)
+        except BaseException as e:
+            self._record_outcome(provider, e, started)
+            raise
 
         # Create execution context
         context = AgentContext(project_root=self.project_root)
+        scheduler = self._scheduler or get_scheduler()
+        for candidate in (priority, current_priority(), self.priority, RequestPriority.WORKFLOW):
+            if candidate is not None:
+                priority = candidate
+                break
 
         # Delegate to provider
         logger.info(
             "executing_task_via_provider",
-            provider=self.provider.name,
+            provider=provider.name,
             model=model,
             tools=tools,
-            timeout=timeout or self.DEFAULT_TIMEOUT
+            timeout=timeout or self.DEFAULT_TIMEOUT,
+            priority=priority.name
         )
 
         try:
-            async for message in self.provider.execute_task(
+            async for message in scheduler.stream(
+                provider,
+                priority,
                 task=task,
                 context=context,
                 model=model,
@@ -261,17 +307,98 @@ class ProcessExecutor:
 
             logger.info(
                 "task_execution_completed",
-                provider=self.provider.name
+                provider=provider.name
             )
+            self._record_outcome(provider, None, started)
+
+        except BaseException as e:
+            self._record_outcome(provider, e, started)
+            if isinstance(e, Exception):
+                logger.error(
+                    "task_execution_failed",
+                    provider=provider.name,
+                    error=str(e),
+                    exc_info=True
+                )
+            raise
 
-        except Exception as e:
-            logger.error(
-                "task_execution_failed",
-                provider=self.provider.name,
-                error=str(e),
-                exc_info=True
+    def _select_provider(self) -> "IAgentProvider":
+        """
+        Pick the provider for the next task.
+
+        Without a health checker this is always the configured provider.
+
+        Returns:
+            First provider whose circuit admits a request
+
+        Raises:
+            ProviderUnavailableError: If every candidate's circuit is open
+        """
+        if self.health_checker is None:
+            return self.provider
+
+        from ..providers.exceptions import ProviderUnavailableError
+
+        candidates = [self.provider, *self.fallback_providers]
+        for candidate in candidates:
+            if self.health_checker.allow_request(candidate.name):
+                if candidate is not self.provider:
+                    logger.warning(
+                        "provider_failover",
+                        primary=self.provider.name,
+                        provider=candidate.name,
+                        primary_state=self.health_checker.circuit_state(
+                            self.provider.name
+                        ).value,
+                    )
+                return candidate
+
+        raise ProviderUnavailableError(
+            provider_name=self.provider.name,
+            message=(
+                "All providers are unavailable (circuit open): "
+                + ", ".join(c.name for c in candidates)
+            ),
+        )
+
+    def _record_outcome(
+        self,
+        provider: "IAgentProvider",
+        error: Optional[BaseException],
+        started: float,
+    ) -> None:
+        """Feed a task outcome to the health checker, if one is configured."""
+        if self.health_checker is None:
+            return
+
+        from ..providers.exceptions import ProviderError, ProviderErrorType
+        from ..providers.scheduler import RequestCancelledError
+
+        if error is None:
+            self.health_checker.record_result(
+                provider.name, True, latency_seconds=time.perf_counter() - started
             )
-            raise
+            return
+
+        # Only failures that say something about the provider count against it
+        caller_errors = {
+            ProviderErrorType.INVALID_REQUEST_ERROR,
+            ProviderErrorType.CONTENT_POLICY_ERROR,
+        }
+        provider_failure = isinstance(error, (asyncio.TimeoutError, ValueError)) or (
+            isinstance(error, ProviderError)
+            and not isinstance(error, RequestCancelledError)
+            and error.error_type not in caller_errors
+        )
+        if provider_failure:
+            self.health_checker.record_result(
+                provider.name,
+                False,
+                latency_seconds=time.perf_counter() - started,
+                error=str(error),
+            )
+        else:
+            self.health_checker.release(provider.name)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -0,0 +1,204 @@
+"""State Engine - Shared database access for state services.
+
+This module provides one connection source that the state services can
+share, so operations spanning several services use one connection per
+thread and commit once through an explicit unit of work.
+
+Design Pattern: Unit of Work
+Dependencies: sqlite3, structlog
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Stats bucket for writes made outside any unit of work
+AUTOCOMMIT = "autocommit"
+
+
+@dataclass
+class OperationStats:
+    """Transaction counters for one logical operation."""
+
+    operations: int = 0
+    commits: int = 0
+    rollbacks: int = 0
+
+    @property
+    def commits_per_operation(self) -> float:
+        """Average number of durable commits (fsync points) per operation."""
+        return self.commits / self.operations if self.operations else 0.0
+
+
+class StateEngine:
+    """
+    Shared SQLite engine for state services.
+
+    Services delegate their _get_connection() to connection(). Outside a unit
+    of work that behaves exactly like the services' own thread-local
+    connections did: commit on success, rollback on error. Inside
+    unit_of_work() every service call joins the same transaction, which is
+    committed (one fsync) or rolled back once when the unit ends.
+
+    Commits are only counted when a write transaction was open, so each
+    counted commit is one journal sync on disk.
+
+    Thread Safety:
+        - One connection per thread, shared by all services on the engine
+        - Units of work are per thread; nested units join the outer one
+
+    Example:
+        ```python
+        engine = StateEngine(Path(".gao-dev/documents.db"))
+        epics = EpicStateService(db_path, engine=engine)
+        stories = StoryStateService(db_path, engine=engine)
+
+        with engine.unit_of_work("complete_story"):
+            stories.complete(epic_num=1, story_num=2)
+            epics.update_progress(epic_num=1, completed_stories=2)
+
+        engine.get_stats()["complete_story"]["commits"]  # 1
+        ```
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize state engine.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._stats: Dict[str, OperationStats] = {}
+        self._stats_lock = threading.Lock()
+        self.logger = logger.bind(service="state_engine")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get (or open) this thread's connection."""
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._local.conn.row_factory = sqlite3.Row
+            self._local.conn.execute("PRAGMA foreign_keys = ON")
+        return self._local.conn
+
+    @property
+    def in_unit_of_work(self) -> bool:
+        """Whether the current thread is inside a unit of work."""
+        return getattr(self._local, "operation", None) is not None
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get the thread's connection with transaction handling.
+
+        Commits on success and rolls back on error, unless a unit of work is
+        active, in which case the unit decides.
+
+        Yields:
+            SQLite connection
+        """
+        conn = self._connection()
+        if self.in_unit_of_work:
+            yield conn
+            return
+
+        try:
+            yield conn
+        except Exception:
+            self._rollback(conn, AUTOCOMMIT)
+            raise
+        else:
+            self._commit(conn, AUTOCOMMIT)
+
+    @contextmanager
+    def unit_of_work(self, name: str = "unit_of_work") -> Iterator[sqlite3.Connection]:
+        """
+        Run several service calls in one transaction.
+
+        Nested units join the outermost one and are not counted separately.
+
+        Args:
+            name: Operation name for the stats counters
+
+        Yields:
+            SQLite connection
+
+        Raises:
+            Exception: Whatever the body raised, after rolling back
+        """
+        conn = self._connection()
+        if self.in_unit_of_work:
+            yield conn
+            return
+
+        self._local.operation = name
+        self._record(name, operations=1)
+        try:
+            yield conn
+        except Exception:
+            self._rollback(conn, name)
+            raise
+        else:
+            self._commit(conn, name)
+        finally:
+            self._local.operation = None
+
+    def _commit(self, conn: sqlite3.Connection, name: str) -> None:
+        """Commit, counting it if a write transaction was open."""
+        wrote = conn.in_transaction
+        conn.commit()
+        if wrote:
+            self._record(name, commits=1)
+
+    def _rollback(self, conn: sqlite3.Connection, name: str) -> None:
+        """Roll back, counting it if a write transaction was open."""
+        wrote = conn.in_transaction
+        conn.rollback()
+        if wrote:
+            self._record(name, rollbacks=1)
+
+    def _record(self, name: str, **increments: int) -> None:
+        """Add to an operation's counters."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(name, OperationStats())
+            for field, value in increments.items():
+                setattr(stats, field, getattr(stats, field) + value)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get transaction counters per logical operation.
+
+        Writes made outside a unit of work are counted under "autocommit".
+
+        Returns:
+            Mapping of operation name to operations, commits, rollbacks and
+            commits_per_operation
+        """
+        with self._stats_lock:
+            return {
+                name: {**asdict(stats), "commits_per_operation": stats.commits_per_operation}
+                for name, stats in self._stats.items()
+            }
+
+    def reset_stats(self) -> None:
+        """Clear all counters."""
+        with self._stats_lock:
+            self._stats.clear()
+
+    def close(self) -> None:
+        """Close database connection for current thread."""
+        if hasattr(self._local, "conn"):
+            try:
+                self._local.conn.close()
+            except Exception:
+                pass
+            delattr(self._local, "conn")
+
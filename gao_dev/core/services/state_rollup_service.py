@@ -0,0 +1,327 @@
+"""State Rollup Service - Aggregate feature/epic/story progress in SQL.
+
+This service answers progress questions (story counts by status, estimated
+hours, completion percentage) with aggregate queries scoped to the epics
+asked about, instead of listing every epic and story and counting in Python.
+
+An optional rollup cache keeps one pre-aggregated row per epic in
+epic_rollup, maintained by triggers on story_state so it is refreshed in the
+same transaction as every story insert, transition and delete.
+
+Epics belong to a feature through the "feature" key of their metadata.
+
+Design Pattern: Service Layer
+Dependencies: StateEngine, structlog
+"""
+
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable
+
+import structlog
+
+from gao_dev.core.services.state_engine import StateEngine
+
+logger = structlog.get_logger()
+
+STORY_STATUSES = ("pending", "in_progress", "review", "testing", "completed", "blocked")
+
+# (column, aggregate over story_state) for every rollup column
+_AGGREGATES = (
+    [("story_count", "COUNT(*)")]
+    + [(f"{status}_count", f"TOTAL(status = '{status}')") for status in STORY_STATUSES]
+    + [
+        ("estimate_hours", "TOTAL(estimate_hours)"),
+        (
+            "completed_estimate_hours",
+            "TOTAL(CASE WHEN status = 'completed' THEN estimate_hours END)",
+        ),
+        ("actual_hours", "TOTAL(actual_hours)"),
+    ]
+)
+ROLLUP_COLUMNS = [name for name, _ in _AGGREGATES]
+
+_FEATURE = "json_extract(e.metadata, '$.feature')"
+
+
+def _aggregate_select() -> str:
+    """Aggregate column list for a SELECT over story_state."""
+    return ", ".join(f"{expr} AS {name}" for name, expr in _AGGREGATES)
+
+
+def _refresh_epic(epic_ref: str) -> str:
+    """Statement recomputing one epic's cached rollup (for trigger bodies)."""
+    return (
+        f"INSERT OR REPLACE INTO epic_rollup (epic_num, {', '.join(ROLLUP_COLUMNS)}) "
+        f"SELECT {epic_ref}, {_aggregate_select()} "
+        f"FROM story_state WHERE epic_num = {epic_ref};"
+    )
+
+
+def _progress(story_count: int, completed_count: int) -> float:
+    """Completion percentage by story count."""
+    return (completed_count / story_count * 100.0) if story_count > 0 else 0.0
+
+
+class StateRollupService:
+    """
+    Service for feature, epic and story progress rollups.
+
+    Every query aggregates only the epics it is asked about, using the
+    story_state epic index and an index on the epic feature key, so cost
+    follows feature size rather than project size.
+
+    Example:
+        ```python
+        service = StateRollupService(db_path=Path(".gao-dev/documents.db"))
+
+        # One row per epic of a feature, with story counts and hours
+        for epic in service.get_epic_rollups(feature="user-auth"):
+            print(epic["epic_num"], epic["completed_count"], epic["progress_percentage"])
+
+        # One row per feature
+        service.get_feature_rollups()["user-auth"]["progress_percentage"]
+
+        # Keep per-epic rollups materialized, refreshed on story changes
+        service.enable_cache()
+        ```
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        engine: Optional[StateEngine] = None,
+        cache_rollups: bool = False,
+    ):
+        """
+        Initialize state rollup service.
+
+        Args:
+            db_path: Path to SQLite database file
+            engine: Shared StateEngine (default: a private engine for db_path)
+            cache_rollups: Materialize per-epic rollups (see enable_cache)
+        """
+        self.db_path = Path(db_path)
+        self._owns_engine = engine is None
+        self.engine = engine or StateEngine(self.db_path)
+        self.logger = logger.bind(service="state_rollup")
+        if cache_rollups:
+            self.enable_cache()
+
+    def _get_connection(self):
+        """Get database connection from the state engine with transaction handling."""
+        return self.engine.connection()
+
+    # Rollup cache
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether per-epic rollups are materialized in epic_rollup."""
+        with self._get_connection() as conn:
+            return conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'epic_rollup'"
+            ).fetchone() is not None
+
+    def enable_cache(self) -> None:
+        """
+        Materialize per-epic rollups and keep them current with triggers.
+
+        Idempotent. The cache is rebuilt from story_state when enabled.
+        """
+        columns = ", ".join(f"{name} REAL NOT NULL DEFAULT 0" for name in ROLLUP_COLUMNS)
+        with self._get_connection() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS epic_rollup "
+                f"(epic_num INTEGER PRIMARY KEY, {columns})"
+            )
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS story_rollup_insert
+                AFTER INSERT ON story_state
+                BEGIN {_refresh_epic("NEW.epic_num")} END
+                """
+            )
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS story_rollup_update
+                AFTER UPDATE OF epic_num, status, estimate_hours, actual_hours ON story_state
+                BEGIN {_refresh_epic("OLD.epic_num")} {_refresh_epic("NEW.epic_num")} END
+                """
+            )
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS story_rollup_delete
+                AFTER DELETE ON story_state
+                BEGIN {_refresh_epic("OLD.epic_num")} END
+                """
+            )
+            conn.execute("DELETE FROM epic_rollup")
+            conn.execute(
+                f"""
+                INSERT INTO epic_rollup (epic_num, {", ".join(ROLLUP_COLUMNS)})
+                SELECT epic_num, {_aggregate_select()}
+                FROM story_state GROUP BY epic_num
+                """
+            )
+
+        self.logger.info("rollup_cache_enabled")
+
+    def disable_cache(self) -> None:
+        """Drop the rollup cache and its triggers."""
+        with self._get_connection() as conn:
+            for trigger in ("story_rollup_insert", "story_rollup_update", "story_rollup_delete"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            conn.execute("DROP TABLE IF EXISTS epic_rollup")
+
+        self.logger.info("rollup_cache_disabled")
+
+    def _rollup_source(self, epic_filter: str) -> str:
+        """
+        Per-epic rollup rows, from the cache or aggregated on the fly.
+
+        Args:
+            epic_filter: Condition on epic_state alias e selecting the epics
+
+        Returns:
+            SQL subquery with epic_num and ROLLUP_COLUMNS
+        """
+        if self.cache_enabled:
+            return "epic_rollup"
+        return f"""(
+            SELECT epic_num, {_aggregate_select()}
+            FROM story_state
+            WHERE epic_num IN (SELECT e.epic_num FROM epic_state e WHERE {epic_filter})
+            GROUP BY epic_num
+        )"""
+
+    # Queries
+
+    def get_epic_rollups(
+        self,
+        epic_nums: Optional[Iterable[int]] = None,
+        feature: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get progress rollups for epics.
+
+        Args:
+            epic_nums: Only these epics (default: all)
+            feature: Only epics of this feature (default: all)
+
+        Returns:
+            One dict per epic, ordered by epic_num, with epic_num, title,
+            status, feature, story_count, <status>_count for every story
+            status, estimate_hours, completed_estimate_hours, actual_hours
+            and progress_percentage
+        """
+        conditions = ["1 = 1"]
+        params: Dict[str, Any] = {}
+        if epic_nums is not None:
+            epic_nums = list(epic_nums)
+            if not epic_nums:
+                return []
+            conditions.append(
+                f"e.epic_num IN ({', '.join(f':epic{i}' for i in range(len(epic_nums)))})"
+            )
+            params.update({f"epic{i}": num for i, num in enumerate(epic_nums)})
+        if feature is not None:
+            conditions.append(f"{_FEATURE} = :feature")
+            params["feature"] = feature
+        epic_filter = " AND ".join(conditions)
+
+        rollup_columns = ", ".join(f"COALESCE(r.{name}, 0) AS {name}" for name in ROLLUP_COLUMNS)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT e.epic_num, e.title, e.status, {_FEATURE} AS feature, {rollup_columns}
+                FROM epic_state e
+                LEFT JOIN {self._rollup_source(epic_filter)} r ON r.epic_num = e.epic_num
+                WHERE {epic_filter}
+                ORDER BY e.epic_num
+                """,
+                params,
+            ).fetchall()
+
+        return [self._finish(dict(row)) for row in rows]
+
+    def get_epic_rollup(self, epic_num: int) -> Dict[str, Any]:
+        """
+        Get the progress rollup for one epic.
+
+        Args:
+            epic_num: Epic number
+
+        Returns:
+            Rollup dict (see get_epic_rollups)
+
+        Raises:
+            ValueError: If epic not found
+        """
+        rollups = self.get_epic_rollups(epic_nums=[epic_num])
+        if not rollups:
+            raise ValueError(f"Epic {epic_num} not found")
+        return rollups[0]
+
+    def get_feature_rollups(
+        self, features: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get progress rollups per feature.
+
+        Args:
+            features: Only these features (default: every feature with epics)
+
+        Returns:
+            Mapping of feature name to epic_count, the rollup columns summed
+            over its epics, and progress_percentage
+        """
+        conditions = [f"{_FEATURE} IS NOT NULL"]
+        params: Dict[str, Any] = {}
+        if features is not None:
+            features = list(features)
+            if not features:
+                return {}
+            conditions.append(
+                f"{_FEATURE} IN ({', '.join(f':feature{i}' for i in range(len(features)))})"
+            )
+            params.update({f"feature{i}": name for i, name in enumerate(features)})
+        epic_filter = " AND ".join(conditions)
+
+        rollup_columns = ", ".join(
+            f"COALESCE(SUM(r.{name}), 0) AS {name}" for name in ROLLUP_COLUMNS
+        )
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_FEATURE} AS feature, COUNT(*) AS epic_count, {rollup_columns}
+                FROM epic_state e
+                LEFT JOIN {self._rollup_source(epic_filter)} r ON r.epic_num = e.epic_num
+                WHERE {epic_filter}
+                GROUP BY feature
+                """,
+                params,
+            ).fetchall()
+
+        return {row["feature"]: self._finish(dict(row)) for row in rows}
+
+    def _finish(self, rollup: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize counts to int and add progress_percentage."""
+        for name in ROLLUP_COLUMNS:
+            if name.endswith("_count"):
+                rollup[name] = int(rollup[name])
+        rollup["progress_percentage"] = _progress(
+            rollup["story_count"], rollup["completed_count"]
+        )
+        return rollup
+
+    def close(self) -> None:
+        """Close database connection for current thread (unless the engine is shared)."""
+        if self._owns_engine:
+            self.engine.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close connections."""
+        self.close()
@@ -10,14 +10,18 @@ Key Features:
 - Stale lock detection using PID validation
 - Cross-platform compatibility (Windows, macOS, Linux)
 - Atomic file operations to prevent race conditions
+- Cached lock state (refreshed on lock file change or after a short TTL) so
+  per-request checks cost a single stat() call
 """
 
 import json
 import os
 import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import structlog
 
@@ -28,6 +32,29 @@ except ImportError:
 
 logger = structlog.get_logger(__name__)
 
+# Default lifetime of cached lock state. Bounds how long a dead lock holder
+# can still be reported as alive when the lock file itself is unchanged.
+DEFAULT_STATE_TTL_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class _LockSnapshot:
+    """Parsed lock file state, cached between checks.
+
+    Attributes:
+        lock_file: Lock file path the snapshot was read from
+        signature: (mtime_ns, size, inode) of the lock file, None if missing
+        data: Parsed lock data, None if missing or corrupted
+        held_by_other: True if a live process other than us holds the lock
+        checked_at: Monotonic time the snapshot was taken
+    """
+
+    lock_file: Path
+    signature: Optional[Tuple[int, int, int]]
+    data: Optional[Dict[str, Any]]
+    held_by_other: bool
+    checked_at: float
+
 
 class SessionLock:
     """Manages session lock for exclusive write access control.
@@ -35,19 +62,24 @@ class SessionLock:
     Attributes:
         lock_file: Path to .gao-dev/session.lock
         current_mode: Current lock mode ("read", "write", "none")
+        state_ttl: Seconds cached lock state stays valid while the lock
+            file is unchanged
         _lock: Thread lock for atomic operations
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, state_ttl: float = DEFAULT_STATE_TTL_SECONDS):
         """Initialize session lock manager.
 
         Args:
             project_root: Project root directory
+            state_ttl: Lifetime of cached lock state in seconds (0 disables caching)
         """
         self.project_root = project_root
         self.lock_file = project_root / ".gao-dev" / "session.lock"
         self.current_mode: str = "none"
+        self.state_ttl = state_ttl
         self._lock = threading.Lock()
+        self._snapshot: Optional[_LockSnapshot] = None
 
         # NOTE: Do NOT create .gao-dev directory here!
         # Creating it prematurely interferes with project state detection.
@@ -75,6 +107,7 @@ class SessionLock:
             raise ValueError(f"Invalid mode: {mode}. Must be 'read' or 'write'")
 
         with self._lock:
+            self._snapshot = None
             return self._acquire_internal(interface, mode)
 
     def _acquire_internal(self, interface: str, mode: str) -> bool:
@@ -164,6 +197,7 @@ class SessionLock:
         Safe to call even if no lock is held.
         """
         with self._lock:
+            self._snapshot = None
             if self.lock_file.exists():
                 try:
                     lock_data = json.loads(self.lock_file.read_text(encoding="utf-8"))
@@ -204,6 +238,7 @@ class SessionLock:
             True if downgraded, False if failed
         """
         with self._lock:
+            self._snapshot = None
             if self.current_mode != "write":
                 logger.warning("downgrade_denied", current_mode=self.current_mode)
                 return False
@@ -227,26 +262,30 @@ class SessionLock:
     def is_write_locked_by_other(self) -> bool:
         """Check if another process holds write lock.
 
+        Uses cached lock state, so repeated checks cost a single stat() call
+        until the lock file changes or the cache TTL expires.
+
         Returns:
             True if another process holds write lock, False otherwise
         """
         with self._lock:
-            if not self.lock_file.exists():
-                return False
+            return self._get_snapshot().held_by_other
 
-            try:
-                lock_data = json.loads(self.lock_file.read_text(encoding="utf-8"))
-
-                # We hold the lock
-                if lock_data.get("pid") == os.getpid():
-                    return False
+    def get_write_lock_holder(self) -> Optional[str]:
+        """Get the interface of another process holding the write lock.
 
-                # Check if lock holder is alive
-                return self.is_process_alive(lock_data["pid"])
+        Combines is_write_locked_by_other() and get_lock_state() into one
+        cached check for hot paths such as request middleware.
 
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning("lock_check_failed", error=str(e))
-                return False
+        Returns:
+            Holder interface ("cli" or "web") if another live process holds
+            the write lock, None otherwise
+        """
+        with self._lock:
+            snapshot = self._get_snapshot()
+            if not snapshot.held_by_other or snapshot.data is None:
+                return None
+            return snapshot.data.get("interface") or "unknown"
 
     def get_lock_state(self) -> Dict[str, Optional[str]]:
         """Get current lock state.
@@ -255,34 +294,86 @@ class SessionLock:
             Dictionary with mode, holder, and timestamp
         """
         with self._lock:
-            if not self.lock_file.exists():
+            snapshot = self._get_snapshot()
+            data = snapshot.data
+
+            if data is None:
                 return {"mode": "write", "holder": None, "timestamp": None}
 
-            try:
-                lock_data = json.loads(self.lock_file.read_text(encoding="utf-8"))
+            # We hold the lock
+            if data.get("pid") == os.getpid():
+                return {
+                    "mode": "write",
+                    "holder": data.get("interface"),
+                    "timestamp": data.get("timestamp"),
+                }
+
+            # Lock holder is alive
+            if snapshot.held_by_other:
+                return {
+                    "mode": "read",
+                    "holder": data.get("interface"),
+                    "timestamp": data.get("timestamp"),
+                }
+
+            # Stale lock
+            return {"mode": "write", "holder": None, "timestamp": None}
+
+    def invalidate_cache(self) -> None:
+        """Discard cached lock state so the next check re-reads the lock file."""
+        with self._lock:
+            self._snapshot = None
 
-                # We hold the lock
-                if lock_data.get("pid") == os.getpid():
-                    return {
-                        "mode": "write",
-                        "holder": lock_data.get("interface"),
-                        "timestamp": lock_data.get("timestamp"),
-                    }
+    def _get_snapshot(self) -> _LockSnapshot:
+        """Get lock state, re-reading the lock file only when needed (not thread-safe).
 
-                # Check if lock holder is alive
-                if self.is_process_alive(lock_data["pid"]):
-                    return {
-                        "mode": "read",
-                        "holder": lock_data.get("interface"),
-                        "timestamp": lock_data.get("timestamp"),
-                    }
+        The cached snapshot is reused while the lock file path and its
+        (mtime, size, inode) signature are unchanged and the snapshot is
+        younger than state_ttl. Otherwise the file is parsed and the holder
+        PID probed again.
 
-                # Stale lock
-                return {"mode": "write", "holder": None, "timestamp": None}
-
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning("get_lock_state_failed", error=str(e))
-                return {"mode": "write", "holder": None, "timestamp": None}
+        Returns:
+            Current lock snapshot
+        """
+        lock_file = self.lock_file
+        try:
+            st = lock_file.stat()
+            signature: Optional[Tuple[int, int, int]] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            signature = None
+
+        now = time.monotonic()
+        cached = self._snapshot
+        if (
+            cached is not None
+            and cached.lock_file == lock_file
+            and cached.signature == signature
+            and now - cached.checked_at < self.state_ttl
+        ):
+            return cached
+
+        data: Optional[Dict[str, Any]] = None
+        held_by_other = False
+        if signature is not None:
+            try:
+                data = json.loads(lock_file.read_text(encoding="utf-8"))
+                pid = data["pid"]
+                held_by_other = pid != os.getpid() and self.is_process_alive(pid)
+            except FileNotFoundError:
+                data = None
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                logger.warning("lock_check_failed", error=str(e))
+                data = None
+
+        snapshot = _LockSnapshot(
+            lock_file=lock_file,
+            signature=signature,
+            data=data,
+            held_by_other=held_by_other,
+            checked_at=now,
+        )
+        self._snapshot = snapshot
+        return snapshot
 
     @staticmethod
     def is_process_alive(pid: int) -> bool:
@@ -315,6 +406,7 @@ class SessionLock:
             RuntimeError: If lock holder is still alive
         """
         with self._lock:
+            self._snapshot = None
             if not self.lock_file.exists():
                 logger.info("force_unlock_no_lock")
                 return True
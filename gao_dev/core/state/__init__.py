@@ -21,6 +21,7 @@ from .exceptions import (
     ConflictError,
 )
 from .state_tracker import StateTracker
+from .pagination import WorkflowPage
 from .frontmatter_parser import FrontmatterParser
 from .markdown_syncer import MarkdownSyncer, SyncReport, ConflictResolution
 
@@ -28,6 +29,7 @@ __all__ = [
     "SCHEMA_VERSION",
     "get_schema_path",
     "StateTracker",
+    "WorkflowPage",
     "Story",
     "Epic",
     "Sprint",
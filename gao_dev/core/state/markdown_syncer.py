@@ -2,19 +2,64 @@
 
 Provides bidirectional synchronization between markdown story files and
 SQLite database with intelligent conflict detection and resolution.
+
+Directory syncs are incremental: a sync manifest table records the size,
+mtime and content hash of every synced file, so unchanged files are skipped
+after a single stat(). Changed files are parsed in a worker pool and all
+database changes are applied in one transaction.
 """
 
 import hashlib
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
+import structlog
+
 from .state_tracker import StateTracker
 from .frontmatter_parser import FrontmatterParser
 from .models import Story
-from .exceptions import SyncError, ConflictError, RecordNotFoundError
+from .exceptions import (
+    SyncError,
+    ConflictError,
+    RecordNotFoundError,
+    StateTrackerError,
+)
+
+logger = structlog.get_logger(__name__)
+
+VALID_STATUSES = ["pending", "in_progress", "done", "blocked", "cancelled"]
+VALID_PRIORITIES = ["P0", "P1", "P2", "P3"]
+
+# Manifest of synced markdown files (created lazily in the state database)
+MANIFEST_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS markdown_sync_manifest (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    epic_num INTEGER NOT NULL,
+    story_num INTEGER NOT NULL,
+    synced_at TEXT NOT NULL
+)
+"""
+
+
+@dataclass
+class _ParsedFile:
+    """A markdown file read and parsed by a sync worker."""
+
+    path: Path
+    key: str
+    size: int
+    mtime_ns: int
+    frontmatter: Dict[str, Any] = field(default_factory=dict)
+    content_hash: str = ""
+    error: Optional[str] = None
 
 
 @dataclass
@@ -88,6 +133,7 @@ class MarkdownSyncer:
         self,
         state_tracker: StateTracker,
         conflict_strategy: str = ConflictResolution.DATABASE_WINS,
+        conflict_log_path: Optional[Path] = None,
     ):
         """Initialize MarkdownSyncer.
 
@@ -95,12 +141,13 @@ class MarkdownSyncer:
             state_tracker: StateTracker instance for database access
             conflict_strategy: Conflict resolution strategy
                 (database_wins, markdown_wins, manual)
+            conflict_log_path: Conflict log file
+                (default: gao_dev/logs/sync_conflicts.log)
         """
         self.state_tracker = state_tracker
         self.conflict_strategy = conflict_strategy
         self.parser = FrontmatterParser()
-        self.conflict_log_path = Path("gao_dev/logs/sync_conflicts.log")
-        self.conflict_log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conflict_log_path = Path(conflict_log_path or "gao_dev/logs/sync_conflicts.log")
 
     def sync_from_markdown(self, file_path: Path) -> Dict[str, Any]:
         """Sync markdown file to database.
@@ -232,7 +279,12 @@ class MarkdownSyncer:
             ) from e
 
     def sync_directory(
-        self, dir_path: Path, recursive: bool = True, pattern: str = "*.md"
+        self,
+        dir_path: Path,
+        recursive: bool = True,
+        pattern: str = "*.md",
+        force: bool = False,
+        max_workers: Optional[int] = None,
     ) -> SyncReport:
         """Batch sync directory of markdown files.
 
@@ -240,10 +292,17 @@ class MarkdownSyncer:
         database. Continues processing even if individual files fail,
         collecting all errors in the report.
 
+        Files whose size and mtime match the sync manifest (and whose story
+        still carries the manifest hash) are skipped without being read.
+        Remaining files are parsed concurrently, and all creates, updates and
+        manifest entries are written in a single transaction.
+
         Args:
             dir_path: Directory to sync
             recursive: Recursively sync subdirectories (default: True)
             pattern: File pattern to match (default: '*.md')
+            force: Ignore the manifest and re-read every file (default: False)
+            max_workers: Parser worker threads (default: executor default)
 
         Returns:
             SyncReport with operation results and error details
@@ -257,30 +316,380 @@ class MarkdownSyncer:
 
         # Find all markdown files
         if recursive:
-            files = dir_path.rglob(pattern)
+            files = sorted(dir_path.rglob(pattern))
         else:
-            files = dir_path.glob(pattern)
+            files = sorted(dir_path.glob(pattern))
 
-        for file_path in files:
-            report.files_processed += 1
+        report.files_processed = len(files)
+        if not files:
+            return report
 
-            try:
-                result = self.sync_from_markdown(file_path)
+        with self.state_tracker._get_connection() as conn:
+            conn.execute(MANIFEST_TABLE_SQL)
+            manifest = self._load_manifest(conn)
+            stories = self._load_story_index(conn)
 
-                if result["status"] == "created":
-                    report.stories_created += 1
-                elif result["status"] == "updated":
-                    report.stories_updated += 1
-                elif result["status"] == "skipped":
+        # Stat pass: skip files unchanged since the last sync
+        pending: List[_ParsedFile] = []
+        for file_path in files:
+            key = os.path.abspath(file_path)
+            try:
+                st = file_path.stat()
+            except OSError as e:
+                report.errors.append(f"{file_path}: {e}")
+                continue
+
+            entry = manifest.get(key)
+            if not force and entry is not None:
+                size, mtime_ns, content_hash, epic_num, story_num = entry
+                story = stories.get((epic_num, story_num))
+                if (
+                    size == st.st_size
+                    and mtime_ns == st.st_mtime_ns
+                    and story is not None
+                    and story.content_hash == content_hash
+                ):
                     report.files_skipped += 1
+                    continue
 
-            except Exception as e:
-                error_msg = f"{file_path}: {str(e)}"
-                report.errors.append(error_msg)
-                # Continue processing other files
+            pending.append(
+                _ParsedFile(path=file_path, key=key, size=st.st_size, mtime_ns=st.st_mtime_ns)
+            )
+
+        if not pending:
+            return report
+
+        # Parse pass: read, hash and parse frontmatter in a worker pool
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            parsed = list(pool.map(self._parse_file, pending))
+
+        try:
+            self._apply_batch(parsed, stories, report)
+        except StateTrackerError as e:
+            # Batch rolled back - fall back to per-file sync so one bad
+            # row cannot block the others
+            logger.warning("markdown_batch_sync_failed", error=str(e), files=len(parsed))
+            self._sync_files_individually(parsed, report)
 
         return report
 
+    def _parse_file(self, parsed: _ParsedFile) -> _ParsedFile:
+        """Read, hash and parse one markdown file (runs in a worker thread).
+
+        Args:
+            parsed: File entry to fill in
+
+        Returns:
+            The same entry with frontmatter, hash or error set
+        """
+        try:
+            content = parsed.path.read_text(encoding="utf-8")
+            parsed.frontmatter, _ = self.parser.parse(content)
+            parsed.content_hash = self._calculate_hash(content)
+
+            epic_num = parsed.frontmatter.get("epic")
+            story_num = parsed.frontmatter.get("story_num")
+            if not epic_num or not story_num:
+                raise SyncError(
+                    f"Missing epic or story_num in frontmatter: {parsed.path}"
+                )
+        except Exception as e:
+            parsed.error = f"{parsed.path}: Failed to sync {parsed.path}: {e}"
+        return parsed
+
+    def _apply_batch(
+        self,
+        parsed: List[_ParsedFile],
+        stories: Dict[Tuple[int, int], Story],
+        report: SyncReport,
+    ) -> None:
+        """Plan and apply all database changes for parsed files in one transaction.
+
+        Files are planned in order against an in-memory story index, so a
+        story defined by two files behaves exactly as with sequential syncs.
+
+        Args:
+            parsed: Parsed files (including per-file errors)
+            stories: Existing stories keyed by (epic_num, story_num)
+            report: Report to update
+
+        Raises:
+            StateTrackerError: If the batch could not be written (rolled back)
+        """
+        now = datetime.now().isoformat()
+        creates: List[Tuple[Any, ...]] = []
+        assignments: List[Tuple[int, int, int]] = []
+        updates: Dict[Tuple[int, int], Tuple[Any, ...]] = {}
+        manifest_rows: List[Tuple[Any, ...]] = []
+        counts = {"created": 0, "updated": 0, "skipped": 0}
+        errors: List[str] = []
+
+        with self.state_tracker._get_connection() as conn:
+            epics = {row[0] for row in conn.execute("SELECT epic_num FROM epics")}
+            sprints = {row[0] for row in conn.execute("SELECT sprint_num FROM sprints")}
+
+            for item in parsed:
+                if item.error:
+                    errors.append(item.error)
+                    continue
+
+                fm = item.frontmatter
+                epic_num, story_num = fm["epic"], fm["story_num"]
+                key = (epic_num, story_num)
+                existing = stories.get(key)
+
+                try:
+                    if existing is None:
+                        row, sprint = self._plan_create(item, epics, sprints, now)
+                        creates.append(row)
+                        if sprint is not None:
+                            assignments.append((sprint, epic_num, story_num))
+                        stories[key] = Story(
+                            id=0,
+                            epic=epic_num,
+                            story_num=story_num,
+                            title=row[2],
+                            status=row[3],
+                            owner=row[4],
+                            points=row[5],
+                            priority=row[6],
+                            sprint=sprint,
+                            content_hash=item.content_hash,
+                        )
+                        counts["created"] += 1
+                    elif existing.content_hash == item.content_hash:
+                        counts["skipped"] += 1
+                    else:
+                        conflicts = self._detect_conflicts(existing, fm)
+                        if conflicts:
+                            self._handle_conflicts(conflicts, item.path)
+                        updated = self._plan_update(existing, fm, item.content_hash)
+                        stories[key] = updated
+                        updates[key] = (
+                            updated.status,
+                            updated.owner,
+                            updated.points,
+                            updated.content_hash,
+                            now,
+                            epic_num,
+                            story_num,
+                        )
+                        counts["updated"] += 1
+                except Exception as e:
+                    errors.append(f"{item.path}: Failed to sync {item.path}: {e}")
+                    continue
+
+                manifest_rows.append(
+                    (item.key, item.size, item.mtime_ns, item.content_hash, epic_num, story_num, now)
+                )
+
+            if creates:
+                conn.executemany(
+                    """
+                    INSERT INTO stories (
+                        epic_num, story_num, title, status, owner,
+                        points, priority, content_hash, created_at, updated_at
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    creates,
+                )
+            if assignments:
+                conn.executemany(
+                    "INSERT INTO story_assignments (sprint_num, epic_num, story_num) VALUES (?, ?, ?)",
+                    assignments,
+                )
+            if updates:
+                conn.executemany(
+                    """
+                    UPDATE stories
+                    SET status = ?, owner = ?, points = ?, content_hash = ?, updated_at = ?
+                    WHERE epic_num = ? AND story_num = ?
+                    """,
+                    list(updates.values()),
+                )
+            if manifest_rows:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO markdown_sync_manifest (
+                        path, size, mtime_ns, content_hash, epic_num, story_num, synced_at
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    manifest_rows,
+                )
+
+        report.stories_created += counts["created"]
+        report.stories_updated += counts["updated"]
+        report.files_skipped += counts["skipped"]
+        report.errors.extend(errors)
+
+    def _plan_create(
+        self,
+        item: _ParsedFile,
+        epics: set,
+        sprints: set,
+        now: str,
+    ) -> Tuple[Tuple[Any, ...], Optional[int]]:
+        """Validate a new story and build its insert row.
+
+        Args:
+            item: Parsed markdown file
+            epics: Existing epic numbers
+            sprints: Existing sprint numbers
+            now: Timestamp for created_at/updated_at
+
+        Returns:
+            Tuple of (stories insert row, sprint number or None)
+
+        Raises:
+            SyncError: If the story cannot be created
+        """
+        fm = item.frontmatter
+        status = fm.get("status", "pending")
+        priority = fm.get("priority", "P1")
+        sprint = fm.get("sprint")
+
+        if status not in VALID_STATUSES:
+            raise SyncError(f"Invalid status '{status}'. Must be one of: {VALID_STATUSES}")
+        if priority not in VALID_PRIORITIES:
+            raise SyncError(
+                f"Invalid priority '{priority}'. Must be one of: {VALID_PRIORITIES}"
+            )
+        if fm["epic"] not in epics:
+            raise SyncError(f"Epic {fm['epic']} not found")
+        if sprint is not None and sprint not in sprints:
+            raise SyncError(f"Sprint {sprint} not found")
+
+        row = (
+            fm["epic"],
+            fm["story_num"],
+            fm.get("title", item.path.stem),
+            status,
+            fm.get("owner"),
+            fm.get("points", 0),
+            priority,
+            item.content_hash,
+            now,
+            now,
+        )
+        return row, sprint
+
+    def _plan_update(
+        self, existing: Story, frontmatter: Dict[str, Any], content_hash: str
+    ) -> Story:
+        """Compute the updated story for a changed markdown file.
+
+        Mirrors _update_story_from_frontmatter: with markdown_wins the
+        status, owner and points come from markdown; the content hash is
+        always updated.
+
+        Args:
+            existing: Current story state
+            frontmatter: Frontmatter dictionary from markdown
+            content_hash: SHA256 hash of content
+
+        Returns:
+            Story with the values to write
+
+        Raises:
+            SyncError: If the markdown status is invalid
+        """
+        status, owner, points = existing.status, existing.owner, existing.points
+
+        if self.conflict_strategy == ConflictResolution.MARKDOWN_WINS:
+            if "status" in frontmatter:
+                status = frontmatter["status"]
+                if status not in VALID_STATUSES:
+                    raise SyncError(
+                        f"Invalid status '{status}'. Must be one of: {VALID_STATUSES}"
+                    )
+            if "owner" in frontmatter:
+                owner = frontmatter["owner"]
+            if "points" in frontmatter:
+                points = frontmatter["points"]
+
+        return Story(
+            id=existing.id,
+            epic=existing.epic,
+            story_num=existing.story_num,
+            title=existing.title,
+            status=status,
+            owner=owner,
+            points=points,
+            priority=existing.priority,
+            sprint=existing.sprint,
+            created_at=existing.created_at,
+            updated_at=existing.updated_at,
+            content_hash=content_hash,
+        )
+
+    def _sync_files_individually(
+        self, parsed: List[_ParsedFile], report: SyncReport
+    ) -> None:
+        """Sync files one at a time (fallback when the batch fails).
+
+        Args:
+            parsed: Parsed files to sync
+            report: Report to update
+        """
+        for item in parsed:
+            if item.error:
+                report.errors.append(item.error)
+                continue
+            try:
+                result = self.sync_from_markdown(item.path)
+            except Exception as e:
+                report.errors.append(f"{item.path}: {str(e)}")
+                continue
+
+            if result["status"] == "created":
+                report.stories_created += 1
+            elif result["status"] == "updated":
+                report.stories_updated += 1
+            elif result["status"] == "skipped":
+                report.files_skipped += 1
+
+    def _load_manifest(
+        self, conn
+    ) -> Dict[str, Tuple[int, int, str, int, int]]:
+        """Load the sync manifest.
+
+        Args:
+            conn: Database connection
+
+        Returns:
+            Mapping of absolute path to (size, mtime_ns, hash, epic, story)
+        """
+        cursor = conn.execute(
+            "SELECT path, size, mtime_ns, content_hash, epic_num, story_num "
+            "FROM markdown_sync_manifest"
+        )
+        return {row[0]: tuple(row[1:]) for row in cursor}
+
+    def _load_story_index(self, conn) -> Dict[Tuple[int, int], Story]:
+        """Load all stories in one query.
+
+        Args:
+            conn: Database connection
+
+        Returns:
+            Stories keyed by (epic_num, story_num)
+        """
+        cursor = conn.execute(
+            """
+            SELECT id, epic_num, story_num, title, status, owner,
+                   points, priority, content_hash, created_at, updated_at
+            FROM stories
+            """
+        )
+        index: Dict[Tuple[int, int], Story] = {}
+        for row in cursor:
+            data = dict(row)
+            data["epic"] = data.pop("epic_num")
+            index[(data["epic"], data["story_num"])] = Story(**data)
+        return index
+
     def _calculate_hash(self, content: str) -> str:
         """Calculate SHA256 hash of content.
 
@@ -387,6 +796,7 @@ class MarkdownSyncer:
             conflicts: List of detected conflicts
             file_path: Path to markdown file with conflicts
         """
+        self.conflict_log_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.conflict_log_path, "a", encoding="utf-8") as f:
             timestamp = datetime.now().isoformat()
             f.write(f"\n[{timestamp}] Conflicts in {file_path}:\n")
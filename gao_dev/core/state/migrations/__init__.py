@@ -47,5 +47,8 @@ def get_all_migrations() -> List[Type[BaseMigration]]:
         Migration001,
     )
     from gao_dev.core.state.migrations.add_features_table import Migration002
+    from gao_dev.core.state.migrations.migration_003_add_workflow_rollups import (
+        Migration003,
+    )
 
-    return [Migration001, Migration002]
+    return [Migration001, Migration002, Migration003]
@@ -0,0 +1,87 @@
+"""Migration 003: Add daily workflow rollups.
+
+Creates the workflow dashboard rollup tables, the workflow_executions
+indexes and the triggers that keep the rollups current, and backfills the
+rollups from existing executions (see gao_dev.core.state.workflow_rollup).
+
+Applied when the state database is initialized, so dashboard and listing
+requests never run DDL or a backfill.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import structlog
+
+from ..workflow_rollup import ROLLUP_TABLES, ROLLUP_TRIGGERS, ensure_workflow_rollup
+
+logger = structlog.get_logger()
+
+
+class Migration003:
+    """Add daily workflow rollups to the state database."""
+
+    version = 3
+    description = "Add daily workflow rollup tables, indexes and triggers"
+
+    @staticmethod
+    def upgrade(db_path: Path) -> bool:
+        """Apply migration to create and backfill the workflow rollups.
+
+        Idempotent: objects that already exist are left alone.
+
+        Args:
+            db_path: Path to SQLite database
+
+        Returns:
+            True if successful
+
+        Raises:
+            Exception: If migration fails
+        """
+        try:
+            with sqlite3.connect(str(db_path)) as conn:
+                created = ensure_workflow_rollup(conn)
+                conn.commit()
+
+            logger.info(
+                "migration_applied" if created else "migration_already_applied",
+                version=Migration003.version,
+                description=Migration003.description,
+            )
+            return True
+
+        except Exception as e:
+            logger.error("migration_failed", version=Migration003.version, error=str(e))
+            raise
+
+    @staticmethod
+    def downgrade(db_path: Path) -> bool:
+        """Rollback migration.
+
+        Drops the rollup tables and triggers; the workflow_executions indexes
+        are kept since listings use them too.
+
+        Args:
+            db_path: Path to SQLite database
+
+        Returns:
+            True if successful
+
+        Raises:
+            Exception: If rollback fails
+        """
+        try:
+            with sqlite3.connect(str(db_path)) as conn:
+                for trigger in ROLLUP_TRIGGERS:
+                    conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                for table in ROLLUP_TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.commit()
+
+            logger.info("migration_rolled_back", version=Migration003.version)
+            return True
+
+        except Exception as e:
+            logger.error("rollback_failed", version=Migration003.version, error=str(e))
+            raise
@@ -0,0 +1,77 @@
+"""Keyset pagination for workflow execution listings.
+
+Workflow listings are ordered newest first by ``(started_at, id)``. A page
+is continued from an opaque cursor holding the last row's key, so each page
+is an index seek regardless of how deep the client has scrolled (unlike
+OFFSET, which re-reads every skipped row).
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from .exceptions import ValidationError
+from .models import WorkflowExecution
+
+WorkflowKey = Tuple[str, int]
+
+
+@dataclass
+class WorkflowPage:
+    """One page of workflow executions.
+
+    Attributes:
+        workflows: Executions on this page, newest first
+        next_cursor: Cursor for the following page, None on the last page
+    """
+
+    workflows: List[WorkflowExecution] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """Whether another page follows."""
+        return self.next_cursor is not None
+
+
+def encode_cursor(started_at: str, row_id: int) -> str:
+    """Encode a listing position as an opaque, URL-safe cursor.
+
+    Args:
+        started_at: started_at of the last row returned
+        row_id: id of the last row returned
+
+    Returns:
+        Cursor string
+    """
+    raw = json.dumps([started_at, row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> WorkflowKey:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        (started_at, id) of the last row of the previous page
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        started_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(started_at, str) or not isinstance(row_id, int):
+        raise ValidationError(f"Invalid cursor: {cursor!r}")
+    return started_at, row_id
+
+
+def workflow_key(workflow: WorkflowExecution) -> WorkflowKey:
+    """Keyset position of a workflow execution."""
+    return workflow.started_at, workflow.id
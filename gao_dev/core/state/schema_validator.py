@@ -10,6 +10,8 @@ from typing import Dict, Set
 
 import structlog
 
+from .workflow_rollup import ROLLUP_INDEXES, ROLLUP_TABLES, ROLLUP_TRIGGERS
+
 logger = structlog.get_logger()
 
 
@@ -65,6 +67,11 @@ class SchemaValidator:
         "features_audit_delete",
     }
 
+    # Derived objects created lazily by StateTracker (allowed, not required)
+    OPTIONAL_TABLES: Set[str] = set(ROLLUP_TABLES)
+    OPTIONAL_INDEXES: Set[str] = set(ROLLUP_INDEXES)
+    OPTIONAL_TRIGGERS: Set[str] = set(ROLLUP_TRIGGERS)
+
     # Expected columns for each table
     EXPECTED_COLUMNS: Dict[str, Set[str]] = {
         "epics": {
@@ -227,9 +234,12 @@ class SchemaValidator:
                 )
                 tables = {row[0] for row in cursor.fetchall()}
                 missing_tables = SchemaValidator.EXPECTED_TABLES - tables
-                extra_tables = tables - SchemaValidator.EXPECTED_TABLES - {
-                    "sqlite_sequence"
-                }
+                extra_tables = (
+                    tables
+                    - SchemaValidator.EXPECTED_TABLES
+                    - SchemaValidator.OPTIONAL_TABLES
+                    - {"sqlite_sequence"}
+                )
 
                 if missing_tables:
                     results["errors"].append(f"Missing tables: {missing_tables}")
@@ -270,7 +280,11 @@ class SchemaValidator:
                 )
                 indexes = {row[0] for row in cursor.fetchall()}
                 missing_indexes = SchemaValidator.EXPECTED_INDEXES - indexes
-                extra_indexes = indexes - SchemaValidator.EXPECTED_INDEXES
+                extra_indexes = (
+                    indexes
+                    - SchemaValidator.EXPECTED_INDEXES
+                    - SchemaValidator.OPTIONAL_INDEXES
+                )
 
                 if missing_indexes:
                     results["errors"].append(f"Missing indexes: {missing_indexes}")
@@ -288,7 +302,11 @@ class SchemaValidator:
                 )
                 triggers = {row[0] for row in cursor.fetchall()}
                 missing_triggers = SchemaValidator.EXPECTED_TRIGGERS - triggers
-                extra_triggers = triggers - SchemaValidator.EXPECTED_TRIGGERS
+                extra_triggers = (
+                    triggers
+                    - SchemaValidator.EXPECTED_TRIGGERS
+                    - SchemaValidator.OPTIONAL_TRIGGERS
+                )
 
                 if missing_triggers:
                     results["errors"].append(f"Missing triggers: {missing_triggers}")
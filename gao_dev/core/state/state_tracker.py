@@ -8,9 +8,22 @@ import sqlite3
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from .models import Story, Epic, Sprint, WorkflowExecution
+from .pagination import (
+    WorkflowKey,
+    WorkflowPage,
+    decode_cursor,
+    encode_cursor,
+    workflow_key,
+)
+from .workflow_rollup import (
+    ensure_workflow_rollup,
+    query_workflow_dashboard,
+    rebuild_workflow_rollup,
+    workflow_rollup_ready,
+)
 from .exceptions import (
     StateTrackerError,
     RecordNotFoundError,
@@ -936,6 +949,7 @@ class StateTracker:
             StateTrackerError: On database error
         """
         with self._get_connection() as conn:
+            ensure_workflow_rollup(conn)
             conn.execute(
                 """
                 INSERT INTO workflow_executions (
@@ -978,6 +992,7 @@ class StateTracker:
         result_str = str(result) if result else None
 
         with self._get_connection() as conn:
+            ensure_workflow_rollup(conn)
             cursor = conn.execute(
                 """
                 UPDATE workflow_executions
@@ -1137,49 +1152,111 @@ class StateTracker:
                 "avg_duration_ms": avg_duration,
             }
 
+    @staticmethod
+    def _workflow_filters(
+        workflow_type: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        status: Optional[List[str]] = None,
+        epic_num: Optional[int] = None,
+        story_num: Optional[int] = None,
+        search: Optional[str] = None,
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by workflow listings and counts.
+
+        Returns:
+            Tuple of (SQL condition, parameters)
+        """
+        query = "1=1"
+        params: List[Any] = []
+
+        if workflow_type:
+            query += " AND workflow_name = ?"
+            params.append(workflow_type)
+
+        if start_date:
+            query += " AND started_at >= ?"
+            params.append(start_date)
+
+        if end_date:
+            query += " AND started_at <= ?"
+            params.append(end_date)
+
+        if status and len(status) > 0:
+            placeholders = ",".join(["?"] * len(status))
+            query += f" AND status IN ({placeholders})"
+            params.extend(status)
+
+        if epic_num is not None:
+            query += " AND epic_num = ?"
+            params.append(epic_num)
+
+        if story_num is not None:
+            query += " AND story_num = ?"
+            params.append(story_num)
+
+        if search:
+            query += " AND (instr(lower(executor), ?) > 0 OR instr(lower(workflow_name), ?) > 0)"
+            params.extend([search.lower(), search.lower()])
+
+        return query, params
+
     def query_workflows(
         self,
         workflow_type: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         status: Optional[List[str]] = None,
+        epic_num: Optional[int] = None,
+        story_num: Optional[int] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[WorkflowKey] = None,
+        include_result: bool = True,
     ) -> List[WorkflowExecution]:
         """Query workflow executions with filters.
 
+        Results are ordered newest first by (started_at, id). Pass ``after``
+        (the key of the last row already seen, see pagination.workflow_key)
+        to continue a listing with an index seek instead of an OFFSET.
+
         Args:
             workflow_type: Filter by workflow name (optional)
             start_date: Filter by start date >= this ISO timestamp (optional)
             end_date: Filter by start date <= this ISO timestamp (optional)
             status: Filter by status values (optional list)
+            epic_num: Filter by epic number (optional)
+            story_num: Filter by story number (optional)
+            search: Case-insensitive substring of workflow id or name (optional)
+            limit: Maximum number of rows (optional, all rows if None)
+            offset: Rows to skip (page-number pagination)
+            after: Only rows strictly after this (started_at, id) key
+            include_result: Load the (potentially large) result/output column
 
         Returns:
             List of WorkflowExecution instances matching filters
         """
-        with self._get_connection() as conn:
-            # Build dynamic query
-            query = "SELECT * FROM workflow_executions WHERE 1=1"
-            params: List[Any] = []
-
-            if workflow_type:
-                query += " AND workflow_name = ?"
-                params.append(workflow_type)
-
-            if start_date:
-                query += " AND started_at >= ?"
-                params.append(start_date)
-
-            if end_date:
-                query += " AND started_at <= ?"
-                params.append(end_date)
-
-            if status and len(status) > 0:
-                placeholders = ",".join(["?"] * len(status))
-                query += f" AND status IN ({placeholders})"
-                params.extend(status)
+        where, params = self._workflow_filters(
+            workflow_type, start_date, end_date, status, epic_num, story_num, search
+        )
+        if after is not None:
+            where += " AND (started_at, id) < (?, ?)"
+            params.extend(after)
 
-            # Order by started_at descending (most recent first)
-            query += " ORDER BY started_at DESC"
+        columns = "*" if include_result else (
+            "id, executor, epic_num, story_num, workflow_name, status, "
+            "started_at, completed_at, NULL AS output"
+        )
+        query = (
+            f"SELECT {columns} FROM workflow_executions WHERE {where} "
+            "ORDER BY started_at DESC, id DESC"
+        )
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
 
+        with self._get_connection() as conn:
             cursor = conn.execute(query, params)
             workflows = []
             for row in cursor.fetchall():
@@ -1198,6 +1275,94 @@ class StateTracker:
                 workflows.append(WorkflowExecution(**wf_data))
             return workflows
 
+    def page_workflows(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        include_result: bool = False,
+        **filters: Any,
+    ) -> WorkflowPage:
+        """Get one keyset-paginated page of workflow executions.
+
+        Args:
+            limit: Page size
+            cursor: Cursor from the previous page's next_cursor (optional)
+            include_result: Load the result/output column
+            **filters: Filters accepted by query_workflows
+
+        Returns:
+            WorkflowPage with the executions and the next page's cursor
+
+        Raises:
+            ValidationError: If limit is not positive or cursor is malformed
+        """
+        if limit < 1:
+            raise ValidationError("limit must be at least 1")
+        after = decode_cursor(cursor) if cursor else None
+
+        # One extra row tells whether another page follows
+        workflows = self.query_workflows(
+            limit=limit + 1, after=after, include_result=include_result, **filters
+        )
+        next_cursor = None
+        if len(workflows) > limit:
+            workflows = workflows[:limit]
+            next_cursor = encode_cursor(*workflow_key(workflows[-1]))
+        return WorkflowPage(workflows=workflows, next_cursor=next_cursor)
+
+    def count_workflows(self, **filters: Any) -> int:
+        """Count workflow executions matching query_workflows filters.
+
+        Args:
+            **filters: Filters accepted by query_workflows
+
+        Returns:
+            Number of matching executions
+        """
+        where, params = self._workflow_filters(**filters)
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT COUNT(*) AS total FROM workflow_executions WHERE {where}", params
+            )
+            return cursor.fetchone()["total"]
+
+    def get_workflow_dashboard_metrics(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        epic_num: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Aggregate workflow metrics for the dashboard in SQL.
+
+        Whole days are read from the daily rollups maintained by triggers on
+        workflow_executions; only the partial days at the edges of a date
+        range are aggregated from raw rows. Reads never create the rollups
+        (see migration 003); without them every figure comes from raw rows.
+
+        Args:
+            start_date: Filter by start date >= this ISO timestamp (optional)
+            end_date: Filter by start date <= this ISO timestamp (optional)
+            epic_num: Filter by epic number (optional)
+
+        Returns:
+            Dictionary with summary, workflow_type_metrics, agent_utilization,
+            longest_workflows, failure_analysis and workflows_over_time
+        """
+        with self._get_connection() as conn:
+            return query_workflow_dashboard(
+                conn, start_date, end_date, epic_num, use_rollups=workflow_rollup_ready(conn)
+            )
+
+    def rebuild_workflow_rollup(self) -> int:
+        """Recompute the daily workflow rollups from workflow_executions.
+
+        Returns:
+            Number of rollup rows written
+        """
+        with self._get_connection() as conn:
+            ensure_workflow_rollup(conn)
+            return rebuild_workflow_rollup(conn)
+
     def get_workflow_types(self) -> List[str]:
         """Get all unique workflow names.
 
@@ -0,0 +1,713 @@
+"""Daily workflow execution rollups and aggregate SQL for the metrics dashboard.
+
+The dashboard used to load every ``workflow_executions`` row into Python and
+parse two timestamps per row. With tens of thousands of executions that
+dominated request time. Instead, three small rollup tables keyed by
+(day, epic) are maintained by triggers on ``workflow_executions``:
+
+- ``workflow_daily_rollup``: per workflow type, status counts and duration
+  sum/min/max (summary, per-type metrics, failure rates, daily series)
+- ``workflow_daily_agent_rollup``: per agent, execution count and duration
+- ``workflow_daily_error_rollup``: per first line of failure output
+
+Because triggers do the bookkeeping, executions tracked and updated through
+StateTracker (or any other connection) are reflected immediately. Dashboard
+queries read whole days from the rollups and only aggregate raw rows for the
+partial days at the edges of a date filter. The longest-workflows list seeks
+into an index on the duration expression, above a lower bound taken from the
+rollup's per-bucket maxima.
+
+The rollups are derived data: state migration 003 creates (and backfills)
+them when the database is initialized, StateTracker writes create them on
+databases that predate them, and they can be rebuilt at any time. Reads
+never create them; until they exist the dashboard aggregates raw rows.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+ROLLUP_TABLE = "workflow_daily_rollup"
+AGENT_ROLLUP_TABLE = "workflow_daily_agent_rollup"
+ERROR_ROLLUP_TABLE = "workflow_daily_error_rollup"
+
+# Sentinel stored for executions without an epic (part of the primary key)
+NO_EPIC = -1
+
+# Size of the longest-workflows list
+LONGEST_LIMIT = 10
+
+WORKFLOW_STATUSES = ("started", "running", "completed", "failed", "cancelled")
+
+# Derived objects, created by migration 003 (not part of schema.sql)
+ROLLUP_TABLES = (ROLLUP_TABLE, AGENT_ROLLUP_TABLE, ERROR_ROLLUP_TABLE)
+ROLLUP_INDEXES = (
+    "idx_workflow_started_at",
+    "idx_workflow_epic_started",
+    "idx_workflow_duration",
+    "idx_workflow_name_started",
+    "idx_workflow_status_started",
+    "idx_workflow_executor",
+)
+ROLLUP_TRIGGERS = (
+    "workflow_rollup_insert",
+    "workflow_rollup_update",
+    "workflow_error_rollup_update",
+    "workflow_rollup_delete",
+)
+
+
+def _col(alias: str, column: str) -> str:
+    return f"{alias}.{column}" if alias else column
+
+
+def day_sql(alias: str = "") -> str:
+    """Calendar day (first 10 chars of started_at), '' if unparseable."""
+    started = _col(alias, "started_at")
+    return (
+        f"CASE WHEN julianday({started}) IS NOT NULL "
+        f"THEN substr({started}, 1, 10) ELSE '' END"
+    )
+
+
+def agent_sql(alias: str = "") -> str:
+    """Agent name: executor prefix before the first '-', else 'Unknown'."""
+    executor = _col(alias, "executor")
+    return (
+        f"CASE WHEN instr({executor}, '-') > 0 "
+        f"THEN substr({executor}, 1, instr({executor}, '-') - 1) ELSE 'Unknown' END"
+    )
+
+
+def span_sql(alias: str = "") -> str:
+    """Execution span in days (indexed expression, NULL if not finished)."""
+    return f"julianday({_col(alias, 'completed_at')}) - julianday({_col(alias, 'started_at')})"
+
+
+def duration_sql(alias: str = "") -> str:
+    """Execution duration in seconds, to the millisecond (NULL if not finished)."""
+    return f"round(({span_sql(alias)}) * 86400.0, 3)"
+
+
+def error_message_sql(alias: str = "") -> str:
+    """First line of the execution output, at most 100 characters."""
+    output = _col(alias, "output")
+    return (
+        f"substr(CASE WHEN instr({output}, char(10)) > 0 "
+        f"THEN substr({output}, 1, instr({output}, char(10)) - 1) ELSE {output} END, 1, 100)"
+    )
+
+
+def _epic_sql(alias: str) -> str:
+    return f"COALESCE({_col(alias, 'epic_num')}, {NO_EPIC})"
+
+
+@dataclass(frozen=True)
+class _Rollup:
+    """Description of one rollup table.
+
+    Attributes:
+        table: Table name
+        key: Bucket column (besides day and epic_num)
+        values: Builds column -> expression for one execution row alias
+        count_column: Column counting rows in a bucket
+        condition: Builds the filter a row must pass to be rolled up
+        tracks_range: Whether duration_min/duration_max are kept
+    """
+
+    table: str
+    key: str
+    values: Callable[[str], Dict[str, str]]
+    count_column: str
+    condition: Optional[Callable[[str], str]] = None
+    tracks_range: bool = False
+
+    def measures(self) -> List[str]:
+        """Additive columns."""
+        skip = {"day", "epic_num", self.key, "duration_min", "duration_max"}
+        return [c for c in self.values("") if c not in skip]
+
+
+def _type_values(alias: str) -> Dict[str, str]:
+    duration = duration_sql(alias)
+    values = {
+        "day": day_sql(alias),
+        "epic_num": _epic_sql(alias),
+        "workflow_name": _col(alias, "workflow_name"),
+        "executions": "1",
+    }
+    for status in WORKFLOW_STATUSES:
+        values[status] = f"({_col(alias, 'status')} = '{status}')"
+    values.update({
+        "timed_executions": f"(({duration}) IS NOT NULL)",
+        "duration_total": f"COALESCE({duration}, 0)",
+        "duration_min": duration,
+        "duration_max": duration,
+    })
+    return values
+
+
+def _agent_values(alias: str) -> Dict[str, str]:
+    return {
+        "day": day_sql(alias),
+        "epic_num": _epic_sql(alias),
+        "agent": agent_sql(alias),
+        "executions": "1",
+        "duration_total": f"COALESCE({duration_sql(alias)}, 0)",
+    }
+
+
+def _error_values(alias: str) -> Dict[str, str]:
+    return {
+        "day": day_sql(alias),
+        "epic_num": _epic_sql(alias),
+        "message": error_message_sql(alias),
+        "failures": "1",
+    }
+
+
+def _error_condition(alias: str) -> str:
+    output = _col(alias, "output")
+    return f"{_col(alias, 'status')} = 'failed' AND {output} IS NOT NULL AND {output} != ''"
+
+
+TYPE_ROLLUP = _Rollup(
+    ROLLUP_TABLE, "workflow_name", _type_values, "executions", tracks_range=True
+)
+AGENT_ROLLUP = _Rollup(AGENT_ROLLUP_TABLE, "agent", _agent_values, "executions")
+ERROR_ROLLUP = _Rollup(
+    ERROR_ROLLUP_TABLE, "message", _error_values, "failures", condition=_error_condition
+)
+
+
+def _add_row_sql(rollup: _Rollup, alias: str) -> str:
+    """Upsert one execution row into its rollup bucket."""
+    values = rollup.values(alias)
+    where = rollup.condition(alias) if rollup.condition else "1"
+    updates = [f"{c} = {c} + excluded.{c}" for c in rollup.measures()]
+    if rollup.tracks_range:
+        updates += [
+            "duration_min = CASE WHEN excluded.duration_min IS NULL THEN duration_min "
+            "WHEN duration_min IS NULL OR excluded.duration_min < duration_min "
+            "THEN excluded.duration_min ELSE duration_min END",
+            "duration_max = CASE WHEN excluded.duration_max IS NULL THEN duration_max "
+            "WHEN duration_max IS NULL OR excluded.duration_max > duration_max "
+            "THEN excluded.duration_max ELSE duration_max END",
+        ]
+    return f"""
+    INSERT INTO {rollup.table} ({', '.join(values)})
+    SELECT {', '.join(values.values())}
+    WHERE {where}
+    ON CONFLICT (day, epic_num, {rollup.key}) DO UPDATE SET
+        {', '.join(updates)};
+    """
+
+
+def _remove_row_sql(rollup: _Rollup, alias: str) -> str:
+    """Subtract one execution row from its rollup bucket.
+
+    Counts and sums are decremented. For the type rollup, min/max are
+    recomputed from the bucket's remaining rows, but only when the removed
+    row had a duration (the common running -> completed transition never
+    pays for it).
+    """
+    values = rollup.values(alias)
+    key = " AND ".join(
+        f"{column} = {values[column]}" for column in ("day", "epic_num", rollup.key)
+    )
+    updates = [f"{c} = {c} - {values[c]}" for c in rollup.measures()]
+    if rollup.tracks_range:
+        duration = values["duration_min"]
+        bucket = f"""
+            FROM workflow_executions AS w
+            WHERE w.workflow_name = {_col(alias, 'workflow_name')}
+              AND {_epic_sql('w')} = {_epic_sql(alias)}
+              AND w.started_at >= substr({alias}.started_at, 1, 10)
+              AND w.started_at < substr({alias}.started_at, 1, 10) || '~'
+              AND {day_sql('w')} = {day_sql(alias)}
+        """
+        updates += [
+            f"duration_min = CASE WHEN ({duration}) IS NULL THEN duration_min "
+            f"ELSE (SELECT MIN({duration_sql('w')}) {bucket}) END",
+            f"duration_max = CASE WHEN ({duration}) IS NULL THEN duration_max "
+            f"ELSE (SELECT MAX({duration_sql('w')}) {bucket}) END",
+        ]
+    where = key
+    if rollup.condition:
+        where += f" AND {rollup.condition(alias)}"
+    return f"""
+    UPDATE {rollup.table} SET {', '.join(updates)} WHERE {where};
+    DELETE FROM {rollup.table} WHERE {key} AND {rollup.count_column} <= 0;
+    """
+
+
+def _table_sql(rollup: _Rollup) -> str:
+    columns = ["day TEXT NOT NULL", "epic_num INTEGER NOT NULL", f"{rollup.key} TEXT NOT NULL"]
+    columns += [
+        f"{c} {'REAL' if c == 'duration_total' else 'INTEGER'} NOT NULL DEFAULT 0"
+        for c in rollup.measures()
+    ]
+    if rollup.tracks_range:
+        columns += ["duration_min REAL", "duration_max REAL"]
+    columns.append(f"PRIMARY KEY (day, epic_num, {rollup.key})")
+    body = ",\n    ".join(columns)
+    return f"CREATE TABLE IF NOT EXISTS {rollup.table} (\n    {body}\n) WITHOUT ROWID;"
+
+
+ROLLUPS = (TYPE_ROLLUP, AGENT_ROLLUP, ERROR_ROLLUP)
+
+ROLLUP_OBJECTS_SQL = "\n".join(_table_sql(r) for r in ROLLUPS) + f"""
+CREATE INDEX IF NOT EXISTS idx_workflow_started_at
+    ON workflow_executions(started_at);
+CREATE INDEX IF NOT EXISTS idx_workflow_epic_started
+    ON workflow_executions(epic_num, started_at);
+CREATE INDEX IF NOT EXISTS idx_workflow_duration
+    ON workflow_executions({span_sql()});
+
+-- Listing filters the UI combines with the newest-first (started_at, id)
+-- keyset order; id is the rowid, so these cover seek, filter and count.
+CREATE INDEX IF NOT EXISTS idx_workflow_name_started
+    ON workflow_executions(workflow_name, started_at);
+CREATE INDEX IF NOT EXISTS idx_workflow_status_started
+    ON workflow_executions(status, started_at);
+CREATE INDEX IF NOT EXISTS idx_workflow_executor
+    ON workflow_executions(executor);
+
+CREATE TRIGGER IF NOT EXISTS workflow_rollup_insert
+AFTER INSERT ON workflow_executions
+BEGIN
+    {''.join(_add_row_sql(r, 'NEW') for r in ROLLUPS)}
+END;
+
+CREATE TRIGGER IF NOT EXISTS workflow_rollup_update
+AFTER UPDATE OF workflow_name, epic_num, status, executor, started_at, completed_at
+ON workflow_executions
+BEGIN
+    {_remove_row_sql(TYPE_ROLLUP, 'OLD')}
+    {_remove_row_sql(AGENT_ROLLUP, 'OLD')}
+    {_add_row_sql(TYPE_ROLLUP, 'NEW')}
+    {_add_row_sql(AGENT_ROLLUP, 'NEW')}
+END;
+
+-- Output changes constantly while workflows run (progress); only failed
+-- executions contribute to the error rollup.
+CREATE TRIGGER IF NOT EXISTS workflow_error_rollup_update
+AFTER UPDATE OF epic_num, status, started_at, output ON workflow_executions
+WHEN OLD.status = 'failed' OR NEW.status = 'failed'
+BEGIN
+    {_remove_row_sql(ERROR_ROLLUP, 'OLD')}
+    {_add_row_sql(ERROR_ROLLUP, 'NEW')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS workflow_rollup_delete
+AFTER DELETE ON workflow_executions
+BEGIN
+    {''.join(_remove_row_sql(r, 'OLD') for r in ROLLUPS)}
+END;
+"""
+
+
+def workflow_rollup_ready(conn: sqlite3.Connection) -> bool:
+    """Check whether all rollup tables, indexes and triggers exist (read-only).
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        True if the dashboard can read from the rollups
+    """
+    names = ROLLUP_TABLES + ROLLUP_INDEXES + ROLLUP_TRIGGERS
+    placeholders = ", ".join("?" * len(names))
+    cursor = conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})", names
+    )
+    return cursor.fetchone()[0] == len(names)
+
+
+def ensure_workflow_rollup(conn: sqlite3.Connection) -> bool:
+    """Create the rollup tables, indexes and triggers if missing.
+
+    Args:
+        conn: Connection to a database with a workflow_executions table
+
+    Returns:
+        True if any object was created (the rollups are then backfilled)
+    """
+    if workflow_rollup_ready(conn):
+        return False
+
+    # executescript() would commit the caller's transaction; run statements
+    # one at a time instead.
+    for statement in _split_statements(ROLLUP_OBJECTS_SQL):
+        conn.execute(statement)
+    buckets = rebuild_workflow_rollup(conn)
+    logger.info("workflow_rollup_created", buckets=buckets)
+    return True
+
+
+def rebuild_workflow_rollup(conn: sqlite3.Connection) -> int:
+    """Recompute all rollups from workflow_executions.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Number of rollup buckets written
+    """
+    written = 0
+    for rollup in ROLLUPS:
+        values = rollup.values("")
+        aggregates = ["day", "epic_num", rollup.key]
+        aggregates += [f"SUM({c})" for c in rollup.measures()]
+        if rollup.tracks_range:
+            aggregates += ["MIN(duration_min)", "MAX(duration_max)"]
+        where = f"WHERE {rollup.condition('')}" if rollup.condition else ""
+
+        conn.execute(f"DELETE FROM {rollup.table}")
+        cursor = conn.execute(
+            f"""
+            INSERT INTO {rollup.table} ({', '.join(values)})
+            SELECT {', '.join(aggregates)}
+            FROM (
+                SELECT {', '.join(f'{expr} AS {c}' for c, expr in values.items())}
+                FROM workflow_executions {where}
+            )
+            GROUP BY day, epic_num, {rollup.key}
+            """
+        )
+        written += cursor.rowcount
+    return written
+
+
+def _split_statements(script: str) -> List[str]:
+    """Split a DDL script into statements (trigger bodies kept whole)."""
+    statements = []
+    buffer: List[str] = []
+    for line in script.splitlines():
+        if not line.strip() or (not buffer and line.startswith("--")):
+            continue
+        buffer.append(line)
+        candidate = "\n".join(buffer)
+        if line.rstrip().endswith(";") and sqlite3.complete_statement(candidate):
+            statements.append(candidate)
+            buffer = []
+    return statements
+
+
+def _valid_bound(value: Optional[str]) -> bool:
+    """Whether a date filter starts with a YYYY-MM-DD calendar day."""
+    if value is None:
+        return True
+    try:
+        date.fromisoformat(value[:10])
+    except ValueError:
+        return False
+    return True
+
+
+def _raw_filters(
+    start_date: Optional[str], end_date: Optional[str], epic: Optional[int]
+) -> Tuple[List[str], List[Any]]:
+    conditions: List[str] = []
+    params: List[Any] = []
+    if start_date is not None:
+        conditions.append("started_at >= ?")
+        params.append(start_date)
+    if end_date is not None:
+        conditions.append("started_at <= ?")
+        params.append(end_date)
+    if epic is not None:
+        conditions.append("epic_num = ?")
+        params.append(epic)
+    return conditions, params
+
+
+def _whole_day_filters(
+    start_date: Optional[str], end_date: Optional[str], epic: Optional[int]
+) -> Tuple[List[str], List[Any]]:
+    """Rollup conditions selecting the days that lie entirely in the range."""
+    conditions: List[str] = []
+    params: List[Any] = []
+    if start_date is not None or end_date is not None:
+        conditions.append("day != ''")
+    if start_date is not None:
+        conditions.append("day > ?")
+        params.append(start_date[:10])
+    if end_date is not None:
+        conditions.append("day < ?")
+        params.append(end_date[:10])
+    if epic is not None:
+        conditions.append("epic_num = ?")
+        params.append(epic)
+    return conditions, params
+
+
+def _longest_threshold(
+    conn: sqlite3.Connection,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    epic: Optional[int],
+    limit: int,
+) -> Optional[float]:
+    """Lower bound on the duration of the top ``limit`` executions.
+
+    Each of the ``limit`` type-rollup buckets with the largest duration_max
+    holds at least one matching execution at least that long, so the
+    ``limit``-th largest bucket maximum bounds the top-N from below. That lets
+    the longest-workflows query seek into the duration index instead of
+    sorting every matching row.
+    """
+    if not (_valid_bound(start_date) and _valid_bound(end_date)):
+        return None
+    conditions, params = _whole_day_filters(start_date, end_date, epic)
+    conditions.append("duration_max IS NOT NULL")
+    row = conn.execute(
+        f"""
+        SELECT duration_max FROM {ROLLUP_TABLE}
+        WHERE {' AND '.join(conditions)}
+        ORDER BY duration_max DESC
+        LIMIT 1 OFFSET ?
+        """,
+        params + [limit - 1],
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _source_sql(
+    rollup: _Rollup,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    epic: Optional[int],
+    use_rollups: bool = True,
+) -> Tuple[str, List[Any]]:
+    """Build a subquery yielding rollup rows for the filters.
+
+    Whole days inside the range come from the rollup table; the partial days
+    at the range edges (and everything, for unparseable bounds or without
+    rollups) come from workflow_executions projected into the same columns.
+    """
+    values = rollup.values("")
+    raw_select = (
+        f"SELECT {', '.join(f'{expr} AS {c}' for c, expr in values.items())} "
+        "FROM workflow_executions"
+    )
+    base_conditions = [rollup.condition("")] if rollup.condition else []
+
+    if not (use_rollups and _valid_bound(start_date) and _valid_bound(end_date)):
+        conditions, params = _raw_filters(start_date, end_date, epic)
+        conditions = base_conditions + conditions
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return raw_select + where, params
+
+    # Whole days from the rollup
+    conditions, params = _whole_day_filters(start_date, end_date, epic)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    parts = [f"SELECT {', '.join(values)} FROM {rollup.table}{where}"]
+
+    # Partial edge days from raw rows (a few hundred rows at most per day)
+    raw_select += " INDEXED BY idx_workflow_started_at"
+    for day in sorted({b[:10] for b in (start_date, end_date) if b is not None}):
+        conditions, raw_params = _raw_filters(start_date, end_date, epic)
+        conditions = ["started_at >= ?", "started_at < ?"] + base_conditions + conditions
+        parts.append(raw_select + " WHERE " + " AND ".join(conditions))
+        params.extend([day, day + "~"] + raw_params)
+
+    return " UNION ALL ".join(parts), params
+
+
+def _rate(part: int, whole: int) -> float:
+    return round(part / whole * 100.0, 2) if whole > 0 else 0.0
+
+
+def query_workflow_dashboard(
+    conn: sqlite3.Connection,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    epic: Optional[int] = None,
+    use_rollups: bool = True,
+) -> Dict[str, Any]:
+    """Compute the workflow metrics dashboard with aggregate SQL.
+
+    Args:
+        conn: Database connection
+        start_date: Only executions started at or after this ISO timestamp
+        end_date: Only executions started at or before this ISO timestamp
+        epic: Only executions for this epic
+        use_rollups: Read whole days from the rollups (they must exist, see
+            workflow_rollup_ready); False aggregates workflow_executions only
+
+    Returns:
+        Dictionary with summary, workflow_type_metrics, agent_utilization,
+        longest_workflows, failure_analysis and workflows_over_time
+    """
+    type_source, type_params = _source_sql(TYPE_ROLLUP, start_date, end_date, epic, use_rollups)
+    sums = ", ".join(f"SUM({c}) AS {c}" for c in TYPE_ROLLUP.measures())
+
+    # Per workflow type (the summary is the sum over types)
+    type_rows = conn.execute(
+        f"""
+        SELECT workflow_name, {sums},
+               MIN(duration_min) AS duration_min, MAX(duration_max) AS duration_max
+        FROM ({type_source})
+        GROUP BY workflow_name
+        """,
+        type_params,
+    ).fetchall()
+
+    totals = {c: sum(row[c] for row in type_rows) for c in TYPE_ROLLUP.measures()}
+    total_workflows = totals["executions"]
+    finished = totals["completed"] + totals["failed"] + totals["cancelled"]
+    summary = {
+        "total_workflows": total_workflows,
+        "completed": totals["completed"],
+        "failed": totals["failed"],
+        "cancelled": totals["cancelled"],
+        "running": totals["running"],
+        "pending": totals["started"],
+        "success_rate": _rate(totals["completed"], finished),
+        "average_duration": (
+            round(totals["duration_total"] / totals["timed_executions"], 2)
+            if totals["timed_executions"] else 0.0
+        ),
+        "total_duration": round(totals["duration_total"], 2),
+    }
+
+    workflow_type_metrics = []
+    most_failed_workflows = []
+    for row in type_rows:
+        type_finished = row["completed"] + row["failed"] + row["cancelled"]
+        workflow_type_metrics.append({
+            "workflow_type": row["workflow_name"],
+            "count": row["executions"],
+            "average_duration": (
+                round(row["duration_total"] / row["timed_executions"], 2)
+                if row["timed_executions"] else 0.0
+            ),
+            "success_rate": _rate(row["completed"], type_finished),
+            "min_duration": round(row["duration_min"] or 0.0, 2),
+            "max_duration": round(row["duration_max"] or 0.0, 2),
+        })
+        if row["failed"] > 0:
+            most_failed_workflows.append({
+                "workflow_type": row["workflow_name"],
+                "failure_count": row["failed"],
+                "total_count": row["executions"],
+                "failure_rate": _rate(row["failed"], row["executions"]),
+            })
+    workflow_type_metrics.sort(key=lambda x: x["count"], reverse=True)
+    most_failed_workflows.sort(key=lambda x: x["failure_count"], reverse=True)
+
+    # Daily series (days with at least one finished execution)
+    workflows_over_time = [
+        {
+            "date": row["day"],
+            "completed": row["completed"],
+            "failed": row["failed"],
+            "cancelled": row["cancelled"],
+        }
+        for row in conn.execute(
+            f"""
+            SELECT day, SUM(completed) AS completed, SUM(failed) AS failed,
+                   SUM(cancelled) AS cancelled
+            FROM ({type_source})
+            WHERE day != ''
+            GROUP BY day
+            HAVING SUM(completed) + SUM(failed) + SUM(cancelled) > 0
+            ORDER BY day
+            """,
+            type_params,
+        )
+    ]
+
+    # Agent utilization
+    agent_source, agent_params = _source_sql(
+        AGENT_ROLLUP, start_date, end_date, epic, use_rollups
+    )
+    agent_utilization = [
+        {
+            "agent": row["agent"],
+            "workflow_count": row["executions"],
+            "total_duration": round(row["duration_total"], 2),
+            "percentage": _rate(row["executions"], total_workflows),
+        }
+        for row in conn.execute(
+            f"""
+            SELECT agent, SUM(executions) AS executions,
+                   SUM(duration_total) AS duration_total
+            FROM ({agent_source})
+            GROUP BY agent
+            ORDER BY executions DESC, agent
+            """,
+            agent_params,
+        )
+    ]
+
+    # Common errors
+    error_source, error_params = _source_sql(
+        ERROR_ROLLUP, start_date, end_date, epic, use_rollups
+    )
+    common_errors = [
+        {"error_message": row["message"], "count": row["count"]}
+        for row in conn.execute(
+            f"""
+            SELECT message, SUM(failures) AS count
+            FROM ({error_source})
+            GROUP BY message
+            ORDER BY count DESC, message
+            LIMIT 10
+            """,
+            error_params,
+        )
+    ]
+
+    # Longest workflows: seek into the span index above a bound from the rollup
+    conditions, raw_params = _raw_filters(start_date, end_date, epic)
+    source = "workflow_executions"
+    threshold = None
+    if use_rollups:
+        threshold = _longest_threshold(conn, start_date, end_date, epic, LONGEST_LIMIT)
+    if threshold is not None:
+        source += " INDEXED BY idx_workflow_duration"
+        # Bucket maxima are rounded to the millisecond
+        conditions.insert(0, f"{span_sql()} >= ?")
+        raw_params.insert(0, (threshold - 0.001) / 86400.0)
+    raw_where = "".join(f" AND {c}" for c in conditions)
+    longest_workflows = [
+        {
+            "workflow_id": row["executor"],
+            "workflow_name": row["workflow_name"],
+            "duration": round(row["duration"], 2),
+            "status": row["status"],
+            "agent": row["agent"],
+            "started_at": row["started_at"],
+        }
+        for row in conn.execute(
+            f"""
+            SELECT executor, workflow_name, status, started_at,
+                   {agent_sql()} AS agent, {duration_sql()} AS duration
+            FROM {source}
+            WHERE {span_sql()} IS NOT NULL{raw_where}
+            ORDER BY {span_sql()} DESC, started_at DESC
+            LIMIT ?
+            """,
+            raw_params + [LONGEST_LIMIT],
+        )
+    ]
+
+    return {
+        "summary": summary,
+        "workflow_type_metrics": workflow_type_metrics,
+        "agent_utilization": agent_utilization,
+        "longest_workflows": longest_workflows,
+        "failure_analysis": {
+            "most_failed_workflows": most_failed_workflows[:10],
+            "most_failed_steps": [],  # Would need step-level tracking
+            "common_errors": common_errors,
+        },
+        "workflows_over_time": workflows_over_time,
+    }
@@ -7,11 +7,12 @@ Epic: 24 - State Tables & Tracker
 Story: 24.7 - Implement StateCoordinator Facade
 
 Design Pattern: Facade
-Dependencies: All 5 state services, structlog
+Dependencies: All 5 state services, StateEngine, structlog
 """
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 
 import structlog
 
@@ -20,6 +21,8 @@ from gao_dev.core.services.story_state_service import StoryStateService
 from gao_dev.core.services.action_item_service import ActionItemService
 from gao_dev.core.services.ceremony_service import CeremonyService
 from gao_dev.core.services.learning_index_service import LearningIndexService
+from gao_dev.core.services.state_engine import StateEngine
+from gao_dev.core.services.state_rollup_service import StateRollupService
 from gao_dev.core.services.feature_state_service import (
     FeatureStateService,
     Feature,
@@ -37,6 +40,11 @@ class StateCoordinator:
     Provides unified interface to epic, story, action item, ceremony,
     learning, and feature state services with coordinated operations.
 
+    All services share one StateEngine (one connection per thread), and
+    multi-service operations run in a single unit of work, so they commit
+    once. Per-operation commit counts are available from
+    get_transaction_stats().
+
     Example:
         ```python
         coordinator = StateCoordinator(
@@ -72,27 +80,80 @@ class StateCoordinator:
         ```
     """
 
-    def __init__(self, db_path: Path, project_root: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Path,
+        project_root: Optional[Path] = None,
+        cache_rollups: bool = False,
+    ):
         """
         Initialize state coordinator with all services.
 
         Args:
             db_path: Path to SQLite database file (shared across all services)
             project_root: Project root directory (for feature service)
+            cache_rollups: Materialize per-epic progress rollups, refreshed
+                by triggers on story changes (see StateRollupService)
         """
         self.db_path = Path(db_path)
         self.project_root = Path(project_root) if project_root else self.db_path.parent.parent
 
-        # Initialize all services with same database
-        self.epic_service = EpicStateService(db_path=self.db_path)
-        self.story_service = StoryStateService(db_path=self.db_path)
-        self.action_service = ActionItemService(db_path=self.db_path)
-        self.ceremony_service = CeremonyService(db_path=self.db_path)
-        self.learning_service = LearningIndexService(db_path=self.db_path)
-        self.feature_service = FeatureStateService(project_root=self.project_root)
+        # Initialize all services on one shared engine
+        self.engine = StateEngine(self.db_path)
+        self.epic_service = EpicStateService(db_path=self.db_path, engine=self.engine)
+        self.story_service = StoryStateService(db_path=self.db_path, engine=self.engine)
+        self.action_service = ActionItemService(db_path=self.db_path, engine=self.engine)
+        self.ceremony_service = CeremonyService(db_path=self.db_path, engine=self.engine)
+        self.learning_service = LearningIndexService(db_path=self.db_path, engine=self.engine)
+        self.rollup_service = StateRollupService(
+            db_path=self.db_path, engine=self.engine, cache_rollups=cache_rollups
+        )
+
+        # Feature service derives its database from project_root; only share
+        # the engine when that is the same file
+        feature_db = self.project_root / ".gao-dev" / "documents.db"
+        feature_engine = (
+            self.engine if feature_db.resolve() == self.db_path.resolve() else None
+        )
+        self.feature_service = FeatureStateService(
+            project_root=self.project_root, engine=feature_engine
+        )
 
         self.logger = logger.bind(service="state_coordinator")
 
+    # Transactions
+
+    @contextmanager
+    def unit_of_work(self, name: str = "unit_of_work") -> Iterator[None]:
+        """
+        Run several coordinator or service calls as one transaction.
+
+        Everything inside commits once when the block exits, or rolls back
+        if it raises. Nested units join the outer one.
+
+        Args:
+            name: Operation name for get_transaction_stats()
+
+        Example:
+            ```python
+            with coordinator.unit_of_work("sprint_close"):
+                coordinator.complete_story(1, 3, auto_update_epic=True)
+                coordinator.record_ceremony("retrospective", "Went well")
+            ```
+        """
+        with self.engine.unit_of_work(name):
+            yield
+
+    def get_transaction_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get commit and rollback counts per logical operation.
+
+        Returns:
+            Mapping of operation name to operations, commits, rollbacks and
+            commits_per_operation (writes outside a unit are "autocommit")
+        """
+        return self.engine.get_stats()
+
     # Epic Operations
 
     def create_epic(
@@ -160,7 +221,7 @@ class StateCoordinator:
         """
         Create new story.
 
-        Optionally updates epic's total_stories count.
+        Optionally updates epic's total_stories count (in the same transaction).
 
         Args:
             epic_num: Epic number
@@ -176,31 +237,32 @@ class StateCoordinator:
         Returns:
             Created story record
         """
-        # Create story
-        story = self.story_service.create(
-            epic_num=epic_num,
-            story_num=story_num,
-            title=title,
-            status=status,
-            assignee=assignee,
-            priority=priority,
-            estimate_hours=estimate_hours,
-            metadata=metadata,
-        )
-
-        # Update epic if requested
-        if auto_update_epic:
-            epic = self.epic_service.get(epic_num)
-            self.epic_service.update_progress(
-                epic_num=epic_num, total_stories=epic["total_stories"] + 1
-            )
-
-            self.logger.info(
-                "epic_total_stories_incremented",
+        with self.engine.unit_of_work("create_story"):
+            # Create story
+            story = self.story_service.create(
                 epic_num=epic_num,
-                new_total=epic["total_stories"] + 1,
+                story_num=story_num,
+                title=title,
+                status=status,
+                assignee=assignee,
+                priority=priority,
+                estimate_hours=estimate_hours,
+                metadata=metadata,
             )
 
+            # Update epic if requested
+            if auto_update_epic:
+                epic = self.epic_service.get(epic_num)
+                self.epic_service.update_progress(
+                    epic_num=epic_num, total_stories=epic["total_stories"] + 1
+                )
+
+                self.logger.info(
+                    "epic_total_stories_incremented",
+                    epic_num=epic_num,
+                    new_total=epic["total_stories"] + 1,
+                )
+
         return story
 
     def complete_story(
@@ -213,7 +275,8 @@ class StateCoordinator:
         """
         Mark story as completed.
 
-        Optionally updates epic's completed_stories count and progress.
+        Optionally updates epic's completed_stories count and progress (in
+        the same transaction).
 
         Args:
             epic_num: Epic number
@@ -224,36 +287,37 @@ class StateCoordinator:
         Returns:
             Updated story record
         """
-        # Complete story
-        story = self.story_service.complete(
-            epic_num=epic_num, story_num=story_num, actual_hours=actual_hours
-        )
-
-        # Update epic if requested
-        if auto_update_epic:
-            epic = self.epic_service.get(epic_num)
-            new_completed = epic["completed_stories"] + 1
-
-            # Auto-transition epic to in_progress or completed
-            new_status = epic["status"]
-            if new_status == "planning" and new_completed > 0:
-                new_status = "in_progress"
-            elif new_completed >= epic["total_stories"] and epic["total_stories"] > 0:
-                new_status = "completed"
-
-            self.epic_service.update_progress(
-                epic_num=epic_num,
-                completed_stories=new_completed,
-                status=new_status,
+        with self.engine.unit_of_work("complete_story"):
+            # Complete story
+            story = self.story_service.complete(
+                epic_num=epic_num, story_num=story_num, actual_hours=actual_hours
             )
 
-            self.logger.info(
-                "epic_progress_auto_updated",
-                epic_num=epic_num,
-                completed_stories=new_completed,
-                total_stories=epic["total_stories"],
-                new_status=new_status,
-            )
+            # Update epic if requested
+            if auto_update_epic:
+                epic = self.epic_service.get(epic_num)
+                new_completed = epic["completed_stories"] + 1
+
+                # Auto-transition epic to in_progress or completed
+                new_status = epic["status"]
+                if new_status == "planning" and new_completed > 0:
+                    new_status = "in_progress"
+                elif new_completed >= epic["total_stories"] and epic["total_stories"] > 0:
+                    new_status = "completed"
+
+                self.epic_service.update_progress(
+                    epic_num=epic_num,
+                    completed_stories=new_completed,
+                    status=new_status,
+                )
+
+                self.logger.info(
+                    "epic_progress_auto_updated",
+                    epic_num=epic_num,
+                    completed_stories=new_completed,
+                    total_stories=epic["total_stories"],
+                    new_status=new_status,
+                )
 
         return story
 
@@ -433,6 +497,9 @@ class StateCoordinator:
         - Story counts
         - Completion metrics
 
+        Epics belong to a feature through their metadata "feature" key. Story
+        counts come from one aggregate query over the feature's epics.
+
         Args:
             name: Feature name
 
@@ -440,7 +507,8 @@ class StateCoordinator:
             Dictionary with:
                 - feature: Feature dict
                 - epics: List of Epic dicts for this feature
-                - epic_summaries: List of {epic_num, title, status, story_count, completed_count}
+                - epic_summaries: List of {epic_num, title, status, story_count,
+                  completed_count, ...} (see StateRollupService.get_epic_rollups)
                 - total_stories: Total story count across all epics
                 - completed_stories: Number of completed stories
                 - completion_pct: Percentage of stories complete
@@ -453,37 +521,11 @@ class StateCoordinator:
         if not feature:
             raise ValueError(f"Feature '{name}' not found")
 
-        # Get all epics for this feature (from epics table, filter by feature column)
-        # Note: EpicStateService uses epic_state table, but we need epics table
-        # Since EpicStateService doesn't support feature filtering yet,
-        # we'll query directly or filter in-memory
-        all_epics = self.epic_service.list()
-        feature_epics = [e for e in all_epics if e.get("feature") == name]
-
-        # Build epic summaries
-        epic_summaries = []
-        total_stories = 0
-        completed_stories = 0
-
-        for epic in feature_epics:
-            epic_num = epic["epic_num"]
-            stories = self.story_service.list_by_epic(epic_num)
-            story_count = len(stories)
-            completed_count = len([s for s in stories if s["status"] == "completed"])
-
-            epic_summaries.append(
-                {
-                    "epic_num": epic_num,
-                    "title": epic["title"],
-                    "status": epic["status"],
-                    "story_count": story_count,
-                    "completed_count": completed_count,
-                }
-            )
-
-            total_stories += story_count
-            completed_stories += completed_count
+        feature_epics = self.epic_service.list_by_feature(name)
+        epic_summaries = self.rollup_service.get_epic_rollups(feature=name)
 
+        total_stories = sum(epic["story_count"] for epic in epic_summaries)
+        completed_stories = sum(epic["completed_count"] for epic in epic_summaries)
         completion_pct = (
             (completed_stories / total_stories * 100) if total_stories > 0 else 0.0
         )
@@ -506,6 +548,12 @@ class StateCoordinator:
             "completion_pct": completion_pct,
         }
 
+    def get_feature_rollups(
+        self, names: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get story progress per feature (facade to StateRollupService)."""
+        return self.rollup_service.get_feature_rollups(features=names)
+
     # Cleanup
 
     def close(self) -> None:
@@ -515,7 +563,9 @@ class StateCoordinator:
         self.action_service.close()
         self.ceremony_service.close()
         self.learning_service.close()
+        self.rollup_service.close()
         self.feature_service.close()
+        self.engine.close()
 
     def __enter__(self):
         """Context manager entry."""
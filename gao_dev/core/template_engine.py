@@ -0,0 +1,112 @@
+"""Compiled {{variable}} template rendering.
+
+Shared by WorkflowExecutor and PromptTemplate. A template is parsed once
+into literal chunks and variable slots; rendering is then a single pass that
+joins the chunks with the variable values instead of one replace/regex pass
+per variable.
+
+Semantics match the original per-variable substitution:
+- Only exact ``{{name}}`` placeholders are replaced (no whitespace trimming)
+- Placeholders without a value are left in the output unchanged
+- Values are inserted with ``str(value)`` and are never re-scanned for
+  placeholders
+
+Example:
+    ```python
+    template = compile_template("Hello {{name}}, welcome to {{project}}!")
+    template.render({"name": "Alice", "project": "GAO-Dev"})
+    # "Hello Alice, welcome to GAO-Dev!"
+    ```
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, FrozenSet, Mapping, Tuple
+
+# {{name}} where name contains no braces (so "{{{x}}}" renders as "{" + x + "}")
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
+
+# Compiled templates cached by source text (workflow templates, instructions, prompts)
+TEMPLATE_CACHE_SIZE = 1024
+
+
+class CompiledTemplate:
+    """
+    Template parsed into literal chunks and variable slots.
+
+    Attributes:
+        source: Original template text
+        variables: Names of all placeholders in the template
+    """
+
+    __slots__ = ("source", "variables", "_literals", "_slots")
+
+    def __init__(self, source: str):
+        """
+        Parse template source.
+
+        Args:
+            source: Template text with {{variable}} placeholders
+        """
+        parts = PLACEHOLDER_PATTERN.split(source)
+        self.source = source
+        # split() alternates literal, name, literal, ..., literal
+        self._literals: Tuple[str, ...] = tuple(parts[0::2])
+        self._slots: Tuple[str, ...] = tuple(parts[1::2])
+        self.variables: FrozenSet[str] = frozenset(self._slots)
+
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """
+        Render template in a single pass.
+
+        Args:
+            variables: Variable values by name
+
+        Returns:
+            Rendered text
+        """
+        if not self._slots:
+            return self.source
+
+        literals = self._literals
+        out = [literals[0]]
+        append = out.append
+        for position, name in enumerate(self._slots, start=1):
+            if name in variables:
+                append(str(variables[name]))
+            else:
+                append("{{" + name + "}}")
+            append(literals[position])
+        return "".join(out)
+
+    def __repr__(self) -> str:
+        """Developer representation."""
+        return f"CompiledTemplate(slots={len(self._slots)}, length={len(self.source)})"
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(source: str) -> CompiledTemplate:
+    """
+    Compile template source, reusing the cached result for identical text.
+
+    Args:
+        source: Template text with {{variable}} placeholders
+
+    Returns:
+        CompiledTemplate
+    """
+    return CompiledTemplate(source)
+
+
+def render_template(source: str, variables: Mapping[str, Any]) -> str:
+    """
+    Render template source with variables (compiling it on first use).
+
+    Args:
+        source: Template text with {{variable}} placeholders
+        variables: Variable values by name
+
+    Returns:
+        Rendered text
+    """
+    return compile_template(source).render(variables)
@@ -3,17 +3,22 @@
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
-import re
 import structlog
 
+from .catalog_cache import get_catalog_cache
 from .models.workflow import WorkflowInfo
 from .models.workflow_context import WorkflowContext
 from .config_loader import ConfigLoader
+from .template_engine import compile_template
 from .services.feature_path_resolver import FeaturePathResolver
 from .services.feature_state_service import FeatureStateService
 
 logger = structlog.get_logger(__name__)
 
+# Passes over variable values that reference other variables (e.g. a default of
+# "{{feature_dir}}/x" where feature_dir is "docs/features/{{feature_name}}")
+MAX_VARIABLE_EXPANSION_DEPTH = 5
+
 
 class WorkflowExecutor:
     """
@@ -48,6 +53,7 @@ class WorkflowExecutor:
         """
         self.config_loader = config_loader
         self.project_root = project_root or Path.cwd()
+        self.catalog = get_catalog_cache(project_root)
 
         # Initialize FeaturePathResolver if feature_service provided
         self.feature_resolver: Optional[FeaturePathResolver] = None
@@ -117,6 +123,7 @@ class WorkflowExecutor:
         NEW ENHANCEMENT (Story 34.3):
         5. Feature name resolution (FeaturePathResolver with 6-level priority)
         6. Feature-scoped path generation (using resolved feature_name)
+        7. Placeholders inside values expanded against the other variables
 
         Args:
             workflow: Workflow info
@@ -215,6 +222,11 @@ class WorkflowExecutor:
                 paths=list(feature_paths.keys())
             )
 
+        # Layer 7: Expand placeholders inside values (defaults such as
+        # feature_dir reference feature_name, epic, ...). Rendering is single
+        # pass, so this must happen before templates are rendered.
+        self._expand_variable_values(variables)
+
         # Validate required variables
         for var_name, var_config in workflow.variables.items():
             if var_config.get("required", False) and var_name not in variables:
@@ -228,6 +240,28 @@ class WorkflowExecutor:
 
         return variables
 
+    def _expand_variable_values(self, variables: Dict[str, Any]) -> None:
+        """
+        Render {{variable}} placeholders inside string variable values in place.
+
+        Repeats until no value changes (or MAX_VARIABLE_EXPANSION_DEPTH passes),
+        so values that reference other templated values resolve fully.
+        Placeholders without a value are left unchanged.
+
+        Args:
+            variables: Resolved variables (modified in place)
+        """
+        for _ in range(MAX_VARIABLE_EXPANSION_DEPTH):
+            changed = False
+            for name, value in variables.items():
+                if isinstance(value, str) and "{{" in value:
+                    rendered = compile_template(value).render(variables)
+                    if rendered != value:
+                        variables[name] = rendered
+                        changed = True
+            if not changed:
+                return
+
     def _workflow_requires_feature_name(self, workflow: WorkflowInfo) -> bool:
         """
         Check if workflow requires feature_name.
@@ -331,7 +365,7 @@ class WorkflowExecutor:
         """
         instructions_file = workflow.installed_path / "instructions.md"
         if instructions_file.exists():
-            return instructions_file.read_text(encoding="utf-8")
+            return self.catalog.get_text(instructions_file)
         return ""
 
     def _load_template(self, workflow: WorkflowInfo, template_name: str) -> Optional[str]:
@@ -351,13 +385,16 @@ class WorkflowExecutor:
 
         template_file = workflow.installed_path / template_filename
         if template_file.exists():
-            return template_file.read_text(encoding="utf-8")
+            return self.catalog.get_text(template_file)
         return None
 
     def _render_template(self, template: str, variables: Dict[str, Any]) -> str:
         """
         Render template with variables using Mustache-style syntax.
 
+        The template is compiled once (cached by its text) and rendered in a
+        single pass, so values such as Windows paths are inserted verbatim.
+
         Args:
             template: Template string
             variables: Variables dictionary
@@ -365,17 +402,9 @@ class WorkflowExecutor:
         Returns:
             Rendered template
         """
-        rendered = template
-
-        # Replace {{variable}} with value
-        for key, value in variables.items():
-            pattern = r"\{\{" + re.escape(str(key)) + r"\}\}"
-            # Escape backslashes in replacement string to avoid regex escape sequence issues
-            # This is critical for Windows paths (C:\Users\... becomes C:\\Users\\...)
-            replacement = str(value).replace("\\", "\\\\")
-            rendered = re.sub(pattern, replacement, rendered)
-
-        return rendered
+        return compile_template(template).render(
+            {str(key): value for key, value in variables.items()}
+        )
 
     # ========================================================================
     # Public API Methods
@@ -2,8 +2,8 @@
 
 from pathlib import Path
 from typing import Dict, List, Optional
-import yaml
 
+from .catalog_cache import CatalogCache, get_catalog_cache
 from .models.workflow import WorkflowInfo
 from .config_loader import ConfigLoader
 
@@ -11,14 +11,18 @@ from .config_loader import ConfigLoader
 class WorkflowRegistry:
     """Discover and manage GAO-Dev workflows."""
 
-    def __init__(self, config_loader: ConfigLoader):
+    def __init__(self, config_loader: ConfigLoader, catalog: Optional[CatalogCache] = None):
         """
         Initialize workflow registry.
 
         Args:
             config_loader: Configuration loader instance
+            catalog: Parsed-file catalog (defaults to the shared project catalog)
         """
         self.config_loader = config_loader
+        self.catalog = catalog if catalog is not None else get_catalog_cache(
+            getattr(config_loader, "project_root", None)
+        )
         self._workflows: Dict[str, WorkflowInfo] = {}
         self._indexed = False
 
@@ -48,6 +52,7 @@ class WorkflowRegistry:
                     # Use workflow name as key (later paths override earlier ones)
                     self._workflows[workflow_info.name] = workflow_info
 
+        self.catalog.flush()
         self._indexed = True
 
     def _load_workflow(self, workflow_file: Path) -> Optional[WorkflowInfo]:
@@ -61,8 +66,7 @@ class WorkflowRegistry:
             WorkflowInfo if valid, None otherwise
         """
         try:
-            with open(workflow_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = self.catalog.get_yaml(workflow_file)
 
             if not data or "name" not in data:
                 return None
@@ -20,6 +20,7 @@ from gao_dev.lifecycle.models import (
     DocumentType,
     DocumentState,
     RelationshipType,
+    ScanManifestEntry,
 )
 from gao_dev.lifecycle.scanner import DocumentScanner, ScanResult
 from gao_dev.lifecycle.archival import ArchivalManager, RetentionPolicy, ArchivalAction
@@ -34,6 +35,7 @@ __all__ = [
     "DocumentType",
     "DocumentState",
     "RelationshipType",
+    "ScanManifestEntry",
     "DocumentScanner",
     "ScanResult",
     "ArchivalManager",
@@ -104,8 +104,59 @@ class DocumentLifecycleManager:
             ...     metadata={"version": "1.0"}
             ... )
         """
-        # Extract metadata from file
-        extracted_metadata = self._extract_metadata(path)
+        record = self.prepare_registration(path, doc_type, author, metadata)
+        merged_metadata = record["metadata"]
+
+        # Register in database
+        document = self.registry.register_document(
+            path=record["path"],
+            doc_type=record["doc_type"],
+            author=record["author"],
+            metadata=merged_metadata,
+            owner=record["owner"],
+            reviewer=record["reviewer"],
+            feature=record["feature"],
+            epic=record["epic"],
+            story=record["story"],
+        )
+
+        # Create relationships from frontmatter
+        if "related_docs" in merged_metadata:
+            self._create_relationships(document, merged_metadata["related_docs"])
+
+        return document
+
+    def prepare_registration(
+        self,
+        path: Path,
+        doc_type: str,
+        author: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        extracted_metadata: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the registry fields for a new document without writing anything.
+
+        Merges path-derived, frontmatter and provided metadata (in increasing
+        priority) and lifts governance fields out of the result, exactly as
+        register_document does. Batch callers that have already read the file
+        pass its frontmatter and hash to avoid reading it again.
+
+        Args:
+            path: Path to document file
+            doc_type: Document type
+            author: Document author
+            metadata: Optional metadata (takes precedence)
+            extracted_metadata: Frontmatter, if already parsed (default: read file)
+            content_hash: Content hash, if already computed (default: hash file)
+
+        Returns:
+            Dictionary with path, doc_type, author, metadata, content_hash,
+            owner, reviewer, feature, epic and story
+        """
+        if extracted_metadata is None:
+            extracted_metadata = self._extract_metadata(path)
 
         # Extract feature/epic from path
         path_metadata = self._extract_path_metadata(path)
@@ -118,35 +169,23 @@ class DocumentLifecycleManager:
         }
 
         # Calculate content hash
-        content_hash = self._calculate_content_hash(path)
+        if content_hash is None:
+            content_hash = self._calculate_content_hash(path)
         if content_hash:
             merged_metadata["content_hash"] = content_hash
 
-        # Extract governance fields
-        owner = merged_metadata.get("owner")
-        reviewer = merged_metadata.get("reviewer")
-        feature = merged_metadata.get("feature")
-        epic = merged_metadata.get("epic")
-        story = merged_metadata.get("story")
-
-        # Register in database
-        document = self.registry.register_document(
-            path=str(path),
-            doc_type=doc_type,
-            author=author,
-            metadata=merged_metadata,
-            owner=owner,
-            reviewer=reviewer,
-            feature=feature,
-            epic=epic,
-            story=story,
-        )
-
-        # Create relationships from frontmatter
-        if "related_docs" in merged_metadata:
-            self._create_relationships(document, merged_metadata["related_docs"])
-
-        return document
+        return {
+            "path": str(path),
+            "doc_type": doc_type,
+            "author": author,
+            "metadata": merged_metadata,
+            "content_hash": content_hash,
+            "owner": merged_metadata.get("owner"),
+            "reviewer": merged_metadata.get("reviewer"),
+            "feature": merged_metadata.get("feature"),
+            "epic": merged_metadata.get("epic"),
+            "story": merged_metadata.get("story"),
+        }
 
     def transition_state(
         self,
@@ -219,53 +258,22 @@ class DocumentLifecycleManager:
         """
         Get document lineage (ancestors and descendants).
 
-        Recursively traverses relationships to build complete lineage tree.
+        Traverses relationships in both directions with recursive queries.
 
         Args:
             doc_id: Document ID
 
         Returns:
             Tuple of (ancestors, descendants)
-            - ancestors: List of parent documents (ordered from immediate parent to root)
-            - descendants: List of child documents (depth-first traversal)
+            - ancestors: All ancestor documents, nearest first (immediate parents to roots)
+            - descendants: All descendant documents, nearest first
 
         Example:
             >>> ancestors, descendants = manager.get_document_lineage(doc_id=5)
             >>> print(f"Parents: {[d.path for d in ancestors]}")
             >>> print(f"Children: {[d.path for d in descendants]}")
         """
-        ancestors = []
-        descendants = []
-
-        # Get ancestors (recursive)
-        current_id = doc_id
-        visited = set()
-        while current_id and current_id not in visited:
-            visited.add(current_id)
-            parents = self.registry.get_parent_documents(current_id)
-            if parents:
-                ancestors.extend(parents)
-                current_id = parents[0].id
-            else:
-                break
-
-        # Get descendants (recursive depth-first)
-        def get_descendants_recursive(doc_id: int, visited: set) -> List[Document]:
-            if doc_id in visited:
-                return []
-            visited.add(doc_id)
-
-            children = self.registry.get_child_documents(doc_id)
-            all_descendants = list(children)
-
-            for child in children:
-                all_descendants.extend(get_descendants_recursive(child.id, visited))
-
-            return all_descendants
-
-        descendants = get_descendants_recursive(doc_id, set())
-
-        return (ancestors, descendants)
+        return self.registry.get_lineage(doc_id)
 
     def archive_document(self, doc_id: int) -> Path:
         """
@@ -391,15 +399,29 @@ class DocumentLifecycleManager:
             return {}
 
         try:
-            content = path.read_text(encoding="utf-8")
+            return self.parse_frontmatter(path.read_text(encoding="utf-8"))
+        except Exception:
+            # Silently fail - return empty dict
+            return {}
+
+    @staticmethod
+    def parse_frontmatter(content: str) -> Dict[str, Any]:
+        """
+        Parse YAML frontmatter from markdown content.
+
+        Args:
+            content: Document text
 
+        Returns:
+            Frontmatter dictionary, or {} if there is none or it is invalid
+        """
+        try:
             # Extract YAML frontmatter
             if content.startswith("---"):
                 parts = content.split("---", 2)
                 if len(parts) >= 3:
                     frontmatter = yaml.safe_load(parts[1])
-                    return frontmatter or {}
-
+                    return frontmatter if isinstance(frontmatter, dict) else {}
         except Exception:
             # Silently fail - return empty dict
             pass
@@ -173,23 +173,9 @@ class DocumentHealthMetrics:
         Returns:
             Count of orphaned documents
         """
-        all_docs = self.registry.query_documents()
-        orphaned = 0
-
-        for doc in all_docs:
-            # Skip temp/draft
-            classification = doc.metadata.get("5s_classification", "permanent")
-            if classification == "temp" or doc.state == DocumentState.DRAFT:
-                continue
-
-            # Check for relationships
-            parents = self.registry.get_parent_documents(doc.id)
-            children = self.registry.get_child_documents(doc.id)
-
-            if not parents and not children:
-                orphaned += 1
-
-        return orphaned
+        return self.registry.count_orphaned_documents(
+            exclude_drafts=True, exclude_temp=True
+        )
 
     def _count_without_owners(self, documents: List[Document]) -> int:
         """
@@ -0,0 +1,115 @@
+"""
+Migration 008: Index the epic feature key.
+
+Epics belong to a feature through the "feature" key of their metadata.
+StateRollupService groups and filters epics by that key, so this migration
+adds an expression index on it to keep feature lookups off a table scan.
+
+Kept separate from Migration 005 so databases that already applied 005
+receive the index too.
+"""
+
+import sqlite3
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class Migration008:
+    """Epic feature key index migration."""
+
+    VERSION = "008"
+    DESCRIPTION = "Index epic_state by metadata feature key"
+
+    @staticmethod
+    def up(conn: sqlite3.Connection) -> None:
+        """
+        Apply migration: create idx_epic_state_feature.
+
+        Requires epic_state and schema_version (Migration 005).
+
+        Args:
+            conn: SQLite database connection
+
+        Raises:
+            sqlite3.Error: If migration fails
+        """
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_epic_state_feature "
+                "ON epic_state(json_extract(metadata, '$.feature'))"
+            )
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO schema_version (version, applied_at, description)
+                VALUES (?, datetime('now'), ?)
+                """,
+                (Migration008.VERSION, Migration008.DESCRIPTION),
+            )
+            conn.commit()
+
+            logger.info("migration_008_completed", version=Migration008.VERSION)
+
+        except Exception as e:
+            logger.error("migration_008_failed", error=str(e))
+            conn.rollback()
+            raise
+
+    @staticmethod
+    def down(conn: sqlite3.Connection) -> None:
+        """
+        Rollback migration: drop idx_epic_state_feature.
+
+        Args:
+            conn: SQLite database connection
+
+        Raises:
+            sqlite3.Error: If rollback fails
+        """
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("DROP INDEX IF EXISTS idx_epic_state_feature")
+            cursor.execute(
+                "DELETE FROM schema_version WHERE version = ?",
+                (Migration008.VERSION,),
+            )
+            conn.commit()
+
+            logger.info("migration_008_rollback_completed", version=Migration008.VERSION)
+
+        except Exception as e:
+            logger.error("migration_008_rollback_failed", error=str(e))
+            conn.rollback()
+            raise
+
+    @staticmethod
+    def is_applied(conn: sqlite3.Connection) -> bool:
+        """
+        Check if this migration has been applied.
+
+        Args:
+            conn: SQLite database connection
+
+        Returns:
+            True if migration is applied, False otherwise
+        """
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='schema_version'
+            """
+        )
+        if not cursor.fetchone():
+            return False
+
+        cursor.execute(
+            "SELECT version FROM schema_version WHERE version = ?",
+            (Migration008.VERSION,),
+        )
+        return cursor.fetchone() is not None
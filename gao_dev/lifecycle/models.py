@@ -274,3 +274,22 @@ class DocumentQuery:
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
         return where_clause, params
+
+
+@dataclass
+class ScanManifestEntry:
+    """
+    What the document scanner last saw for a file.
+
+    A file whose size and mtime still match its entry is skipped without being
+    read; one whose content hash still matches only has its stat refreshed.
+    Classification and naming warning are kept so scan summaries stay complete
+    for skipped files.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    classification: str
+    naming_warning: Optional[str] = None
@@ -8,11 +8,12 @@ interface, and relationship management using SQLite.
 
 import hashlib
 import json
+import os
 import sqlite3
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from gao_dev.lifecycle.models import (
     Document,
@@ -20,6 +21,7 @@ from gao_dev.lifecycle.models import (
     DocumentType,
     DocumentRelationship,
     RelationshipType,
+    ScanManifestEntry,
 )
 from gao_dev.lifecycle.exceptions import (
     DocumentNotFoundError,
@@ -29,6 +31,46 @@ from gao_dev.lifecycle.exceptions import (
     DatabaseError,
 )
 
+# Schema migrations applied by DocumentRegistry, in order
+_MIGRATIONS = [
+    ("001_create_schema.py", "migration_001"),
+    ("002_add_transitions_table.py", "migration_002"),
+    ("003_add_reviews_table.py", "migration_003"),
+    ("004_create_fts5.py", "migration_004"),
+]
+
+_migration_class_cache: List[Any] = []
+_migration_class_lock = threading.Lock()
+
+
+def _migration_classes() -> List[Any]:
+    """
+    Load the migration classes once per process.
+
+    The migration files are not importable by name (they start with a
+    digit), so they are loaded from their paths; doing that on every
+    DocumentRegistry construction dominated registry start-up.
+
+    Returns:
+        Migration classes (Migration001, ...) in order
+    """
+    import importlib.util
+
+    with _migration_class_lock:
+        if not _migration_class_cache:
+            for migration_file, module_name in _MIGRATIONS:
+                migration_path = Path(__file__).parent / "migrations" / migration_file
+                spec = importlib.util.spec_from_file_location(module_name, migration_path)
+                migration_module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(migration_module)
+
+                # Get the Migration class (e.g., Migration001, Migration002)
+                migration_num = module_name.split("_")[1]
+                _migration_class_cache.append(
+                    getattr(migration_module, f"Migration{migration_num}")
+                )
+        return list(_migration_class_cache)
+
 
 class DocumentRegistry:
     """
@@ -47,17 +89,29 @@ class DocumentRegistry:
         - Connection reuse within threads
         - Parameterized queries for SQL injection prevention
         - Indexed queries for fast lookups (<50ms)
+        - Graph traversals (lineage, orphans) in single recursive/anti-join queries
     """
 
-    def __init__(self, db_path: Path):
+    # Upper bound on traversal depth; also stops runaway walks through cycles
+    MAX_GRAPH_DEPTH = 100
+
+    # Keep IN (...) lists well under SQLite's bound-parameter limit
+    _IN_CHUNK_SIZE = 500
+
+    def __init__(self, db_path: Path, cache_relationships: bool = False):
         """
         Initialize document registry.
 
         Args:
             db_path: Path to SQLite database file
+            cache_relationships: Keep an in-memory adjacency map for graph
+                traversals, rebuilt after relationships change
         """
         self.db_path = Path(db_path)
         self._local = threading.local()
+        self.cache_relationships = cache_relationships
+        self._adjacency: Optional[Dict[str, Dict[int, List[Tuple[int, str]]]]] = None
+        self._adjacency_lock = threading.Lock()
         self._init_database()
 
     def close(self) -> None:
@@ -91,32 +145,32 @@ class DocumentRegistry:
         Creates all tables and indexes using the migration scripts.
         Applies migrations in order: 001, 002, 003.
         """
-        import importlib.util
-        from pathlib import Path as ImportPath
-
-        migrations = [
-            ("001_create_schema.py", "migration_001"),
-            ("002_add_transitions_table.py", "migration_002"),
-            ("003_add_reviews_table.py", "migration_003"),
-            ("004_create_fts5.py", "migration_004"),
-        ]
-
         with self._get_connection() as conn:
-            for migration_file, module_name in migrations:
-                migration_path = (
-                    ImportPath(__file__).parent / "migrations" / migration_file
-                )
-                spec = importlib.util.spec_from_file_location(module_name, migration_path)
-                migration_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(migration_module)
-
-                # Get the Migration class (e.g., Migration001, Migration002)
-                migration_num = module_name.split("_")[1]
-                migration_class = getattr(migration_module, f"Migration{migration_num}")
-
+            for migration_class in _migration_classes():
                 if not migration_class.is_applied(conn):
                     migration_class.up(conn)
 
+            # The primary key covers parent lookups; graph walks also go child -> parent
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_relationships_child "
+                "ON document_relationships(child_id)"
+            )
+
+            # Per-file stat/hash manifest used by DocumentScanner to skip unchanged files
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scan_manifest (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    classification TEXT NOT NULL,
+                    naming_warning TEXT,
+                    scanned_at TEXT NOT NULL DEFAULT (datetime('now'))
+                )
+                """
+            )
+
     @contextmanager
     def _get_connection(self):
         """
@@ -493,6 +547,10 @@ class DocumentRegistry:
         except Exception as e:
             raise DatabaseError(f"Failed to delete document: {e}", original_error=e)
 
+        if not soft:
+            # Relationships cascade with the document
+            self._invalidate_adjacency()
+
     # Query Interface
 
     def query_documents(
@@ -673,9 +731,11 @@ class DocumentRegistry:
                     (parent_id, child_id, rel_type.value),
                 )
 
-                return DocumentRelationship(
-                    parent_id=parent_id, child_id=child_id, relationship_type=rel_type
-                )
+            # Invalidate after commit so a concurrent rebuild cannot see the old edges
+            self._invalidate_adjacency()
+            return DocumentRelationship(
+                parent_id=parent_id, child_id=child_id, relationship_type=rel_type
+            )
         except sqlite3.IntegrityError as e:
             if "UNIQUE constraint" in str(e):
                 raise RelationshipError(
@@ -832,3 +892,442 @@ class DocumentRegistry:
             raise DatabaseError(
                 f"Failed to get child documents: {e}", original_error=e
             )
+
+    # Graph Queries
+
+    def get_ancestors(
+        self,
+        doc_id: int,
+        max_depth: Optional[int] = None,
+        rel_type: Optional[RelationshipType] = None,
+    ) -> List[Document]:
+        """
+        Get all ancestors of a document with one recursive query.
+
+        Args:
+            doc_id: Document ID
+            max_depth: Maximum number of hops (default: MAX_GRAPH_DEPTH)
+            rel_type: Optional relationship type filter applied to every hop
+
+        Returns:
+            Ancestors ordered nearest first (immediate parents, then theirs);
+            each document appears once, at its shortest distance
+
+        Raises:
+            DocumentNotFoundError: If document not found
+            DatabaseError: If database operation fails
+        """
+        self.get_document(doc_id)
+        return self._walk(doc_id, "parents", max_depth, rel_type)
+
+    def get_descendants(
+        self,
+        doc_id: int,
+        max_depth: Optional[int] = None,
+        rel_type: Optional[RelationshipType] = None,
+    ) -> List[Document]:
+        """
+        Get all descendants of a document with one recursive query.
+
+        Args:
+            doc_id: Document ID
+            max_depth: Maximum number of hops (default: MAX_GRAPH_DEPTH)
+            rel_type: Optional relationship type filter applied to every hop
+
+        Returns:
+            Descendants ordered nearest first (children, then grandchildren);
+            each document appears once, at its shortest distance
+
+        Raises:
+            DocumentNotFoundError: If document not found
+            DatabaseError: If database operation fails
+        """
+        self.get_document(doc_id)
+        return self._walk(doc_id, "children", max_depth, rel_type)
+
+    def get_lineage(
+        self, doc_id: int, max_depth: Optional[int] = None
+    ) -> Tuple[List[Document], List[Document]]:
+        """
+        Get ancestors and descendants of a document.
+
+        Args:
+            doc_id: Document ID
+            max_depth: Maximum number of hops in each direction
+
+        Returns:
+            Tuple of (ancestors, descendants), each ordered nearest first
+
+        Raises:
+            DocumentNotFoundError: If document not found
+            DatabaseError: If database operation fails
+        """
+        self.get_document(doc_id)
+        return (
+            self._walk(doc_id, "parents", max_depth, None),
+            self._walk(doc_id, "children", max_depth, None),
+        )
+
+    def find_orphaned_documents(
+        self, exclude_drafts: bool = True, exclude_temp: bool = True
+    ) -> List[Document]:
+        """
+        Find documents with no relationships in either direction.
+
+        Args:
+            exclude_drafts: Skip documents in the draft state
+            exclude_temp: Skip documents classified as temp (5S classification)
+
+        Returns:
+            List of orphaned documents
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        where_sql, params = self._orphan_filter(exclude_drafts, exclude_temp)
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"SELECT d.* FROM documents d WHERE {where_sql} ORDER BY d.id", params
+                ).fetchall()
+                return [self._row_to_document(row) for row in rows]
+        except Exception as e:
+            raise DatabaseError(f"Failed to find orphaned documents: {e}", original_error=e)
+
+    def count_orphaned_documents(
+        self, exclude_drafts: bool = True, exclude_temp: bool = True
+    ) -> int:
+        """
+        Count documents with no relationships in either direction.
+
+        Args:
+            exclude_drafts: Skip documents in the draft state
+            exclude_temp: Skip documents classified as temp (5S classification)
+
+        Returns:
+            Number of orphaned documents
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        where_sql, params = self._orphan_filter(exclude_drafts, exclude_temp)
+        try:
+            with self._get_connection() as conn:
+                return conn.execute(
+                    f"SELECT COUNT(*) FROM documents d WHERE {where_sql}", params
+                ).fetchone()[0]
+        except Exception as e:
+            raise DatabaseError(f"Failed to count orphaned documents: {e}", original_error=e)
+
+    @staticmethod
+    def _orphan_filter(exclude_drafts: bool, exclude_temp: bool) -> Tuple[str, List[Any]]:
+        """Build the anti-join WHERE clause for orphan queries."""
+        clauses = [
+            "NOT EXISTS (SELECT 1 FROM document_relationships r WHERE r.parent_id = d.id)",
+            "NOT EXISTS (SELECT 1 FROM document_relationships r WHERE r.child_id = d.id)",
+        ]
+        params: List[Any] = []
+        if exclude_drafts:
+            clauses.append("d.state != ?")
+            params.append(DocumentState.DRAFT.value)
+        if exclude_temp:
+            clauses.append(
+                "COALESCE(json_extract(d.metadata, '$.\"5s_classification\"'), 'permanent') != ?"
+            )
+            params.append("temp")
+        return " AND ".join(clauses), params
+
+    def _walk(
+        self,
+        doc_id: int,
+        direction: str,
+        max_depth: Optional[int],
+        rel_type: Optional[RelationshipType],
+    ) -> List[Document]:
+        """
+        Traverse relationships from a document.
+
+        Uses the adjacency cache when enabled, otherwise a WITH RECURSIVE query.
+
+        Args:
+            doc_id: Start document ID (excluded from the result)
+            direction: "parents" or "children"
+            max_depth: Maximum number of hops (default: MAX_GRAPH_DEPTH)
+            rel_type: Optional relationship type filter
+
+        Returns:
+            Reached documents ordered by (distance, id)
+        """
+        depth_limit = min(max_depth or self.MAX_GRAPH_DEPTH, self.MAX_GRAPH_DEPTH)
+
+        try:
+            if self.cache_relationships:
+                ids = self._walk_cached(doc_id, direction, depth_limit, rel_type)
+                return self._get_documents_by_ids(ids)
+
+            if direction == "parents":
+                from_col, to_col = "child_id", "parent_id"
+            else:
+                from_col, to_col = "parent_id", "child_id"
+            type_sql = " AND r.relationship_type = ?" if rel_type else ""
+            params: List[Any] = [doc_id, depth_limit]
+            if rel_type:
+                params.append(rel_type.value)
+            params.append(doc_id)
+
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"""
+                    WITH RECURSIVE graph(id, depth) AS (
+                        SELECT ?, 0
+                        UNION
+                        SELECT r.{to_col}, g.depth + 1
+                        FROM document_relationships r
+                        JOIN graph g ON r.{from_col} = g.id
+                        WHERE g.depth < ?{type_sql}
+                    )
+                    SELECT d.*, MIN(g.depth) AS depth
+                    FROM graph g JOIN documents d ON d.id = g.id
+                    WHERE g.id != ?
+                    GROUP BY d.id
+                    ORDER BY depth, d.id
+                    """,
+                    params,
+                ).fetchall()
+                return [self._row_to_document(row) for row in rows]
+        except Exception as e:
+            raise DatabaseError(f"Failed to traverse {direction}: {e}", original_error=e)
+
+    def _walk_cached(
+        self,
+        doc_id: int,
+        direction: str,
+        depth_limit: int,
+        rel_type: Optional[RelationshipType],
+    ) -> List[int]:
+        """Breadth-first walk over the adjacency cache; same order as the SQL walk."""
+        edges = self._get_adjacency()[direction]
+        distances = {doc_id: 0}
+        frontier = [doc_id]
+        for depth in range(1, depth_limit + 1):
+            next_frontier = []
+            for node in frontier:
+                for neighbour, neighbour_type in edges.get(node, ()):
+                    if rel_type and neighbour_type != rel_type.value:
+                        continue
+                    if neighbour not in distances:
+                        distances[neighbour] = depth
+                        next_frontier.append(neighbour)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        del distances[doc_id]
+        return sorted(distances, key=lambda node: (distances[node], node))
+
+    def _get_adjacency(self) -> Dict[str, Dict[int, List[Tuple[int, str]]]]:
+        """Load parent/child adjacency lists in one query, building them on first use."""
+        with self._adjacency_lock:
+            if self._adjacency is None:
+                parents: Dict[int, List[Tuple[int, str]]] = {}
+                children: Dict[int, List[Tuple[int, str]]] = {}
+                with self._get_connection() as conn:
+                    for row in conn.execute(
+                        "SELECT parent_id, child_id, relationship_type FROM document_relationships"
+                    ):
+                        parent_id, child_id, rel = row[0], row[1], row[2]
+                        children.setdefault(parent_id, []).append((child_id, rel))
+                        parents.setdefault(child_id, []).append((parent_id, rel))
+                self._adjacency = {"parents": parents, "children": children}
+            return self._adjacency
+
+    def _invalidate_adjacency(self) -> None:
+        """Drop the adjacency cache after relationships change."""
+        with self._adjacency_lock:
+            self._adjacency = None
+
+    def _get_documents_by_ids(self, ids: List[int]) -> List[Document]:
+        """Load documents by ID in one query, preserving the order of ``ids``."""
+        if not ids:
+            return []
+        placeholders = ", ".join("?" * len(ids))
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM documents WHERE id IN ({placeholders})", ids
+            ).fetchall()
+        by_id = {row["id"]: self._row_to_document(row) for row in rows}
+        return [by_id[doc_id] for doc_id in ids if doc_id in by_id]
+
+    # Scan Support
+
+    def get_document_ids_by_path(self, paths: List[str]) -> Dict[str, int]:
+        """
+        Look up document IDs for many paths.
+
+        Args:
+            paths: Document paths
+
+        Returns:
+            Mapping of path to document ID for registered paths
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        found: Dict[str, int] = {}
+        try:
+            with self._get_connection() as conn:
+                for start in range(0, len(paths), self._IN_CHUNK_SIZE):
+                    chunk = paths[start:start + self._IN_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    for row in conn.execute(
+                        f"SELECT id, path FROM documents WHERE path IN ({placeholders})", chunk
+                    ):
+                        found[row["path"]] = row["id"]
+            return found
+        except Exception as e:
+            raise DatabaseError(f"Failed to look up documents: {e}", original_error=e)
+
+    def get_scan_manifest(self, root: str) -> Dict[str, ScanManifestEntry]:
+        """
+        Get scan manifest entries for files under a directory.
+
+        Args:
+            root: Directory path prefix
+
+        Returns:
+            Mapping of path to manifest entry
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        # Match whole directory names so "docs" does not pick up "docs2"
+        prefix = os.path.join(root, "")
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT path, size, mtime_ns, content_hash, classification, naming_warning
+                    FROM scan_manifest WHERE substr(path, 1, ?) = ?
+                    """,
+                    (len(prefix), prefix),
+                ).fetchall()
+            return {row["path"]: ScanManifestEntry(**dict(row)) for row in rows}
+        except Exception as e:
+            raise DatabaseError(f"Failed to read scan manifest: {e}", original_error=e)
+
+    def apply_scan_batch(
+        self,
+        registrations: List[Dict[str, Any]],
+        updates: List[Dict[str, Any]],
+        manifest: List[ScanManifestEntry],
+        removed_paths: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """
+        Apply a scan's registrations, updates and manifest changes in one transaction.
+
+        Paths that are already registered are left alone rather than failing
+        the batch. Updates only overwrite governance fields that have a value.
+
+        Args:
+            registrations: New documents, each with path, doc_type, author,
+                metadata, content_hash and optional owner, reviewer, feature,
+                epic, story
+            updates: Changed documents, each with id, metadata, content_hash
+                and optional owner, reviewer, feature, epic, story
+            manifest: Manifest entries to insert or replace
+            removed_paths: Manifest paths to forget (files no longer on disk)
+
+        Returns:
+            Mapping of path to document ID for the documents this call registered
+
+        Raises:
+            ValidationError: If a registration has an invalid document type
+            DatabaseError: If database operation fails (nothing is applied)
+        """
+        for record in registrations:
+            self._validate_doc_type(record["doc_type"])
+
+        governance = ("owner", "reviewer", "feature", "epic", "story")
+        new_paths = [record["path"] for record in registrations]
+        existing = set(self.get_document_ids_by_path(new_paths))
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO documents (
+                        path, type, state, created_at, modified_at,
+                        author, feature, epic, story, owner, reviewer,
+                        content_hash, metadata
+                    ) VALUES (?, ?, ?, datetime('now'), datetime('now'), ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            record["path"],
+                            record["doc_type"],
+                            DocumentState.DRAFT.value,
+                            record["author"],
+                            record.get("feature"),
+                            record.get("epic"),
+                            record.get("story"),
+                            record.get("owner"),
+                            record.get("reviewer"),
+                            record.get("content_hash"),
+                            json.dumps(record.get("metadata") or {}),
+                        )
+                        for record in registrations
+                        if record["path"] not in existing
+                    ],
+                )
+
+                conn.executemany(
+                    f"""
+                    UPDATE documents SET
+                        metadata = ?,
+                        content_hash = ?,
+                        {", ".join(f"{name} = COALESCE(?, {name})" for name in governance)},
+                        modified_at = datetime('now')
+                    WHERE id = ?
+                    """,
+                    [
+                        (
+                            json.dumps(update.get("metadata") or {}),
+                            update.get("content_hash"),
+                            *(update.get(name) for name in governance),
+                            update["id"],
+                        )
+                        for update in updates
+                    ],
+                )
+
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO scan_manifest (
+                        path, size, mtime_ns, content_hash, classification,
+                        naming_warning, scanned_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+                    """,
+                    [
+                        (
+                            entry.path,
+                            entry.size,
+                            entry.mtime_ns,
+                            entry.content_hash,
+                            entry.classification,
+                            entry.naming_warning,
+                        )
+                        for entry in manifest
+                    ],
+                )
+
+                if removed_paths:
+                    conn.executemany(
+                        "DELETE FROM scan_manifest WHERE path = ?",
+                        [(path,) for path in removed_paths],
+                    )
+
+        except Exception as e:
+            raise DatabaseError(f"Failed to apply scan batch: {e}", original_error=e)
+
+        return self.get_document_ids_by_path(
+            [path for path in new_paths if path not in existing]
+        )
@@ -7,16 +7,22 @@ documents from the filesystem. It implements:
 - 5S methodology classification (Sort: permanent, transient, temp)
 - Filename validation against naming convention
 - Metadata extraction from YAML frontmatter
-- Batch registration for performance
+- Incremental rescans against a persisted scan manifest
+- Parallel reading and hashing of changed files
+- Batch registration in a single transaction
 - Progress reporting for large scans
 """
 
+import hashlib
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Callable, Tuple
 
 from gao_dev.lifecycle.document_manager import DocumentLifecycleManager
+from gao_dev.lifecycle.models import DocumentType, ScanManifestEntry
 from gao_dev.lifecycle.naming_convention import DocumentNamingConvention
 
 
@@ -26,7 +32,9 @@ class ScanResult:
     Results from document scan operation.
 
     Provides comprehensive summary of scan operation including discovery,
-    registration, validation, and classification statistics.
+    registration, validation, and classification statistics. Files skipped
+    because they are unchanged since the last scan still count towards
+    total_scanned, naming compliance and classification counts.
     """
 
     total_scanned: int
@@ -36,6 +44,18 @@ class ScanResult:
     naming_compliance_rate: float
     classification_counts: Dict[str, int]  # permanent, transient, temp
     warnings: List[str]
+    unchanged_skipped: int = 0
+
+
+@dataclass
+class _FileRead:
+    """Content hash and frontmatter read from one file by a scan worker."""
+
+    path: Path
+    stat: os.stat_result
+    content_hash: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
 
 
 class DocumentScanner:
@@ -51,7 +71,10 @@ class DocumentScanner:
     - Recursive directory scanning
     - Smart exclusion patterns (.git, node_modules, etc.)
     - Filename validation with warnings for non-compliance
-    - Batch registration for performance
+    - Incremental rescans: files whose size and mtime match the scan manifest
+      are not read, and files whose content hash matches are not re-registered
+    - Parallel reading, hashing and frontmatter parsing of changed files
+    - Batch registration in a single transaction
     - Progress reporting for large scans
     - Metadata extraction from YAML frontmatter
 
@@ -88,6 +111,7 @@ class DocumentScanner:
         document_manager: DocumentLifecycleManager,
         exclude_patterns: Optional[List[str]] = None,
         exclude_hidden: bool = True,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize document scanner.
@@ -96,10 +120,13 @@ class DocumentScanner:
             document_manager: Document lifecycle manager for registration
             exclude_patterns: Optional custom exclude patterns (extends defaults)
             exclude_hidden: Whether to exclude hidden files (default: True)
+            max_workers: Threads used to read changed files (default: executor
+                default; 1 reads sequentially)
         """
         self.doc_mgr = document_manager
         self.naming_convention = DocumentNamingConvention()
         self.exclude_hidden = exclude_hidden
+        self.max_workers = max_workers
 
         # Combine default and custom exclude patterns
         self.exclude_patterns = list(self.DEFAULT_EXCLUDES)
@@ -117,11 +144,13 @@ class DocumentScanner:
         This method:
         1. Recursively discovers all .md files
         2. Applies exclusion patterns
-        3. Validates filenames against naming convention
-        4. Extracts metadata from YAML frontmatter
-        5. Classifies documents using 5S Sort methodology
-        6. Registers new documents or updates existing ones
-        7. Reports progress for large scans
+        3. Skips files whose size and mtime match the scan manifest
+        4. Reads, hashes and extracts frontmatter of the rest in parallel
+        5. Validates filenames against naming convention
+        6. Classifies documents using 5S Sort methodology
+        7. Registers new documents, updates changed ones and refreshes the
+           manifest in a single transaction
+        8. Reports progress for large scans
 
         Args:
             path: Directory to scan (absolute or relative)
@@ -138,50 +167,99 @@ class DocumentScanner:
             >>> print(f"Compliance: {result.naming_compliance_rate:.1f}%")
         """
         path = Path(path).resolve()
+        registry = self.doc_mgr.registry
 
         # Initialize counters
-        total_scanned = 0
-        new_registered = 0
-        existing_updated = 0
         files_skipped = 0
-        warnings = []
+        unchanged_skipped = 0
+        warnings: List[str] = []
         naming_violations = 0
         classification_counts = {'permanent': 0, 'transient': 0, 'temp': 0}
 
-        # Collect documents to register in batch
-        documents_to_register = []
+        def tally(classification: str, naming_warning: Optional[str]) -> None:
+            nonlocal naming_violations
+            classification_counts[classification] += 1
+            if naming_warning:
+                naming_violations += 1
+                warnings.append(naming_warning)
 
         # Find all markdown files recursively
+        candidates: List[Tuple[Path, os.stat_result]] = []
         for file_path in path.rglob('*.md'):
             # Skip excluded paths
             if self._should_exclude(file_path):
                 files_skipped += 1
                 continue
+            try:
+                candidates.append((file_path, file_path.stat()))
+            except OSError as e:
+                warnings.append(f"Error scanning {file_path.name}: {str(e)}")
 
-            total_scanned += 1
+        total_scanned = len(candidates)
+        manifest = registry.get_scan_manifest(str(path))
+        doc_ids = registry.get_document_ids_by_path([str(p) for p, _ in candidates])
 
-            # Progress reporting
+        # Skip files that have not changed since the last scan
+        to_read: List[Tuple[Path, os.stat_result]] = []
+        for file_path, stat in candidates:
             if progress_callback:
                 progress_callback(f"Scanning {file_path.name}")
 
-            try:
-                # Check if already registered
-                existing_doc = self.doc_mgr.registry.get_document_by_path(str(file_path))
+            entry = manifest.get(str(file_path))
+            if (
+                entry is not None
+                and str(file_path) in doc_ids
+                and entry.size == stat.st_size
+                and entry.mtime_ns == stat.st_mtime_ns
+            ):
+                unchanged_skipped += 1
+                tally(entry.classification, entry.naming_warning)
+            else:
+                to_read.append((file_path, stat))
+
+        if self.max_workers == 1 or len(to_read) < 2:
+            reads = [self._read_file(*item) for item in to_read]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                reads = list(pool.map(lambda item: self._read_file(*item), to_read))
+
+        registrations: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        manifest_entries: List[ScanManifestEntry] = []
+        related: Dict[str, Any] = {}
+
+        for read in reads:
+            file_path = read.path
+            if read.error:
+                warnings.append(f"Error scanning {file_path.name}: {read.error}")
+                continue
+
+            entry = manifest.get(str(file_path))
+            doc_id = doc_ids.get(str(file_path))
 
-                # Extract metadata from file
-                metadata = self.doc_mgr._extract_metadata(file_path)
+            # Touched but not modified: only refresh the stat in the manifest
+            if entry is not None and doc_id is not None and entry.content_hash == read.content_hash:
+                unchanged_skipped += 1
+                tally(entry.classification, entry.naming_warning)
+                manifest_entries.append(
+                    replace(entry, size=read.stat.st_size, mtime_ns=read.stat.st_mtime_ns)
+                )
+                continue
+
+            try:
+                metadata = read.metadata
 
                 # Validate naming convention
+                naming_warning = None
                 is_valid, error = self.naming_convention.validate_filename(file_path.name)
                 if not is_valid:
-                    naming_violations += 1
                     # Suggest correct filename
                     doc_type = self._detect_doc_type(file_path, metadata)
                     subject = metadata.get('subject', file_path.stem)
                     suggested = self.naming_convention.suggest_filename(
                         file_path.name, doc_type, subject
                     )
-                    warnings.append(
+                    naming_warning = (
                         f"Non-standard filename: {file_path.name} "
                         f"(suggest: {suggested})"
                     )
@@ -189,54 +267,79 @@ class DocumentScanner:
                 # Classify with 5S Sort methodology
                 classification = self._classify_document(file_path, metadata)
                 metadata['5s_classification'] = classification
-                classification_counts[classification] += 1
 
                 # Detect document type
                 doc_type = self._detect_doc_type(file_path, metadata)
+                DocumentType(doc_type)
 
                 # Get author from metadata or default
                 author = metadata.get('author', 'unknown')
 
-                if existing_doc:
-                    # Update existing document metadata and governance fields
-                    update_kwargs = {'metadata': metadata}
-
-                    # Extract governance fields if present
-                    if 'owner' in metadata:
-                        update_kwargs['owner'] = metadata['owner']
-                    if 'reviewer' in metadata:
-                        update_kwargs['reviewer'] = metadata['reviewer']
-                    if 'feature' in metadata:
-                        update_kwargs['feature'] = metadata['feature']
-                    if 'epic' in metadata:
-                        update_kwargs['epic'] = metadata['epic']
-                    if 'story' in metadata:
-                        update_kwargs['story'] = metadata['story']
-
-                    self.doc_mgr.registry.update_document(
-                        existing_doc.id,
-                        **update_kwargs,
-                    )
-                    existing_updated += 1
-                else:
-                    # Collect for batch registration
-                    documents_to_register.append({
-                        'path': file_path,
-                        'doc_type': doc_type,
-                        'author': author,
-                        'metadata': metadata,
-                    })
-
             except Exception as e:
                 warnings.append(f"Error scanning {file_path.name}: {str(e)}")
+                continue
 
-        # Batch register new documents
-        for doc_data in documents_to_register:
+            tally(classification, naming_warning)
+
+            if doc_id is not None:
+                updates.append({
+                    'id': doc_id,
+                    'metadata': metadata,
+                    'content_hash': read.content_hash,
+                    'owner': metadata.get('owner'),
+                    'reviewer': metadata.get('reviewer'),
+                    'feature': metadata.get('feature'),
+                    'epic': metadata.get('epic'),
+                    'story': metadata.get('story'),
+                })
+            else:
+                # Frontmatter is already in metadata, so nothing is re-read
+                registrations.append(self.doc_mgr.prepare_registration(
+                    file_path,
+                    doc_type,
+                    author,
+                    metadata,
+                    extracted_metadata={},
+                    content_hash=read.content_hash,
+                ))
+                if 'related_docs' in metadata:
+                    related[str(file_path)] = metadata['related_docs']
+
+            manifest_entries.append(ScanManifestEntry(
+                path=str(file_path),
+                size=read.stat.st_size,
+                mtime_ns=read.stat.st_mtime_ns,
+                content_hash=read.content_hash,
+                classification=classification,
+                naming_warning=naming_warning,
+            ))
+
+        # Forget files that are no longer on disk (or are now excluded)
+        seen = {str(p) for p, _ in candidates}
+        removed_paths = [p for p in manifest if p not in seen]
+
+        # Register, update and record the manifest in one transaction
+        new_registered = 0
+        existing_updated = 0
+        try:
+            new_ids = registry.apply_scan_batch(
+                registrations, updates, manifest_entries, removed_paths
+            )
+            new_registered = len(new_ids)
+            existing_updated = len(updates)
+        except Exception as e:
+            new_ids = {}
+            warnings.append(f"Error registering scanned documents: {str(e)}")
+
+        # Relationships need the new documents' IDs
+        for doc_path, related_docs in related.items():
+            if doc_path not in new_ids:
+                continue
             try:
-                self.doc_mgr.register_document(**doc_data)
-                new_registered += 1
+                document = registry.get_document(new_ids[doc_path])
+                self.doc_mgr._create_relationships(document, related_docs)
             except Exception as e:
-                warnings.append(f"Error registering {doc_data['path'].name}: {str(e)}")
+                warnings.append(f"Error registering {Path(doc_path).name}: {str(e)}")
 
         # Calculate naming compliance rate
         naming_compliance_rate = (
@@ -252,6 +355,34 @@ class DocumentScanner:
             naming_compliance_rate=naming_compliance_rate,
             classification_counts=classification_counts,
             warnings=warnings,
+            unchanged_skipped=unchanged_skipped,
+        )
+
+    def _read_file(self, path: Path, stat: os.stat_result) -> _FileRead:
+        """
+        Read, hash and parse the frontmatter of one file.
+
+        Runs on a worker thread, so it only touches the file itself.
+
+        Args:
+            path: Document file path
+            stat: Stat result taken during discovery
+
+        Returns:
+            _FileRead with content hash and frontmatter, or the read error
+        """
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            return _FileRead(path=path, stat=stat, error=str(e))
+
+        return _FileRead(
+            path=path,
+            stat=stat,
+            content_hash=hashlib.sha256(data).hexdigest(),
+            metadata=DocumentLifecycleManager.parse_frontmatter(
+                data.decode('utf-8', errors='replace')
+            ),
         )
 
     def _should_exclude(self, path: Path) -> bool:
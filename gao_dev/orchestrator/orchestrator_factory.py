@@ -23,6 +23,9 @@ from ..core.events.event_bus import EventBus
 from ..core.services.workflow_coordinator import WorkflowCoordinator
 from ..core.services.story_lifecycle import StoryLifecycleManager
 from ..core.services.process_executor import ProcessExecutor
+from ..core.providers.factory import ProviderFactory
+from ..core.providers.health_check import get_health_checker
+from ..core.providers.scheduler import RequestPriority, get_scheduler
 from ..core.services.quality_gate import QualityGateManager
 from ..core.services.ai_analysis_service import AIAnalysisService
 from ..core.services.git_integrated_state_manager import GitIntegratedStateManager
@@ -31,6 +34,50 @@ from ..lifecycle.project_lifecycle import ProjectDocumentLifecycle
 logger = structlog.get_logger()
 
 
+def failover_options(config_loader: ConfigLoader, provider_name: str) -> dict:
+    """
+    Build ProcessExecutor circuit-breaking options from provider config.
+
+    Failover is enabled when ``providers.auto_fallback`` is set; the other
+    providers of ``providers.fallback_chain`` become the fallbacks.
+
+    Args:
+        config_loader: Project configuration
+        provider_name: Primary provider name
+
+    Returns:
+        Keyword arguments for ProcessExecutor (empty when disabled)
+    """
+    providers_config = config_loader.get("providers", {}) or {}
+    if not providers_config.get("auto_fallback", False):
+        return {}
+
+    health_config = providers_config.get("selection", {}).get("health", {})
+    checker = get_health_checker()
+    checker.cache_duration = health_config.get("cache_duration", checker.cache_duration)
+
+    fallbacks = ProviderFactory().create_fallback_providers(
+        providers_config.get("fallback_chain", []),
+        exclude=provider_name,
+        provider_configs=providers_config,
+    )
+    return {"health_checker": checker, "fallback_providers": fallbacks}
+
+
+def configure_scheduler(config_loader: ConfigLoader) -> None:
+    """
+    Apply the ``providers.scheduler`` limits to the shared LLM scheduler.
+
+    Safe to call for every executor created: unchanged limits leave the
+    scheduler's token buckets untouched.
+
+    Args:
+        config_loader: Project configuration
+    """
+    providers_config = config_loader.get("providers", {}) or {}
+    get_scheduler().configure_from_dict(providers_config.get("scheduler", {}))
+
+
 def create_orchestrator(
     project_root: Path,
     api_key: Optional[str] = None,
@@ -90,10 +137,16 @@ def create_orchestrator(
     if api_key and "api_key" not in provider_specific_config:
         provider_specific_config["api_key"] = api_key
 
+    # Shared admission limits for all provider requests in this process
+    configure_scheduler(config_loader)
+
+    # Benchmarks yield to interactive and regular workflow traffic
     process_executor = ProcessExecutor(
         project_root=project_root,
         provider_name=provider_name,
         provider_config=provider_specific_config if provider_specific_config else None,
+        priority=RequestPriority.BACKGROUND if mode == "benchmark" else RequestPriority.WORKFLOW,
+        **failover_options(config_loader, provider_name),
     )
 
     # Step 3: Initialize document lifecycle
@@ -15,6 +15,7 @@ from .exceptions import (
 # Import benchmark loader (from benchmark_loader.py)
 from .benchmark_loader import BenchmarkConfig, load_benchmark
 from .git_cloner import GitCloner
+from .boilerplate_cache import BoilerplateCache, BoilerplateCacheStats, MaterializeResult
 from ..core.git_manager import GitManager
 from .template_scanner import TemplateScanner, TemplateVariable
 from .template_substitutor import TemplateSubstitutor, SubstitutionResult, SubstitutionError
@@ -37,6 +38,9 @@ __all__ = [
     "BenchmarkConfig",
     "load_benchmark",
     "GitCloner",
+    "BoilerplateCache",
+    "BoilerplateCacheStats",
+    "MaterializeResult",
     "GitManager",
     "TemplateScanner",
     "TemplateVariable",
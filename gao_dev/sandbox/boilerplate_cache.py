@@ -0,0 +1,364 @@
+"""Local mirror cache for boilerplate repositories.
+
+Creating a sandbox project from a boilerplate used to clone the remote
+repository every time. The cache keeps one bare mirror per repository URL,
+refreshes it with ``git fetch`` only when it is older than ``max_age_seconds``
+(or when a requested ref is missing), and materializes projects from the
+mirror with ``git archive``, so no network access and no ``.git`` cleanup is
+needed per project.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from .exceptions import GitCloneError, InvalidGitUrlError
+from .git_cloner import GitCloner
+
+logger = structlog.get_logger(__name__)
+
+# Constants
+DEFAULT_MAX_AGE_SECONDS = 3600
+GIT_TIMEOUT_SECONDS = 300
+FETCH_STAMP = "gao-dev-fetched"
+DEFAULT_CACHE_SUBDIR = Path(".cache") / "boilerplates"  # relative to sandbox root
+
+
+@dataclass
+class MaterializeResult:
+    """
+    Outcome of materializing a boilerplate into a project directory.
+
+    Attributes:
+        repo_url: Boilerplate repository URL
+        ref: Requested ref (None means the mirror's HEAD)
+        commit: Commit the files were taken from
+        cache_hit: True if an existing mirror was used
+        fetched: True if the mirror was cloned or fetched for this call
+        mirror_seconds: Time spent cloning/fetching the mirror
+        extract_seconds: Time spent writing files into the target
+        files: Number of files written
+    """
+
+    repo_url: str
+    ref: Optional[str]
+    commit: str
+    cache_hit: bool
+    fetched: bool
+    mirror_seconds: float
+    extract_seconds: float
+    files: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+
+@dataclass
+class BoilerplateCacheStats:
+    """
+    Cumulative cache counters and timings.
+
+    Attributes:
+        hits: Materializations served from an existing mirror
+        misses: Materializations that had to create the mirror
+        refreshes: Fetches of an existing mirror
+        mirror_seconds: Total time cloning/fetching mirrors
+        extract_seconds: Total time writing project files
+        results: Per-call results, in order
+    """
+
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    mirror_seconds: float = 0.0
+    extract_seconds: float = 0.0
+    results: List[MaterializeResult] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (without per-call results)."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "mirror_seconds": self.mirror_seconds,
+            "extract_seconds": self.extract_seconds,
+        }
+
+
+class BoilerplateCache:
+    """
+    Bare-mirror cache for boilerplate repositories.
+
+    Mirrors live in ``cache_dir/<sha256(url)[:16]>.git`` and hold every ref of
+    the repository, so a single mirror serves any branch, tag or commit of
+    that URL. New mirrors are cloned into a temporary directory and renamed
+    into place, so concurrent creators never see a partial mirror.
+
+    Example:
+        ```python
+        cache = BoilerplateCache(sandbox_root / ".cache" / "boilerplates")
+        result = cache.materialize("https://github.com/org/starter.git", project_dir)
+        print(result.cache_hit, result.extract_seconds)
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        git_cloner: Optional[GitCloner] = None,
+    ):
+        """
+        Initialize boilerplate cache.
+
+        Args:
+            cache_dir: Directory holding the bare mirrors
+            max_age_seconds: Mirrors older than this are fetched before use
+            git_cloner: GitCloner used for URL validation (creates default if not provided)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_age_seconds = max_age_seconds
+        self.git_cloner = git_cloner or GitCloner()
+        self.stats = BoilerplateCacheStats()
+        self._lock = threading.Lock()
+
+    def mirror_path(self, repo_url: str) -> Path:
+        """
+        Get the mirror location for a repository URL.
+
+        Args:
+            repo_url: Repository URL
+
+        Returns:
+            Path of the bare mirror (may not exist yet)
+        """
+        key = hashlib.sha256(repo_url.strip().encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{key}.git"
+
+    def is_stale(self, repo_url: str) -> bool:
+        """
+        Check whether a mirror is missing or older than max_age_seconds.
+
+        Args:
+            repo_url: Repository URL
+
+        Returns:
+            True if the mirror must be cloned or fetched before use
+        """
+        stamp = self.mirror_path(repo_url) / FETCH_STAMP
+        if not stamp.exists():
+            return True
+        return time.time() - stamp.stat().st_mtime > self.max_age_seconds
+
+    def materialize(
+        self,
+        repo_url: str,
+        target_path: Path,
+        ref: Optional[str] = None,
+    ) -> MaterializeResult:
+        """
+        Write the files of a boilerplate ref into a directory.
+
+        Existing files in target_path are overwritten; no .git directory is
+        created.
+
+        Args:
+            repo_url: Boilerplate repository URL
+            target_path: Directory to write the files into
+            ref: Branch, tag or commit (default: the repository's HEAD)
+
+        Returns:
+            MaterializeResult with cache and timing details
+
+        Raises:
+            InvalidGitUrlError: If URL format is invalid
+            GitCloneError: If the mirror cannot be created or the ref is unknown
+        """
+        if not self.git_cloner.validate_git_url(repo_url):
+            raise InvalidGitUrlError(repo_url, "URL format not supported")
+
+        target_path = Path(target_path)
+        mirror = self.mirror_path(repo_url)
+
+        start = time.perf_counter()
+        cache_hit, fetched = self._ensure_mirror(repo_url, mirror)
+        commit = self._resolve(mirror, ref)
+        if commit is None and cache_hit and not fetched:
+            # Ref may be newer than the mirror
+            self._fetch(repo_url, mirror)
+            fetched = True
+            commit = self._resolve(mirror, ref)
+        if commit is None:
+            raise GitCloneError(repo_url, f"Unknown ref '{ref or 'HEAD'}'")
+        mirror_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        files = self._extract(mirror, commit, target_path)
+        extract_seconds = time.perf_counter() - start
+
+        result = MaterializeResult(
+            repo_url=repo_url,
+            ref=ref,
+            commit=commit,
+            cache_hit=cache_hit,
+            fetched=fetched,
+            mirror_seconds=mirror_seconds,
+            extract_seconds=extract_seconds,
+            files=files,
+        )
+        with self._lock:
+            if cache_hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+            self.stats.mirror_seconds += mirror_seconds
+            self.stats.extract_seconds += extract_seconds
+            self.stats.results.append(result)
+
+        logger.info(
+            "boilerplate_materialized",
+            repo_url=repo_url,
+            commit=commit,
+            cache_hit=cache_hit,
+            fetched=fetched,
+            mirror_seconds=round(mirror_seconds, 3),
+            extract_seconds=round(extract_seconds, 3),
+            files=files,
+        )
+        return result
+
+    def evict(self, repo_url: str) -> bool:
+        """
+        Remove the mirror for a repository URL.
+
+        Args:
+            repo_url: Repository URL
+
+        Returns:
+            True if a mirror was removed
+        """
+        mirror = self.mirror_path(repo_url)
+        if not mirror.exists():
+            return False
+        shutil.rmtree(mirror)
+        logger.info("boilerplate_mirror_evicted", repo_url=repo_url, mirror=str(mirror))
+        return True
+
+    def _ensure_mirror(self, repo_url: str, mirror: Path) -> Tuple[bool, bool]:
+        """
+        Create or refresh the mirror as needed.
+
+        Returns:
+            Tuple of (cache_hit, fetched)
+        """
+        if not mirror.exists():
+            self._clone_mirror(repo_url, mirror)
+            return False, True
+
+        if self.is_stale(repo_url):
+            try:
+                self._fetch(repo_url, mirror)
+                return True, True
+            except GitCloneError as e:
+                # Offline or remote gone: a stale boilerplate beats no boilerplate
+                logger.warning("boilerplate_mirror_refresh_failed", repo_url=repo_url, error=str(e))
+
+        return True, False
+
+    def _clone_mirror(self, repo_url: str, mirror: Path) -> None:
+        """Clone a bare mirror into a temporary directory and move it into place."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_dir = Path(tempfile.mkdtemp(prefix=".mirror-", dir=self.cache_dir))
+        try:
+            self._git(repo_url, ["clone", "--mirror", "--quiet", repo_url, str(temp_dir)])
+            (temp_dir / FETCH_STAMP).touch()
+            try:
+                os.rename(temp_dir, mirror)
+            except OSError:
+                # Another process published the mirror first
+                if not mirror.exists():
+                    raise
+        finally:
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+        logger.info("boilerplate_mirror_created", repo_url=repo_url, mirror=str(mirror))
+
+    def _fetch(self, repo_url: str, mirror: Path) -> None:
+        """Fetch all refs into an existing mirror."""
+        start = time.perf_counter()
+        self._git(repo_url, ["--git-dir", str(mirror), "fetch", "--prune", "--quiet", "origin"])
+        (mirror / FETCH_STAMP).touch()
+        with self._lock:
+            self.stats.refreshes += 1
+        logger.info(
+            "boilerplate_mirror_refreshed",
+            repo_url=repo_url,
+            seconds=round(time.perf_counter() - start, 3),
+        )
+
+    def _resolve(self, mirror: Path, ref: Optional[str]) -> Optional[str]:
+        """Resolve a ref to a commit in the mirror, or None if unknown."""
+        result = subprocess.run(
+            ["git", "--git-dir", str(mirror), "rev-parse", "--verify", "--quiet",
+             f"{ref or 'HEAD'}^{{commit}}"],
+            capture_output=True,
+            text=True,
+            timeout=GIT_TIMEOUT_SECONDS,
+            check=False,
+        )
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def _extract(self, mirror: Path, commit: str, target_path: Path) -> int:
+        """Stream ``git archive`` of a commit into target_path."""
+        target_path.mkdir(parents=True, exist_ok=True)
+        process = subprocess.Popen(
+            ["git", "--git-dir", str(mirror), "archive", "--format=tar", commit],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        files = 0
+        try:
+            with tarfile.open(fileobj=process.stdout, mode="r|") as archive:
+                for member in archive:
+                    if hasattr(tarfile, "data_filter"):
+                        archive.extract(member, target_path, filter="data")
+                    else:
+                        archive.extract(member, target_path)
+                    if member.isfile():
+                        files += 1
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read().decode("utf-8", errors="replace")
+            process.stderr.close()
+            returncode = process.wait(timeout=GIT_TIMEOUT_SECONDS)
+
+        if returncode != 0:
+            raise GitCloneError(str(mirror), f"git archive failed: {stderr.strip()}")
+        return files
+
+    def _git(self, repo_url: str, args: List[str]) -> None:
+        """Run a git command, raising GitCloneError on failure."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                capture_output=True,
+                text=True,
+                timeout=GIT_TIMEOUT_SECONDS,
+                check=False,
+            )
+        except subprocess.TimeoutExpired:
+            raise GitCloneError(repo_url, f"git timed out after {GIT_TIMEOUT_SECONDS} seconds")
+        if result.returncode != 0:
+            raise GitCloneError(repo_url, (result.stderr or result.stdout).strip())
@@ -21,7 +21,7 @@ logger = structlog.get_logger(__name__)
 # Constants
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 2
-SUPPORTED_SCHEMES = {"https", "http", "ssh", "git"}
+SUPPORTED_SCHEMES = {"https", "http", "ssh", "git", "file"}
 
 # URL patterns
 HTTPS_URL_PATTERN = re.compile(
@@ -188,6 +188,7 @@ class GitCloner:
         - HTTP: http://github.com/user/repo.git
         - SSH: git@github.com:user/repo.git
         - SSH: ssh://git@github.com/user/repo.git
+        - Local: file:///path/to/repo.git
 
         Args:
             url: URL to validate
@@ -12,6 +12,7 @@ import structlog
 from .models import ProjectMetadata, ProjectStatus, BenchmarkRun
 from .exceptions import ProjectNotFoundError
 from .git_cloner import GitCloner
+from .boilerplate_cache import BoilerplateCache
 from .services.project_lifecycle import ProjectLifecycleService
 from .services.project_state import ProjectStateService
 from .services.boilerplate import BoilerplateService
@@ -53,6 +54,7 @@ class SandboxManager:
         boilerplate_service: Optional[BoilerplateService] = None,
         lifecycle_service: Optional[ProjectLifecycleService] = None,
         benchmark_service: Optional[BenchmarkTrackingService] = None,
+        boilerplate_cache: Optional[BoilerplateCache] = None,
     ):
         """
         Initialize sandbox manager.
@@ -64,6 +66,8 @@ class SandboxManager:
             boilerplate_service: Optional BoilerplateService (creates default if not provided)
             lifecycle_service: Optional ProjectLifecycleService (creates default if not provided)
             benchmark_service: Optional BenchmarkTrackingService (creates default if not provided)
+            boilerplate_cache: Optional BoilerplateCache used by the default
+                BoilerplateService (default: clone boilerplates every time)
         """
         self.sandbox_root = Path(sandbox_root).resolve()
         self.projects_dir = self.sandbox_root / "projects"
@@ -76,7 +80,7 @@ class SandboxManager:
             sandbox_root=self.sandbox_root
         )
         self.boilerplate_service = boilerplate_service or BoilerplateService(
-            git_cloner=self._git_cloner
+            git_cloner=self._git_cloner, cache=boilerplate_cache
         )
         self.lifecycle_service = lifecycle_service or ProjectLifecycleService(
             sandbox_root=self.sandbox_root,
@@ -163,6 +167,16 @@ class SandboxManager:
         # Delegate to lifecycle service
         return self.lifecycle_service.list_projects(status=status)
 
+    def reindex_projects(self) -> int:
+        """
+        Rebuild the project registry index from the .sandbox.yaml files.
+
+        Returns:
+            Number of projects indexed
+        """
+        # Delegate to lifecycle service
+        return self.lifecycle_service.reindex_projects()
+
     def update_project(self, name: str, metadata: ProjectMetadata) -> None:
         """
         Update project metadata.
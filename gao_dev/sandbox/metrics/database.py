@@ -137,6 +137,10 @@ class MetricsDatabase:
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_runs_benchmark ON benchmark_runs(benchmark_name)"
             )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_project_timestamp "
+                "ON benchmark_runs(project_name, timestamp)"
+            )
 
             # Create indexes on foreign keys for better join performance
             cursor.execute(
@@ -51,11 +51,10 @@ class MetricsExporter:
         Raises:
             IOError: If file cannot be written
         """
-        metrics_list = []
-        for run_id in run_ids:
-            metrics = self.storage.get_metrics(run_id)
-            if metrics:
-                metrics_list.append(metrics.to_dict())
+        metrics_list = [
+            metrics.to_dict()
+            for metrics in self.storage.get_metrics_bulk(run_ids).values()
+        ]
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -86,11 +85,7 @@ class MetricsExporter:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Fetch all metrics
-        metrics_list = []
-        for run_id in run_ids:
-            metrics = self.storage.get_metrics(run_id)
-            if metrics:
-                metrics_list.append(metrics)
+        metrics_list = list(self.storage.get_metrics_bulk(run_ids).values())
 
         if not metrics_list:
             return
@@ -0,0 +1,660 @@
+"""Parallel, cached quality measurement pipeline.
+
+This module provides the QualityPipeline class, which measures a project with
+every supported quality tool in a single concurrent pass:
+
+- The test suite runs once, producing JUnit XML and coverage JSON reports
+- ruff, eslint, mypy, tsc and bandit run concurrently alongside the tests
+- Structured tool output (JSON/XML) is parsed instead of console text
+- Results are cached on disk, keyed by a hash of the project tree, so an
+  unchanged project is never re-measured
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the shape of QualityResults or the tool invocations change so
+# stale cache entries are ignored.
+CACHE_VERSION = 1
+
+# Directories and files that never influence quality results. Tool caches are
+# excluded so that a measurement run does not invalidate its own cache entry.
+IGNORE_NAMES = {
+    ".git",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    "env",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".tox",
+    "dist",
+    "build",
+    "coverage",
+    "htmlcov",
+    ".coverage",
+    ".coverage.json",
+    ".pytest-report.json",
+    ".DS_Store",
+}
+
+ESLINT_CONFIG_FILES = {
+    ".eslintrc.js",
+    ".eslintrc.json",
+    "eslint.config.js",
+    "package.json",
+}
+
+# Per-tool timeouts in seconds (match the sequential QualityTracker runners)
+TOOL_TIMEOUTS = {
+    "tests": 300,
+    "ruff": 60,
+    "eslint": 120,
+    "mypy": 120,
+    "tsc": 120,
+    "bandit": 120,
+}
+
+# pytest exit code for command line usage errors (e.g. pytest-cov missing)
+PYTEST_USAGE_ERROR = 4
+
+# mypy exit code for crashes and usage errors (e.g. --output=json before 1.11)
+MYPY_USAGE_ERROR = 2
+
+
+@dataclass
+class QualityResults:
+    """
+    Raw results of a single quality measurement pass.
+
+    Each tool field is None when the tool does not apply to the project,
+    is not installed, or timed out.
+
+    Attributes:
+        tests: Test counts (total, passed, failed, skipped)
+        coverage: Line coverage percentage (0.0-100.0)
+        ruff: Ruff findings (total, by_severity)
+        eslint: ESLint counts (errorCount, warningCount)
+        mypy: MyPy error count (errors)
+        tsc: TypeScript compiler error count (errors)
+        bandit: Bandit findings (total, by_severity)
+        tree_hash: Hash of the project tree the results were measured on
+        duration_seconds: Wall-clock time of the measurement pass
+        cached: True if the results were served from the cache
+    """
+
+    tests: Optional[Dict[str, int]] = None
+    coverage: Optional[float] = None
+    ruff: Optional[Dict[str, Any]] = None
+    eslint: Optional[Dict[str, int]] = None
+    mypy: Optional[Dict[str, int]] = None
+    tsc: Optional[Dict[str, int]] = None
+    bandit: Optional[Dict[str, Any]] = None
+    tree_hash: str = ""
+    duration_seconds: float = 0.0
+    cached: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert results to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary representation of the results
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QualityResults":
+        """
+        Create results from a dictionary.
+
+        Args:
+            data: Dictionary produced by to_dict()
+
+        Returns:
+            QualityResults instance
+        """
+        known = cls.__dataclass_fields__.keys()
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+def scan_project_tree(project_path: Path) -> Tuple[str, List[str]]:
+    """
+    Hash the project tree and list its files.
+
+    Hashes relative paths and file contents (ignoring IGNORE_NAMES) so the
+    hash only changes when something that can affect quality results changes.
+
+    Args:
+        project_path: Path to the project directory
+
+    Returns:
+        Tuple of (hex digest, sorted list of relative POSIX file paths)
+    """
+    files: List[str] = []
+    for root, dirs, filenames in os.walk(project_path):
+        dirs[:] = sorted(d for d in dirs if d not in IGNORE_NAMES)
+        rel_root = Path(root).relative_to(project_path)
+        for name in filenames:
+            if name in IGNORE_NAMES:
+                continue
+            files.append((rel_root / name).as_posix())
+    files.sort()
+
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode("utf-8"))
+    for rel_path in files:
+        digest.update(rel_path.encode("utf-8"))
+        digest.update(b"\0")
+        try:
+            with open(project_path / rel_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+        except OSError:
+            continue
+        digest.update(b"\0")
+
+    return digest.hexdigest(), files
+
+
+def parse_junit_xml(report_path: Path) -> Optional[Dict[str, int]]:
+    """
+    Parse a JUnit XML report into test counts.
+
+    Args:
+        report_path: Path to the JUnit XML file written by pytest
+
+    Returns:
+        Dictionary with total, passed, failed and skipped counts, or None
+    """
+    try:
+        root = ET.parse(report_path).getroot()
+    except (ET.ParseError, OSError):
+        return None
+
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    total = failed = skipped = 0
+    for suite in suites:
+        total += int(suite.get("tests", 0))
+        failed += int(suite.get("failures", 0)) + int(suite.get("errors", 0))
+        skipped += int(suite.get("skipped", 0))
+
+    return {
+        "total": total,
+        "passed": max(total - failed - skipped, 0),
+        "failed": failed,
+        "skipped": skipped,
+    }
+
+
+def parse_coverage_json(report_path: Path) -> Optional[float]:
+    """
+    Parse a coverage.py JSON report into a coverage percentage.
+
+    Args:
+        report_path: Path to the coverage JSON file
+
+    Returns:
+        Coverage percentage (0.0-100.0), or None if unavailable
+    """
+    try:
+        with open(report_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data.get("totals", {}).get("percent_covered", 0.0)
+
+
+def parse_ruff_json(output: str) -> Dict[str, Any]:
+    """
+    Aggregate ruff JSON findings by severity.
+
+    Args:
+        output: ruff --output-format=json stdout
+
+    Returns:
+        Dictionary with total and by_severity counts
+    """
+    errors = json.loads(output)
+    by_severity: Dict[str, int] = {}
+
+    for error in errors:
+        # Ruff uses "code" field, map first letter to severity
+        code = error.get("code") or ""
+        severity = "error" if code.startswith(("E", "F")) else "warning"
+        by_severity[severity] = by_severity.get(severity, 0) + 1
+
+    return {"total": len(errors), "by_severity": by_severity}
+
+
+def parse_eslint_json(output: str) -> Dict[str, int]:
+    """
+    Sum ESLint JSON per-file results.
+
+    Args:
+        output: eslint --format=json stdout
+
+    Returns:
+        Dictionary with errorCount and warningCount
+    """
+    total_errors = 0
+    total_warnings = 0
+    for file_result in json.loads(output):
+        total_errors += file_result.get("errorCount", 0)
+        total_warnings += file_result.get("warningCount", 0)
+    return {"errorCount": total_errors, "warningCount": total_warnings}
+
+
+def parse_bandit_json(output: str) -> Dict[str, Any]:
+    """
+    Aggregate bandit JSON findings by severity.
+
+    Args:
+        output: bandit -f json stdout
+
+    Returns:
+        Dictionary with total and by_severity counts
+    """
+    results = json.loads(output).get("results", [])
+    by_severity: Dict[str, int] = {}
+    for issue in results:
+        severity = issue.get("issue_severity", "UNDEFINED").lower()
+        by_severity[severity] = by_severity.get(severity, 0) + 1
+    return {"total": len(results), "by_severity": by_severity}
+
+
+def parse_mypy_output(output: str) -> int:
+    """
+    Count mypy errors from JSON-lines or plain text output.
+
+    Args:
+        output: mypy --output=json (or plain text) stdout
+
+    Returns:
+        Number of errors found
+    """
+    import re
+
+    errors = 0
+    structured = False
+    for line in output.splitlines():
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        structured = True
+        if record.get("severity") == "error":
+            errors += 1
+
+    if structured:
+        return errors
+    return len(re.findall(r"^.+:\d+: error:", output, re.MULTILINE))
+
+
+def mypy_error_count(returncode: int, output: str) -> int:
+    """
+    Count mypy errors, treating a failed run without parseable errors as failing.
+
+    mypy exits non-zero only when it reports errors or cannot run, so a
+    non-zero exit with nothing counted (a crash, a usage error, output in an
+    unexpected format) is reported as one error instead of a clean pass.
+
+    Args:
+        returncode: mypy exit code
+        output: mypy stdout and stderr
+
+    Returns:
+        Number of errors found (at least 1 if mypy failed)
+    """
+    errors = parse_mypy_output(output)
+    if returncode != 0 and errors == 0:
+        logger.warning("mypy_failed_without_errors", returncode=returncode, output=output[-500:])
+        return 1
+    return errors
+
+
+def parse_tsc_output(output: str) -> int:
+    """
+    Count TypeScript compiler errors.
+
+    Args:
+        output: tsc --noEmit stdout/stderr
+
+    Returns:
+        Number of errors found
+    """
+    import re
+
+    # Look for pattern like "Found 5 errors."
+    match = re.search(r"Found (\d+) error", output)
+    if match:
+        return int(match.group(1))
+
+    # Fallback: count lines with error markers
+    return len(re.findall(r":\d+:\d+\s+-\s+error\s+TS\d+:", output))
+
+
+class QualityPipeline:
+    """
+    Measures project quality with all tools concurrently.
+
+    Runs the test suite once (with coverage and JUnit reports) while the
+    linters, type checkers and security scanner run in parallel worker
+    threads. Report files are written to a private temp directory so the
+    project tree is not modified by the measurement.
+
+    Attributes:
+        cache_dir: Directory holding cached results (None disables caching)
+        max_workers: Maximum number of tools running at the same time
+
+    Example:
+        pipeline = QualityPipeline()
+        results = pipeline.measure(Path("sandbox/projects/todo-app-001"))
+        print(results.tests, results.coverage, results.cached)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_workers: int = 6,
+        use_cache: bool = True,
+    ):
+        """
+        Initialize quality pipeline.
+
+        Args:
+            cache_dir: Cache directory (default: ~/.gao-dev/cache/quality)
+            max_workers: Maximum number of concurrently running tools
+            use_cache: Whether to read and write cached results
+        """
+        if use_cache:
+            self.cache_dir: Optional[Path] = (
+                cache_dir or Path.home() / ".gao-dev" / "cache" / "quality"
+            )
+        else:
+            self.cache_dir = None
+        self.max_workers = max(1, max_workers)
+
+    def measure(self, project_path: Path, force: bool = False) -> QualityResults:
+        """
+        Measure all quality metrics for a project.
+
+        Args:
+            project_path: Path to the project directory
+            force: Re-measure even if cached results exist
+
+        Returns:
+            QualityResults for the current project tree
+        """
+        project_path = Path(project_path)
+        start = time.perf_counter()
+        tree_hash, files = scan_project_tree(project_path)
+
+        if not force:
+            cached = self._load_cached(tree_hash)
+            if cached is not None:
+                logger.info(
+                    "quality_results_cached",
+                    project=str(project_path),
+                    tree_hash=tree_hash[:12],
+                )
+                return cached
+
+        results = QualityResults(tree_hash=tree_hash)
+        tasks = self._plan_tasks(project_path, files)
+
+        with tempfile.TemporaryDirectory(prefix="gao-quality-") as tmp:
+            report_dir = Path(tmp)
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, max(len(tasks), 1)),
+                thread_name_prefix="quality",
+            ) as pool:
+                futures = {
+                    name: pool.submit(task, project_path, report_dir)
+                    for name, task in tasks.items()
+                }
+                for name, future in futures.items():
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        logger.warning("quality_tool_failed", tool=name, error=str(e))
+                        continue
+                    if name == "tests" and outcome is not None:
+                        results.tests, results.coverage = outcome
+                    elif outcome is not None:
+                        setattr(results, name, outcome)
+
+        results.duration_seconds = time.perf_counter() - start
+        logger.info(
+            "quality_results_measured",
+            project=str(project_path),
+            tools=sorted(tasks),
+            duration_seconds=round(results.duration_seconds, 2),
+        )
+        self._store_cached(results)
+        return results
+
+    def _plan_tasks(
+        self, project_path: Path, files: List[str]
+    ) -> Dict[str, Callable[[Path, Path], Any]]:
+        """
+        Select the tools that apply to the project.
+
+        Args:
+            project_path: Path to the project directory
+            files: Relative file paths from scan_project_tree()
+
+        Returns:
+            Mapping of result field name to tool runner
+        """
+        names = set(files)
+        has_python = any(f.endswith(".py") for f in files)
+
+        tasks: Dict[str, Callable[[Path, Path], Any]] = {
+            "tests": self._run_tests,
+            "ruff": self._run_ruff,
+        }
+        if names & ESLINT_CONFIG_FILES:
+            tasks["eslint"] = self._run_eslint
+        if has_python:
+            tasks["mypy"] = self._run_mypy
+            tasks["bandit"] = self._run_bandit
+        if "tsconfig.json" in names:
+            tasks["tsc"] = self._run_tsc
+        return tasks
+
+    def _run(
+        self,
+        cmd: List[str],
+        cwd: Path,
+        timeout: int,
+        env: Optional[Dict[str, str]] = None,
+    ) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run a tool, returning None if it is missing or times out.
+
+        Args:
+            cmd: Command line to execute
+            cwd: Working directory
+            timeout: Timeout in seconds
+            env: Optional environment override
+
+        Returns:
+            CompletedProcess, or None if the tool could not be run
+        """
+        try:
+            return subprocess.run(
+                cmd,
+                cwd=cwd,
+                capture_output=True,
+                timeout=timeout,
+                text=True,
+                env=env,
+            )
+        except FileNotFoundError:
+            return None
+        except subprocess.TimeoutExpired:
+            logger.warning("quality_tool_timeout", command=cmd[0], timeout=timeout)
+            return None
+
+    def _run_tests(
+        self, project_path: Path, report_dir: Path
+    ) -> Optional[Tuple[Optional[Dict[str, int]], Optional[float]]]:
+        """
+        Run the test suite once with JUnit and coverage JSON reports.
+
+        Falls back to a run without coverage if pytest-cov is unavailable.
+
+        Returns:
+            Tuple of (test counts, coverage percentage), or None
+        """
+        junit_path = report_dir / "junit.xml"
+        coverage_path = report_dir / "coverage.json"
+        env = {**os.environ, "COVERAGE_FILE": str(report_dir / ".coverage")}
+        base_cmd = [
+            "pytest",
+            "-q",
+            "--tb=no",
+            "-p",
+            "no:cacheprovider",
+            f"--junitxml={junit_path}",
+        ]
+        cov_args = ["--cov=.", f"--cov-report=json:{coverage_path}"]
+
+        result = self._run(base_cmd + cov_args, project_path, TOOL_TIMEOUTS["tests"], env)
+        if result is None:
+            return None
+        if result.returncode == PYTEST_USAGE_ERROR and not junit_path.exists():
+            result = self._run(base_cmd, project_path, TOOL_TIMEOUTS["tests"], env)
+            if result is None:
+                return None
+
+        tests = parse_junit_xml(junit_path) if junit_path.exists() else None
+        coverage = parse_coverage_json(coverage_path) if coverage_path.exists() else None
+        if tests is None and coverage is None:
+            return None
+        return tests, coverage
+
+    def _run_ruff(self, project_path: Path, report_dir: Path) -> Optional[Dict[str, Any]]:
+        """Run ruff and aggregate findings by severity."""
+        result = self._run(
+            ["ruff", "check", ".", "--output-format=json"],
+            project_path,
+            TOOL_TIMEOUTS["ruff"],
+        )
+        if result is None or not result.stdout:
+            return None
+        return parse_ruff_json(result.stdout)
+
+    def _run_eslint(self, project_path: Path, report_dir: Path) -> Optional[Dict[str, int]]:
+        """Run eslint and sum error/warning counts."""
+        result = self._run(
+            ["npx", "eslint", ".", "--format=json"],
+            project_path,
+            TOOL_TIMEOUTS["eslint"],
+        )
+        if result is None or not result.stdout:
+            return None
+        return parse_eslint_json(result.stdout)
+
+    def _run_mypy(self, project_path: Path, report_dir: Path) -> Optional[Dict[str, int]]:
+        """
+        Run mypy with JSON-lines output and count errors.
+
+        Falls back to plain text output if this mypy predates --output=json.
+        """
+        cmd = ["mypy", ".", "--no-error-summary"]
+        result = self._run(cmd + ["--output=json"], project_path, TOOL_TIMEOUTS["mypy"])
+        if (
+            result is not None
+            and result.returncode == MYPY_USAGE_ERROR
+            and "--output" in result.stderr
+        ):
+            result = self._run(cmd, project_path, TOOL_TIMEOUTS["mypy"])
+        if result is None:
+            return None
+        return {"errors": mypy_error_count(result.returncode, result.stdout + result.stderr)}
+
+    def _run_tsc(self, project_path: Path, report_dir: Path) -> Optional[Dict[str, int]]:
+        """Run the TypeScript compiler without emitting and count errors."""
+        result = self._run(
+            ["npx", "tsc", "--noEmit", "--pretty", "false"],
+            project_path,
+            TOOL_TIMEOUTS["tsc"],
+        )
+        if result is None:
+            return None
+        return {"errors": parse_tsc_output(result.stdout + result.stderr)}
+
+    def _run_bandit(self, project_path: Path, report_dir: Path) -> Optional[Dict[str, Any]]:
+        """Run bandit and aggregate findings by severity."""
+        result = self._run(
+            ["bandit", "-r", ".", "-f", "json", "-q"],
+            project_path,
+            TOOL_TIMEOUTS["bandit"],
+        )
+        if result is None or not result.stdout:
+            return None
+        return parse_bandit_json(result.stdout)
+
+    def _cache_path(self, tree_hash: str) -> Optional[Path]:
+        """Get the cache file for a tree hash, or None if caching is off."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{tree_hash}.json"
+
+    def _load_cached(self, tree_hash: str) -> Optional[QualityResults]:
+        """
+        Load cached results for a tree hash.
+
+        Args:
+            tree_hash: Project tree hash
+
+        Returns:
+            Cached QualityResults, or None on miss or unreadable entry
+        """
+        cache_path = self._cache_path(tree_hash)
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                results = QualityResults.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        results.cached = True
+        return results
+
+    def _store_cached(self, results: QualityResults) -> None:
+        """
+        Persist results atomically, ignoring cache write failures.
+
+        Args:
+            results: Freshly measured results
+        """
+        cache_path = self._cache_path(results.tree_hash)
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(results.to_dict()), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("quality_cache_write_failed", path=str(cache_path), error=str(e))
@@ -3,6 +3,10 @@
 This module provides the QualityTracker class, which wraps MetricsCollector
 to extract and track quality metrics from external tools like pytest, ruff,
 mypy, and bandit.
+
+The per-tool track_* methods run each tool sequentially. track_all() instead
+delegates to QualityPipeline, which runs every tool concurrently, runs the
+test suite only once, and caches results by project tree hash.
 """
 
 import subprocess
@@ -11,6 +15,13 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 
 from .collector import MetricsCollector
+from .quality_pipeline import (
+    QualityPipeline,
+    QualityResults,
+    mypy_error_count,
+    parse_mypy_output,
+    parse_tsc_output,
+)
 
 
 class QualityTracker:
@@ -29,7 +40,10 @@ class QualityTracker:
         tracker = QualityTracker()
         project_path = Path("sandbox/projects/todo-app-001")
 
-        # Track all quality metrics
+        # Track all quality metrics in one concurrent, cached pass
+        tracker.track_all(project_path)
+
+        # Or track individual metrics sequentially
         tracker.track_tests(project_path)
         tracker.track_linting(project_path)
         tracker.track_type_errors(project_path)
@@ -40,15 +54,93 @@ class QualityTracker:
         metrics = tracker.collector.get_current_metrics()
     """
 
-    def __init__(self, collector: Optional[MetricsCollector] = None):
+    def __init__(
+        self,
+        collector: Optional[MetricsCollector] = None,
+        pipeline: Optional[QualityPipeline] = None,
+    ):
         """
         Initialize quality tracker.
 
         Args:
             collector: Optional MetricsCollector instance. If not provided,
                       creates a new singleton instance.
+            pipeline: Optional QualityPipeline used by track_all(). If not
+                      provided, one with the default cache is created lazily.
         """
         self.collector = collector or MetricsCollector()
+        self._pipeline = pipeline
+
+    @property
+    def pipeline(self) -> QualityPipeline:
+        """Get the quality pipeline, creating it on first use."""
+        if self._pipeline is None:
+            self._pipeline = QualityPipeline()
+        return self._pipeline
+
+    def track_all(self, project_path: Path, force: bool = False) -> QualityResults:
+        """
+        Extract all tool-based quality metrics in a single concurrent pass.
+
+        Runs tests (once, with coverage), linting, type checking and security
+        scanning in parallel via QualityPipeline. Results for an unchanged
+        project tree are served from the cache.
+
+        Args:
+            project_path: Path to the project directory
+            force: Re-measure even if cached results exist
+
+        Returns:
+            QualityResults that were recorded on the collector
+        """
+        results = self.pipeline.measure(project_path, force=force)
+        self.apply_results(results)
+        return results
+
+    def apply_results(self, results: QualityResults) -> None:
+        """
+        Record pipeline results on the collector.
+
+        Sets the same metric keys as the individual track_* methods.
+
+        Args:
+            results: Results from QualityPipeline.measure()
+        """
+        if results.tests:
+            total = results.tests["total"]
+            self.collector.set_value("tests_written", total)
+            self.collector.set_value("tests_passing", results.tests["passed"])
+            self.collector.set_value("tests_failing", results.tests["failed"])
+            if total > 0:
+                pass_rate = (results.tests["passed"] / total) * 100
+                self.collector.set_value("test_pass_rate", pass_rate)
+
+        if results.coverage is not None:
+            self.collector.set_value("code_coverage", results.coverage)
+
+        if results.ruff or results.eslint:
+            by_severity: Dict[str, int] = dict((results.ruff or {}).get("by_severity", {}))
+            total = (results.ruff or {}).get("total", 0)
+            if results.eslint:
+                errors = results.eslint.get("errorCount", 0)
+                warnings = results.eslint.get("warningCount", 0)
+                total += errors + warnings
+                by_severity["error"] = by_severity.get("error", 0) + errors
+                by_severity["warning"] = by_severity.get("warning", 0) + warnings
+            self.collector.set_value("linting_errors", total)
+            self.collector.set_value("linting_by_severity", by_severity)
+
+        python_errors = results.mypy["errors"] if results.mypy else 0
+        ts_errors = results.tsc["errors"] if results.tsc else 0
+        if results.mypy:
+            self.collector.set_value("type_errors_python", python_errors)
+        if results.tsc:
+            self.collector.set_value("type_errors_typescript", ts_errors)
+        self.collector.set_value("type_errors_total", python_errors + ts_errors)
+
+        if results.bandit:
+            self.collector.set_value("security_vulnerabilities", results.bandit["total"])
+            self.collector.set_value("security_by_severity", results.bandit["by_severity"])
 
     def track_tests(self, project_path: Path) -> None:
         """
@@ -454,9 +546,9 @@ class QualityTracker:
                 text=True,
             )
 
-            # MyPy returns non-zero if errors found
-            # Parse output to count errors
-            error_count = self._parse_mypy_output(result.stdout + result.stderr)
+            # MyPy returns non-zero if errors found; a non-zero exit without
+            # countable errors (crash, usage error) still counts as failing
+            error_count = mypy_error_count(result.returncode, result.stdout + result.stderr)
 
             return {"errors": error_count}
 
@@ -479,11 +571,7 @@ class QualityTracker:
             Number of errors found
         """
         try:
-            # Count lines with "error:" in them
-            import re
-
-            error_lines = re.findall(r"^.+:\d+: error:", output, re.MULTILINE)
-            return len(error_lines)
+            return parse_mypy_output(output)
         except Exception:
             return 0
 
@@ -534,18 +622,7 @@ class QualityTracker:
             Number of errors found
         """
         try:
-            # Look for pattern like "Found 5 errors."
-            import re
-
-            pattern = r"Found (\d+) error"
-            match = re.search(pattern, output)
-
-            if match:
-                return int(match.group(1))
-
-            # Fallback: count lines with error markers
-            error_lines = re.findall(r":\d+:\d+\s+-\s+error\s+TS\d+:", output)
-            return len(error_lines)
+            return parse_tsc_output(output)
         except Exception:
             return 0
 
@@ -6,8 +6,9 @@ provide high-level storage operations with transaction safety.
 """
 
 import json
+from dataclasses import MISSING, fields
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 
 from .database import MetricsDatabase
 from .models import (
@@ -19,6 +20,54 @@ from .models import (
 )
 
 
+# BenchmarkMetrics attribute -> (table, alias, model). Column names match model fields.
+_CATEGORIES: Dict[str, Tuple[str, str, type]] = {
+    "performance": ("performance_metrics", "p", PerformanceMetrics),
+    "autonomy": ("autonomy_metrics", "a", AutonomyMetrics),
+    "quality": ("quality_metrics", "q", QualityMetrics),
+    "workflow": ("workflow_metrics", "w", WorkflowMetrics),
+}
+
+# Metrics averaged by get_average_metrics, as (category, column)
+_AVERAGED_METRICS = (
+    ("performance", "total_time_seconds"),
+    ("performance", "token_usage_total"),
+    ("performance", "api_calls_count"),
+    ("performance", "api_calls_cost"),
+    ("autonomy", "manual_interventions_count"),
+    ("autonomy", "one_shot_success_rate"),
+    ("autonomy", "error_recovery_rate"),
+    ("quality", "tests_written"),
+    ("quality", "tests_passing"),
+    ("quality", "code_coverage_percentage"),
+    ("workflow", "stories_created"),
+    ("workflow", "stories_completed"),
+    ("workflow", "avg_cycle_time_seconds"),
+)
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_BULK_CHUNK_SIZE = 500
+
+# LEFT JOIN of every metric table onto benchmark_runs aliased as r
+_METRICS_JOIN = " ".join(
+    f"LEFT JOIN {table} {alias} ON {alias}.run_id = r.run_id"
+    for table, alias, _ in _CATEGORIES.values()
+)
+
+
+def _is_json_field(model: type, name: str) -> bool:
+    """Whether a model field is stored as a JSON document (dicts and lists)."""
+    return next(f for f in fields(model) if f.name == name).default_factory is not MISSING
+
+
+def _category_select(category: str) -> str:
+    """Select list for one category, with columns prefixed "<category>." plus a presence marker."""
+    _, alias, model = _CATEGORIES[category]
+    columns = [f'{alias}.id AS "{category}.id"']
+    columns += [f'{alias}.{f.name} AS "{category}.{f.name}"' for f in fields(model)]
+    return ", ".join(columns)
+
+
 class MetricsStorage:
     """
     Handles storage and retrieval of benchmark metrics.
@@ -195,87 +244,110 @@ class MetricsStorage:
         Returns:
             BenchmarkMetrics object if found, None otherwise
         """
+        return self.get_metrics_bulk([run_id]).get(run_id)
+
+    def get_metrics_bulk(self, run_ids: Iterable[str]) -> Dict[str, BenchmarkMetrics]:
+        """
+        Get metrics for many runs with one joined query per chunk of run IDs.
+
+        Args:
+            run_ids: Run identifiers to load
+
+        Returns:
+            BenchmarkMetrics keyed by run_id, in the order requested; unknown
+            run IDs are omitted
+        """
+        ordered = list(dict.fromkeys(run_ids))
+        if not ordered:
+            return {}
+
+        select = ", ".join(
+            ["r.*"] + [_category_select(category) for category in _CATEGORIES]
+        )
+        found: Dict[str, BenchmarkMetrics] = {}
         with self.db.connection() as conn:
-            cursor = conn.cursor()
+            for start in range(0, len(ordered), _BULK_CHUNK_SIZE):
+                chunk = ordered[start:start + _BULK_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT {select} FROM benchmark_runs r {_METRICS_JOIN} "
+                    f"WHERE r.run_id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    if row["run_id"] not in found:
+                        found[row["run_id"]] = self._metrics_from_row(row)
+
+        return {run_id: found[run_id] for run_id in ordered if run_id in found}
+
+    @staticmethod
+    def _metrics_from_row(row: Any) -> BenchmarkMetrics:
+        """
+        Reconstruct BenchmarkMetrics from a joined row.
 
-            # Get benchmark run
-            cursor.execute("SELECT * FROM benchmark_runs WHERE run_id = ?", (run_id,))
-            run_row = cursor.fetchone()
-            if not run_row:
-                return None
-
-            # Get all metric categories
-            cursor.execute("SELECT * FROM performance_metrics WHERE run_id = ?", (run_id,))
-            perf_row = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM autonomy_metrics WHERE run_id = ?", (run_id,))
-            auto_row = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM quality_metrics WHERE run_id = ?", (run_id,))
-            qual_row = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM workflow_metrics WHERE run_id = ?", (run_id,))
-            work_row = cursor.fetchone()
-
-            # Reconstruct BenchmarkMetrics
-            return BenchmarkMetrics(
-                run_id=run_row["run_id"],
-                timestamp=run_row["timestamp"],
-                project_name=run_row["project_name"],
-                benchmark_name=run_row["benchmark_name"],
-                version=run_row["version"],
-                performance=PerformanceMetrics(
-                    total_time_seconds=perf_row["total_time_seconds"],
-                    phase_times=json.loads(perf_row["phase_times"]),
-                    token_usage_total=perf_row["token_usage_total"],
-                    token_usage_by_agent=json.loads(perf_row["token_usage_by_agent"]),
-                    api_calls_count=perf_row["api_calls_count"],
-                    api_calls_cost=perf_row["api_calls_cost"],
-                )
-                if perf_row
-                else PerformanceMetrics(),
-                autonomy=AutonomyMetrics(
-                    manual_interventions_count=auto_row["manual_interventions_count"],
-                    manual_interventions_types=json.loads(auto_row["manual_interventions_types"]),
-                    prompts_needed_initial=auto_row["prompts_needed_initial"],
-                    prompts_needed_followup=auto_row["prompts_needed_followup"],
-                    one_shot_success_rate=auto_row["one_shot_success_rate"],
-                    error_recovery_rate=auto_row["error_recovery_rate"],
-                    agent_handoffs_successful=auto_row["agent_handoffs_successful"],
-                    agent_handoffs_failed=auto_row["agent_handoffs_failed"],
-                )
-                if auto_row
-                else AutonomyMetrics(),
-                quality=QualityMetrics(
-                    tests_written=qual_row["tests_written"],
-                    tests_passing=qual_row["tests_passing"],
-                    code_coverage_percentage=qual_row["code_coverage_percentage"],
-                    linting_errors_count=qual_row["linting_errors_count"],
-                    linting_errors_by_severity=json.loads(
-                        qual_row["linting_errors_by_severity"]
-                    ),
-                    type_errors_count=qual_row["type_errors_count"],
-                    security_vulnerabilities_count=qual_row["security_vulnerabilities_count"],
-                    security_vulnerabilities_by_severity=json.loads(
-                        qual_row["security_vulnerabilities_by_severity"]
-                    ),
-                    functional_completeness_percentage=qual_row[
-                        "functional_completeness_percentage"
-                    ],
-                )
-                if qual_row
-                else QualityMetrics(),
-                workflow=WorkflowMetrics(
-                    stories_created=work_row["stories_created"],
-                    stories_completed=work_row["stories_completed"],
-                    avg_cycle_time_seconds=work_row["avg_cycle_time_seconds"],
-                    phase_distribution=json.loads(work_row["phase_distribution"]),
-                    rework_count=work_row["rework_count"],
-                )
-                if work_row
-                else WorkflowMetrics(),
-                metadata=json.loads(run_row["metadata"]),
-            )
+        Categories without a stored row fall back to their model defaults.
+
+        Args:
+            row: sqlite3.Row selected with the "<category>.<column>" aliases
+
+        Returns:
+            BenchmarkMetrics for the row's run
+        """
+        categories: Dict[str, Any] = {}
+        for category, (_, _, model) in _CATEGORIES.items():
+            if row[f"{category}.id"] is None:
+                categories[category] = model()
+                continue
+            values = {}
+            for f in fields(model):
+                value = row[f"{category}.{f.name}"]
+                values[f.name] = json.loads(value) if _is_json_field(model, f.name) else value
+            categories[category] = model(**values)
+
+        return BenchmarkMetrics(
+            run_id=row["run_id"],
+            timestamp=row["timestamp"],
+            project_name=row["project_name"],
+            benchmark_name=row["benchmark_name"],
+            version=row["version"],
+            metadata=json.loads(row["metadata"]),
+            **categories,
+        )
+
+    @staticmethod
+    def _run_filters(
+        project_name: Optional[str] = None,
+        benchmark_name: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the WHERE clause shared by run listings and aggregates.
+
+        Returns:
+            Tuple of (clause including " WHERE ", or "", parameters)
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if project_name:
+            conditions.append("project_name = ?")
+            params.append(project_name)
+
+        if benchmark_name:
+            conditions.append("benchmark_name = ?")
+            params.append(benchmark_name)
+
+        if start_date:
+            conditions.append("timestamp >= ?")
+            params.append(start_date)
+
+        if end_date:
+            conditions.append("timestamp <= ?")
+            params.append(end_date)
+
+        clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return clause, params
 
     def list_runs(
         self,
@@ -303,29 +375,10 @@ class MetricsStorage:
         with self.db.connection() as conn:
             cursor = conn.cursor()
 
-            query = "SELECT * FROM benchmark_runs"
-            conditions = []
-            params = []
-
-            if project_name:
-                conditions.append("project_name = ?")
-                params.append(project_name)
-
-            if benchmark_name:
-                conditions.append("benchmark_name = ?")
-                params.append(benchmark_name)
-
-            if start_date:
-                conditions.append("timestamp >= ?")
-                params.append(start_date)
-
-            if end_date:
-                conditions.append("timestamp <= ?")
-                params.append(end_date)
-
-            if conditions:
-                query += " WHERE " + " AND ".join(conditions)
-
+            where, params = self._run_filters(
+                project_name, benchmark_name, start_date, end_date
+            )
+            query = "SELECT * FROM benchmark_runs" + where
             query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
 
@@ -401,7 +454,8 @@ class MetricsStorage:
         Get average metrics across recent runs.
 
         Calculates averages for key numeric metrics across the most recent runs
-        matching the filter criteria.
+        matching the filter criteria in a single aggregate query. Runs missing a
+        metric category count as zeros, matching get_metrics defaults.
 
         Args:
             project_name: Filter by project name
@@ -411,55 +465,24 @@ class MetricsStorage:
         Returns:
             Dictionary containing average values for key metrics
         """
-        runs = self.list_runs(
-            project_name=project_name, benchmark_name=benchmark_name, limit=limit
+        where, params = self._run_filters(project_name, benchmark_name)
+        averages = ", ".join(
+            f"AVG(COALESCE({_CATEGORIES[category][1]}.{column}, 0)) AS {column}"
+            for category, column in _AVERAGED_METRICS
+        )
+        query = (
+            "WITH recent AS ("
+            f"SELECT run_id FROM benchmark_runs{where} ORDER BY timestamp DESC LIMIT ?"
+            f") SELECT COUNT(*) AS run_count, {averages} "
+            f"FROM recent r {_METRICS_JOIN}"
         )
 
-        if not runs:
-            return {}
-
-        # Collect metrics for averaging
-        metrics_list = []
-        for run in runs:
-            metrics = self.get_metrics(run["run_id"])
-            if metrics:
-                metrics_list.append(metrics)
+        with self.db.connection() as conn:
+            row = conn.execute(query, [*params, limit]).fetchone()
 
-        if not metrics_list:
+        if not row["run_count"]:
             return {}
-
-        # Calculate averages
-        total = len(metrics_list)
-        return {
-            "total_time_seconds": sum(m.performance.total_time_seconds for m in metrics_list)
-            / total,
-            "token_usage_total": sum(m.performance.token_usage_total for m in metrics_list)
-            / total,
-            "api_calls_count": sum(m.performance.api_calls_count for m in metrics_list) / total,
-            "api_calls_cost": sum(m.performance.api_calls_cost for m in metrics_list) / total,
-            "manual_interventions_count": sum(
-                m.autonomy.manual_interventions_count for m in metrics_list
-            )
-            / total,
-            "one_shot_success_rate": sum(
-                m.autonomy.one_shot_success_rate for m in metrics_list
-            )
-            / total,
-            "error_recovery_rate": sum(m.autonomy.error_recovery_rate for m in metrics_list)
-            / total,
-            "tests_written": sum(m.quality.tests_written for m in metrics_list) / total,
-            "tests_passing": sum(m.quality.tests_passing for m in metrics_list) / total,
-            "code_coverage_percentage": sum(
-                m.quality.code_coverage_percentage for m in metrics_list
-            )
-            / total,
-            "stories_created": sum(m.workflow.stories_created for m in metrics_list) / total,
-            "stories_completed": sum(m.workflow.stories_completed for m in metrics_list) / total,
-            "avg_cycle_time_seconds": sum(
-                m.workflow.avg_cycle_time_seconds for m in metrics_list
-            )
-            / total,
-        }
+        return {column: float(row[column]) for _, column in _AVERAGED_METRICS}
 
     def get_metric_trends(
         self,
@@ -467,47 +490,80 @@ class MetricsStorage:
         project_name: Optional[str] = None,
         benchmark_name: Optional[str] = None,
         limit: int = 20,
+        moving_average_window: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get trend data for a specific metric over time.
 
-        Returns time series data showing how a metric has changed across runs.
+        Returns time series data showing how a metric has changed across runs,
+        read with one query against the metric's own table.
 
         Args:
             metric_name: Name of the metric to track (e.g., 'total_time_seconds')
             project_name: Filter by project name
             benchmark_name: Filter by benchmark name
             limit: Number of recent runs to include (default: 20)
+            moving_average_window: If set, add a "moving_average" over this
+                many runs (numeric metrics only)
 
         Returns:
-            List of dictionaries with timestamp and metric value
+            List of dictionaries with timestamp and metric value, oldest first
+
+        Raises:
+            ValueError: If a moving average is requested for a non-numeric metric
+                or the window is not positive
         """
-        runs = self.list_runs(
-            project_name=project_name, benchmark_name=benchmark_name, limit=limit
+        resolved = self._resolve_metric(metric_name)
+        if resolved is None:
+            return []
+        table, model = resolved
+        is_json = _is_json_field(model, metric_name)
+        if moving_average_window is not None:
+            if is_json:
+                raise ValueError(f"Metric '{metric_name}' is not numeric")
+            if moving_average_window < 1:
+                raise ValueError("moving_average_window must be positive")
+
+        default = "'{}'" if is_json else "0"
+        value = f"COALESCE(m.{metric_name}, {default})"
+        where, params = self._run_filters(project_name, benchmark_name)
+        select = f"r.run_id, r.timestamp, {value} AS value"
+        if moving_average_window is not None:
+            select += (
+                f", AVG({value}) OVER (ORDER BY r.timestamp "
+                "ROWS BETWEEN ? PRECEDING AND CURRENT ROW) AS moving_average"
+            )
+            params_select = [moving_average_window - 1]
+        else:
+            params_select = []
+        query = (
+            "WITH recent AS ("
+            f"SELECT run_id, timestamp FROM benchmark_runs{where} "
+            "ORDER BY timestamp DESC LIMIT ?"
+            f") SELECT {select} FROM recent r "
+            f"LEFT JOIN {table} m ON m.run_id = r.run_id "
+            "ORDER BY r.timestamp"
         )
 
-        trends = []
-        for run in runs:
-            metrics = self.get_metrics(run["run_id"])
-            if not metrics:
-                continue
-
-            # Extract metric value by name
-            value = None
-            if hasattr(metrics.performance, metric_name):
-                value = getattr(metrics.performance, metric_name)
-            elif hasattr(metrics.autonomy, metric_name):
-                value = getattr(metrics.autonomy, metric_name)
-            elif hasattr(metrics.quality, metric_name):
-                value = getattr(metrics.quality, metric_name)
-            elif hasattr(metrics.workflow, metric_name):
-                value = getattr(metrics.workflow, metric_name)
-
-            if value is not None:
-                trends.append(
-                    {"timestamp": metrics.timestamp, "run_id": metrics.run_id, "value": value}
-                )
+        with self.db.connection() as conn:
+            rows = conn.execute(query, [*params, limit, *params_select]).fetchall()
 
-        # Sort by timestamp ascending (oldest first for trend visualization)
-        trends.sort(key=lambda x: x["timestamp"])
+        trends = []
+        for row in rows:
+            point = {
+                "timestamp": row["timestamp"],
+                "run_id": row["run_id"],
+                "value": json.loads(row["value"]) if is_json else row["value"],
+            }
+            if moving_average_window is not None:
+                point["moving_average"] = row["moving_average"]
+            trends.append(point)
         return trends
+
+    @staticmethod
+    def _resolve_metric(metric_name: str) -> Optional[Tuple[str, type]]:
+        """Find the (table, model) storing a metric, checking categories in order."""
+        for table, _, model in _CATEGORIES.values():
+            if any(f.name == metric_name for f in fields(model)):
+                return table, model
+        return None
@@ -6,6 +6,7 @@ document.addEventListener('DOMContentLoaded', function() {
     initializeTableSorting();
     initializeCopyButtons();
     initializeNavigation();
+    initializeCharts();
 });
 
 /**
@@ -190,6 +191,90 @@ function initializeNavigation() {
     });
 }
 
+/**
+ * Render charts emitted as JSON data (chart_format="json") into inline SVG
+ */
+function initializeCharts() {
+    document.querySelectorAll('.chart-canvas[data-chart]').forEach(function(element) {
+        try {
+            element.appendChild(renderChart(JSON.parse(element.dataset.chart)));
+        } catch (error) {
+            element.textContent = 'Chart unavailable';
+        }
+    });
+}
+
+/**
+ * Build an SVG line, bar, horizontal bar or gauge chart from labels and series
+ */
+function renderChart(chart) {
+    const ns = 'http://www.w3.org/2000/svg';
+    const colors = ['#2563eb', '#7c3aed', '#10b981', '#f59e0b'];
+    const width = 640, height = 320, pad = 40;
+    const svg = document.createElementNS(ns, 'svg');
+    svg.setAttribute('viewBox', '0 0 ' + width + ' ' + height);
+    svg.setAttribute('width', '100%');
+
+    function add(tag, attrs, text) {
+        const node = document.createElementNS(ns, tag);
+        Object.keys(attrs).forEach(function(key) { node.setAttribute(key, attrs[key]); });
+        if (text !== undefined) node.textContent = text;
+        svg.appendChild(node);
+        return node;
+    }
+
+    const labels = chart.labels || [];
+    const series = chart.series || [];
+    const all = series.reduce(function(acc, s) { return acc.concat(s.values); }, []);
+    const max = chart.max || Math.max.apply(null, all.concat([1]));
+    const plotW = width - 2 * pad, plotH = height - 2 * pad;
+
+    add('line', {x1: pad, y1: height - pad, x2: width - pad, y2: height - pad, stroke: '#6b7280'});
+
+    if (chart.type === 'gauge') {
+        const value = series[0].values[0];
+        add('rect', {x: pad, y: height / 2 - 20, width: plotW, height: 40, fill: '#e5e7eb'});
+        add('rect', {x: pad, y: height / 2 - 20, width: plotW * value / max, height: 40,
+                     fill: chart.color || colors[0]});
+        add('text', {x: width / 2, y: height / 2 + 8, 'text-anchor': 'middle',
+                     'font-size': 24, 'font-weight': 'bold'}, value.toFixed(1) + '%');
+    } else if (chart.type === 'line') {
+        series.forEach(function(s, si) {
+            const step = plotW / Math.max(s.values.length - 1, 1);
+            const points = s.values.map(function(v, i) {
+                return (pad + i * step) + ',' + (height - pad - plotH * v / max);
+            });
+            add('polyline', {points: points.join(' '), fill: 'none',
+                             stroke: colors[si % colors.length], 'stroke-width': 2});
+        });
+    } else if (chart.type === 'hbar') {
+        const band = plotH / Math.max(labels.length, 1);
+        labels.forEach(function(label, i) {
+            const v = series[0].values[i];
+            add('rect', {x: pad, y: pad + i * band + 4, width: plotW * v / max,
+                         height: band - 8, fill: colors[i % 2]});
+            add('text', {x: pad + 4, y: pad + (i + 0.5) * band + 4, 'font-size': 12,
+                         fill: '#ffffff'}, label + ' (' + formatDuration(v) + ')');
+        });
+    } else {
+        const band = plotW / Math.max(labels.length, 1);
+        const barW = (band - 8) / Math.max(series.length, 1);
+        labels.forEach(function(label, i) {
+            series.forEach(function(s, si) {
+                const h = plotH * s.values[i] / max;
+                add('rect', {x: pad + i * band + 4 + si * barW, y: height - pad - h,
+                             width: barW, height: h, fill: colors[si % colors.length]});
+            });
+            add('text', {x: pad + (i + 0.5) * band, y: height - pad + 16,
+                         'text-anchor': 'middle', 'font-size': 11}, label);
+        });
+    }
+
+    add('text', {x: width / 2, y: pad / 2 + 4, 'text-anchor': 'middle',
+                 'font-size': 14, 'font-weight': 'bold'}, chart.title || '');
+    return svg;
+}
+
 /**
  * Format duration for display
  */
@@ -1,21 +1,26 @@
-"""Chart generation for benchmark reports."""
+"""Chart generation for benchmark reports.
 
-from dataclasses import dataclass
+Charts are described by a picklable ``ChartSpec`` so a batch can be rendered
+in a process pool, and rendered output is cached on disk keyed by a hash of
+the spec. matplotlib is only imported the first time a figure is drawn.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from datetime import datetime
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 import base64
+import hashlib
+import json
+import os
 
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.figure import Figure
 import numpy as np
 import structlog
 
 
-
 logger = structlog.get_logger(__name__)
 
 
@@ -29,6 +34,41 @@ COLORS = {
     "gray": "#6b7280",         # Gray
 }
 
+# Supported output formats. "json" emits the chart data for client-side rendering.
+OUTPUT_FORMATS = ("png", "svg", "json")
+
+# Bump when drawing code changes so stale cache entries are not served
+CACHE_VERSION = 1
+
+# Human-readable name per chart kind, used in error messages
+_CHART_LABELS = {
+    "timeline": "timeline",
+    "bar": "bar",
+    "gauge": "gauge",
+    "radar": "radar",
+    "horizontal_bar": "phase duration",
+    "comparison": "comparison",
+}
+
+_pyplot_module = None
+
+
+def _pyplot() -> Any:
+    """Import pyplot on first use with the non-interactive backend and report style."""
+    global _pyplot_module
+    if _pyplot_module is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+
+        try:
+            plt.style.use('seaborn-v0_8-darkgrid')
+        except OSError:
+            # Fallback if seaborn style not available
+            plt.style.use('default')
+        _pyplot_module = plt
+    return _pyplot_module
+
 
 class ChartGeneratorError(Exception):
     """Base exception for chart generation errors."""
@@ -47,13 +87,28 @@ class ChartData:
     colors: Optional[List[str]] = None
 
 
+@dataclass(frozen=True)
+class ChartSpec:
+    """Picklable description of a single chart.
+
+    Attributes:
+        kind: Chart kind (a key of ``_CHART_LABELS``)
+        params: Keyword arguments for the chart's draw method
+    """
+
+    kind: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
 class ChartGenerator:
     """Generates charts for benchmark reports."""
 
     def __init__(
         self,
         dpi: int = 300,
-        figsize: Tuple[int, int] = (10, 6)
+        figsize: Tuple[int, int] = (10, 6),
+        output_format: str = "png",
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """
         Initialize chart generator.
@@ -61,21 +116,28 @@ class ChartGenerator:
         Args:
             dpi: Resolution for chart images
             figsize: Default figure size (width, height) in inches
+            output_format: "png" or "svg" data URIs, or "json" chart data
+            cache_dir: Directory for rendered charts (default: no caching)
+
+        Raises:
+            ValueError: If output_format is not supported
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unsupported chart format '{output_format}', "
+                f"expected one of {', '.join(OUTPUT_FORMATS)}"
+            )
+
         self.dpi = dpi
         self.figsize = figsize
-
-        # Set default matplotlib style
-        try:
-            plt.style.use('seaborn-v0_8-darkgrid')
-        except OSError:
-            # Fallback if seaborn style not available
-            plt.style.use('default')
+        self.output_format = output_format
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
         logger.info(
             "chart_generator_initialized",
             dpi=dpi,
             figsize=figsize,
+            output_format=output_format,
         )
 
     def generate_performance_timeline(
@@ -93,37 +155,16 @@ class ChartGenerator:
             title: Chart title
 
         Returns:
-            Base64-encoded PNG image
+            Chart in the configured output format
 
         Raises:
             ChartGeneratorError: If chart generation fails
         """
-        try:
-            fig, ax = plt.subplots(figsize=self.figsize)
-
-            ax.plot(
-                timestamps,
-                response_times,
-                color=COLORS["primary"],
-                linewidth=2,
-                marker='o',
-                markersize=4,
-            )
-
-            ax.set_title(title, fontsize=14, fontweight='bold')
-            ax.set_xlabel("Time", fontsize=11)
-            ax.set_ylabel("Response Time (ms)", fontsize=11)
-            ax.grid(True, alpha=0.3)
-
-            # Format x-axis dates
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-            fig.autofmt_xdate()
-
-            return self._figure_to_base64(fig)
-
-        except Exception as e:
-            logger.error("chart_generation_failed", chart_type="timeline", error=str(e))
-            raise ChartGeneratorError(f"Failed to generate timeline chart: {e}")
+        return self.render(ChartSpec("timeline", {
+            "timestamps": list(timestamps),
+            "response_times": list(response_times),
+            "title": title,
+        }))
 
     def generate_api_calls_bar_chart(
         self,
@@ -140,48 +181,16 @@ class ChartGenerator:
             title: Chart title
 
         Returns:
-            Base64-encoded PNG image
+            Chart in the configured output format
 
         Raises:
             ChartGeneratorError: If chart generation fails
         """
-        try:
-            fig, ax = plt.subplots(figsize=self.figsize)
-
-            bars = ax.bar(
-                phase_names,
-                api_calls,
-                color=COLORS["secondary"],
-                alpha=0.8,
-            )
-
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2.,
-                    height,
-                    f'{int(height)}',
-                    ha='center',
-                    va='bottom',
-                    fontsize=10,
-                )
-
-            ax.set_title(title, fontsize=14, fontweight='bold')
-            ax.set_xlabel("Phase", fontsize=11)
-            ax.set_ylabel("API Calls", fontsize=11)
-            ax.grid(True, alpha=0.3, axis='y')
-
-            # Rotate labels if many phases
-            if len(phase_names) > 5:
-                plt.xticks(rotation=45, ha='right')
-
-            plt.tight_layout()
-            return self._figure_to_base64(fig)
-
-        except Exception as e:
-            logger.error("chart_generation_failed", chart_type="bar", error=str(e))
-            raise ChartGeneratorError(f"Failed to generate bar chart: {e}")
+        return self.render(ChartSpec("bar", {
+            "phase_names": list(phase_names),
+            "api_calls": list(api_calls),
+            "title": title,
+        }))
 
     def generate_test_coverage_gauge(
         self,
@@ -196,44 +205,15 @@ class ChartGenerator:
             title: Chart title
 
         Returns:
-            Base64-encoded PNG image
+            Chart in the configured output format
 
         Raises:
             ChartGeneratorError: If chart generation fails
         """
-        try:
-            fig, ax = plt.subplots(figsize=(8, 4))
-
-            # Create simple bar representation instead of polar
-            color = self._get_coverage_color(coverage_percent)
-
-            ax.barh(0, coverage_percent, height=0.5, color=color, alpha=0.8)
-            ax.barh(0, 100 - coverage_percent, left=coverage_percent,
-                   height=0.5, color='lightgray', alpha=0.3)
-
-            # Center text
-            ax.text(
-                50, 0, f'{coverage_percent:.1f}%',
-                ha='center', va='center',
-                fontsize=24, fontweight='bold'
-            )
-
-            ax.set_xlim(0, 100)
-            ax.set_ylim(-1, 1)
-            ax.set_xticks([0, 25, 50, 75, 100])
-            ax.set_yticks([])
-            ax.set_xlabel("Coverage (%)", fontsize=11)
-            ax.set_title(title, fontsize=14, fontweight='bold')
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_visible(False)
-
-            plt.tight_layout()
-            return self._figure_to_base64(fig)
-
-        except Exception as e:
-            logger.error("chart_generation_failed", chart_type="gauge", error=str(e))
-            raise ChartGeneratorError(f"Failed to generate gauge chart: {e}")
+        return self.render(ChartSpec("gauge", {
+            "coverage_percent": coverage_percent,
+            "title": title,
+        }))
 
     def generate_quality_radar(
         self,
@@ -248,42 +228,15 @@ class ChartGenerator:
             title: Chart title
 
         Returns:
-            Base64-encoded PNG image
+            Chart in the configured output format
 
         Raises:
             ChartGeneratorError: If chart generation fails
         """
-        try:
-            fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': 'polar'})
-
-            categories = list(metrics.keys())
-            values = list(metrics.values())
-
-            # Number of variables
-            N = len(categories)
-
-            # Compute angle for each axis
-            angles = [n / float(N) * 2 * np.pi for n in range(N)]
-            values_plot = values + values[:1]  # Complete the circle
-            angles_plot = angles + angles[:1]
-
-            # Plot
-            ax.plot(angles_plot, values_plot, 'o-', linewidth=2, color=COLORS["primary"])
-            ax.fill(angles_plot, values_plot, alpha=0.25, color=COLORS["primary"])
-
-            ax.set_xticks(angles)
-            ax.set_xticklabels(categories)
-            ax.set_ylim(0, 100)
-            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-
-            ax.grid(True)
-
-            plt.tight_layout()
-            return self._figure_to_base64(fig)
-
-        except Exception as e:
-            logger.error("chart_generation_failed", chart_type="radar", error=str(e))
-            raise ChartGeneratorError(f"Failed to generate radar chart: {e}")
+        return self.render(ChartSpec("radar", {
+            "metrics": dict(metrics),
+            "title": title,
+        }))
 
     def generate_phase_duration_chart(
         self,
@@ -300,44 +253,16 @@ class ChartGenerator:
             title: Chart title
 
         Returns:
-            Base64-encoded PNG image
+            Chart in the configured output format
 
         Raises:
             ChartGeneratorError: If chart generation fails
         """
-        try:
-            fig, ax = plt.subplots(figsize=self.figsize)
-
-            y_pos = range(len(phase_names))
-            colors = [COLORS["primary"] if i % 2 == 0 else COLORS["secondary"]
-                      for i in range(len(phase_names))]
-
-            bars = ax.barh(y_pos, durations, color=colors, alpha=0.8)
-
-            # Add value labels
-            for i, (bar, duration) in enumerate(zip(bars, durations)):
-                width = bar.get_width()
-                label = self._format_duration(duration)
-                ax.text(
-                    width,
-                    i,
-                    f' {label}',
-                    va='center',
-                    fontsize=10,
-                )
-
-            ax.set_yticks(y_pos)
-            ax.set_yticklabels(phase_names)
-            ax.set_xlabel("Duration", fontsize=11)
-            ax.set_title(title, fontsize=14, fontweight='bold')
-            ax.grid(True, alpha=0.3, axis='x')
-
-            plt.tight_layout()
-            return self._figure_to_base64(fig)
-
-        except Exception as e:
-            logger.error("chart_generation_failed", chart_type="horizontal_bar", error=str(e))
-            raise ChartGeneratorError(f"Failed to generate phase duration chart: {e}")
+        return self.render(ChartSpec("horizontal_bar", {
+            "phase_names": list(phase_names),
+            "durations": list(durations),
+            "title": title,
+        }))
 
     def generate_comparison_bar_chart(
         self,
@@ -360,74 +285,454 @@ class ChartGenerator:
             title: Chart title
 
         Returns:
-            Base64-encoded PNG image
+            Chart in the configured output format
+
+        Raises:
+            ChartGeneratorError: If chart generation fails
+        """
+        return self.render(ChartSpec("comparison", {
+            "metric_names": list(metric_names),
+            "run1_values": list(run1_values),
+            "run2_values": list(run2_values),
+            "run1_label": run1_label,
+            "run2_label": run2_label,
+            "title": title,
+        }))
+
+    # Rendering, caching and batching
+
+    def render(self, spec: ChartSpec) -> str:
+        """
+        Render a chart, serving it from the disk cache when possible.
+
+        Args:
+            spec: Chart to render
+
+        Returns:
+            A PNG or SVG data URI, or a JSON document for client-side rendering
 
         Raises:
             ChartGeneratorError: If chart generation fails
         """
+        key = self.cache_key(spec)
+        cached = self._read_cache(key)
+        if cached is not None:
+            return cached
+
+        result = self._render_uncached(spec)
+        self._write_cache(key, result)
+        return result
+
+    def render_many(
+        self,
+        specs: Dict[str, ChartSpec],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """
+        Render a batch of charts, drawing cache misses in a process pool.
+
+        Charts that fail are logged and left out of the result, so one bad
+        series does not cost the whole report its charts.
+
+        Args:
+            specs: Charts to render, keyed by chart name
+            max_workers: Pool size (default: CPU count). Always capped at the
+                CPU count and the number of charts to draw; a single chart
+                or worker renders in-process.
+
+        Returns:
+            Rendered charts keyed by chart name, in the order of ``specs``
+        """
+        rendered: Dict[str, str] = {}
+        misses: Dict[str, Tuple[str, ChartSpec]] = {}
+        for name, spec in specs.items():
+            key = self.cache_key(spec)
+            cached = self._read_cache(key)
+            if cached is not None:
+                rendered[name] = cached
+            else:
+                misses[name] = (key, spec)
+
+        cpu_count = os.cpu_count() or 1
+        workers = min(len(misses), max_workers or cpu_count, cpu_count)
+        outcomes: Dict[str, Tuple[bool, str]] = {}
+        # Starting a pool costs more than drawing a single chart
+        if workers > 1 and self.output_format != "json":
+            outcomes = self._render_in_pool(
+                {name: spec for name, (_, spec) in misses.items()}, workers
+            )
+        for name, (_, spec) in misses.items():
+            if name not in outcomes:
+                outcomes[name] = _render_outcome(self, spec)
+
+        for name, (key, spec) in misses.items():
+            ok, value = outcomes[name]
+            if ok:
+                self._write_cache(key, value)
+                rendered[name] = value
+            else:
+                logger.warning("chart_render_failed", chart=name, kind=spec.kind, error=value)
+
+        logger.info(
+            "charts_rendered",
+            total=len(specs),
+            cache_hits=len(specs) - len(misses),
+            workers=max(workers, 1),
+        )
+        return {name: rendered[name] for name in specs if name in rendered}
+
+    def cache_key(self, spec: ChartSpec) -> str:
+        """
+        Hash a chart's inputs and rendering settings.
+
+        Args:
+            spec: Chart to hash
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "version": CACHE_VERSION,
+                "kind": spec.kind,
+                "params": spec.params,
+                "format": self.output_format,
+                "dpi": self.dpi,
+                "figsize": list(self.figsize),
+            },
+            sort_keys=True,
+            default=_json_default,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _render_in_pool(
+        self, specs: Dict[str, ChartSpec], workers: int
+    ) -> Dict[str, Tuple[bool, str]]:
+        """Draw charts in worker processes; returns {} if no pool can be started."""
+        settings = (self.dpi, self.figsize, self.output_format)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    name: pool.submit(_render_in_worker, settings, spec)
+                    for name, spec in specs.items()
+                }
+                return {name: future.result() for name, future in futures.items()}
+        except (BrokenProcessPool, OSError) as e:
+            # Sandboxes without fork/semaphores still get their charts
+            logger.warning("chart_pool_unavailable", error=str(e))
+            return {}
+
+    def _render_uncached(self, spec: ChartSpec) -> str:
+        """Render a chart in the configured format without touching the cache."""
+        label = _CHART_LABELS.get(spec.kind)
+        if label is None:
+            raise ChartGeneratorError(f"Unknown chart kind: {spec.kind}")
+
+        if self.output_format == "json":
+            return json.dumps(self._chart_payload(spec), default=_json_default)
+
         try:
-            fig, ax = plt.subplots(figsize=self.figsize)
+            fig = getattr(self, f"_draw_{spec.kind}")(**spec.params)
+        except Exception as e:
+            logger.error("chart_generation_failed", chart_type=spec.kind, error=str(e))
+            raise ChartGeneratorError(f"Failed to generate {label} chart: {e}")
+        return self._figure_to_data_uri(fig)
+
+    def _read_cache(self, key: str) -> Optional[str]:
+        """Return a cached chart, or None on a miss."""
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.{self.output_format}.txt"
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_cache(self, key: str, value: str) -> None:
+        """Store a rendered chart; cache failures never fail the chart."""
+        if self.cache_dir is None:
+            return
+        path = self.cache_dir / f"{key}.{self.output_format}.txt"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(value, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("chart_cache_write_failed", path=str(path), error=str(e))
+
+    def _chart_payload(self, spec: ChartSpec) -> Dict[str, Any]:
+        """Describe a chart as labels and series for the report's client-side renderer."""
+        p = spec.params
+        title = p.get("title", "")
+        if spec.kind == "timeline":
+            return {
+                "type": "line", "title": title, "labels": p["timestamps"],
+                "series": [{"name": "Response Time (ms)", "values": p["response_times"]}],
+            }
+        if spec.kind == "bar":
+            return {
+                "type": "bar", "title": title, "labels": p["phase_names"],
+                "series": [{"name": "API Calls", "values": p["api_calls"]}],
+            }
+        if spec.kind == "gauge":
+            return {
+                "type": "gauge", "title": title, "labels": ["Coverage (%)"],
+                "series": [{"name": "Coverage", "values": [p["coverage_percent"]]}],
+                "max": 100, "color": self._get_coverage_color(p["coverage_percent"]),
+            }
+        if spec.kind == "radar":
+            return {
+                "type": "bar", "title": title, "labels": list(p["metrics"].keys()),
+                "series": [{"name": title, "values": list(p["metrics"].values())}],
+                "max": 100,
+            }
+        if spec.kind == "horizontal_bar":
+            return {
+                "type": "hbar", "title": title, "labels": p["phase_names"],
+                "series": [{"name": "Duration (s)", "values": p["durations"]}],
+            }
+        return {
+            "type": "bar", "title": title, "labels": p["metric_names"],
+            "series": [
+                {"name": p["run1_label"], "values": p["run1_values"]},
+                {"name": p["run2_label"], "values": p["run2_values"]},
+            ],
+        }
+
+    # Drawing
+
+    def _draw_timeline(
+        self, timestamps: List[datetime], response_times: List[float], title: str
+    ) -> Any:
+        """Draw the response time line chart."""
+        plt = _pyplot()
+        import matplotlib.dates as mdates
+
+        fig, ax = plt.subplots(figsize=self.figsize)
+
+        ax.plot(
+            timestamps,
+            response_times,
+            color=COLORS["primary"],
+            linewidth=2,
+            marker='o',
+            markersize=4,
+        )
 
-            x = np.arange(len(metric_names))
-            width = 0.35
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xlabel("Time", fontsize=11)
+        ax.set_ylabel("Response Time (ms)", fontsize=11)
+        ax.grid(True, alpha=0.3)
+
+        # Format x-axis dates
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+        fig.autofmt_xdate()
+        return fig
+
+    def _draw_bar(self, phase_names: List[str], api_calls: List[int], title: str) -> Any:
+        """Draw the API calls bar chart."""
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=self.figsize)
+
+        bars = ax.bar(
+            phase_names,
+            api_calls,
+            color=COLORS["secondary"],
+            alpha=0.8,
+        )
 
-            ax.bar(
-                x - width/2,
-                run1_values,
-                width,
-                label=run1_label,
-                color=COLORS["primary"],
-                alpha=0.8,
+        # Add value labels on bars
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(
+                bar.get_x() + bar.get_width() / 2.,
+                height,
+                f'{int(height)}',
+                ha='center',
+                va='bottom',
+                fontsize=10,
             )
-            ax.bar(
-                x + width/2,
-                run2_values,
+
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xlabel("Phase", fontsize=11)
+        ax.set_ylabel("API Calls", fontsize=11)
+        ax.grid(True, alpha=0.3, axis='y')
+
+        # Rotate labels if many phases
+        if len(phase_names) > 5:
+            plt.xticks(rotation=45, ha='right')
+
+        plt.tight_layout()
+        return fig
+
+    def _draw_gauge(self, coverage_percent: float, title: str) -> Any:
+        """Draw the test coverage gauge."""
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=(8, 4))
+
+        # Create simple bar representation instead of polar
+        color = self._get_coverage_color(coverage_percent)
+
+        ax.barh(0, coverage_percent, height=0.5, color=color, alpha=0.8)
+        ax.barh(0, 100 - coverage_percent, left=coverage_percent,
+               height=0.5, color='lightgray', alpha=0.3)
+
+        # Center text
+        ax.text(
+            50, 0, f'{coverage_percent:.1f}%',
+            ha='center', va='center',
+            fontsize=24, fontweight='bold'
+        )
+
+        ax.set_xlim(0, 100)
+        ax.set_ylim(-1, 1)
+        ax.set_xticks([0, 25, 50, 75, 100])
+        ax.set_yticks([])
+        ax.set_xlabel("Coverage (%)", fontsize=11)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_visible(False)
+
+        plt.tight_layout()
+        return fig
+
+    def _draw_radar(self, metrics: Dict[str, float], title: str) -> Any:
+        """Draw the quality radar chart."""
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': 'polar'})
+
+        categories = list(metrics.keys())
+        values = list(metrics.values())
+
+        # Number of variables
+        N = len(categories)
+
+        # Compute angle for each axis
+        angles = [n / float(N) * 2 * np.pi for n in range(N)]
+        values_plot = values + values[:1]  # Complete the circle
+        angles_plot = angles + angles[:1]
+
+        # Plot
+        ax.plot(angles_plot, values_plot, 'o-', linewidth=2, color=COLORS["primary"])
+        ax.fill(angles_plot, values_plot, alpha=0.25, color=COLORS["primary"])
+
+        ax.set_xticks(angles)
+        ax.set_xticklabels(categories)
+        ax.set_ylim(0, 100)
+        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+
+        ax.grid(True)
+
+        plt.tight_layout()
+        return fig
+
+    def _draw_horizontal_bar(
+        self, phase_names: List[str], durations: List[float], title: str
+    ) -> Any:
+        """Draw the phase duration chart."""
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=self.figsize)
+
+        y_pos = range(len(phase_names))
+        colors = [COLORS["primary"] if i % 2 == 0 else COLORS["secondary"]
+                  for i in range(len(phase_names))]
+
+        bars = ax.barh(y_pos, durations, color=colors, alpha=0.8)
+
+        # Add value labels
+        for i, (bar, duration) in enumerate(zip(bars, durations)):
+            width = bar.get_width()
+            label = self._format_duration(duration)
+            ax.text(
                 width,
-                label=run2_label,
-                color=COLORS["secondary"],
-                alpha=0.8,
+                i,
+                f' {label}',
+                va='center',
+                fontsize=10,
             )
 
-            ax.set_xlabel("Metrics", fontsize=11)
-            ax.set_ylabel("Values", fontsize=11)
-            ax.set_title(title, fontsize=14, fontweight='bold')
-            ax.set_xticks(x)
-            ax.set_xticklabels(metric_names, rotation=45, ha='right')
-            ax.legend()
-            ax.grid(True, alpha=0.3, axis='y')
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(phase_names)
+        ax.set_xlabel("Duration", fontsize=11)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3, axis='x')
 
-            plt.tight_layout()
-            return self._figure_to_base64(fig)
+        plt.tight_layout()
+        return fig
 
-        except Exception as e:
-            logger.error("chart_generation_failed", chart_type="comparison", error=str(e))
-            raise ChartGeneratorError(f"Failed to generate comparison chart: {e}")
+    def _draw_comparison(
+        self,
+        metric_names: List[str],
+        run1_values: List[float],
+        run2_values: List[float],
+        run1_label: str,
+        run2_label: str,
+        title: str,
+    ) -> Any:
+        """Draw the grouped comparison bar chart."""
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=self.figsize)
+
+        x = np.arange(len(metric_names))
+        width = 0.35
+
+        ax.bar(
+            x - width/2,
+            run1_values,
+            width,
+            label=run1_label,
+            color=COLORS["primary"],
+            alpha=0.8,
+        )
+        ax.bar(
+            x + width/2,
+            run2_values,
+            width,
+            label=run2_label,
+            color=COLORS["secondary"],
+            alpha=0.8,
+        )
 
-    def _figure_to_base64(self, fig: Figure) -> str:
+        ax.set_xlabel("Metrics", fontsize=11)
+        ax.set_ylabel("Values", fontsize=11)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xticks(x)
+        ax.set_xticklabels(metric_names, rotation=45, ha='right')
+        ax.legend()
+        ax.grid(True, alpha=0.3, axis='y')
+
+        plt.tight_layout()
+        return fig
+
+    def _figure_to_data_uri(self, fig: Any) -> str:
         """
-        Convert matplotlib figure to base64-encoded PNG.
+        Convert matplotlib figure to a base64 data URI in the configured format.
 
         Args:
             fig: Matplotlib figure
 
         Returns:
-            Base64-encoded image string
+            Data URI string
 
         Raises:
             ChartGeneratorError: If conversion fails
         """
+        plt = _pyplot()
         buffer = BytesIO()
+        mime = "image/svg+xml" if self.output_format == "svg" else "image/png"
         try:
             fig.savefig(
                 buffer,
-                format='png',
+                format=self.output_format,
                 dpi=self.dpi,
                 bbox_inches='tight',
                 facecolor='white',
             )
             buffer.seek(0)
             image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-            return f"data:image/png;base64,{image_base64}"
+            return f"data:{mime};base64,{image_base64}"
         except Exception as e:
             logger.error("base64_conversion_failed", error=str(e))
             raise ChartGeneratorError(f"Failed to convert chart to base64: {e}")
@@ -456,3 +761,29 @@ class ChartGenerator:
         else:
             hours = seconds / 3600
             return f"{hours:.1f}h"
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoder fallback for datetimes and numpy scalars."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _render_outcome(generator: ChartGenerator, spec: ChartSpec) -> Tuple[bool, str]:
+    """Render a chart, returning (ok, chart or error message) instead of raising."""
+    try:
+        return True, generator._render_uncached(spec)
+    except Exception as e:
+        return False, str(e)
+
+
+def _render_in_worker(
+    settings: Tuple[int, Tuple[int, int], str], spec: ChartSpec
+) -> Tuple[bool, str]:
+    """Process pool entry point; the parent process owns the cache."""
+    dpi, figsize, output_format = settings
+    generator = ChartGenerator(dpi=dpi, figsize=figsize, output_format=output_format)
+    return _render_outcome(generator, spec)
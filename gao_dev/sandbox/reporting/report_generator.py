@@ -18,7 +18,7 @@ from gao_dev.sandbox.metrics.models import (
     WorkflowMetrics,
 )
 from gao_dev.sandbox.models import BenchmarkRun
-from gao_dev.sandbox.reporting.chart_generator import ChartGenerator
+from gao_dev.sandbox.reporting.chart_generator import ChartGenerator, ChartSpec
 
 
 logger = structlog.get_logger(__name__)
@@ -128,7 +128,10 @@ class ReportGenerator:
     def __init__(
         self,
         metrics_db_path: Path,
-        template_dir: Optional[Path] = None
+        template_dir: Optional[Path] = None,
+        chart_format: str = "png",
+        chart_cache_dir: Optional[Path] = None,
+        chart_workers: Optional[int] = None,
     ) -> None:
         """
         Initialize report generator.
@@ -136,8 +139,19 @@ class ReportGenerator:
         Args:
             metrics_db_path: Path to metrics database
             template_dir: Path to templates directory (default: built-in)
+            chart_format: "png", "svg", or "json" (charts drawn in the browser)
+            chart_cache_dir: Rendered chart cache (default: chart_cache/ next
+                to the metrics database)
+            chart_workers: Processes used to draw charts (default: CPU count)
         """
         self.storage = MetricsStorage(metrics_db_path)
+        self.chart_format = chart_format
+        self.chart_cache_dir = (
+            Path(chart_cache_dir)
+            if chart_cache_dir is not None
+            else Path(metrics_db_path).parent / "chart_cache"
+        )
+        self.chart_workers = chart_workers
 
         # Set up Jinja2 environment
         if template_dir is None:
@@ -345,30 +359,37 @@ class ReportGenerator:
 
     def _generate_run_charts(self, run_data: RunReportData) -> Dict[str, str]:
         """Generate charts for run report."""
-        chart_gen = ChartGenerator()
-        charts = {}
+        specs = {}
 
         # Phase duration chart
         if run_data.workflow and run_data.workflow.phase_durations:
-            try:
-                phase_names = list(run_data.workflow.phase_durations.keys())
-                durations = list(run_data.workflow.phase_durations.values())
-                charts["phase_durations"] = chart_gen.generate_phase_duration_chart(
-                    phase_names, durations
-                )
-            except Exception as e:
-                logger.warning("phase_duration_chart_failed", error=str(e))
+            specs["phase_durations"] = ChartSpec("horizontal_bar", {
+                "phase_names": list(run_data.workflow.phase_durations.keys()),
+                "durations": list(run_data.workflow.phase_durations.values()),
+                "title": "Phase Durations",
+            })
 
         # Test coverage gauge
         if run_data.quality and run_data.quality.test_coverage_percent is not None:
-            try:
-                charts["test_coverage"] = chart_gen.generate_test_coverage_gauge(
-                    run_data.quality.test_coverage_percent
-                )
-            except Exception as e:
-                logger.warning("coverage_chart_failed", error=str(e))
+            specs["test_coverage"] = ChartSpec("gauge", {
+                "coverage_percent": run_data.quality.test_coverage_percent,
+                "title": "Test Coverage",
+            })
+
+        return self._render_charts(specs)
+
+    def _chart_generator(self) -> ChartGenerator:
+        """Create a chart generator with this report's format and cache."""
+        return ChartGenerator(
+            output_format=self.chart_format,
+            cache_dir=self.chart_cache_dir,
+        )
 
-        return charts
+    def _render_charts(self, specs: Dict[str, ChartSpec]) -> Dict[str, str]:
+        """Render a report's charts as one batch."""
+        if not specs:
+            return {}
+        return self._chart_generator().render_many(specs, max_workers=self.chart_workers)
 
     def _write_report(
         self,
@@ -613,26 +634,19 @@ class ReportGenerator:
         comparison_data: ComparisonReportData
     ) -> Dict[str, str]:
         """Generate charts for comparison report."""
-        chart_gen = ChartGenerator()
-        charts = {}
-
-        try:
-            metric_names = [c.name for c in comparison_data.performance[:3]]
-            run1_values = [c.run1_value for c in comparison_data.performance[:3]]
-            run2_values = [c.run2_value for c in comparison_data.performance[:3]]
-
-            charts["performance_comparison"] = chart_gen.generate_comparison_bar_chart(
-                metric_names,
-                run1_values,
-                run2_values,
-                f"Run {run1_data.run.run_id[:8]}",
-                f"Run {run2_data.run.run_id[:8]}",
-                "Performance Metrics Comparison"
-            )
-        except Exception as e:
-            logger.warning("comparison_chart_failed", error=str(e))
+        performance = comparison_data.performance[:3]
+        specs = {
+            "performance_comparison": ChartSpec("comparison", {
+                "metric_names": [c.name for c in performance],
+                "run1_values": [c.run1_value for c in performance],
+                "run2_values": [c.run2_value for c in performance],
+                "run1_label": f"Run {run1_data.run.run_id[:8]}",
+                "run2_label": f"Run {run2_data.run.run_id[:8]}",
+                "title": "Performance Metrics Comparison",
+            }),
+        }
 
-        return charts
+        return self._render_charts(specs)
 
     # Trend Analysis Methods
 
@@ -836,18 +850,14 @@ class ReportGenerator:
 
     def _generate_trend_charts(self, trend_data: TrendReportData) -> Dict[str, str]:
         """Generate charts for trend report."""
-        chart_gen = ChartGenerator()
-        charts = {}
+        specs = {}
 
         for trend in trend_data.performance_trends + trend_data.quality_trends:
-            try:
-                chart_name = trend.metric_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
-                charts[chart_name] = chart_gen.generate_performance_timeline(
-                    trend.timestamps,
-                    trend.values,
-                    title=trend.metric_name
-                )
-            except Exception as e:
-                logger.warning("trend_chart_failed", metric=trend.metric_name, error=str(e))
-
-        return charts
+            chart_name = trend.metric_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
+            specs[chart_name] = ChartSpec("timeline", {
+                "timestamps": list(trend.timestamps),
+                "response_times": list(trend.values),
+                "title": trend.metric_name,
+            })
+
+        return self._render_charts(specs)
@@ -2,12 +2,14 @@
 
 from .project_lifecycle import ProjectLifecycleService
 from .project_state import ProjectStateService
+from .project_registry import ProjectRegistry
 from .boilerplate import BoilerplateService
 from .benchmark_tracking import BenchmarkTrackingService
 
 __all__ = [
     "ProjectLifecycleService",
     "ProjectStateService",
+    "ProjectRegistry",
     "BoilerplateService",
     "BenchmarkTrackingService",
 ]
@@ -6,6 +6,7 @@ from typing import Optional
 
 import structlog
 
+from gao_dev.sandbox.boilerplate_cache import BoilerplateCache
 from gao_dev.sandbox.git_cloner import GitCloner
 
 logger = structlog.get_logger(__name__)
@@ -22,16 +23,24 @@ class BoilerplateService:
 
     Attributes:
         git_cloner: GitCloner instance for repository operations
+        cache: Optional BoilerplateCache; when set, projects are materialized
+            from a local mirror instead of a fresh clone
     """
 
-    def __init__(self, git_cloner: Optional[GitCloner] = None):
+    def __init__(
+        self,
+        git_cloner: Optional[GitCloner] = None,
+        cache: Optional[BoilerplateCache] = None,
+    ):
         """
         Initialize boilerplate service.
 
         Args:
             git_cloner: Optional GitCloner instance (creates default if not provided)
+            cache: Optional BoilerplateCache for mirror-based cloning
         """
         self.git_cloner = git_cloner or GitCloner()
+        self.cache = cache
 
     def set_git_cloner(self, git_cloner: GitCloner) -> None:
         """
@@ -48,16 +57,20 @@ class BoilerplateService:
         self,
         boilerplate_url: str,
         target_path: Path,
+        ref: Optional[str] = None,
     ) -> None:
         """
         Clone boilerplate repository and merge into target directory.
 
         Creates a temporary clone, merges its contents into the target
         directory, then cleans up the .git directory and temporary clone.
+        With a cache configured, the files are written straight from the
+        cached mirror instead.
 
         Args:
             boilerplate_url: Git repository URL of boilerplate
             target_path: Directory to merge boilerplate into
+            ref: Branch, tag or commit (default: repository default branch)
 
         Raises:
             InvalidGitUrlError: If URL format is invalid
@@ -72,10 +85,21 @@ class BoilerplateService:
         )
 
         try:
+            if self.cache is not None:
+                self.cache.materialize(boilerplate_url, target_path, ref=ref)
+                logger.info(
+                    "boilerplate_integration_complete",
+                    target_path=str(target_path),
+                )
+                return
+
             # Clone into a temporary directory first
             temp_clone_dir = target_path / ".boilerplate_clone"
 
-            self.git_cloner.clone_repository(boilerplate_url, temp_clone_dir)
+            if ref:
+                self.git_cloner.clone_repository(boilerplate_url, temp_clone_dir, branch=ref)
+            else:
+                self.git_cloner.clone_repository(boilerplate_url, temp_clone_dir)
 
             logger.info("boilerplate_cloned_to_temp", temp_dir=str(temp_clone_dir))
 
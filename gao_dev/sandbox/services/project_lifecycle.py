@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -174,6 +175,7 @@ class ProjectLifecycleService:
             raise ProjectNotFoundError(name)
         project_dir = self.get_project_path(name)
         shutil.rmtree(project_dir)
+        self.state_service.remove_from_index(name)
         logger.info("project_deleted", project=name)
 
     def list_projects(
@@ -182,12 +184,36 @@ class ProjectLifecycleService:
         """
         List all sandbox projects.
 
+        Served from the project registry index; falls back to reading every
+        metadata file if the index is unavailable.
+
         Args:
             status: Optional status filter (only return projects with this status)
 
         Returns:
             List of ProjectMetadata objects, sorted by last_modified descending
         """
+        try:
+            projects = self.state_service.list_indexed_projects(status)
+        except sqlite3.Error as e:
+            logger.warning("project_index_unavailable", error=str(e))
+            projects = self._scan_projects(status)
+
+        logger.info("listed_projects", count=len(projects))
+
+        return projects
+
+    def reindex_projects(self) -> int:
+        """
+        Rebuild the project registry index from the metadata files.
+
+        Returns:
+            Number of projects indexed
+        """
+        return self.state_service.reindex()
+
+    def _scan_projects(self, status: Optional[ProjectStatus] = None) -> List[ProjectMetadata]:
+        """List projects by reading every metadata file (index fallback)."""
         projects: List[ProjectMetadata] = []
 
         # Iterate through project directories
@@ -222,8 +248,6 @@ class ProjectLifecycleService:
         # Sort by last_modified descending (newest first)
         projects.sort(key=lambda p: p.last_modified, reverse=True)
 
-        logger.info("listed_projects", count=len(projects))
-
         return projects
 
     def project_exists(self, name: str) -> bool:
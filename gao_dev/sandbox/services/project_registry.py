@@ -0,0 +1,159 @@
+"""SQLite index of sandbox project metadata."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import structlog
+
+from gao_dev.sandbox.models import ProjectMetadata, ProjectStatus
+
+logger = structlog.get_logger(__name__)
+
+REGISTRY_FILENAME = ".sandbox_index.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    last_modified REAL NOT NULL,
+    metadata TEXT NOT NULL,
+    metadata_mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_status_modified
+    ON projects(status, last_modified DESC);
+CREATE INDEX IF NOT EXISTS idx_projects_modified
+    ON projects(last_modified DESC);
+"""
+
+
+class ProjectRegistry:
+    """
+    Index of sandbox project metadata for fast listing.
+
+    The .sandbox.yaml files stay the source of truth. The registry stores
+    each project's serialized metadata together with the modification time
+    of the file it came from, so callers can tell which entries are stale
+    from a stat alone and re-read only those files.
+
+    Attributes:
+        db_path: Path to the SQLite index
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize project registry.
+
+        Args:
+            db_path: Path to the SQLite index (created on first use)
+        """
+        self.db_path = Path(db_path)
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the index, creating it if needed; commit on success."""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            if not self._initialized:
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def upsert(self, metadata: ProjectMetadata, metadata_mtime_ns: int) -> None:
+        """
+        Add or replace a project's entry.
+
+        Args:
+            metadata: Project metadata
+            metadata_mtime_ns: st_mtime_ns of the .sandbox.yaml it was saved to
+        """
+        self.upsert_many([(metadata, metadata_mtime_ns)])
+
+    def upsert_many(self, entries: Iterable[tuple]) -> None:
+        """
+        Add or replace several entries in one transaction.
+
+        Args:
+            entries: (ProjectMetadata, metadata_mtime_ns) pairs
+        """
+        rows = [
+            (
+                metadata.name,
+                metadata.status.value,
+                metadata.last_modified.timestamp(),
+                json.dumps(metadata.to_dict(), default=str),
+                mtime_ns,
+            )
+            for metadata, mtime_ns in entries
+        ]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO projects "
+                "(name, status, last_modified, metadata, metadata_mtime_ns) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def remove(self, names: Iterable[str]) -> None:
+        """
+        Remove entries.
+
+        Args:
+            names: Project names to remove
+        """
+        names = [(name,) for name in names]
+        if not names:
+            return
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM projects WHERE name = ?", names)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM projects")
+
+    def get_mtimes(self) -> Dict[str, int]:
+        """
+        Get the indexed metadata file mtime of every project.
+
+        Returns:
+            Mapping of project name to metadata_mtime_ns
+        """
+        with self._connect() as conn:
+            return dict(conn.execute("SELECT name, metadata_mtime_ns FROM projects"))
+
+    def list_projects(self, status: Optional[ProjectStatus] = None) -> List[ProjectMetadata]:
+        """
+        List indexed projects, newest first.
+
+        Args:
+            status: Optional status filter
+
+        Returns:
+            ProjectMetadata objects sorted by last_modified descending
+        """
+        query = "SELECT metadata FROM projects"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status.value,)
+        query += " ORDER BY last_modified DESC, name"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [ProjectMetadata.from_dict(json.loads(row[0])) for row in rows]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -14,6 +15,7 @@ from gao_dev.sandbox.exceptions import (
     ProjectNotFoundError,
     ProjectStateError,
 )
+from gao_dev.sandbox.services.project_registry import ProjectRegistry, REGISTRY_FILENAME
 
 logger = structlog.get_logger(__name__)
 
@@ -27,20 +29,24 @@ class ProjectStateService:
     Responsible for:
     - Loading and saving project metadata
     - Managing project status transitions
+    - Keeping the project registry index in step with the metadata files
 
     Attributes:
         sandbox_root: Root directory for all sandbox projects
+        registry: ProjectRegistry indexing project metadata
     """
 
-    def __init__(self, sandbox_root: Path):
+    def __init__(self, sandbox_root: Path, registry: Optional[ProjectRegistry] = None):
         """
         Initialize state service.
 
         Args:
             sandbox_root: Root directory for sandbox projects
+            registry: Optional ProjectRegistry (default: index in sandbox_root)
         """
         self.sandbox_root = Path(sandbox_root).resolve()
         self.projects_dir = self.sandbox_root / "projects"
+        self.registry = registry or ProjectRegistry(self.sandbox_root / REGISTRY_FILENAME)
 
     def get_project(self, name: str, lifecycle_service: "ProjectLifecycleService") -> ProjectMetadata:
         """
@@ -179,8 +185,109 @@ class ProjectStateService:
                 allow_unicode=True,
             )
 
+        try:
+            self.registry.upsert(metadata, metadata_file.stat().st_mtime_ns)
+        except sqlite3.Error as e:
+            # The index is rebuilt from the metadata files, never the reverse
+            logger.warning("project_index_update_failed", project=metadata.name, error=str(e))
+
         logger.debug("metadata_saved", project_dir=str(project_dir))
 
+    def list_indexed_projects(
+        self, status: Optional[ProjectStatus] = None
+    ) -> List[ProjectMetadata]:
+        """
+        List projects from the registry index.
+
+        The index is synced first, which only re-reads metadata files whose
+        modification time changed since they were indexed.
+
+        Args:
+            status: Optional status filter
+
+        Returns:
+            ProjectMetadata objects sorted by last_modified descending
+
+        Raises:
+            sqlite3.Error: If the index cannot be used
+        """
+        self.sync_index()
+        return self.registry.list_projects(status)
+
+    def sync_index(self) -> int:
+        """
+        Bring the registry index in line with the metadata files.
+
+        Returns:
+            Number of metadata files (re)read
+
+        Raises:
+            sqlite3.Error: If the index cannot be used
+        """
+        indexed = self.registry.get_mtimes()
+        present = set()
+        changed = []
+
+        if self.projects_dir.exists():
+            for project_dir in self.projects_dir.iterdir():
+                metadata_file = project_dir / METADATA_FILENAME
+                try:
+                    mtime_ns = metadata_file.stat().st_mtime_ns
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                present.add(project_dir.name)
+                if indexed.get(project_dir.name) == mtime_ns:
+                    continue
+
+                try:
+                    changed.append((self.load_metadata(project_dir), mtime_ns))
+                except Exception as e:
+                    # Skip projects with invalid metadata
+                    present.discard(project_dir.name)
+                    logger.warning(
+                        "skipping_project_invalid_metadata",
+                        project_dir=str(project_dir),
+                        error=str(e),
+                    )
+
+        self.registry.remove(set(indexed) - present)
+        self.registry.upsert_many(changed)
+
+        if changed or set(indexed) - present:
+            logger.debug(
+                "project_index_synced",
+                reread=len(changed),
+                removed=len(set(indexed) - present),
+            )
+        return len(changed)
+
+    def reindex(self) -> int:
+        """
+        Rebuild the registry index from the metadata files.
+
+        Returns:
+            Number of projects indexed
+
+        Raises:
+            sqlite3.Error: If the index cannot be used
+        """
+        self.registry.clear()
+        count = self.sync_index()
+        logger.info("project_index_rebuilt", projects=count)
+        return count
+
+    def remove_from_index(self, name: str) -> None:
+        """
+        Drop a deleted project from the registry index.
+
+        Args:
+            name: Project name
+        """
+        try:
+            self.registry.remove([name])
+        except sqlite3.Error as e:
+            logger.warning("project_index_update_failed", project=name, error=str(e))
+
     def create_metadata(
         self,
         name: str,
@@ -1,8 +1,9 @@
 """Template variable detection in boilerplate projects."""
 
+import os
 import re
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import Iterator, List, Dict, Set, Tuple
 from dataclasses import dataclass, field
 
 import structlog
@@ -13,6 +14,15 @@ logger = structlog.get_logger(__name__)
 DOUBLE_BRACE_PATTERN = re.compile(r"\{\{([a-zA-Z_][a-zA-Z0-9_]*)\}\}")
 DOUBLE_UNDERSCORE_PATTERN = re.compile(r"__([A-Z_][A-Z0-9_]*)__")
 
+# Both formats in one pattern, so each file is searched once
+TEMPLATE_PATTERN = re.compile(
+    r"\{\{(?P<double_brace>[a-zA-Z_][a-zA-Z0-9_]*)\}\}"
+    r"|__(?P<double_underscore>[A-Z_][A-Z0-9_]*)__"
+)
+
+# Files larger than this are not scanned or substituted
+MAX_FILE_SIZE = 1_000_000
+
 # File extensions to scan
 TEXT_EXTENSIONS = {
     ".md",
@@ -72,6 +82,50 @@ IGNORE_FILES = {
 }
 
 
+def find_variables(content: str) -> Set[Tuple[str, str]]:
+    """
+    Find template variables in text with a single regex pass.
+
+    A double underscore variable inside a double brace one
+    ({{__NAME__}}) is reported as both, as with separate passes.
+
+    Args:
+        content: Text to search
+
+    Returns:
+        Set of (variable_name, format) tuples
+    """
+    variables = set()
+    for match in TEMPLATE_PATTERN.finditer(content):
+        var_format = match.lastgroup
+        var_name = match.group(var_format)
+        variables.add((var_name, var_format))
+        if var_format == "double_brace" and "__" in var_name:
+            for inner in DOUBLE_UNDERSCORE_PATTERN.finditer(var_name):
+                variables.add((inner.group(1), "double_underscore"))
+    return variables
+
+
+def walk_files(project_path: Path, ignore_dirs: Set[str] = IGNORE_DIRS) -> Iterator[Path]:
+    """
+    Walk a project tree, yielding files outside ignored directories.
+
+    Ignored directories are pruned, so dependency trees such as
+    node_modules are never descended into.
+
+    Args:
+        project_path: Root directory to walk
+        ignore_dirs: Directory names to skip
+
+    Yields:
+        Path objects for each file
+    """
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = sorted(d for d in dirs if d not in ignore_dirs)
+        for name in sorted(files):
+            yield Path(root, name)
+
+
 @dataclass
 class TemplateVariable:
     """Represents a detected template variable."""
@@ -187,22 +241,12 @@ class TemplateScanner:
         Returns:
             Set of (variable_name, format) tuples found in file
         """
-        variables = set()
-
         try:
             # Read file content
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                 content = f.read()
 
-            # Find double brace variables {{VAR}}
-            for match in DOUBLE_BRACE_PATTERN.finditer(content):
-                var_name = match.group(1)
-                variables.add((var_name, "double_brace"))
-
-            # Find double underscore variables __VAR__
-            for match in DOUBLE_UNDERSCORE_PATTERN.finditer(content):
-                var_name = match.group(1)
-                variables.add((var_name, "double_underscore"))
+            variables = find_variables(content)
 
         except Exception as e:
             logger.debug(
@@ -241,7 +285,7 @@ class TemplateScanner:
 
         # Check file size (skip files > 1MB)
         try:
-            if file_path.stat().st_size > 1_000_000:
+            if file_path.stat().st_size > MAX_FILE_SIZE:
                 logger.debug("skipping_large_file", file=str(file_path))
                 return False
         except Exception:
@@ -262,13 +306,7 @@ class TemplateScanner:
             Path objects for each file
         """
         try:
-            for item in project_path.rglob("*"):
-                # Skip if any parent directory is in ignore list
-                if any(part in self.ignore_dirs for part in item.parts):
-                    continue
-
-                if item.is_file():
-                    yield item
+            yield from walk_files(project_path, self.ignore_dirs)
 
         except Exception as e:
             logger.error(
@@ -1,26 +1,50 @@
-"""Template variable substitution engine."""
-
+"""Template variable substitution engine.
+
+Substitution is a single pipeline: the project is walked once, each text
+file is read once and searched with one combined pattern for both variable
+formats, detection (before) and leftover checks (after) come from that same
+pass, and files are processed in parallel. Rollback information is recorded
+in one journal file instead of a .bak copy next to every file.
+"""
+
+import base64
+import json
+import os
 import re
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
 
 import structlog
 
 from .exceptions import SandboxError
-from .template_scanner import TemplateScanner, TEXT_EXTENSIONS, IGNORE_DIRS
+from .template_scanner import (
+    DOUBLE_UNDERSCORE_PATTERN,
+    IGNORE_FILES,
+    MAX_FILE_SIZE,
+    TEMPLATE_PATTERN,
+    TEXT_EXTENSIONS,
+    find_variables,
+    walk_files,
+)
 
 logger = structlog.get_logger(__name__)
 
-# Variable patterns for substitution
-DOUBLE_BRACE_PATTERN = re.compile(r"\{\{([a-zA-Z_][a-zA-Z0-9_]*)\}\}")
-DOUBLE_UNDERSCORE_PATTERN = re.compile(r"__([A-Z_][A-Z0-9_]*)__")
-
 # Value validation pattern (alphanumeric, hyphens, underscores, spaces, dots)
 VALUE_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9\-\s_.]*[a-zA-Z0-9]$|^[a-zA-Z0-9]$")
 
+# Rollback journal, one JSON line per modified file, in the project root
+JOURNAL_FILENAME = ".template_substitution.journal"
+
+# Files are decoded losslessly so undecodable bytes and line endings survive
+ENCODING = "utf-8"
+ENCODING_ERRORS = "surrogateescape"
+
 
 class SubstitutionError(SandboxError):
     """Raised when substitution fails."""
@@ -37,6 +61,55 @@ class SubstitutionResult:
     unsubstituted_variables: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
     success: bool = True
+    files_scanned: int = 0
+    journal_path: Optional[str] = None
+
+
+@dataclass
+class _FileOutcome:
+    """What substituting one file found and changed."""
+
+    substitutions: int = 0
+    detected: Set[Tuple[str, str]] = field(default_factory=set)
+    remaining: Set[Tuple[str, str]] = field(default_factory=set)
+    error: Optional[str] = None
+
+
+def substitute_text(content: str, variables: Dict[str, str]) -> Tuple[str, int]:
+    """
+    Substitute both variable formats in one regex pass.
+
+    Unknown variables are left unchanged. A double underscore variable
+    inside an unknown double brace one ({{__NAME__}}) is still substituted.
+
+    Args:
+        content: Text to substitute in
+        variables: Variable name -> value mapping
+
+    Returns:
+        Tuple of (new content, number of substitutions)
+    """
+    count = 0
+
+    def replace_underscore(match):
+        nonlocal count
+        if match.group(1) in variables:
+            count += 1
+            return variables[match.group(1)]
+        return match.group(0)
+
+    def replace(match):
+        nonlocal count
+        var_format = match.lastgroup
+        var_name = match.group(var_format)
+        if var_name in variables:
+            count += 1
+            return variables[var_name]
+        if var_format == "double_brace" and "__" in var_name:
+            return DOUBLE_UNDERSCORE_PATTERN.sub(replace_underscore, match.group(0))
+        return match.group(0)
+
+    return TEMPLATE_PATTERN.sub(replace, content), count
 
 
 class TemplateSubstitutor:
@@ -47,8 +120,8 @@ class TemplateSubstitutor:
     - {{variable_name}} - double brace format
     - __VARIABLE_NAME__ - double underscore format
 
-    Validates values, preserves file encodings, and provides
-    comprehensive error reporting.
+    Validates values, preserves file encodings and line endings, and
+    provides comprehensive error reporting.
     """
 
     # Common default variables
@@ -59,9 +132,15 @@ class TemplateSubstitutor:
         "YEAR": str(datetime.now().year),
     }
 
-    def __init__(self):
-        """Initialize template substitutor."""
-        self.scanner = TemplateScanner()
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize template substitutor.
+
+        Args:
+            max_workers: Threads processing files (default: min(8, CPU count))
+        """
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self._journal_lock = threading.Lock()
 
     def substitute_variables(
         self,
@@ -75,7 +154,7 @@ class TemplateSubstitutor:
         Args:
             project_path: Root directory of project
             variables: Dictionary mapping variable names to values
-            create_backup: Whether to backup files before substitution
+            create_backup: Whether to journal original contents for rollback
 
         Returns:
             SubstitutionResult with operation details
@@ -108,52 +187,59 @@ class TemplateSubstitutor:
                 success=False,
             )
 
-        # Scan for template variables
-        detected_vars = self.scanner.scan_project(project_path)
+        # Perform substitution, detecting variables in the same pass
+        result = SubstitutionResult()
+        files_to_process = list(self._get_text_files(project_path))
+        result.files_scanned = len(files_to_process)
 
-        # Check for required variables
-        detected_names = {v.name for v in detected_vars}
-        provided_names = set(all_variables.keys())
-        missing_vars = detected_names - provided_names
+        journal = None
+        if create_backup:
+            journal_path = project_path / JOURNAL_FILENAME
+            journal = open(journal_path, "w", encoding="utf-8")
+            result.journal_path = str(journal_path)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                outcomes = list(
+                    pool.map(
+                        lambda file_path: self._process_file(
+                            file_path, project_path, all_variables, journal
+                        ),
+                        files_to_process,
+                    )
+                )
+        finally:
+            if journal is not None:
+                journal.close()
+
+        detected: Set[Tuple[str, str]] = set()
+        remaining: Set[Tuple[str, str]] = set()
+        for outcome in outcomes:
+            detected |= outcome.detected
+            remaining |= outcome.remaining
+            if outcome.error:
+                result.errors.append(outcome.error)
+            elif outcome.substitutions > 0:
+                result.files_modified += 1
+                result.variables_substituted += outcome.substitutions
 
+        # Check for required variables
+        missing_vars = {name for name, _ in detected} - set(all_variables)
         if missing_vars:
             logger.warning(
                 "missing_variables",
-                missing=list(missing_vars),
+                missing=sorted(missing_vars),
             )
 
-        # Perform substitution
-        result = SubstitutionResult()
-        files_to_process = list(self._get_text_files(project_path))
-
-        for file_path in files_to_process:
-            try:
-                # Create backup if requested
-                if create_backup:
-                    backup_path = file_path.with_suffix(file_path.suffix + ".bak")
-                    shutil.copy2(file_path, backup_path)
-
-                # Substitute in file
-                subs_made = self.substitute_in_file(file_path, all_variables)
-
-                if subs_made > 0:
-                    result.files_modified += 1
-                    result.variables_substituted += subs_made
-
-            except Exception as e:
-                error_msg = f"Error processing {file_path}: {str(e)}"
-                result.errors.append(error_msg)
-                logger.error("substitution_error", file=str(file_path), error=str(e))
-
-        # Check for unsubstituted variables
-        unsubstituted = self._find_unsubstituted_variables(project_path)
-        result.unsubstituted_variables = unsubstituted
+        # Unsubstituted variables, as the scanner would report them
+        result.unsubstituted_variables = [name for name, _ in sorted(remaining)]
 
         # Determine success
         result.success = len(result.errors) == 0
 
         logger.info(
             "substitution_complete",
+            files_scanned=result.files_scanned,
             files_modified=result.files_modified,
             variables_substituted=result.variables_substituted,
             unsubstituted=len(result.unsubstituted_variables),
@@ -178,39 +264,13 @@ class TemplateSubstitutor:
             Number of substitutions made
         """
         try:
-            # Read file content
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            original_content = content
-            total_subs = 0
-
-            # Substitute double brace variables {{VAR}}
-            def replace_brace(match):
-                nonlocal total_subs
-                var_name = match.group(1)
-                if var_name in variables:
-                    total_subs += 1
-                    return variables[var_name]
-                return match.group(0)  # Leave unchanged
-
-            content = DOUBLE_BRACE_PATTERN.sub(replace_brace, content)
-
-            # Substitute double underscore variables __VAR__
-            def replace_underscore(match):
-                nonlocal total_subs
-                var_name = match.group(1)
-                if var_name in variables:
-                    total_subs += 1
-                    return variables[var_name]
-                return match.group(0)  # Leave unchanged
-
-            content = DOUBLE_UNDERSCORE_PATTERN.sub(replace_underscore, content)
+            data = Path(file_path).read_bytes()
+            content = data.decode(ENCODING, ENCODING_ERRORS)
+            new_content, total_subs = substitute_text(content, variables)
 
             # Write back only if changed
-            if content != original_content:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+            if new_content != content:
+                self._write_atomic(Path(file_path), new_content.encode(ENCODING, ENCODING_ERRORS))
 
             return total_subs
 
@@ -249,9 +309,11 @@ class TemplateSubstitutor:
 
     def rollback_substitution(self, project_path: Path) -> bool:
         """
-        Rollback substitution using backup files.
+        Rollback substitution using the journal.
 
-        Restores all .bak files and removes them after restoration.
+        Restores every file recorded in the journal and removes the journal.
+        Projects substituted by older versions are restored from their .bak
+        files instead.
 
         Args:
             project_path: Project root directory
@@ -266,16 +328,35 @@ class TemplateSubstitutor:
 
         logger.info("rolling_back_substitution", project_path=str(project_path))
 
+        journal_path = project_path / JOURNAL_FILENAME
         restored_count = 0
         try:
-            for backup_file in project_path.rglob("*.bak"):
-                # Get original file path
-                original_file = backup_file.with_suffix("")
-
-                # Restore from backup
-                shutil.copy2(backup_file, original_file)
-                backup_file.unlink()  # Remove backup
-                restored_count += 1
+            if journal_path.exists():
+                restored: Set[str] = set()
+                with open(journal_path, "r", encoding="utf-8") as journal:
+                    for line in journal:
+                        if not line.strip():
+                            continue
+                        entry = json.loads(line)
+                        # The first entry for a file holds its original content
+                        if entry["path"] in restored:
+                            continue
+                        self._write_atomic(
+                            project_path / entry["path"],
+                            base64.b64decode(entry["content"]),
+                        )
+                        restored.add(entry["path"])
+                restored_count = len(restored)
+                journal_path.unlink()
+            else:
+                for backup_file in project_path.rglob("*.bak"):
+                    # Get original file path
+                    original_file = backup_file.with_suffix("")
+
+                    # Restore from backup
+                    shutil.copy2(backup_file, original_file)
+                    backup_file.unlink()  # Remove backup
+                    restored_count += 1
 
             logger.info("rollback_complete", files_restored=restored_count)
             return True
@@ -284,6 +365,80 @@ class TemplateSubstitutor:
             logger.error("rollback_failed", error=str(e))
             return False
 
+    def _process_file(
+        self,
+        file_path: Path,
+        project_path: Path,
+        variables: Dict[str, str],
+        journal,
+    ) -> _FileOutcome:
+        """
+        Read, scan and substitute one file.
+
+        Args:
+            file_path: File to process
+            project_path: Project root (for journal paths)
+            variables: Variable name -> value mapping
+            journal: Open journal file, or None for no rollback info
+
+        Returns:
+            _FileOutcome for the file (errors are captured, not raised)
+        """
+        outcome = _FileOutcome()
+        try:
+            data = file_path.read_bytes()
+            # Most files have no variables; skip decoding and regex for them
+            if b"{{" not in data and b"__" not in data:
+                return outcome
+
+            content = data.decode(ENCODING, ENCODING_ERRORS)
+            # Lock files are substituted but, like the scanner, not reported
+            reportable = file_path.name not in IGNORE_FILES
+            if reportable:
+                outcome.detected = find_variables(content)
+
+            new_content, outcome.substitutions = substitute_text(content, variables)
+            if new_content != content:
+                if journal is not None:
+                    self._journal_original(journal, file_path.relative_to(project_path), data)
+                self._write_atomic(file_path, new_content.encode(ENCODING, ENCODING_ERRORS))
+                logger.debug("template_file_processed", file_path=str(file_path))
+
+            if reportable:
+                outcome.remaining = (
+                    find_variables(new_content) if outcome.substitutions else outcome.detected
+                )
+
+        except Exception as e:
+            outcome.error = f"Error processing {file_path}: {str(e)}"
+            logger.error("substitution_error", file=str(file_path), error=str(e))
+
+        return outcome
+
+    def _journal_original(self, journal, rel_path: Path, data: bytes) -> None:
+        """Record a file's original content before it is overwritten."""
+        entry = {
+            "path": rel_path.as_posix(),
+            "content": base64.b64encode(data).decode("ascii"),
+        }
+        with self._journal_lock:
+            journal.write(json.dumps(entry) + "\n")
+            journal.flush()
+
+    def _write_atomic(self, file_path: Path, data: bytes) -> None:
+        """Replace a file's content via a temporary file, keeping its mode."""
+        fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            if file_path.exists():
+                shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
     def _get_text_files(self, project_path: Path):
         """
         Get all text files to process for substitution.
@@ -294,33 +449,16 @@ class TemplateSubstitutor:
         Yields:
             Path objects for text files
         """
-        for file_path in project_path.rglob("*"):
-            # Skip ignored directories
-            if any(part in IGNORE_DIRS for part in file_path.parts):
-                continue
-
+        for file_path in walk_files(project_path):
             # Skip backup files
             if file_path.suffix == ".bak":
                 continue
 
             # Check if text file
-            if file_path.is_file() and file_path.suffix.lower() in TEXT_EXTENSIONS:
+            if file_path.suffix.lower() in TEXT_EXTENSIONS:
                 # Skip large files
                 try:
-                    if file_path.stat().st_size < 1_000_000:
+                    if file_path.stat().st_size <= MAX_FILE_SIZE:
                         yield file_path
                 except Exception:
                     continue
-
-    def _find_unsubstituted_variables(self, project_path: Path) -> List[str]:
-        """
-        Find any remaining unsubstituted variables.
-
-        Args:
-            project_path: Project root directory
-
-        Returns:
-            List of unsubstituted variable names
-        """
-        remaining_vars = self.scanner.scan_project(project_path)
-        return [v.name for v in remaining_vars]
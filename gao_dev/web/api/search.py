@@ -12,13 +12,13 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Literal, Optional
 
-import sqlite3
-
 import structlog
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from ..db_gateway import get_db_gateway
+
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/search", tags=["search"])
@@ -189,59 +189,55 @@ async def search_messages(
 
         query = "\n".join(sql_parts)
 
-        # Execute search
-        conn = sqlite3.connect(str(db_path))
-        try:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-
-            # Extract search terms for highlighting
-            search_terms = [term.strip() for term in q.lower().split() if term.strip()]
-
-            # Build results
-            results: List[SearchResult] = []
-            for row in rows:
-                # Extract highlights (words from content that match search terms)
-                content_words = row[3].split()
-                highlights = []
-                for word in content_words:
-                    word_lower = word.lower().strip(".,!?;:")
-                    if any(term in word_lower for term in search_terms):
-                        highlights.append(word.strip(".,!?;:"))
-
-                # Deduplicate and limit highlights
-                highlights = list(dict.fromkeys(highlights))[:5]
-
-                results.append(
-                    SearchResult(
-                        messageId=row[0],
-                        conversationId=row[1],
-                        conversationType=row[2],
-                        content=row[3][:200],  # Truncate to 200 chars
-                        sender=row[4],
-                        timestamp=row[5],
-                        highlights=highlights,
-                    )
+        # Execute search off the event loop
+        rows = await get_db_gateway(request).fetch_all(
+            db_path, query, params, label="search.messages"
+        )
+
+        # Extract search terms for highlighting
+        search_terms = [term.strip() for term in q.lower().split() if term.strip()]
+
+        # Build results
+        results: List[SearchResult] = []
+        for row in rows:
+            # Extract highlights (words from content that match search terms)
+            content_words = row[3].split()
+            highlights = []
+            for word in content_words:
+                word_lower = word.lower().strip(".,!?;:")
+                if any(term in word_lower for term in search_terms):
+                    highlights.append(word.strip(".,!?;:"))
+
+            # Deduplicate and limit highlights
+            highlights = list(dict.fromkeys(highlights))[:5]
+
+            results.append(
+                SearchResult(
+                    messageId=row[0],
+                    conversationId=row[1],
+                    conversationType=row[2],
+                    content=row[3][:200],  # Truncate to 200 chars
+                    sender=row[4],
+                    timestamp=row[5],
+                    highlights=highlights,
                 )
-
-            logger.info(
-                "search_completed",
-                query=q,
-                type=type,
-                agent=agent,
-                date_range=date_range,
-                results_count=len(results),
             )
 
-            return JSONResponse(
-                {
-                    "results": [r.dict() for r in results],
-                    "total": len(results),
-                }
-            )
-        finally:
-            conn.close()
+        logger.info(
+            "search_completed",
+            query=q,
+            type=type,
+            agent=agent,
+            date_range=date_range,
+            results_count=len(results),
+        )
+
+        return JSONResponse(
+            {
+                "results": [r.dict() for r in results],
+                "total": len(results),
+            }
+        )
 
     except Exception as e:
         logger.exception("search_failed", query=q, error=str(e))
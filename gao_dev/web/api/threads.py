@@ -10,13 +10,15 @@ import sqlite3
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import structlog
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from ..db_gateway import connect, get_db_gateway
+
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/threads", tags=["threads"])
@@ -38,14 +40,14 @@ class ThreadReplyRequest(BaseModel):
 
 
 # Helper functions
-def _get_db_connection(project_root: Path) -> sqlite3.Connection:
-    """Get database connection.
+def _get_db_path(project_root: Path) -> Path:
+    """Get database path.
 
     Args:
         project_root: Project root directory
 
     Returns:
-        SQLite connection
+        Path to documents.db
 
     Raises:
         HTTPException: If database not found
@@ -56,11 +58,22 @@ def _get_db_connection(project_root: Path) -> sqlite3.Connection:
             status_code=503,
             detail="Database not found. Project not initialized."
         )
+    return db_path
+
+
+def _get_db_connection(project_root: Path) -> sqlite3.Connection:
+    """Get database connection.
 
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        SQLite connection
+
+    Raises:
+        HTTPException: If database not found
+    """
+    return connect(_get_db_path(project_root))
 
 
 def _get_or_create_message(conn: sqlite3.Connection, message_id: str) -> Optional[dict]:
@@ -91,6 +104,235 @@ def _get_or_create_message(conn: sqlite3.Connection, message_id: str) -> Optiona
     return None
 
 
+def _create_thread_sync(db_path: Path, body: CreateThreadRequest) -> Tuple[bool, int, str]:
+    """Create thread for a parent message unless one already exists.
+
+    Runs on the DB gateway writer thread.
+
+    Args:
+        db_path: Path to documents.db
+        body: Create thread request
+
+    Returns:
+        Tuple of (created, thread ID, created_at)
+    """
+    conn = connect(db_path)
+    try:
+        # Check if thread already exists for this parent message
+        cursor = conn.execute(
+            "SELECT id, created_at FROM threads WHERE parent_message_id = ?",
+            (body.parentMessageId,)
+        )
+        existing_thread = cursor.fetchone()
+        if existing_thread:
+            return False, existing_thread["id"], existing_thread["created_at"]
+
+        # Create new thread
+        cursor = conn.execute(
+            """
+            INSERT INTO threads (parent_message_id, conversation_id, conversation_type)
+            VALUES (?, ?, ?)
+            """,
+            (body.parentMessageId, body.conversationId, body.conversationType)
+        )
+        thread_id = cursor.lastrowid
+
+        # Get created thread
+        cursor = conn.execute(
+            "SELECT id, created_at FROM threads WHERE id = ?",
+            (thread_id,)
+        )
+        thread = cursor.fetchone()
+
+        conn.commit()
+        return True, thread_id, thread["created_at"]
+    finally:
+        conn.close()
+
+
+def _format_timestamp(created_at: str) -> int:
+    """Convert ISO timestamp to epoch milliseconds."""
+    return int(datetime.fromisoformat(created_at.replace("Z", "+00:00")).timestamp() * 1000)
+
+
+def _get_thread_sync(db_path: Path, thread_id: int) -> Optional[Dict[str, Any]]:
+    """Load thread with parent message and replies.
+
+    Runs on the DB gateway reader pool.
+
+    Args:
+        db_path: Path to documents.db
+        thread_id: Thread ID
+
+    Returns:
+        Thread response payload, or None if the thread does not exist
+    """
+    conn = connect(db_path)
+    try:
+        # Get thread
+        cursor = conn.execute(
+            """
+            SELECT id, parent_message_id, conversation_id, conversation_type,
+                   reply_count, created_at, updated_at
+            FROM threads
+            WHERE id = ?
+            """,
+            (thread_id,)
+        )
+        thread = cursor.fetchone()
+
+        if not thread:
+            return None
+
+        # Get parent message
+        cursor = conn.execute(
+            """
+            SELECT id, conversation_id, conversation_type, content, role,
+                   agent_id, agent_name, thread_count, created_at, updated_at
+            FROM messages
+            WHERE id = ?
+            """,
+            (thread["parent_message_id"],)
+        )
+        parent_message_row = cursor.fetchone()
+
+        parent_message = None
+        if parent_message_row:
+            parent_message = {
+                "id": parent_message_row["id"],
+                "conversationId": parent_message_row["conversation_id"],
+                "conversationType": parent_message_row["conversation_type"],
+                "content": parent_message_row["content"],
+                "role": parent_message_row["role"],
+                "agentId": parent_message_row["agent_id"],
+                "agentName": parent_message_row["agent_name"],
+                "threadCount": parent_message_row["thread_count"],
+                "createdAt": parent_message_row["created_at"],
+                "timestamp": _format_timestamp(parent_message_row["created_at"])
+            }
+
+        # Get replies (sorted by created_at)
+        cursor = conn.execute(
+            """
+            SELECT id, conversation_id, conversation_type, content, role,
+                   agent_id, agent_name, created_at, updated_at
+            FROM messages
+            WHERE thread_id = ?
+            ORDER BY created_at ASC
+            """,
+            (thread_id,)
+        )
+        replies_rows = cursor.fetchall()
+
+        replies = []
+        for row in replies_rows:
+            replies.append({
+                "id": row["id"],
+                "conversationId": row["conversation_id"],
+                "conversationType": row["conversation_type"],
+                "content": row["content"],
+                "role": row["role"],
+                "agentId": row["agent_id"],
+                "agentName": row["agent_name"],
+                "createdAt": row["created_at"],
+                "timestamp": _format_timestamp(row["created_at"])
+            })
+
+        return {
+            "threadId": thread["id"],
+            "parentMessage": parent_message,
+            "replies": replies,
+            "conversationId": thread["conversation_id"],
+            "conversationType": thread["conversation_type"],
+            "replyCount": thread["reply_count"]
+        }
+    finally:
+        conn.close()
+
+
+def _post_thread_reply_sync(
+    db_path: Path, thread_id: int, content: str
+) -> Optional[Dict[str, Any]]:
+    """Insert a user reply into a thread.
+
+    Runs on the DB gateway writer thread.
+
+    Args:
+        db_path: Path to documents.db
+        thread_id: Thread ID
+        content: Reply content
+
+    Returns:
+        Dict with message_id, created_at, thread row fields and the parent's
+        updated thread_count, or None if the thread does not exist
+    """
+    conn = connect(db_path)
+    try:
+        # Verify thread exists
+        cursor = conn.execute(
+            """
+            SELECT id, parent_message_id, conversation_id, conversation_type
+            FROM threads
+            WHERE id = ?
+            """,
+            (thread_id,)
+        )
+        thread = cursor.fetchone()
+
+        if not thread:
+            return None
+
+        # Create message ID
+        message_id = f"msg-{uuid.uuid4().hex[:12]}"
+
+        # Insert message
+        conn.execute(
+            """
+            INSERT INTO messages (
+                id, conversation_id, conversation_type, content, role,
+                thread_id, reply_to_message_id
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                message_id,
+                thread["conversation_id"],
+                thread["conversation_type"],
+                content,
+                "user",  # User is always the poster (agent replies not yet supported)
+                thread_id,
+                thread["parent_message_id"]
+            )
+        )
+
+        # Get created message
+        cursor = conn.execute(
+            "SELECT id, content, role, created_at FROM messages WHERE id = ?",
+            (message_id,)
+        )
+        message = cursor.fetchone()
+
+        conn.commit()
+
+        # Get updated parent message thread count (for thread.updated event)
+        cursor = conn.execute(
+            "SELECT thread_count FROM messages WHERE id = ?",
+            (thread["parent_message_id"],)
+        )
+        parent_msg = cursor.fetchone()
+
+        return {
+            "message_id": message_id,
+            "created_at": message["created_at"],
+            "parent_message_id": thread["parent_message_id"],
+            "conversation_id": thread["conversation_id"],
+            "conversation_type": thread["conversation_type"],
+            "thread_count": parent_msg["thread_count"] if parent_msg else 0,
+        }
+    finally:
+        conn.close()
+
+
 # API Endpoints
 @router.post("")
 async def create_thread(
@@ -134,88 +376,60 @@ async def create_thread(
         )
 
     try:
-        project_root = request.app.state.project_root
-        conn = _get_db_connection(project_root)
-
-        try:
-            # Check if thread already exists for this parent message
-            cursor = conn.execute(
-                "SELECT id, created_at FROM threads WHERE parent_message_id = ?",
-                (body.parentMessageId,)
-            )
-            existing_thread = cursor.fetchone()
-
-            if existing_thread:
-                # Thread already exists, return it WITHOUT publishing event
-                logger.info(
-                    "thread_already_exists",
-                    thread_id=existing_thread["id"],
-                    parent_message_id=body.parentMessageId
-                )
-                return JSONResponse({
-                    "threadId": existing_thread["id"],
-                    "parentMessageId": body.parentMessageId,
-                    "conversationId": body.conversationId,
-                    "conversationType": body.conversationType,
-                    "createdAt": existing_thread["created_at"]
-                })
-
-            # Create new thread
-            cursor = conn.execute(
-                """
-                INSERT INTO threads (parent_message_id, conversation_id, conversation_type)
-                VALUES (?, ?, ?)
-                """,
-                (body.parentMessageId, body.conversationId, body.conversationType)
-            )
-            thread_id = cursor.lastrowid
-
-            # Get created thread
-            cursor = conn.execute(
-                "SELECT id, created_at FROM threads WHERE id = ?",
-                (thread_id,)
-            )
-            thread = cursor.fetchone()
-
-            conn.commit()
+        db_path = _get_db_path(request.app.state.project_root)
+        created, thread_id, created_at = await get_db_gateway(request).write(
+            _create_thread_sync, db_path, body, label="threads.create"
+        )
 
+        if not created:
+            # Thread already exists, return it WITHOUT publishing event
             logger.info(
-                "thread_created",
+                "thread_already_exists",
                 thread_id=thread_id,
-                parent_message_id=body.parentMessageId,
-                conversation_id=body.conversationId
+                parent_message_id=body.parentMessageId
             )
-
-            # Publish WebSocket event
-            try:
-                await request.app.state.event_bus.publish({
-                    "type": "thread.created",
-                    "payload": {
-                        "threadId": thread_id,
-                        "parentMessageId": body.parentMessageId,
-                        "conversationId": body.conversationId,
-                        "conversationType": body.conversationType,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
-            except Exception as ws_error:
-                # Non-fatal: WebSocket broadcast failed
-                logger.warning(
-                    "websocket_broadcast_failed",
-                    error=str(ws_error),
-                    thread_id=thread_id
-                )
-
             return JSONResponse({
                 "threadId": thread_id,
                 "parentMessageId": body.parentMessageId,
                 "conversationId": body.conversationId,
                 "conversationType": body.conversationType,
-                "createdAt": thread["created_at"]
+                "createdAt": created_at
             })
 
-        finally:
-            conn.close()
+        logger.info(
+            "thread_created",
+            thread_id=thread_id,
+            parent_message_id=body.parentMessageId,
+            conversation_id=body.conversationId
+        )
+
+        # Publish WebSocket event
+        try:
+            await request.app.state.event_bus.publish({
+                "type": "thread.created",
+                "payload": {
+                    "threadId": thread_id,
+                    "parentMessageId": body.parentMessageId,
+                    "conversationId": body.conversationId,
+                    "conversationType": body.conversationType,
+                    "timestamp": datetime.now().isoformat()
+                }
+            })
+        except Exception as ws_error:
+            # Non-fatal: WebSocket broadcast failed
+            logger.warning(
+                "websocket_broadcast_failed",
+                error=str(ws_error),
+                thread_id=thread_id
+            )
+
+        return JSONResponse({
+            "threadId": thread_id,
+            "parentMessageId": body.parentMessageId,
+            "conversationId": body.conversationId,
+            "conversationType": body.conversationType,
+            "createdAt": created_at
+        })
 
     except HTTPException:
         raise
@@ -276,93 +490,18 @@ async def get_thread(
         }
     """
     try:
-        project_root = request.app.state.project_root
-        conn = _get_db_connection(project_root)
-
-        try:
-            # Get thread
-            cursor = conn.execute(
-                """
-                SELECT id, parent_message_id, conversation_id, conversation_type,
-                       reply_count, created_at, updated_at
-                FROM threads
-                WHERE id = ?
-                """,
-                (thread_id,)
-            )
-            thread = cursor.fetchone()
-
-            if not thread:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Thread {thread_id} not found"
-                )
-
-            # Get parent message
-            cursor = conn.execute(
-                """
-                SELECT id, conversation_id, conversation_type, content, role,
-                       agent_id, agent_name, thread_count, created_at, updated_at
-                FROM messages
-                WHERE id = ?
-                """,
-                (thread["parent_message_id"],)
-            )
-            parent_message_row = cursor.fetchone()
-
-            parent_message = None
-            if parent_message_row:
-                parent_message = {
-                    "id": parent_message_row["id"],
-                    "conversationId": parent_message_row["conversation_id"],
-                    "conversationType": parent_message_row["conversation_type"],
-                    "content": parent_message_row["content"],
-                    "role": parent_message_row["role"],
-                    "agentId": parent_message_row["agent_id"],
-                    "agentName": parent_message_row["agent_name"],
-                    "threadCount": parent_message_row["thread_count"],
-                    "createdAt": parent_message_row["created_at"],
-                    "timestamp": int(datetime.fromisoformat(parent_message_row["created_at"].replace("Z", "+00:00")).timestamp() * 1000)
-                }
+        db_path = _get_db_path(request.app.state.project_root)
+        thread = await get_db_gateway(request).read(
+            _get_thread_sync, db_path, thread_id, label="threads.get"
+        )
 
-            # Get replies (sorted by created_at)
-            cursor = conn.execute(
-                """
-                SELECT id, conversation_id, conversation_type, content, role,
-                       agent_id, agent_name, created_at, updated_at
-                FROM messages
-                WHERE thread_id = ?
-                ORDER BY created_at ASC
-                """,
-                (thread_id,)
+        if thread is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Thread {thread_id} not found"
             )
-            replies_rows = cursor.fetchall()
-
-            replies = []
-            for row in replies_rows:
-                replies.append({
-                    "id": row["id"],
-                    "conversationId": row["conversation_id"],
-                    "conversationType": row["conversation_type"],
-                    "content": row["content"],
-                    "role": row["role"],
-                    "agentId": row["agent_id"],
-                    "agentName": row["agent_name"],
-                    "createdAt": row["created_at"],
-                    "timestamp": int(datetime.fromisoformat(row["created_at"].replace("Z", "+00:00")).timestamp() * 1000)
-                })
-
-            return JSONResponse({
-                "threadId": thread["id"],
-                "parentMessage": parent_message,
-                "replies": replies,
-                "conversationId": thread["conversation_id"],
-                "conversationType": thread["conversation_type"],
-                "replyCount": thread["reply_count"]
-            })
 
-        finally:
-            conn.close()
+        return JSONResponse(thread)
 
     except HTTPException:
         raise
@@ -417,122 +556,71 @@ async def post_thread_reply(
         )
 
     try:
-        project_root = request.app.state.project_root
-        conn = _get_db_connection(project_root)
-
-        try:
-            # Verify thread exists
-            cursor = conn.execute(
-                """
-                SELECT id, parent_message_id, conversation_id, conversation_type
-                FROM threads
-                WHERE id = ?
-                """,
-                (thread_id,)
-            )
-            thread = cursor.fetchone()
-
-            if not thread:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Thread {thread_id} not found"
-                )
-
-            # Create message ID
-            message_id = f"msg-{uuid.uuid4().hex[:12]}"
-
-            # Insert message
-            cursor = conn.execute(
-                """
-                INSERT INTO messages (
-                    id, conversation_id, conversation_type, content, role,
-                    thread_id, reply_to_message_id
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    message_id,
-                    thread["conversation_id"],
-                    thread["conversation_type"],
-                    body.content,
-                    "user",  # User is always the poster (agent replies not yet supported)
-                    thread_id,
-                    thread["parent_message_id"]
-                )
-            )
+        db_path = _get_db_path(request.app.state.project_root)
+        reply = await get_db_gateway(request).write(
+            _post_thread_reply_sync, db_path, thread_id, body.content,
+            label="threads.reply"
+        )
 
-            # Get created message
-            cursor = conn.execute(
-                "SELECT id, content, role, created_at FROM messages WHERE id = ?",
-                (message_id,)
+        if reply is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Thread {thread_id} not found"
             )
-            message = cursor.fetchone()
-
-            conn.commit()
 
-            logger.info(
-                "thread_reply_created",
-                message_id=message_id,
-                thread_id=thread_id,
-                parent_message_id=thread["parent_message_id"]
-            )
+        message_id = reply["message_id"]
+        logger.info(
+            "thread_reply_created",
+            message_id=message_id,
+            thread_id=thread_id,
+            parent_message_id=reply["parent_message_id"]
+        )
 
-            # Publish WebSocket events
-            try:
-                # Event 1: thread.reply
-                await request.app.state.event_bus.publish({
-                    "type": "thread.reply",
-                    "payload": {
-                        "messageId": message_id,
-                        "threadId": thread_id,
-                        "parentMessageId": thread["parent_message_id"],
-                        "conversationId": thread["conversation_id"],
-                        "conversationType": thread["conversation_type"],
-                        "content": body.content,
-                        "role": "user",
-                        "createdAt": message["created_at"],
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
-
-                # Event 2: thread.updated (parent message thread count changed)
-                # Get updated parent message thread count
-                cursor = conn.execute(
-                    "SELECT thread_count FROM messages WHERE id = ?",
-                    (thread["parent_message_id"],)
-                )
-                parent_msg = cursor.fetchone()
-                thread_count = parent_msg["thread_count"] if parent_msg else 0
-
-                await request.app.state.event_bus.publish({
-                    "type": "thread.updated",
-                    "payload": {
-                        "threadId": thread_id,
-                        "parentMessageId": thread["parent_message_id"],
-                        "threadCount": thread_count,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
-
-            except Exception as ws_error:
-                # Non-fatal: WebSocket broadcast failed
-                logger.warning(
-                    "websocket_broadcast_failed",
-                    error=str(ws_error),
-                    message_id=message_id
-                )
+        # Publish WebSocket events
+        try:
+            # Event 1: thread.reply
+            await request.app.state.event_bus.publish({
+                "type": "thread.reply",
+                "payload": {
+                    "messageId": message_id,
+                    "threadId": thread_id,
+                    "parentMessageId": reply["parent_message_id"],
+                    "conversationId": reply["conversation_id"],
+                    "conversationType": reply["conversation_type"],
+                    "content": body.content,
+                    "role": "user",
+                    "createdAt": reply["created_at"],
+                    "timestamp": datetime.now().isoformat()
+                }
+            })
 
-            return JSONResponse({
-                "messageId": message_id,
-                "threadId": thread_id,
-                "content": body.content,
-                "role": "user",
-                "createdAt": message["created_at"],
-                "parentMessageId": thread["parent_message_id"]
+            # Event 2: thread.updated (parent message thread count changed)
+            await request.app.state.event_bus.publish({
+                "type": "thread.updated",
+                "payload": {
+                    "threadId": thread_id,
+                    "parentMessageId": reply["parent_message_id"],
+                    "threadCount": reply["thread_count"],
+                    "timestamp": datetime.now().isoformat()
+                }
             })
 
-        finally:
-            conn.close()
+        except Exception as ws_error:
+            # Non-fatal: WebSocket broadcast failed
+            logger.warning(
+                "websocket_broadcast_failed",
+                error=str(ws_error),
+                message_id=message_id
+            )
+
+        return JSONResponse({
+            "messageId": message_id,
+            "threadId": thread_id,
+            "content": body.content,
+            "role": "user",
+            "createdAt": reply["created_at"],
+            "parentMessageId": reply["parent_message_id"]
+        })
 
     except HTTPException:
         raise
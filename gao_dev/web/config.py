@@ -58,11 +58,17 @@ class WebConfig:
         cors_origins: Allowed CORS origins (default: localhost with port ranges)
         frontend_dist_path: Path to frontend build directory
         project_root: Project root directory (where gao-dev was run from)
+        db_max_concurrency: Maximum concurrent database reads from web handlers
+        db_slow_query_ms: Database calls slower than this are logged
+        serve_source_maps: Serve frontend ``.map`` files (disable in production)
 
     Environment Variables:
         WEB_HOST: Override server host (default: 127.0.0.1)
         WEB_PORT: Override server port (default: 3000)
         WEB_AUTO_OPEN_BROWSER: Auto-open browser (default: true)
+        WEB_DB_MAX_CONCURRENCY: Database read concurrency limit (default: 4)
+        WEB_DB_SLOW_QUERY_MS: Slow database call threshold (default: 250)
+        WEB_SERVE_SOURCE_MAPS: Serve frontend source maps (default: true)
     """
 
     host: str = field(default_factory=lambda: os.getenv("WEB_HOST", "127.0.0.1"))
@@ -73,6 +79,15 @@ class WebConfig:
     cors_origins: List[str] = field(default_factory=_get_cors_origins)
     frontend_dist_path: str = field(default_factory=_get_default_frontend_dist_path)
     project_root: Optional[Path] = None  # Must be set explicitly by caller
+    db_max_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("WEB_DB_MAX_CONCURRENCY", "4"))
+    )
+    db_slow_query_ms: float = field(
+        default_factory=lambda: float(os.getenv("WEB_DB_SLOW_QUERY_MS", "250"))
+    )
+    serve_source_maps: bool = field(
+        default_factory=lambda: os.getenv("WEB_SERVE_SOURCE_MAPS", "true").lower() == "true"
+    )
 
     def get_url(self) -> str:
         """Get the full server URL."""
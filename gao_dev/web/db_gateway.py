@@ -0,0 +1,291 @@
+"""Async database gateway for web API handlers.
+
+Web handlers are ``async def`` endpoints; running sqlite3 queries directly in
+them blocks the event loop, so one slow query stalls every HTTP request and
+WebSocket. The gateway runs database work off the loop:
+
+- Reads run on a bounded reader thread pool (the concurrency limit)
+- Writes run on a single writer thread, so web writes never contend with
+  each other for the SQLite write lock
+- Every call is timed; per-label statistics are kept and slow calls logged
+
+Example:
+    ```python
+    gateway = get_db_gateway(request)
+    rows = await gateway.fetch_all(db_path, "SELECT * FROM messages", label="messages")
+    workflows = await gateway.read(tracker.query_workflows, label="workflow_timeline")
+    ```
+"""
+
+import asyncio
+import functools
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_SLOW_QUERY_MS = 250.0
+
+
+@dataclass
+class QueryStats:
+    """Timing statistics for one query label.
+
+    Attributes:
+        count: Number of calls
+        errors: Number of calls that raised
+        total_ms: Total wall time in milliseconds
+        max_ms: Slowest call in milliseconds
+    """
+
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        """Average call time in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON responses."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.avg_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open a connection configured like the web API handlers expect.
+
+    Args:
+        db_path: SQLite database path
+
+    Returns:
+        Connection with Row factory and foreign keys enabled
+    """
+    conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+class DatabaseGateway:
+    """Run blocking database work off the event loop with timing.
+
+    Attributes:
+        max_concurrency: Maximum number of reads running at once
+        slow_query_ms: Calls slower than this are logged as warnings
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+    ):
+        """Initialize gateway.
+
+        Args:
+            max_concurrency: Reader thread pool size
+            slow_query_ms: Slow call threshold in milliseconds
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.slow_query_ms = slow_query_ms
+        self._readers = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="gao-db-read"
+        )
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gao-db-write")
+        self._stats: Dict[str, QueryStats] = {}
+        self._stats_lock = threading.Lock()
+
+    async def read(
+        self, func: Callable[..., T], *args: Any, label: Optional[str] = None, **kwargs: Any
+    ) -> T:
+        """Run a read-only database call on the reader pool.
+
+        Args:
+            func: Blocking callable performing the reads
+            *args: Positional arguments for func
+            label: Name used for timing statistics (defaults to func name)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+        """
+        return await self._submit(self._readers, func, args, kwargs, label)
+
+    async def write(
+        self, func: Callable[..., T], *args: Any, label: Optional[str] = None, **kwargs: Any
+    ) -> T:
+        """Run a database call that writes on the single writer thread.
+
+        Args:
+            func: Blocking callable performing the writes
+            *args: Positional arguments for func
+            label: Name used for timing statistics (defaults to func name)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+        """
+        return await self._submit(self._writer, func, args, kwargs, label)
+
+    async def fetch_all(
+        self,
+        db_path: Path,
+        sql: str,
+        params: Sequence[Any] = (),
+        label: Optional[str] = None,
+    ) -> List[sqlite3.Row]:
+        """Run a SELECT and return all rows.
+
+        Args:
+            db_path: SQLite database path
+            sql: Query text
+            params: Query parameters
+            label: Name used for timing statistics
+
+        Returns:
+            List of rows
+        """
+
+        def _fetch_all() -> List[sqlite3.Row]:
+            conn = connect(db_path)
+            try:
+                return conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+
+        return await self.read(_fetch_all, label=label or "fetch_all")
+
+    async def fetch_one(
+        self,
+        db_path: Path,
+        sql: str,
+        params: Sequence[Any] = (),
+        label: Optional[str] = None,
+    ) -> Optional[sqlite3.Row]:
+        """Run a SELECT and return the first row.
+
+        Args:
+            db_path: SQLite database path
+            sql: Query text
+            params: Query parameters
+            label: Name used for timing statistics
+
+        Returns:
+            First row, or None if the query returned nothing
+        """
+
+        def _fetch_one() -> Optional[sqlite3.Row]:
+            conn = connect(db_path)
+            try:
+                return conn.execute(sql, params).fetchone()
+            finally:
+                conn.close()
+
+        return await self.read(_fetch_one, label=label or "fetch_one")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get timing statistics per label.
+
+        Returns:
+            Dictionary mapping label to statistics dictionary
+        """
+        with self._stats_lock:
+            return {label: stats.to_dict() for label, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Clear timing statistics."""
+        with self._stats_lock:
+            self._stats.clear()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the reader and writer threads.
+
+        Args:
+            wait: Wait for running calls to finish
+        """
+        self._readers.shutdown(wait=wait)
+        self._writer.shutdown(wait=wait)
+
+    async def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        func: Callable[..., T],
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+        label: Optional[str],
+    ) -> T:
+        """Run func on executor and record its timing."""
+        name = label or getattr(func, "__name__", "query")
+        call = functools.partial(self._timed, name, func, args, kwargs)
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+    def _timed(
+        self,
+        label: str,
+        func: Callable[..., T],
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+    ) -> T:
+        """Call func in a worker thread, recording wall time (worker side)."""
+        start = time.perf_counter()
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._stats_lock:
+                stats = self._stats.setdefault(label, QueryStats())
+                stats.count += 1
+                stats.errors += int(failed)
+                stats.total_ms += elapsed_ms
+                stats.max_ms = max(stats.max_ms, elapsed_ms)
+            if elapsed_ms >= self.slow_query_ms:
+                logger.warning(
+                    "slow_db_query", label=label, duration_ms=round(elapsed_ms, 1)
+                )
+
+
+def get_db_gateway(request: Any) -> DatabaseGateway:
+    """Get the application's database gateway.
+
+    Apps built without create_app() (e.g. routers mounted in tests) get a
+    default gateway on first use.
+
+    Args:
+        request: FastAPI request (or anything with ``.app.state``)
+
+    Returns:
+        DatabaseGateway stored in ``app.state.db_gateway``
+    """
+    state = request.app.state
+    gateway = getattr(state, "db_gateway", None)
+    if gateway is None:
+        gateway = DatabaseGateway()
+        state.db_gateway = gateway
+    return gateway
@@ -2,19 +2,23 @@
 
 Enforces read-only mode when CLI holds write lock, allowing observability
 while preventing conflicting write operations.
-"""
 
-from typing import Callable
+Implemented as a pure ASGI middleware (rather than BaseHTTPMiddleware) so
+that allowed requests pass straight through without extra per-request tasks
+or response stream wrapping.
+"""
 
 import structlog
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = structlog.get_logger(__name__)
 
+# Methods that never modify state (observability)
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-class ReadOnlyMiddleware(BaseHTTPMiddleware):
+
+class ReadOnlyMiddleware:
     """Middleware to enforce read-only mode when CLI holds lock.
 
     Allows GET/HEAD/OPTIONS (observability) but rejects write operations
@@ -22,48 +26,57 @@ class ReadOnlyMiddleware(BaseHTTPMiddleware):
     holds write lock.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and enforce read-only mode if needed.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware.
 
         Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
+            app: Next ASGI application in the stack
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and enforce read-only mode if needed.
 
-        Returns:
-            HTTP response
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # GET/HEAD/OPTIONS: always allowed (observability)
-        if request.method in ["GET", "HEAD", "OPTIONS"]:
-            return await call_next(request)
+        # Non-HTTP (WebSocket, lifespan) and GET/HEAD/OPTIONS: always allowed
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
 
         # Write operations (POST/PATCH/PUT/DELETE): check lock
-        session_lock = getattr(request.app.state, "session_lock", None)
+        app = scope.get("app")
+        session_lock = getattr(getattr(app, "state", None), "session_lock", None)
 
         if session_lock is None:
-            logger.warning("session_lock_not_initialized", path=request.url.path)
+            logger.warning("session_lock_not_initialized", path=scope.get("path"))
             # Allow request if lock not initialized (graceful degradation)
-            return await call_next(request)
-
-        # Check if another process holds write lock
-        if session_lock.is_write_locked_by_other():
-            lock_state = session_lock.get_lock_state()
-            holder = lock_state.get("holder", "unknown")
-
-            logger.warning(
-                "write_operation_rejected",
-                method=request.method,
-                path=request.url.path,
-                lock_holder=holder,
-            )
-
-            return JSONResponse(
-                status_code=423,  # Locked
-                content={
-                    "error": f"Session locked by {holder.upper()}",
-                    "mode": "read-only",
-                    "message": f"Exit {holder.upper()} session to enable write operations",
-                },
-            )
-
-        # Lock available or we hold it - allow write operation
-        return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        # Check if another process holds write lock (cached in SessionLock)
+        holder = session_lock.get_write_lock_holder()
+        if holder is None:
+            # Lock available or we hold it - allow write operation
+            await self.app(scope, receive, send)
+            return
+
+        logger.warning(
+            "write_operation_rejected",
+            method=scope["method"],
+            path=scope.get("path"),
+            lock_holder=holder,
+        )
+
+        response = JSONResponse(
+            status_code=423,  # Locked
+            content={
+                "error": f"Session locked by {holder.upper()}",
+                "mode": "read-only",
+                "message": f"Exit {holder.upper()} session to enable write operations",
+            },
+        )
+        await response(scope, receive, send)
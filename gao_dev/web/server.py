@@ -1,6 +1,7 @@
 """FastAPI web server for GAO-Dev interface."""
 
 import asyncio
+import json
 import signal
 import webbrowser
 from datetime import datetime
@@ -11,17 +12,18 @@ import structlog
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 from .auth import SessionTokenManager
 from .config import WebConfig
+from .db_gateway import DatabaseGateway
 from .event_bus import WebEventBus
 from .middleware import ReadOnlyMiddleware
 from .websocket_manager import WebSocketManager
 from .file_tree_builder import build_file_tree
 from .file_watcher import FileSystemWatcher
+from .static_assets import PrecompressedStaticFiles
 from ..core.session_lock import SessionLock
 from .api import git as git_router
 from .api import settings as settings_router
@@ -33,6 +35,12 @@ from .api import onboarding as onboarding_router
 
 logger = structlog.get_logger(__name__)
 
+# Workflow listing page sizes
+TIMELINE_DEFAULT_LIMIT = 1000
+TIMELINE_MAX_LIMIT = 5000
+HISTORY_MAX_LIMIT = 200
+EXPORT_BATCH_SIZE = 500
+
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
@@ -86,6 +94,29 @@ def _detect_language(file_path: Path) -> str:
     return extension_map.get(suffix, "plaintext")
 
 
+def _workflow_export_record(workflow, exported_at: str) -> dict:
+    """Build the export representation of a workflow execution.
+
+    Args:
+        workflow: WorkflowExecution to export
+        exported_at: ISO 8601 export timestamp
+
+    Returns:
+        JSON-serializable export record
+    """
+    return {
+        "workflow_id": workflow.workflow_id,
+        "workflow_name": workflow.workflow_name,
+        "status": workflow.status,
+        "started_at": workflow.started_at,
+        "completed_at": workflow.completed_at,
+        "epic": workflow.epic,
+        "story_num": workflow.story_num,
+        "result": workflow.result,
+        "exported_at": exported_at,
+    }
+
+
 def create_app(config: Optional[WebConfig] = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -146,6 +177,12 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
     app.state.session_lock = session_lock
     app.state.project_root = project_root
 
+    # Shared async DB gateway: keeps sqlite work off the event loop
+    app.state.db_gateway = DatabaseGateway(
+        max_concurrency=config.db_max_concurrency,
+        slow_query_ms=config.db_slow_query_ms,
+    )
+
     # Initialize BrianWebAdapter (Story 39.7)
     from .adapters.brian_adapter import BrianWebAdapter
     from ..orchestrator.chat_session import ChatSession
@@ -154,12 +191,33 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
     from ..core.workflow_registry import WorkflowRegistry
     from ..core.services.ai_analysis_service import AIAnalysisService
     from ..core.services.process_executor import ProcessExecutor
+    from ..core.providers.scheduler import RequestPriority
+    from ..core.providers.health_check import ProviderHealthProber
+    from ..orchestrator.orchestrator_factory import configure_scheduler, failover_options
     from ..core.config_loader import ConfigLoader
 
     # Create Brian infrastructure with AI analysis
     config_loader = ConfigLoader(project_root)
+    configure_scheduler(config_loader)
     workflow_registry = WorkflowRegistry(config_loader)
-    executor = ProcessExecutor(project_root)
+    # Chat requests jump ahead of queued workflow and background work
+    executor = ProcessExecutor(project_root, priority=RequestPriority.INTERACTIVE)
+    failover = failover_options(config_loader, executor.provider.name)
+    executor.health_checker = failover.get("health_checker")
+    executor.fallback_providers = failover.get("fallback_providers", [])
+
+    # Probe the chat providers in the background so failover happens
+    # before a request is sent to a dead provider
+    health_config = config_loader.get("providers", {}).get("selection", {}).get("health", {})
+    app.state.health_prober = None
+    if executor.health_checker is not None and health_config.get("enabled", False):
+        app.state.health_prober = ProviderHealthProber(
+            executor.health_checker,
+            [executor.provider, *executor.fallback_providers],
+            interval=health_config.get("check_interval", 60),
+        )
+        app.state.health_prober.start()
+
     analysis_service = AIAnalysisService(executor)
 
     # Create BrianOrchestrator with proper dependencies
@@ -218,6 +276,21 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
         """
         return JSONResponse({"status": "healthy", "version": "1.0.0"})
 
+    # Database timing endpoint
+    @app.get("/api/health/db")
+    async def db_health() -> JSONResponse:
+        """Database gateway timing statistics.
+
+        Returns:
+            JSON response with concurrency limit and per-query timings
+        """
+        gateway = app.state.db_gateway
+        return JSONResponse({
+            "max_concurrency": gateway.max_concurrency,
+            "slow_query_ms": gateway.slow_query_ms,
+            "queries": gateway.get_stats(),
+        })
+
     # Session token endpoint
     @app.get("/api/session/token")
     async def get_session_token() -> JSONResponse:
@@ -358,11 +431,14 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                 from gao_dev.core.services.ai_analysis_service import AIAnalysisService
                 from gao_dev.core.config_loader import ConfigLoader
                 from gao_dev.core.services.process_executor import ProcessExecutor
+                from gao_dev.core.providers.scheduler import RequestPriority
+                from gao_dev.orchestrator.orchestrator_factory import configure_scheduler
 
                 # Create services (matching ChatREPL initialization)
                 config_loader = ConfigLoader(project_root)
+                configure_scheduler(config_loader)
                 workflow_registry = WorkflowRegistry(config_loader)
-                executor = ProcessExecutor(project_root)
+                executor = ProcessExecutor(project_root, priority=RequestPriority.INTERACTIVE)
                 analysis_service = AIAnalysisService(executor)
 
                 # Create StateTracker and OperationTracker (needed for CommandRouter)
@@ -683,6 +759,8 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         status: Optional[str] = None,
+        limit: int = TIMELINE_DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
     ) -> JSONResponse:
         """Get workflow execution timeline with optional filters.
 
@@ -692,19 +770,25 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
         - end_date: ISO 8601 timestamp (filter started_at <= this)
         - status: Comma-separated list of statuses
 
+        Results are newest first and paginated by cursor: pass the response's
+        ``next_cursor`` back as ``cursor`` to get the following page.
+
         Args:
             request: FastAPI request object
             workflow_type: Optional workflow name filter
             start_date: Optional start date filter (ISO 8601)
             end_date: Optional end date filter (ISO 8601)
             status: Optional comma-separated status filter
+            limit: Page size (capped at TIMELINE_MAX_LIMIT)
+            cursor: Optional cursor from a previous response
 
         Returns:
-            JSON response with workflows array, total count, and filter metadata
+            JSON response with workflows array, total count, next_cursor,
+            has_more, and filter metadata
         """
         try:
             from gao_dev.core.state.state_tracker import StateTracker
-            from gao_dev.core.state.exceptions import StateTrackerError
+            from gao_dev.core.state.exceptions import StateTrackerError, ValidationError
             import sqlite3
             from datetime import datetime
 
@@ -718,6 +802,8 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                 return JSONResponse({
                     "workflows": [],
                     "total": 0,
+                    "next_cursor": None,
+                    "has_more": False,
                     "filters": {
                         "workflow_types": [],
                         "date_range": {"min": None, "max": None},
@@ -730,20 +816,34 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
             if status:
                 status_list = [s.strip() for s in status.split(",")]
 
-            # Query workflows with filters
-            try:
+            filters = {
+                "workflow_type": workflow_type,
+                "start_date": start_date,
+                "end_date": end_date,
+                "status": status_list,
+            }
+            page_size = max(1, min(limit, TIMELINE_MAX_LIMIT))
+
+            # Query one page of workflows with filters
+            def _load_timeline():
                 state_tracker = StateTracker(db_path)
-                workflows = state_tracker.query_workflows(
-                    workflow_type=workflow_type,
-                    start_date=start_date,
-                    end_date=end_date,
-                    status=status_list
+                page = state_tracker.page_workflows(page_size, cursor=cursor, **filters)
+
+                # Get total and filter metadata
+                return (
+                    page,
+                    state_tracker.count_workflows(**filters),
+                    state_tracker.get_workflow_types(),
+                    state_tracker.get_workflow_date_range(),
                 )
 
-                # Get filter metadata
-                workflow_types = state_tracker.get_workflow_types()
-                date_range = state_tracker.get_workflow_date_range()
+            try:
+                page, total, workflow_types, date_range = await app.state.db_gateway.read(
+                    _load_timeline, label="workflows.timeline"
+                )
 
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=str(e))
             except (sqlite3.OperationalError, StateTrackerError) as e:
                 # Handle unmigrated database
                 error_msg = str(e)
@@ -756,6 +856,8 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                     return JSONResponse({
                         "workflows": [],
                         "total": 0,
+                        "next_cursor": None,
+                        "has_more": False,
                         "filters": {
                             "workflow_types": [],
                             "date_range": {"min": None, "max": None},
@@ -766,7 +868,7 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
 
             # Build response with workflow data
             workflow_data = []
-            for wf in workflows:
+            for wf in page.workflows:
                 # Calculate duration if completed
                 duration = None
                 if wf.completed_at and wf.started_at:
@@ -792,7 +894,9 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
 
             return JSONResponse({
                 "workflows": workflow_data,
-                "total": len(workflow_data),
+                "total": total,
+                "next_cursor": page.next_cursor,
+                "has_more": page.has_more,
                 "filters": {
                     "workflow_types": workflow_types,
                     "date_range": date_range,
@@ -800,6 +904,8 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                 }
             })
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.exception("get_workflow_timeline_failed", error=str(e))
             raise HTTPException(
@@ -851,7 +957,11 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
             # Get workflow execution
             state_tracker = StateTracker(db_path)
             try:
-                workflow = state_tracker.get_workflow_execution(workflow_id)
+                workflow = await app.state.db_gateway.read(
+                    state_tracker.get_workflow_execution,
+                    workflow_id,
+                    label="workflows.details",
+                )
             except RecordNotFoundError:
                 raise HTTPException(
                     status_code=404,
@@ -992,19 +1102,17 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                 if not include_completed:
                     status_filter = ["started", "running", "failed", "cancelled"]
 
-                workflows = state_tracker.query_workflows(
+                workflows = await app.state.db_gateway.read(
+                    state_tracker.query_workflows,
                     workflow_type=None,
                     start_date=None,
                     end_date=None,
-                    status=status_filter
+                    status=status_filter,
+                    epic_num=epic,
+                    story_num=story_num,
+                    label="workflows.graph",
                 )
 
-                # Apply epic/story filters
-                if epic is not None:
-                    workflows = [wf for wf in workflows if wf.epic == epic]
-                if story_num is not None:
-                    workflows = [wf for wf in workflows if wf.story_num == story_num]
-
             except (sqlite3.OperationalError, StateTrackerError) as e:
                 error_msg = str(e)
                 if "no such table" in error_msg:
@@ -1207,9 +1315,6 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
             from gao_dev.core.state.state_tracker import StateTracker
             from gao_dev.core.state.exceptions import StateTrackerError
             import sqlite3
-            from datetime import datetime
-            from typing import Dict
-            from collections import defaultdict
 
             # Get project root
             project_root_path = request.app.state.project_root
@@ -1244,17 +1349,13 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
             # Query workflows
             try:
                 state_tracker = StateTracker(db_path)
-                workflows = state_tracker.query_workflows(
-                    workflow_type=None,
+                metrics = await app.state.db_gateway.read(
+                    state_tracker.get_workflow_dashboard_metrics,
                     start_date=start_date,
                     end_date=end_date,
-                    status=None
+                    epic_num=epic,
+                    label="workflows.metrics",
                 )
-
-                # Apply epic filter
-                if epic is not None:
-                    workflows = [wf for wf in workflows if wf.epic == epic]
-
             except (sqlite3.OperationalError, StateTrackerError) as e:
                 error_msg = str(e)
                 if "no such table" in error_msg:
@@ -1283,231 +1384,7 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                     })
                 raise
 
-            # Calculate summary metrics
-            status_counts = defaultdict(int)
-            total_duration = 0
-            durations = []
-
-            for wf in workflows:
-                status_counts[wf.status] += 1
-
-                # Calculate duration
-                if wf.completed_at and wf.started_at:
-                    try:
-                        started = datetime.fromisoformat(wf.started_at.replace("Z", "+00:00"))
-                        completed = datetime.fromisoformat(wf.completed_at.replace("Z", "+00:00"))
-                        duration = (completed - started).total_seconds()
-                        total_duration += duration
-                        durations.append(duration)
-                    except (ValueError, AttributeError):
-                        pass
-
-            total_workflows = len(workflows)
-            completed_count = status_counts.get("completed", 0)
-            failed_count = status_counts.get("failed", 0)
-            cancelled_count = status_counts.get("cancelled", 0)
-            running_count = status_counts.get("running", 0)
-            pending_count = status_counts.get("pending", 0) + status_counts.get("started", 0)
-
-            # Success rate: completed / (completed + failed + cancelled)
-            denominator = completed_count + failed_count + cancelled_count
-            success_rate = (completed_count / denominator * 100.0) if denominator > 0 else 0.0
-
-            # Average duration
-            average_duration = (total_duration / len(durations)) if durations else 0.0
-
-            summary = {
-                "total_workflows": total_workflows,
-                "completed": completed_count,
-                "failed": failed_count,
-                "cancelled": cancelled_count,
-                "running": running_count,
-                "pending": pending_count,
-                "success_rate": round(success_rate, 2),
-                "average_duration": round(average_duration, 2),
-                "total_duration": round(total_duration, 2)
-            }
-
-            # Workflow type metrics
-            workflow_type_data: Dict[str, Dict] = defaultdict(lambda: {
-                "count": 0,
-                "durations": [],
-                "completed": 0,
-                "failed": 0,
-                "cancelled": 0
-            })
-
-            for wf in workflows:
-                wf_type = wf.workflow_name
-                workflow_type_data[wf_type]["count"] += 1
-
-                if wf.completed_at and wf.started_at:
-                    try:
-                        started = datetime.fromisoformat(wf.started_at.replace("Z", "+00:00"))
-                        completed = datetime.fromisoformat(wf.completed_at.replace("Z", "+00:00"))
-                        duration = (completed - started).total_seconds()
-                        workflow_type_data[wf_type]["durations"].append(duration)
-                    except (ValueError, AttributeError):
-                        pass
-
-                if wf.status == "completed":
-                    workflow_type_data[wf_type]["completed"] += 1
-                elif wf.status == "failed":
-                    workflow_type_data[wf_type]["failed"] += 1
-                elif wf.status == "cancelled":
-                    workflow_type_data[wf_type]["cancelled"] += 1
-
-            workflow_type_metrics = []
-            for wf_type, data in workflow_type_data.items():
-                durs = data["durations"]
-                avg_duration = (sum(durs) / len(durs)) if durs else 0.0
-                min_duration = min(durs) if durs else 0.0
-                max_duration = max(durs) if durs else 0.0
-
-                denom = data["completed"] + data["failed"] + data["cancelled"]
-                wf_success_rate = (data["completed"] / denom * 100.0) if denom > 0 else 0.0
-
-                workflow_type_metrics.append({
-                    "workflow_type": wf_type,
-                    "count": data["count"],
-                    "average_duration": round(avg_duration, 2),
-                    "success_rate": round(wf_success_rate, 2),
-                    "min_duration": round(min_duration, 2),
-                    "max_duration": round(max_duration, 2)
-                })
-
-            # Sort by count descending
-            workflow_type_metrics.sort(key=lambda x: x["count"], reverse=True)
-
-            # Agent utilization
-            agent_data: Dict[str, Dict] = defaultdict(lambda: {"count": 0, "duration": 0.0})
-
-            for wf in workflows:
-                # Use workflow_id as agent identifier
-                agent = wf.workflow_id.split("-")[0] if "-" in wf.workflow_id else "Unknown"
-                agent_data[agent]["count"] += 1
-
-                if wf.completed_at and wf.started_at:
-                    try:
-                        started = datetime.fromisoformat(wf.started_at.replace("Z", "+00:00"))
-                        completed = datetime.fromisoformat(wf.completed_at.replace("Z", "+00:00"))
-                        duration = (completed - started).total_seconds()
-                        agent_data[agent]["duration"] += duration
-                    except (ValueError, AttributeError):
-                        pass
-
-            agent_utilization = []
-            for agent, data in agent_data.items():
-                percentage = (data["count"] / total_workflows * 100.0) if total_workflows > 0 else 0.0
-                agent_utilization.append({
-                    "agent": agent,
-                    "workflow_count": data["count"],
-                    "total_duration": round(data["duration"], 2),
-                    "percentage": round(percentage, 2)
-                })
-
-            # Sort by count descending
-            agent_utilization.sort(key=lambda x: x["workflow_count"], reverse=True)
-
-            # Longest workflows (top 10)
-            workflows_with_duration = []
-            for wf in workflows:
-                if wf.completed_at and wf.started_at:
-                    try:
-                        started = datetime.fromisoformat(wf.started_at.replace("Z", "+00:00"))
-                        completed = datetime.fromisoformat(wf.completed_at.replace("Z", "+00:00"))
-                        duration = (completed - started).total_seconds()
-                        workflows_with_duration.append({
-                            "workflow_id": wf.workflow_id,
-                            "workflow_name": wf.workflow_name,
-                            "duration": round(duration, 2),
-                            "status": wf.status,
-                            "agent": wf.workflow_id.split("-")[0] if "-" in wf.workflow_id else "Unknown",
-                            "started_at": wf.started_at
-                        })
-                    except (ValueError, AttributeError):
-                        pass
-
-            workflows_with_duration.sort(key=lambda x: x["duration"], reverse=True)
-            longest_workflows = workflows_with_duration[:10]
-
-            # Failure analysis
-            failed_workflows = [wf for wf in workflows if wf.status == "failed"]
-            failed_by_type: Dict[str, Dict] = defaultdict(lambda: {"failed": 0, "total": 0})
-
-            for wf in workflows:
-                failed_by_type[wf.workflow_name]["total"] += 1
-                if wf.status == "failed":
-                    failed_by_type[wf.workflow_name]["failed"] += 1
-
-            most_failed_workflows = []
-            for wf_type, data in failed_by_type.items():
-                if data["failed"] > 0:
-                    failure_rate = (data["failed"] / data["total"] * 100.0)
-                    most_failed_workflows.append({
-                        "workflow_type": wf_type,
-                        "failure_count": data["failed"],
-                        "total_count": data["total"],
-                        "failure_rate": round(failure_rate, 2)
-                    })
-
-            most_failed_workflows.sort(key=lambda x: x["failure_count"], reverse=True)
-            most_failed_workflows = most_failed_workflows[:10]
-
-            # Common errors (parse from result field if available)
-            error_counts: Dict[str, int] = defaultdict(int)
-            for wf in failed_workflows:
-                if wf.result:
-                    # Simple error extraction - take first line of result
-                    error_line = wf.result.split("\n")[0] if "\n" in wf.result else wf.result
-                    error_counts[error_line[:100]] += 1  # Limit to 100 chars
-
-            common_errors = [
-                {"error_message": msg, "count": count}
-                for msg, count in sorted(error_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-            ]
-
-            failure_analysis = {
-                "most_failed_workflows": most_failed_workflows,
-                "most_failed_steps": [],  # Would need step-level tracking
-                "common_errors": common_errors
-            }
-
-            # Workflows over time (daily aggregation)
-            workflows_by_date: Dict[str, Dict] = defaultdict(lambda: {
-                "completed": 0,
-                "failed": 0,
-                "cancelled": 0
-            })
-
-            for wf in workflows:
-                if wf.started_at:
-                    try:
-                        started = datetime.fromisoformat(wf.started_at.replace("Z", "+00:00"))
-                        date_key = started.strftime("%Y-%m-%d")
-
-                        if wf.status == "completed":
-                            workflows_by_date[date_key]["completed"] += 1
-                        elif wf.status == "failed":
-                            workflows_by_date[date_key]["failed"] += 1
-                        elif wf.status == "cancelled":
-                            workflows_by_date[date_key]["cancelled"] += 1
-                    except (ValueError, AttributeError):
-                        pass
-
-            workflows_over_time = [
-                {"date": date, **counts}
-                for date, counts in sorted(workflows_by_date.items())
-            ]
-
-            return JSONResponse({
-                "summary": summary,
-                "workflow_type_metrics": workflow_type_metrics,
-                "agent_utilization": agent_utilization,
-                "longest_workflows": longest_workflows,
-                "failure_analysis": failure_analysis,
-                "workflows_over_time": workflows_over_time
-            })
+            return JSONResponse(metrics)
 
         except Exception as e:
             logger.exception("get_workflow_metrics_failed", error=str(e))
@@ -1526,59 +1403,72 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
         end_date: Optional[str] = None,
         status: Optional[str] = None,
         search: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> JSONResponse:
         """Get paginated workflow execution history.
 
+        Pages are read with LIMIT/OFFSET in SQL; clients that scroll deep can
+        pass the response's ``next_cursor`` as ``cursor`` instead of ``page``.
+
         Args:
             request: FastAPI request object
-            page: Page number (1-indexed)
-            limit: Items per page (default: 20)
+            page: Page number (1-indexed), ignored when cursor is given
+            limit: Items per page (default: 20, capped at HISTORY_MAX_LIMIT)
             workflow_type: Filter by workflow name
             start_date: Filter by start date (ISO 8601)
             end_date: Filter by end date (ISO 8601)
             status: Filter by status
             search: Search query for workflow_id or workflow_name
+            cursor: Optional cursor from a previous response
 
         Returns:
             JSON response with paginated workflows and metadata
         """
         try:
             from gao_dev.core.state.state_tracker import StateTracker
+            from gao_dev.core.state.exceptions import ValidationError
             import sqlite3
 
+            page = max(1, page)
+            limit = max(1, min(limit, HISTORY_MAX_LIMIT))
+
             project_root_path = request.app.state.project_root
             db_path = project_root_path / ".gao-dev" / "documents.db"
 
             if not db_path.exists():
-                return JSONResponse({"workflows": [], "total": 0, "page": page, "limit": limit, "pages": 0})
+                return JSONResponse({
+                    "workflows": [], "total": 0, "page": page, "limit": limit, "pages": 0,
+                    "next_cursor": None,
+                })
 
-            try:
+            filters = {
+                "workflow_type": workflow_type,
+                "start_date": start_date,
+                "end_date": end_date,
+                "status": [status] if status else None,
+                "search": search,
+            }
+
+            def _load_history():
                 state_tracker = StateTracker(db_path)
-                workflows = state_tracker.query_workflows(
-                    workflow_type=workflow_type,
-                    start_date=start_date,
-                    end_date=end_date,
-                    status=[status] if status else None
+                history = state_tracker.page_workflows(
+                    limit,
+                    cursor=cursor,
+                    offset=0 if cursor else (page - 1) * limit,
+                    **filters,
                 )
+                return history, state_tracker.count_workflows(**filters)
 
-                # Apply search filter
-                if search:
-                    search_lower = search.lower()
-                    workflows = [
-                        wf for wf in workflows
-                        if search_lower in wf.workflow_id.lower() or search_lower in wf.workflow_name.lower()
-                    ]
+            try:
+                history, total = await app.state.db_gateway.read(
+                    _load_history, label="workflows.history"
+                )
 
-                # Calculate pagination
-                total = len(workflows)
                 pages = (total + limit - 1) // limit
-                start_idx = (page - 1) * limit
-                end_idx = start_idx + limit
-                page_workflows = workflows[start_idx:end_idx]
 
                 # Format response
                 workflow_list = []
-                for wf in page_workflows:
+                for wf in history.workflows:
                     duration = None
                     if wf.completed_at and wf.started_at:
                         try:
@@ -1609,31 +1499,105 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                     "total": total,
                     "page": page,
                     "limit": limit,
-                    "pages": pages
+                    "pages": pages,
+                    "next_cursor": history.next_cursor,
                 })
 
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=str(e))
             except sqlite3.OperationalError as e:
                 if "no such table" in str(e):
-                    return JSONResponse({"workflows": [], "total": 0, "page": page, "limit": limit, "pages": 0})
+                    return JSONResponse({
+                        "workflows": [], "total": 0, "page": page, "limit": limit, "pages": 0,
+                        "next_cursor": None,
+                    })
                 raise
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.exception("get_workflow_history_failed", error=str(e))
             raise HTTPException(status_code=500, detail=f"Failed to get workflow history: {str(e)}")
 
+    @app.get("/api/workflows/export")
+    async def export_workflows(
+        request: Request,
+        workflow_type: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> StreamingResponse:
+        """Stream matching workflow executions as NDJSON.
+
+        Rows are read in keyset-paginated batches of EXPORT_BATCH_SIZE and
+        written one JSON object per line as they arrive, so memory use does
+        not grow with the size of the history.
+
+        Args:
+            request: FastAPI request object
+            workflow_type: Filter by workflow name
+            start_date: Filter by start date (ISO 8601)
+            end_date: Filter by end date (ISO 8601)
+            status: Comma-separated status filter
+            search: Search query for workflow_id or workflow_name
+
+        Returns:
+            Streaming application/x-ndjson response, newest first
+        """
+        from gao_dev.core.state.state_tracker import StateTracker
+        from gao_dev.core.state.pagination import workflow_key
+
+        db_path = request.app.state.project_root / ".gao-dev" / "documents.db"
+        filters = {
+            "workflow_type": workflow_type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "status": [s.strip() for s in status.split(",")] if status else None,
+            "search": search,
+        }
+        exported_at = datetime.now().isoformat()
+
+        async def _lines():
+            if not db_path.exists():
+                return
+            state_tracker = StateTracker(db_path)
+            after = None
+            while True:
+                batch = await app.state.db_gateway.read(
+                    state_tracker.query_workflows,
+                    limit=EXPORT_BATCH_SIZE,
+                    after=after,
+                    label="workflows.export_all",
+                    **filters,
+                )
+                for workflow in batch:
+                    yield json.dumps(_workflow_export_record(workflow, exported_at)) + "\n"
+                if len(batch) < EXPORT_BATCH_SIZE:
+                    return
+                after = workflow_key(batch[-1])
+
+        return StreamingResponse(
+            _lines(),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": 'attachment; filename="workflows.ndjson"'},
+        )
+
     @app.get("/api/workflows/{workflow_id}/export")
-    async def export_workflow(request: Request, workflow_id: str) -> JSONResponse:
+    async def export_workflow(request: Request, workflow_id: str, format: str = "json") -> Response:
         """Export workflow execution as JSON.
 
         Args:
             request: FastAPI request object
             workflow_id: Workflow execution ID
+            format: "json" (default) or "ndjson" for a single NDJSON line
 
         Returns:
             JSON response with complete workflow data
         """
         try:
             from gao_dev.core.state.state_tracker import StateTracker
+            from gao_dev.core.state.exceptions import RecordNotFoundError
 
             project_root_path = request.app.state.project_root
             db_path = project_root_path / ".gao-dev" / "documents.db"
@@ -1642,25 +1606,19 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                 raise HTTPException(status_code=404, detail="Workflow not found")
 
             state_tracker = StateTracker(db_path)
-            workflows = state_tracker.query_workflows()
-            workflow = next((wf for wf in workflows if wf.workflow_id == workflow_id), None)
-
-            if not workflow:
+            try:
+                workflow = await app.state.db_gateway.read(
+                    state_tracker.get_workflow_execution, workflow_id, label="workflows.export"
+                )
+            except RecordNotFoundError:
                 raise HTTPException(status_code=404, detail="Workflow not found")
 
-            # Build export data
-            export_data = {
-                "workflow_id": workflow.workflow_id,
-                "workflow_name": workflow.workflow_name,
-                "status": workflow.status,
-                "started_at": workflow.started_at,
-                "completed_at": workflow.completed_at,
-                "epic": workflow.epic,
-                "story_num": workflow.story_num,
-                "result": workflow.result,
-                "exported_at": datetime.now().isoformat()
-            }
+            export_data = _workflow_export_record(workflow, datetime.now().isoformat())
 
+            if format == "ndjson":
+                return Response(
+                    json.dumps(export_data) + "\n", media_type="application/x-ndjson"
+                )
             return JSONResponse(export_data)
 
         except HTTPException:
@@ -1696,7 +1654,9 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                 raise HTTPException(status_code=404, detail="Workflows not found")
 
             state_tracker = StateTracker(db_path)
-            workflows = state_tracker.query_workflows()
+            workflows = await app.state.db_gateway.read(
+                state_tracker.query_workflows, label="workflows.compare"
+            )
 
             wf1 = next((wf for wf in workflows if wf.workflow_id == workflow_id_1), None)
             wf2 = next((wf for wf in workflows if wf.workflow_id == workflow_id_2), None)
@@ -1794,11 +1754,19 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                     }
                 })
 
+            def _load_board():
+                state_tracker = StateTracker(db_path)
+                # Get all active epics with their stories
+                return [
+                    (epic, state_tracker.get_stories_by_epic(epic.epic_num))
+                    for epic in state_tracker.get_active_epics()
+                ]
+
             # Query database
             try:
-                state_tracker = StateTracker(db_path)
-                # Get all active epics
-                epics = state_tracker.get_active_epics()
+                epics_with_stories = await app.state.db_gateway.read(
+                    _load_board, label="kanban.board"
+                )
             except (sqlite3.OperationalError, StateTrackerError) as e:
                 # Handle unmigrated database (schema not initialized)
                 error_msg = str(e)
@@ -1833,10 +1801,7 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
             }
 
             # Process each epic
-            for epic in epics:
-                # Get stories for this epic
-                stories = state_tracker.get_stories_by_epic(epic.epic_num)
-
+            for epic, stories in epics_with_stories:
                 # Group stories by status
                 for story in stories:
                     # Map database status to Kanban column
@@ -2006,15 +1971,20 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
 
                 db_status = status_map.get(body.toStatus, body.toStatus)
 
-                # Update story status
-                state_tracker.update_story_status(
-                    epic_num=epic_num,
-                    story_num=story_num,
-                    new_status=db_status
-                )
+                def _move_story():
+                    # Update story status
+                    state_tracker.update_story_status(
+                        epic_num=epic_num,
+                        story_num=story_num,
+                        new_status=db_status
+                    )
 
-                # Get updated story
-                story = state_tracker.get_story(epic_num, story_num)
+                    # Get updated story
+                    return state_tracker.get_story(epic_num, story_num)
+
+                story = await app.state.db_gateway.write(
+                    _move_story, label="kanban.move_story"
+                )
                 if not story:
                     raise HTTPException(
                         status_code=404,
@@ -2045,15 +2015,22 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
                     message="Epic drag-and-drop not fully implemented (status derived from stories)"
                 )
 
-                epic = state_tracker.get_epic(epic_num)
+                def _load_epic():
+                    epic = state_tracker.get_epic(epic_num)
+                    if not epic:
+                        return None, []
+                    # Get stories for epic to calculate progress
+                    return epic, state_tracker.get_stories_by_epic(epic_num)
+
+                epic, stories = await app.state.db_gateway.read(
+                    _load_epic, label="kanban.load_epic"
+                )
                 if not epic:
                     raise HTTPException(
                         status_code=404,
                         detail=f"Epic {epic_num} not found"
                     )
 
-                # Get stories for epic to calculate progress
-                stories = state_tracker.get_stories_by_epic(epic_num)
                 story_counts = {
                     "total": len(stories),
                     "done": len([s for s in stories if s.status == "done"]),
@@ -2193,16 +2170,28 @@ def create_app(config: Optional[WebConfig] = None) -> FastAPI:
 
     # Check if frontend build is actually ready (both directory and index.html exist)
     if frontend_dist.exists() and index_path.exists():
-        # Mount static assets if they exist
+        # Mount static assets if they exist (compressed, hash-named => immutable)
         assets_path = frontend_dist / "assets"
         if assets_path.exists():
-            app.mount("/assets", StaticFiles(directory=str(assets_path)), name="assets")
+            app.mount(
+                "/assets",
+                PrecompressedStaticFiles(
+                    directory=str(assets_path),
+                    serve_source_maps=config.serve_source_maps,
+                ),
+                name="assets",
+            )
+
+        # index.html is always revalidated (ETag) so new builds are picked up
+        index_files = PrecompressedStaticFiles(
+            directory=str(frontend_dist), immutable_pattern=None
+        )
 
         # Serve index.html for root route
         @app.get("/")
-        async def serve_index() -> FileResponse:
+        async def serve_index(request: Request) -> Response:
             """Serve the frontend index.html."""
-            return FileResponse(str(index_path))
+            return await index_files.get_response("index.html", request.scope)
 
     else:
         # Frontend not built - provide helpful error message
@@ -2300,11 +2289,19 @@ class ServerManager:
                     self.server.config.app.state.file_watcher.stop()
                     logger.info("file_watcher_stopped")
 
+                # Stop provider health probing
+                if getattr(self.server.config.app.state, "health_prober", None):
+                    self.server.config.app.state.health_prober.stop(timeout=5)
+
                 # Release session lock if acquired
                 if hasattr(self.server.config.app.state, "session_lock"):
                     self.server.config.app.state.session_lock.release()
                     logger.info("web_session_lock_released")
 
+                # Stop database worker threads
+                if hasattr(self.server.config.app.state, "db_gateway"):
+                    self.server.config.app.state.db_gateway.shutdown(wait=False)
+
             self.server.should_exit = True
 
 
@@ -0,0 +1,359 @@
+"""Precompressed, cache-friendly static file serving for the frontend build.
+
+The Vite build ships dozens of hash-named Monaco language chunks and source
+maps. Serving them with a plain StaticFiles meant no compression and no
+Cache-Control, so every page load re-downloaded megabytes. This module adds:
+
+- Content negotiation between brotli (if available), gzip and identity,
+  using ``.br``/``.gz`` siblings written at build time or variants
+  compressed on first request (in a worker thread) and kept in memory
+- ``immutable`` long-lived caching for hash-named assets and ``no-cache``
+  (ETag revalidation) for everything else, including ``index.html``
+- Optional refusal of ``.map`` source maps (WEB_SERVE_SOURCE_MAPS=false)
+
+Build-time precompression:
+    ``python -m gao_dev.web.static_assets gao_dev/web/frontend/dist``
+"""
+
+import gzip
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import anyio
+import structlog
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+try:  # Optional: brotli is not a hard dependency
+    import brotli
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+logger = structlog.get_logger(__name__)
+
+# Vite output names: <name>-<8 char hash>.<ext>[.map]
+HASHED_ASSET_PATTERN = re.compile(r"-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+(\.map)?$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+COMPRESSIBLE_EXTENSIONS = frozenset(
+    {".js", ".mjs", ".css", ".map", ".html", ".json", ".svg", ".txt", ".xml", ".wasm"}
+)
+
+# Below this size compression saves less than the headers cost
+MIN_COMPRESS_SIZE = 1024
+
+# In-memory compressed variants (bytes); the full Monaco build fits easily
+MAX_MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+
+# Preference order when the client accepts several encodings
+ENCODING_SUFFIXES: Dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+
+def parse_accept_encoding(header: Optional[str]) -> List[str]:
+    """Parse Accept-Encoding into supported encodings the client accepts.
+
+    Args:
+        header: Accept-Encoding header value
+
+    Returns:
+        Accepted encodings from ENCODING_SUFFIXES, in server preference order
+    """
+    if not header:
+        return []
+
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    return [
+        encoding
+        for encoding in ENCODING_SUFFIXES
+        if accepted.get(encoding, wildcard) > 0
+    ]
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    """Compress data with maximum compression.
+
+    Args:
+        data: Raw bytes
+        encoding: "br" or "gzip"
+
+    Returns:
+        Compressed bytes
+    """
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("brotli is not installed")
+        return brotli.compress(data, quality=11)
+    # mtime=0 keeps output deterministic across builds
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def available_encodings() -> List[str]:
+    """Encodings this process can produce on the fly."""
+    return [e for e in ENCODING_SUFFIXES if e != "br" or brotli is not None]
+
+
+def is_compressible(path: str, size: int) -> bool:
+    """Whether a file is worth compressing.
+
+    Args:
+        path: File path
+        size: File size in bytes
+
+    Returns:
+        True for text-like files of at least MIN_COMPRESS_SIZE bytes
+    """
+    return size >= MIN_COMPRESS_SIZE and os.path.splitext(path)[1].lower() in COMPRESSIBLE_EXTENSIONS
+
+
+def precompress_directory(directory: Path) -> int:
+    """Write ``.gz`` (and ``.br`` if brotli is installed) siblings for assets.
+
+    Variants are only rewritten when older than their source file.
+
+    Args:
+        directory: Frontend build directory
+
+    Returns:
+        Number of compressed files written
+    """
+    written = 0
+    for path in sorted(Path(directory).rglob("*")):
+        if not path.is_file() or path.suffix in (".gz", ".br"):
+            continue
+        stat_result = path.stat()
+        if not is_compressible(str(path), stat_result.st_size):
+            continue
+
+        data = None
+        for encoding in available_encodings():
+            target = path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+            if target.exists() and target.stat().st_mtime >= stat_result.st_mtime:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            compressed = compress_bytes(data, encoding)
+            if len(compressed) >= len(data):
+                continue
+            target.write_bytes(compressed)
+            written += 1
+
+    logger.info("static_assets_precompressed", directory=str(directory), written=written)
+    return written
+
+
+class _CompressOnSendResponse(Response):
+    """Compressed variant that is produced in a worker thread when sent.
+
+    Maximum-level brotli/gzip of a large chunk takes long enough to stall
+    every other request if run on the event loop. Falls back to the identity
+    response when compression does not make the file smaller.
+    """
+
+    def __init__(
+        self,
+        compress: Callable[[], Optional[bytes]],
+        identity: Response,
+        media_type: Optional[str],
+        headers: Dict[str, str],
+    ):
+        super().__init__(b"", media_type=media_type, headers=headers)
+        self._compress = compress
+        self._identity = identity
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body = await anyio.to_thread.run_sync(self._compress)
+        if body is None:
+            for name in ("cache-control", "vary"):
+                if name in self.headers:
+                    self._identity.headers[name] = self.headers[name]
+            await self._identity(scope, receive, send)
+            return
+
+        self.body = body
+        self.headers["content-length"] = str(len(body))
+        await super().__call__(scope, receive, send)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles with compression negotiation and cache headers.
+
+    Attributes:
+        serve_source_maps: Serve ``.map`` files (404 when False)
+        immutable_pattern: Filenames matching this get immutable caching
+    """
+
+    def __init__(
+        self,
+        *args,
+        serve_source_maps: bool = True,
+        immutable_pattern: Optional[re.Pattern] = HASHED_ASSET_PATTERN,
+        **kwargs,
+    ):
+        """Initialize static files.
+
+        Args:
+            *args: StaticFiles positional arguments
+            serve_source_maps: Serve ``.map`` files (404 when False)
+            immutable_pattern: Filename regex for immutable caching (None
+                disables immutable caching)
+            **kwargs: StaticFiles keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        self.serve_source_maps = serve_source_maps
+        self.immutable_pattern = immutable_pattern
+        self._memory_cache: "OrderedDict[Tuple[str, int, int, str], bytes]" = OrderedDict()
+        self._memory_cache_bytes = 0
+        self._memory_lock = threading.Lock()
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Build the response for a file, negotiating compression.
+
+        Args:
+            full_path: File path
+            stat_result: File stat result
+            scope: ASGI scope
+            status_code: Response status code
+
+        Returns:
+            File, compressed or 304 Not Modified response
+        """
+        path = str(full_path)
+        if not self.serve_source_maps and path.endswith(".map"):
+            raise HTTPException(status_code=404)
+
+        request_headers = Headers(scope=scope)
+        response: Response = FileResponse(
+            path, status_code=status_code, stat_result=stat_result
+        )
+
+        if status_code == 200 and is_compressible(path, stat_result.st_size):
+            for encoding in parse_accept_encoding(request_headers.get("accept-encoding")):
+                compressed = self._compressed_response(path, stat_result, encoding, response)
+                if compressed is not None:
+                    response = compressed
+                    break
+            response.headers["vary"] = "Accept-Encoding"
+
+        filename = os.path.basename(path)
+        if self.immutable_pattern is not None and self.immutable_pattern.search(filename):
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["cache-control"] = REVALIDATE_CACHE_CONTROL
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _compressed_response(
+        self,
+        path: str,
+        stat_result: os.stat_result,
+        encoding: str,
+        identity: Response,
+    ) -> Optional[Response]:
+        """Get a compressed variant of a file, or None if not available."""
+        base_etag = identity.headers["etag"].strip('"')
+        headers = {
+            "etag": f'"{base_etag}-{encoding}"',
+            "last-modified": identity.headers["last-modified"],
+            "content-encoding": encoding,
+        }
+        media_type = identity.media_type
+
+        # Build-time sibling (.br/.gz) that is at least as new as the source
+        sibling = path + ENCODING_SUFFIXES[encoding]
+        try:
+            sibling_stat = os.stat(sibling)
+        except OSError:
+            sibling_stat = None
+        if sibling_stat is not None and sibling_stat.st_mtime >= stat_result.st_mtime:
+            response = FileResponse(sibling, stat_result=sibling_stat, media_type=media_type)
+            response.headers.update(headers)
+            return response
+
+        if encoding not in available_encodings():
+            return None
+
+        key = (path, stat_result.st_mtime_ns, stat_result.st_size, encoding)
+        with self._memory_lock:
+            body = self._memory_cache.get(key)
+            if body is not None:
+                self._memory_cache.move_to_end(key)
+                return Response(body, media_type=media_type, headers=headers)
+
+        return _CompressOnSendResponse(
+            partial(self._memory_variant, key), identity, media_type, headers
+        )
+
+    def _memory_variant(self, key: Tuple[str, int, int, str]) -> Optional[bytes]:
+        """Compress a file (first request) and keep the result in memory.
+
+        Runs in a worker thread; see _CompressOnSendResponse.
+        """
+        path, _, _, encoding = key
+        with open(path, "rb") as f:
+            data = f.read()
+        body = compress_bytes(data, encoding)
+        if len(body) >= len(data):
+            return None
+
+        with self._memory_lock:
+            if key in self._memory_cache:  # compressed concurrently by another request
+                return self._memory_cache[key]
+            self._memory_cache[key] = body
+            self._memory_cache_bytes += len(body)
+            while self._memory_cache_bytes > MAX_MEMORY_CACHE_BYTES and self._memory_cache:
+                _, evicted = self._memory_cache.popitem(last=False)
+                self._memory_cache_bytes -= len(evicted)
+        return body
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Precompress a frontend build directory (build-time entry point).
+
+    Args:
+        argv: Command line arguments (directory to compress)
+
+    Returns:
+        Process exit code
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1 or not Path(args[0]).is_dir():
+        print("Usage: python -m gao_dev.web.static_assets <frontend-dist-dir>")
+        return 2
+    written = precompress_directory(Path(args[0]))
+    print(f"Precompressed {written} files in {args[0]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,12 @@ rm -rf build/ dist/ *.egg-info
 echo "Installing build dependencies..."
 pip install --upgrade pip build setuptools-scm
 
+# Precompress frontend assets (served with Content-Encoding negotiation)
+if [ -d gao_dev/web/frontend/dist ]; then
+    echo "Precompressing frontend assets..."
+    python -m gao_dev.web.static_assets gao_dev/web/frontend/dist
+fi
+
 # Build package
 echo "Building package..."
 python -m build
@@ -0,0 +1,231 @@
+"""Tests for the gao-dev daemon and the forwarding client."""
+
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from gao_dev.cli import daemon
+from gao_dev.cli.daemon import DaemonServer, forward, ping, should_forward, stop
+
+pytestmark = pytest.mark.skipif(not daemon.is_supported(), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (AF_UNIX paths are limited to ~100 bytes)."""
+    with tempfile.TemporaryDirectory(prefix="gd-") as tmp:
+        yield Path(tmp) / "daemon" / "d.sock"
+
+
+@pytest.fixture
+def server(socket_path):
+    """Daemon serving from a background thread."""
+    server = DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def test_forward_runs_command_in_daemon(server, socket_path):
+    """Output and exit code of the command come back to the client."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    exit_code = forward(["--version"], path=socket_path, stdout=stdout, stderr=stderr)
+
+    assert exit_code == 0
+    assert "1.0.0" in stdout.getvalue()
+    assert server.commands_run == 1
+
+
+def test_forward_reports_errors_and_exit_code(server, socket_path):
+    """Usage errors are written to the client's stderr with click's exit code."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    exit_code = forward(["no-such-command"], path=socket_path, stdout=stdout, stderr=stderr)
+
+    assert exit_code == 2
+    assert "No such command" in stderr.getvalue()
+
+
+def test_forward_uses_client_cwd_and_env(server, socket_path, tmp_path, monkeypatch):
+    """Commands see the client's working directory and environment, not the daemon's."""
+    import click
+
+    from gao_dev.cli.commands import cli
+
+    @cli.command("test-daemon-probe")
+    def probe():
+        click.echo(f"{os.getcwd()}|{os.environ.get('GAO_DEV_DAEMON_PROBE')}")
+
+    try:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GAO_DEV_DAEMON_PROBE", "client")
+        stdout = io.StringIO()
+
+        forward(["test-daemon-probe"], path=socket_path, stdout=stdout, stderr=io.StringIO())
+    finally:
+        del cli.commands["test-daemon-probe"]
+
+    assert stdout.getvalue().strip() == f"{tmp_path}|client"
+
+
+def test_forward_without_daemon_returns_none(socket_path):
+    """With no daemon the caller runs the command in-process."""
+    assert forward(["--version"], path=socket_path) is None
+    assert ping(socket_path) is None
+    assert stop(socket_path) is False
+
+
+def test_version_mismatch_is_declined(server, socket_path):
+    """A daemon of another version does not run the client's command."""
+    response = daemon._request(
+        socket_path,
+        {"op": "run", "version": "0.0.0-other", "argv": ["--version"], "cwd": "/", "env": {}},
+        timeout=5,
+    )
+
+    assert response["ok"] is False
+    assert response["declined"] is True
+    assert "version mismatch" in response["error"]
+    assert server.commands_run == 0
+
+
+def test_busy_daemon_declines(server, socket_path, monkeypatch):
+    """A command that cannot start promptly is handed back to the client."""
+    monkeypatch.setattr(daemon, "RUN_LOCK_TIMEOUT_SECONDS", 0.05)
+    server._run_lock.acquire()
+    try:
+        exit_code = forward(["--version"], path=socket_path, stdout=io.StringIO())
+    finally:
+        server._run_lock.release()
+
+    assert exit_code is None
+    assert server.commands_run == 0
+
+
+def _serve_once(socket_path, reply):
+    """Accept one connection, read the request and answer with reply bytes."""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+
+    def accept():
+        conn, _ = listener.accept()
+        with conn, conn.makefile("rwb") as stream:
+            stream.readline()
+            stream.write(reply)
+        listener.close()
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_connection_lost_after_send_is_an_error(socket_path):
+    """Once the request was sent the command is not re-run in-process."""
+    thread = _serve_once(socket_path, b"")
+    stderr = io.StringIO()
+
+    exit_code = forward(["--version"], path=socket_path, stdout=io.StringIO(), stderr=stderr)
+    thread.join(timeout=5)
+
+    assert exit_code == 1
+    assert "Lost connection" in stderr.getvalue()
+
+
+def test_daemon_failure_is_reported(socket_path):
+    """A failure the daemon did not mark as declined is reported, not retried."""
+    thread = _serve_once(socket_path, json.dumps({"ok": False, "error": "boom"}).encode() + b"\n")
+    stderr = io.StringIO()
+
+    exit_code = forward(["--version"], path=socket_path, stdout=io.StringIO(), stderr=stderr)
+    thread.join(timeout=5)
+
+    assert exit_code == 1
+    assert "boom" in stderr.getvalue()
+
+
+def test_ping_and_stop(server, socket_path):
+    """Ping reports the daemon; stop shuts it down and removes the socket."""
+    info = ping(socket_path)
+
+    assert info["pid"] == os.getpid()
+    assert info["version"] == "1.0.0"
+    assert stop(socket_path) is True
+
+    server.server_close()
+    assert not socket_path.exists()
+
+
+def test_second_daemon_on_same_socket_is_refused(server, socket_path):
+    """Starting a daemon over a live one fails instead of stealing its socket."""
+    with pytest.raises(RuntimeError, match="already running"):
+        DaemonServer(socket_path)
+
+
+def test_stale_socket_is_replaced(socket_path):
+    """A socket file left by a dead daemon does not block a new one."""
+    first = DaemonServer(socket_path)
+    first.socket.close()  # dies without removing its socket file
+    assert socket_path.exists()
+
+    second = DaemonServer(socket_path)
+    second.server_close()
+
+
+class TestShouldForward:
+    """Tests for the forwarding decision."""
+
+    @pytest.fixture(autouse=True)
+    def non_interactive(self, monkeypatch):
+        with open(os.devnull) as devnull:
+            monkeypatch.setattr("sys.stdin", devnull)
+            monkeypatch.delenv("GAO_DEV_DAEMON", raising=False)
+            yield
+
+    def test_scripted_command_is_forwarded(self):
+        assert should_forward(["lifecycle", "list"])
+
+    @pytest.mark.parametrize("argv", [["start"], ["chat"], ["daemon", "stop"], ["--quiet", "web", "start"]])
+    def test_local_only_commands_run_in_process(self, argv):
+        assert not should_forward(argv)
+
+    def test_disabled_by_environment(self, monkeypatch):
+        monkeypatch.setenv("GAO_DEV_DAEMON", "0")
+
+        assert not should_forward(["lifecycle", "list"])
+
+    def test_terminal_stdin_runs_in_process(self, monkeypatch):
+        class Tty(io.StringIO):
+            def isatty(self):
+                return True
+
+        monkeypatch.setattr("sys.stdin", Tty())
+
+        assert not should_forward(["lifecycle", "list"])
+
+    def test_piped_stdin_runs_in_process(self, monkeypatch):
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            monkeypatch.setattr("sys.stdin", pipe)
+
+            assert not should_forward(["sandbox", "delete", "demo"])
+
+    def test_file_stdin_runs_in_process(self, monkeypatch, tmp_path):
+        answers = tmp_path / "answers.txt"
+        answers.write_text("y\n")
+        with open(answers) as stdin:
+            monkeypatch.setattr("sys.stdin", stdin)
+
+            assert not should_forward(["sandbox", "delete", "demo"])
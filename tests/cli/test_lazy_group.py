@@ -0,0 +1,58 @@
+"""Tests for LazyGroup and the lazily registered gao-dev subcommands."""
+
+import click
+from click.testing import CliRunner
+
+from gao_dev.cli.commands import LAZY_SUBCOMMANDS, cli
+from gao_dev.cli.lazy_group import LazyGroup
+
+
+def test_every_lazy_subcommand_resolves():
+    """Each registered import path points at a click command of that name."""
+    ctx = click.Context(cli)
+    for name in LAZY_SUBCOMMANDS:
+        command = cli.get_command(ctx, name)
+        assert isinstance(command, click.Command), name
+
+    assert set(LAZY_SUBCOMMANDS) <= set(cli.list_commands(ctx))
+
+
+def test_lazy_command_is_imported_on_first_use():
+    """A lazy command is imported once and then cached as a regular command."""
+
+    @click.group(
+        cls=LazyGroup, lazy_subcommands={"lazy": "gao_dev.cli.unlock_command:unlock"}
+    )
+    def group():
+        pass
+
+    @group.command()
+    def eager():
+        """Eager command."""
+
+    assert group.list_commands(click.Context(group)) == ["eager", "lazy"]
+
+    result = CliRunner().invoke(group, ["lazy", "--help"])
+
+    assert result.exit_code == 0
+    assert "lazy" in group.commands
+    assert group.lazy_subcommands == {}
+
+
+def test_lazy_target_must_be_a_command():
+    """Import paths that are not click commands fail loudly."""
+
+    @click.group(cls=LazyGroup, lazy_subcommands={"bad": "click.testing:CliRunner"})
+    def group():
+        pass
+
+    result = CliRunner().invoke(group, ["bad"])
+
+    assert isinstance(result.exception, TypeError)
+
+
+def test_version_runs_without_loading_subcommands():
+    result = CliRunner().invoke(cli, ["--version"])
+
+    assert result.exit_code == 0
+    assert "1.0.0" in result.output
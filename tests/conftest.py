@@ -34,6 +34,12 @@ from tests.mocks import (
 # File System Fixtures
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def isolated_user_cache(tmp_path_factory, monkeypatch):
+    """Keep per-user caches (e.g. the catalog cache) out of the real home directory."""
+    monkeypatch.setenv("GAO_DEV_CACHE_DIR", str(tmp_path_factory.mktemp("user-cache")))
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """
@@ -1,10 +1,19 @@
 """Tests for provider health checker."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime, timedelta
 
-from gao_dev.core.providers.health_check import ProviderHealthChecker
+from gao_dev.core.providers.health_check import (
+    CircuitBreaker,
+    CircuitState,
+    ProviderHealthChecker,
+    ProviderHealthProber,
+)
+from gao_dev.core.providers.selection import AutoDetectStrategy
 
 
 class TestProviderHealthChecker:
@@ -130,3 +139,156 @@ class TestProviderHealthChecker:
         checker.clear_cache()
 
         assert checker._health_cache == {}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProvider:
+    """Provider stand-in whose probe outcome is scripted."""
+
+    def __init__(self, name, healthy=True, delay=0.0):
+        self.name = name
+        self.healthy = healthy
+        self.delay = delay
+
+    async def validate_configuration(self):
+        await asyncio.sleep(self.delay)
+        if isinstance(self.healthy, Exception):
+            raise self.healthy
+        return self.healthy
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state machine."""
+
+    def test_opens_after_threshold(self):
+        """Consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=FakeClock())
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+    def test_half_open_admits_single_trial(self):
+        """After the timeout one trial is admitted; success closes the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """A failed half-open trial re-opens the circuit for another timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        clock.now = 15
+        assert breaker.state is CircuitState.OPEN
+
+
+class TestHealthProbing:
+    """Test probing, circuit-aware health and failover."""
+
+    def test_open_circuit_is_unhealthy(self):
+        """is_healthy reports an open circuit even on a cache miss."""
+        checker = ProviderHealthChecker(failure_threshold=2, cache_duration=0)
+
+        checker.record_result("claude-code", False, error="boom")
+        checker.record_result("claude-code", False, error="boom")
+
+        assert checker.is_healthy("claude-code") is False
+        assert checker.get_health_snapshot()["claude-code"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_probe_records_latency_and_errors(self):
+        """Probe rounds feed error rate, latency and circuit state."""
+        checker = ProviderHealthChecker(failure_threshold=1, probe_timeout=0.05)
+        prober = ProviderHealthProber(
+            checker,
+            [
+                FakeProvider("fast"),
+                FakeProvider("slow", delay=1.0),
+                FakeProvider("broken", healthy=RuntimeError("down")),
+            ],
+        )
+
+        results = await prober.probe_once()
+        snapshot = checker.get_health_snapshot()
+
+        assert results == {"fast": True, "slow": False, "broken": False}
+        assert snapshot["fast"]["avg_latency_ms"] is not None
+        assert snapshot["slow"]["last_error"].startswith("probe timed out")
+        assert snapshot["broken"]["error_rate"] == 1.0
+        assert checker.circuit_state("broken") is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_successful_probe_does_not_close_open_circuit(self):
+        """Only a real task closes a circuit opened by task failures."""
+        clock = FakeClock()
+        checker = ProviderHealthChecker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        prober = ProviderHealthProber(checker, [FakeProvider("claude-code")])
+        checker.record_result("claude-code", False, error="task failed")
+
+        assert (await prober.probe_once()) == {"claude-code": True}
+        assert checker.circuit_state("claude-code") is CircuitState.OPEN
+        assert checker.is_healthy("claude-code") is False
+        assert checker.get_health_snapshot()["claude-code"]["error_rate"] == 0.5
+
+        clock.now = 10
+        await prober.probe_once()
+        assert checker.circuit_state("claude-code") is CircuitState.HALF_OPEN
+
+        assert checker.allow_request("claude-code") is True
+        checker.record_result("claude-code", True)
+        assert checker.circuit_state("claude-code") is CircuitState.CLOSED
+
+    def test_background_prober(self):
+        """The prober thread runs a round as soon as it starts."""
+        checker = ProviderHealthChecker(failure_threshold=1)
+        prober = ProviderHealthProber(checker, [FakeProvider("dead", healthy=False)], interval=60)
+
+        prober.start()
+        try:
+            for _ in range(100):
+                if checker.get_health_snapshot():
+                    break
+                time.sleep(0.01)
+        finally:
+            prober.stop(timeout=5)
+
+        assert not prober.is_running()
+        assert checker.is_healthy("dead") is False
+
+    def test_auto_detect_fails_over(self):
+        """AutoDetectStrategy skips providers with an open circuit."""
+        checker = ProviderHealthChecker(failure_threshold=1)
+        checker.record_result("claude-code", False)
+        primary, backup = Mock(), Mock()
+        primary.name, backup.name = "claude-code", "opencode"
+        strategy = AutoDetectStrategy(["claude-code", "opencode"], health_checker=checker)
+
+        assert strategy.select_provider([primary, backup], "sonnet-4.5") is backup
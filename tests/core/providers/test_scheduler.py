@@ -0,0 +1,201 @@
+"""Tests for the global LLM request scheduler."""
+
+import asyncio
+
+import pytest
+
+from gao_dev.core.providers.scheduler import (
+    LLMScheduler,
+    ProviderLimits,
+    RequestCancelledError,
+    RequestPriority,
+    TokenBucket,
+    priority_scope,
+)
+
+UNLIMITED_RATE = dict(requests_per_minute=None, burst=1)
+
+
+class EchoProvider:
+    """Minimal provider stand-in that records concurrency."""
+
+    name = "echo"
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def execute_task(self, task, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            yield task
+        finally:
+            self.active -= 1
+
+
+async def hold_slot(scheduler, order, label, priority=None, release=None):
+    async with scheduler.slot("echo", priority):
+        order.append(label)
+        if release is not None:
+            await release.wait()
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_delay(self):
+        """A full bucket allows `capacity` requests, then asks callers to wait."""
+        bucket = TokenBucket(rate_per_second=1.0, capacity=2)
+
+        for _ in range(2):
+            assert bucket.delay() == 0.0
+            bucket.consume()
+
+        assert 0.9 < bucket.delay() <= 1.0
+
+    def test_unlimited(self):
+        """No rate means no delay."""
+        bucket = TokenBucket(rate_per_second=None, capacity=1)
+        bucket.consume()
+
+        assert bucket.delay() == 0.0
+
+
+class TestLLMScheduler:
+    """Tests for LLMScheduler admission."""
+
+    async def test_max_in_flight(self):
+        """No more than max_in_flight requests run at once."""
+        scheduler = LLMScheduler(ProviderLimits(max_in_flight=2, **UNLIMITED_RATE))
+        provider = EchoProvider()
+
+        async def run(i):
+            return [m async for m in scheduler.stream(provider, task=f"t{i}")]
+
+        results = await asyncio.gather(*(run(i) for i in range(6)))
+
+        assert results == [[f"t{i}"] for i in range(6)]
+        assert provider.peak == 2
+        stats = scheduler.get_stats()["echo"]
+        assert (stats["admitted"], stats["completed"], stats["in_flight"]) == (6, 6, 0)
+
+    async def test_priority_order(self):
+        """Queued interactive requests are admitted before workflow and background."""
+        scheduler = LLMScheduler(ProviderLimits(max_in_flight=1, **UNLIMITED_RATE))
+        order = []
+        release = asyncio.Event()
+
+        blocker = asyncio.create_task(hold_slot(scheduler, order, "blocker", release=release))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(hold_slot(scheduler, order, "background", RequestPriority.BACKGROUND)),
+            asyncio.create_task(hold_slot(scheduler, order, "workflow", RequestPriority.WORKFLOW)),
+            asyncio.create_task(hold_slot(scheduler, order, "interactive", RequestPriority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(blocker, *waiters)
+
+        assert order == ["blocker", "interactive", "workflow", "background"]
+        assert scheduler.get_stats()["echo"]["admitted_by_priority"]["INTERACTIVE"] == 1
+
+    async def test_priority_scope(self):
+        """Requests without an explicit priority take the scope's priority."""
+        scheduler = LLMScheduler(ProviderLimits(**UNLIMITED_RATE))
+
+        with priority_scope(RequestPriority.BACKGROUND):
+            await hold_slot(scheduler, [], "scoped")
+
+        assert scheduler.get_stats()["echo"]["admitted_by_priority"] == {"BACKGROUND": 1}
+
+    async def test_rate_limit(self):
+        """Requests beyond the burst wait for the bucket to refill."""
+        scheduler = LLMScheduler(ProviderLimits(max_in_flight=10, requests_per_minute=600, burst=1))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        await asyncio.gather(*(hold_slot(scheduler, [], i) for i in range(3)))
+
+        # 600/min = one token every 0.1s after the first
+        assert loop.time() - started >= 0.18
+        assert scheduler.get_stats()["echo"]["max_queue_seconds"] >= 0.18
+
+    async def test_task_cancellation_frees_queue_entry(self):
+        """Cancelling a queued task removes it without consuming a slot."""
+        scheduler = LLMScheduler(ProviderLimits(max_in_flight=1, **UNLIMITED_RATE))
+        order = []
+        release = asyncio.Event()
+
+        blocker = asyncio.create_task(hold_slot(scheduler, order, "blocker", release=release))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(hold_slot(scheduler, order, "cancelled"))
+        await asyncio.sleep(0)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await blocker
+        await hold_slot(scheduler, order, "after")
+
+        assert order == ["blocker", "after"]
+        stats = scheduler.get_stats()["echo"]
+        assert (stats["cancelled"], stats["in_flight"], stats["queued"]) == (1, 0, 0)
+
+    async def test_cancel_queued(self):
+        """cancel_queued fails matching waiters and leaves others queued."""
+        scheduler = LLMScheduler(ProviderLimits(max_in_flight=1, **UNLIMITED_RATE))
+        order = []
+        release = asyncio.Event()
+
+        blocker = asyncio.create_task(hold_slot(scheduler, order, "blocker", release=release))
+        await asyncio.sleep(0)
+        background = asyncio.create_task(
+            hold_slot(scheduler, order, "background", RequestPriority.BACKGROUND)
+        )
+        workflow = asyncio.create_task(hold_slot(scheduler, order, "workflow"))
+        await asyncio.sleep(0)
+
+        assert scheduler.cancel_queued(priority=RequestPriority.BACKGROUND) == 1
+        with pytest.raises(RequestCancelledError):
+            await background
+        release.set()
+        await asyncio.gather(blocker, workflow)
+
+        assert order == ["blocker", "workflow"]
+
+    async def test_configure_from_dict(self):
+        """Config blocks set default and per-provider limits."""
+        scheduler = LLMScheduler()
+        scheduler.configure_from_dict({
+            "default": {"max_in_flight": 3},
+            "echo": {"max_in_flight": 1, "requests_per_minute": None},
+        })
+        provider = EchoProvider()
+
+        async def run():
+            return [m async for m in scheduler.stream(provider, task="x")]
+
+        await asyncio.gather(run(), run(), run())
+
+        assert scheduler.default_limits.max_in_flight == 3
+        assert provider.peak == 1
+
+    async def test_reconfigure_with_same_limits_keeps_bucket(self):
+        """Re-applying unchanged config does not refill the token bucket."""
+        scheduler = LLMScheduler()
+        config = {"echo": {"requests_per_minute": 60, "burst": 1}}
+        scheduler.configure_from_dict(config)
+        provider = EchoProvider()
+        [m async for m in scheduler.stream(provider, task="x")]
+        bucket = scheduler._states["echo"].bucket
+
+        scheduler.configure_from_dict(config)
+
+        assert scheduler._states["echo"].bucket is bucket
+        assert bucket.delay() > 0
+
+        scheduler.configure_from_dict({"echo": {"requests_per_minute": 60, "burst": 2}})
+
+        assert scheduler._states["echo"].bucket is not bucket
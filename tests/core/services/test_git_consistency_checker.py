@@ -10,6 +10,7 @@ import tempfile
 from pathlib import Path
 import importlib.util
 import sys
+from unittest.mock import patch
 
 import pytest
 
@@ -536,3 +537,177 @@ def test_context_manager(temp_project):
         assert report is not None
 
     # Connections should be closed after context exit
+
+
+def test_self_healing_adds_epic_feature_index(temp_project):
+    """Test a database that applied Migration 005 earlier gets Migration 008."""
+    def feature_index_exists():
+        with sqlite3.connect(str(temp_project["db_path"])) as conn:
+            return conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_epic_state_feature'"
+            ).fetchone() is not None
+
+    assert not feature_index_exists()
+
+    GitAwareConsistencyChecker(
+        db_path=temp_project["db_path"],
+        project_path=temp_project["project_path"]
+    ).close()
+
+    assert feature_index_exists()
+
+
+# ============================================================================
+# INCREMENTAL CHECK TESTS
+# ============================================================================
+
+
+def _make_checker(temp_project):
+    return GitAwareConsistencyChecker(
+        db_path=temp_project["db_path"],
+        project_path=temp_project["project_path"]
+    )
+
+
+def test_first_check_is_full_scan_and_saves_watermark(temp_project):
+    """Test clean full scan records HEAD as the watermark."""
+    checker = _make_checker(temp_project)
+    assert checker.get_watermark() is None
+
+    report = checker.check_consistency()
+
+    assert report.full_scan is True
+    watermark = checker.get_watermark()
+    assert watermark["commit_sha"] == temp_project["git"].get_head_sha(short=False)
+    checker.close()
+
+
+def test_incremental_check_skips_unchanged_files(temp_project):
+    """Test second check only examines files changed since the watermark."""
+    checker = _make_checker(temp_project)
+    checker.check_consistency()
+
+    with patch.object(
+        GitManager, "get_last_commits_for_files", wraps=checker.git_manager.get_last_commits_for_files
+    ) as batch_log, patch.object(GitManager, "get_last_commit_for_file") as single_log:
+        report = checker.check_consistency()
+
+    assert report.full_scan is False
+    assert report.since_commit == temp_project["git"].get_head_sha(short=False)
+    assert report.has_issues is False
+    batch_log.assert_not_called()
+    single_log.assert_not_called()
+    checker.close()
+
+
+def test_incremental_check_detects_committed_change(temp_project):
+    """Test state mismatch in a file committed after the watermark."""
+    checker = _make_checker(temp_project)
+    checker.check_consistency()
+
+    temp_project["story1_file"].write_text("# Story 1.1: Login (Done)\n", encoding="utf-8")
+    temp_project["git"].add_all()
+    temp_project["git"].commit("feat(story-1.1): complete login implementation")
+
+    with patch.object(
+        GitManager, "get_last_commits_for_files", wraps=checker.git_manager.get_last_commits_for_files
+    ) as batch_log:
+        report = checker.check_consistency()
+
+    assert report.full_scan is False
+    assert len(report.state_mismatches) == 1
+    assert report.state_mismatches[0].story_num == 1
+    assert report.state_mismatches[0].git_state == "completed"
+    # Only the changed story is looked up, in one batch
+    batch_log.assert_called_once()
+    assert batch_log.call_args[0][0] == [temp_project["story1_file"]]
+    checker.close()
+
+
+def test_incremental_check_detects_deleted_and_new_files(temp_project):
+    """Test orphaned and unregistered files since the watermark are found."""
+    checker = _make_checker(temp_project)
+    checker.check_consistency()
+
+    temp_project["story2_file"].unlink()
+    temp_project["git"].add_all()
+    temp_project["git"].commit("docs: remove story 1.2")
+    new_story = temp_project["project_path"] / "docs" / "stories" / "story-1.3.md"
+    new_story.write_text("# Story 1.3: JWT\n", encoding="utf-8")
+
+    report = checker.check_consistency()
+
+    assert report.full_scan is False
+    assert [(i.epic_num, i.story_num) for i in report.orphaned_records] == [(1, 2)]
+    assert [(i.epic_num, i.story_num) for i in report.unregistered_files] == [(1, 3)]
+    checker.close()
+
+
+def test_incremental_check_detects_database_change(temp_project):
+    """Test records updated in the database after the watermark are re-examined."""
+    checker = _make_checker(temp_project)
+    checker.check_consistency()
+
+    checker.coordinator.story_service.transition(
+        epic_num=1, story_num=2, new_status="in_progress"
+    )
+
+    report = checker.check_consistency()
+
+    assert report.full_scan is False
+    assert [(i.story_num, i.db_state) for i in report.state_mismatches] == [(2, "in_progress")]
+    checker.close()
+
+
+def test_watermark_not_advanced_when_issues_found(temp_project):
+    """Test watermark stays put until the database is consistent again."""
+    checker = _make_checker(temp_project)
+    checker.check_consistency()
+    watermark = checker.get_watermark()
+
+    temp_project["story1_file"].unlink()
+    temp_project["git"].add_all()
+    temp_project["git"].commit("docs: remove story 1.1")
+
+    checker.check_consistency()
+    assert checker.get_watermark() == watermark
+
+    report = checker.check_consistency()
+    assert len(report.orphaned_records) == 1
+    checker.close()
+
+
+def test_unreachable_watermark_falls_back_to_full_scan(temp_project):
+    """Test unknown watermark commit triggers a full scan."""
+    checker = _make_checker(temp_project)
+    checker._save_watermark("0" * 40, "2000-01-01T00:00:00")
+
+    report = checker.check_consistency()
+
+    assert report.full_scan is True
+    assert checker.get_watermark()["commit_sha"] != "0" * 40
+    checker.close()
+
+
+def test_full_scan_ignores_watermark(temp_project):
+    """Test full_scan=True examines every record."""
+    checker = _make_checker(temp_project)
+    checker.check_consistency()
+
+    report = checker.check_consistency(full_scan=True)
+
+    assert report.full_scan is True
+    assert report.since_commit is None
+    checker.close()
+
+
+def test_reset_watermark(temp_project):
+    """Test reset_watermark forces the next check to be a full scan."""
+    checker = _make_checker(temp_project)
+    checker.check_consistency()
+
+    checker.reset_watermark()
+
+    assert checker.get_watermark() is None
+    assert checker.check_consistency().full_scan is True
+    checker.close()
@@ -15,17 +15,21 @@ Story: 29.2 - LearningApplicationService
 
 import json
 import math
+import random
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from gao_dev.core.services.learning_application_service import (
     LearningApplicationService,
     ScoredLearning,
 )
+from gao_dev.core.services.learning_relevance_index import LearningRelevanceIndex
 from gao_dev.methodologies.adaptive_agile.scale_levels import ScaleLevel
 
 
@@ -918,3 +922,177 @@ def test_record_application_database_rollback_on_error(
     conn.close()
 
     assert count == 0, "Failed transaction should rollback"
+
+
+# Vectorized Relevance Index Tests
+
+
+def _insert_learnings(db_path: Path, rows: list[tuple]) -> None:
+    """Insert (topic, category, relevance, success, confidence, indexed_at, metadata, tags) rows."""
+    conn = sqlite3.connect(str(db_path))
+    conn.executemany(
+        """
+        INSERT INTO learning_index (
+            topic, category, learning, relevance_score, success_rate,
+            confidence_score, indexed_at, metadata, tags
+        ) VALUES (?, ?, 'Learning', ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_vectorized_scores_match_scalar_formula(
+    service: LearningApplicationService, db_path: Path
+):
+    """Test index scores equal _calculate_relevance_score for varied learnings."""
+    rng = random.Random(29)
+    categories = ["quality", "technical", "process", "team", "tooling"]
+    phases = [None, "", "implementation", "planning", "any", "all_phases"]
+    project_types = [None, "web_app", "cli", "any", "general"]
+    tag_pool = ["react", "typescript", "python", "api", "db", "auth"]
+
+    rows = []
+    for i in range(200):
+        metadata = {}
+        if rng.random() < 0.8:
+            metadata["scale_level"] = rng.randint(0, 4)
+        metadata["project_type"] = rng.choice(project_types)
+        metadata["phase"] = rng.choice(phases)
+        rows.append((
+            f"Topic {i}",
+            rng.choice(categories),
+            rng.random(),
+            rng.random(),
+            rng.random(),
+            (datetime.now() - timedelta(days=rng.randint(0, 800))).isoformat(),
+            json.dumps(metadata),
+            json.dumps(rng.sample(tag_pool, rng.randint(0, 3))),
+        ))
+    _insert_learnings(db_path, rows)
+
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    learnings = {row["id"]: dict(row) for row in conn.execute("SELECT * FROM learning_index")}
+    index = LearningRelevanceIndex()
+    index.refresh(conn)
+    conn.close()
+
+    contexts = [
+        {},
+        {"tags": ["react", "api", "unknown"]},
+        {"tags": ["python"], "phase": "implementation"},
+        {"phase": "any"},
+    ]
+    for scale_level in [ScaleLevel.LEVEL_0_CHORE, ScaleLevel.LEVEL_3_MEDIUM_FEATURE]:
+        for context in contexts:
+            ids, scores = index.score(scale_level, "web_app", context)
+            for learning_id, score in zip(ids, scores):
+                expected = service._calculate_relevance_score(
+                    learnings[int(learning_id)], scale_level, "web_app", context
+                )
+                assert score == pytest.approx(expected, abs=1e-12)
+
+
+def test_get_relevant_learnings_considers_all_candidates(
+    service: LearningApplicationService, db_path: Path
+):
+    """Test the best learning is found even beyond the first 50 rows."""
+    now = datetime.now().isoformat()
+    weak = [
+        (f"Weak {i}", "technical", 0.3, 0.5, 0.5, now, "{}", "[]") for i in range(120)
+    ]
+    strong = [(
+        "Strong", "quality", 1.0, 1.0, 1.0, now,
+        json.dumps({"scale_level": 3, "project_type": "web_app", "phase": "implementation"}),
+        json.dumps(["react"]),
+    )]
+    _insert_learnings(db_path, weak + strong)
+
+    learnings = service.get_relevant_learnings(
+        scale_level=ScaleLevel.LEVEL_3_MEDIUM_FEATURE,
+        project_type="web_app",
+        context={"tags": ["react"], "phase": "implementation"},
+        limit=3,
+    )
+
+    assert learnings[0].topic == "Strong"
+    assert learnings[0].metadata["project_type"] == "web_app"
+    assert learnings[0].tags == ["react"]
+    # Ties among the weak learnings keep id order
+    assert [sl.topic for sl in learnings[1:]] == ["Weak 0", "Weak 1"]
+
+
+def test_index_refreshes_only_when_database_changes(
+    service: LearningApplicationService, sample_learnings: list[int], db_path: Path
+):
+    """Test index is reused until another connection commits."""
+    args = (ScaleLevel.LEVEL_3_MEDIUM_FEATURE, "web_app", {"tags": ["react"]})
+
+    with patch.object(
+        LearningRelevanceIndex, "refresh", autospec=True, side_effect=LearningRelevanceIndex.refresh
+    ) as refresh:
+        service.get_relevant_learnings(*args, limit=10)
+        service.get_relevant_learnings(*args, limit=10)
+        assert refresh.call_count == 1
+
+        _insert_learnings(db_path, [(
+            "New", "quality", 1.0, 1.0, 1.0, datetime.now().isoformat(),
+            json.dumps({"scale_level": 3, "project_type": "web_app"}), json.dumps(["react"]),
+        )])
+        learnings = service.get_relevant_learnings(*args, limit=10)
+
+    assert refresh.call_count == 2
+    assert "New" in [sl.topic for sl in learnings]
+
+
+def test_index_reparses_only_changed_rows(db_path: Path, sample_learnings: list[int]):
+    """Test refresh only parses metadata/tags of new or modified rows."""
+    conn = sqlite3.connect(str(db_path))
+    index = LearningRelevanceIndex()
+
+    assert index.refresh(conn) == len(index)
+    assert index.refresh(conn) == 0
+
+    conn.execute(
+        "UPDATE learning_index SET tags = ? WHERE id = ?",
+        (json.dumps(["python"]), sample_learnings[0]),
+    )
+    conn.execute("UPDATE learning_index SET success_rate = 0.1 WHERE id = ?", (sample_learnings[1],))
+    conn.commit()
+
+    assert index.refresh(conn) == 1
+    conn.close()
+
+
+def test_record_application_updates_index(
+    service: LearningApplicationService, db_path: Path
+):
+    """Test own writes are reflected in scores without a refresh."""
+    _insert_learnings(db_path, [
+        ("Only", "technical", 0.5, 1.0, 0.5, datetime.now().isoformat(), "{}", "[]"),
+    ])
+    args = (ScaleLevel.LEVEL_3_MEDIUM_FEATURE, "web_app", {})
+    before = service.get_relevant_learnings(*args)[0]
+
+    service.record_application(before.learning_id, epic_num=29, story_num=1,
+                               outcome="failure", context="Test")
+    after = service.get_relevant_learnings(*args)[0]
+
+    # success_rate 1.0 -> 0.0, confidence 0.5 -> 0.0
+    assert after.relevance_score == pytest.approx(before.relevance_score - 0.20 - 0.10)
+
+
+def test_top_k_stable_ties_and_threshold():
+    """Test top_k orders by score, then position, and drops low scores."""
+    ids = np.array([10, 11, 12, 13, 14])
+    scores = np.array([0.5, 0.9, 0.5, 0.1, 0.5])
+
+    assert LearningRelevanceIndex.top_k(ids, scores, k=3, threshold=0.2) == [
+        (11, 0.9), (10, 0.5), (12, 0.5)
+    ]
+    assert LearningRelevanceIndex.top_k(ids, scores, k=10, threshold=0.2) == [
+        (11, 0.9), (10, 0.5), (12, 0.5), (14, 0.5)
+    ]
+    assert LearningRelevanceIndex.top_k(ids, scores, k=0, threshold=0.2) == []
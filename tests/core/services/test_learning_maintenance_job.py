@@ -341,6 +341,114 @@ def test_supersede_outdated_learnings(test_db):
     conn.close()
 
 
+def insert_learnings(db_path, rows):
+    """Insert (category, confidence, days_old) learnings; returns their ids."""
+    conn = sqlite3.connect(str(db_path))
+    now = datetime.now()
+    ids = []
+    for category, confidence, days_old in rows:
+        cursor = conn.execute(
+            """
+            INSERT INTO learning_index (
+                topic, category, learning, confidence_score,
+                indexed_at, created_at, status
+            )
+            VALUES ('Topic', ?, 'Content', ?, ?, ?, 'active')
+            """,
+            (category, confidence, (now - timedelta(days=days_old)).isoformat(), now.isoformat()),
+        )
+        ids.append(cursor.lastrowid)
+    conn.commit()
+    conn.close()
+    return ids
+
+
+def superseded_by(db_path):
+    """Map of superseded learning id to its replacement."""
+    conn = sqlite3.connect(str(db_path))
+    rows = conn.execute(
+        "SELECT id, superseded_by FROM learning_index WHERE status = 'superseded'"
+    ).fetchall()
+    conn.close()
+    return dict(rows)
+
+
+def test_supersede_points_at_strongest_newer_learning(test_db):
+    """The sweep supersedes each outperformed learning once, by the best newer one."""
+    best, middle, weak, close = insert_learnings(
+        test_db,
+        [
+            ("quality", 0.9, 10),
+            ("quality", 0.6, 20),  # beaten by best
+            ("quality", 0.3, 30),  # beaten by best and middle
+            ("quality", 0.75, 40),  # within margin of best
+        ],
+    )
+
+    job = LearningMaintenanceJob(db_path=test_db)
+    with job._get_connection() as conn:
+        superseded = job._supersede_outdated_learnings(conn, verbose=False)
+
+    assert superseded == 2
+    assert superseded_by(test_db) == {middle: best, weak: best}
+
+
+def test_dry_run_supersede_count_is_exact(test_db):
+    """Dry run reports the same supersession count a real run applies."""
+    insert_learnings(test_db, [("technical", 0.1 * (i % 10), i) for i in range(50)])
+
+    job = LearningMaintenanceJob(db_path=test_db)
+    preview = job.run_maintenance(dry_run=True)
+    report = job.run_maintenance()
+
+    assert preview.superseded_count == report.superseded_count > 0
+
+
+def test_incremental_run_only_processes_changes(test_db):
+    """Incremental runs see new learnings and ones with new applications."""
+    job = LearningMaintenanceJob(db_path=test_db)
+    (old,) = insert_learnings(test_db, [("process", 0.5, 100)])
+    first = job.run_maintenance(incremental=True)
+
+    # New, stronger learning supersedes the unchanged older one
+    (new,) = insert_learnings(test_db, [("process", 0.9, 0)])
+    second = job.run_maintenance(incremental=True)
+
+    assert first.incremental is False  # no previous run: full run
+    assert second.incremental is True
+    assert second.decay_updates == 0  # decay factors already current
+    assert superseded_by(test_db) == {old: new}
+
+
+def test_incremental_run_ignores_unchanged_learnings(test_db):
+    """Learnings untouched since the last run are not re-evaluated."""
+    job = LearningMaintenanceJob(db_path=test_db)
+    job.run_maintenance()
+    insert_learnings(test_db, [("team", 0.9, 10), ("team", 0.1, 20)])
+
+    # Pretend both learnings predate the last run
+    conn = sqlite3.connect(str(test_db))
+    conn.execute("UPDATE learning_maintenance_runs SET started_at = '9999-01-01'")
+    conn.commit()
+    conn.close()
+
+    assert job.run_maintenance(incremental=True).superseded_count == 0
+    assert job.run_maintenance().superseded_count == 1
+
+
+def test_incremental_sweep_skips_unchanged_categories(test_db):
+    """Only categories with changed learnings are swept incrementally."""
+    old, new = insert_learnings(test_db, [("process", 0.3, 100), ("process", 0.9, 0)])
+    insert_learnings(test_db, [("team", 0.9, 10), ("team", 0.1, 20)])
+    since = (datetime.now() - timedelta(days=1)).isoformat()
+
+    job = LearningMaintenanceJob(db_path=test_db)
+    with job._get_connection() as conn:
+        pairs = job._find_supersessions(conn, since=since)
+
+    assert [(older["id"], newer["id"]) for older, newer in pairs] == [(old, new)]
+
+
 # ============================================================================
 # Prune Old Applications Tests (AC5)
 # ============================================================================
@@ -7,6 +7,8 @@ from unittest.mock import Mock, AsyncMock, patch
 from gao_dev.core.services.process_executor import ProcessExecutor
 from gao_dev.core.providers.claude_code import ClaudeCodeProvider
 from gao_dev.core.providers.base import IAgentProvider
+from gao_dev.core.providers.exceptions import ProviderUnavailableError
+from gao_dev.core.providers.health_check import CircuitState, ProviderHealthChecker
 
 
 class MockProvider(IAgentProvider):
@@ -207,3 +209,63 @@ class TestProcessExecutorLegacyAPI:
         repr_str = repr(executor)
         assert "ProcessExecutor" in repr_str
         assert "mock" in repr_str
+
+
+class NamedProvider(MockProvider):
+    """Mock provider with a configurable name and failure mode."""
+
+    def __init__(self, name, error=None):
+        super().__init__()
+        self._name = name
+        self.error = error
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def execute_task(self, task, context, model, tools, timeout=None, **kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        yield f"{self._name}: {task}"
+
+
+class TestProcessExecutorFailover:
+    """Test circuit breaking and failover in ProcessExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_fails_over_when_primary_circuit_opens(self, tmp_path):
+        """Once the primary trips its breaker, tasks go to the fallback."""
+        primary = NamedProvider(
+            "primary", error=ProviderUnavailableError("primary", "503 Service Unavailable")
+        )
+        backup = NamedProvider("backup")
+        checker = ProviderHealthChecker(failure_threshold=2, recovery_timeout=60)
+        executor = ProcessExecutor(
+            tmp_path, provider=primary, health_checker=checker, fallback_providers=[backup]
+        )
+
+        for _ in range(2):
+            with pytest.raises(ProviderUnavailableError):
+                async for _ in executor.execute_agent_task("task"):
+                    pass
+        results = [m async for m in executor.execute_agent_task("task")]
+
+        assert results == ["backup: task"]
+        assert primary.calls == 2
+        assert checker.circuit_state("primary") is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_all_circuits_open(self, tmp_path):
+        """With no admissible provider the task fails before starting."""
+        primary = NamedProvider("primary")
+        checker = ProviderHealthChecker(failure_threshold=1)
+        checker.record_result("primary", False)
+        executor = ProcessExecutor(tmp_path, provider=primary, health_checker=checker)
+
+        with pytest.raises(ProviderUnavailableError):
+            async for _ in executor.execute_agent_task("task"):
+                pass
+
+        assert primary.calls == 0
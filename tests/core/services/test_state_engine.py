@@ -0,0 +1,84 @@
+"""Tests for the shared StateEngine and its unit of work."""
+
+import sqlite3
+
+import pytest
+
+from gao_dev.core.services.state_engine import AUTOCOMMIT, StateEngine
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine over a database with one table."""
+    db_path = tmp_path / "state.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE items (name TEXT PRIMARY KEY)")
+    conn.close()
+
+    engine = StateEngine(db_path)
+    yield engine
+    engine.close()
+
+
+def stored_names(engine):
+    """Names visible to a separate connection (i.e. committed)."""
+    conn = sqlite3.connect(str(engine.db_path))
+    names = [row[0] for row in conn.execute("SELECT name FROM items ORDER BY name")]
+    conn.close()
+    return names
+
+
+def test_connection_commits_each_block(engine):
+    """Outside a unit of work every write block commits on its own."""
+    for name in ("a", "b"):
+        with engine.connection() as conn:
+            conn.execute("INSERT INTO items VALUES (?)", (name,))
+    with engine.connection() as conn:
+        conn.execute("SELECT * FROM items").fetchall()
+
+    assert stored_names(engine) == ["a", "b"]
+    assert engine.get_stats()[AUTOCOMMIT]["commits"] == 2  # reads are not counted
+
+
+def test_unit_of_work_commits_once(engine):
+    """Blocks inside a unit of work share one commit."""
+    with engine.unit_of_work("batch"):
+        for name in ("a", "b", "c"):
+            with engine.connection() as conn:
+                conn.execute("INSERT INTO items VALUES (?)", (name,))
+        assert stored_names(engine) == []
+
+    stats = engine.get_stats()
+    assert stored_names(engine) == ["a", "b", "c"]
+    assert stats["batch"] == {
+        "operations": 1,
+        "commits": 1,
+        "rollbacks": 0,
+        "commits_per_operation": 1.0,
+    }
+    assert AUTOCOMMIT not in stats
+
+
+def test_unit_of_work_rolls_back_everything(engine):
+    """An error anywhere in the unit discards all of its writes."""
+    with pytest.raises(sqlite3.IntegrityError):
+        with engine.unit_of_work("batch"):
+            with engine.connection() as conn:
+                conn.execute("INSERT INTO items VALUES ('a')")
+            with engine.connection() as conn:
+                conn.execute("INSERT INTO items VALUES ('a')")
+
+    assert stored_names(engine) == []
+    assert engine.get_stats()["batch"]["rollbacks"] == 1
+
+
+def test_nested_units_join_outer(engine):
+    """A nested unit of work does not commit early or count separately."""
+    with engine.unit_of_work("outer"):
+        with engine.unit_of_work("inner"):
+            with engine.connection() as conn:
+                conn.execute("INSERT INTO items VALUES ('a')")
+        assert stored_names(engine) == []
+
+    assert stored_names(engine) == ["a"]
+    assert set(engine.get_stats()) == {"outer"}
@@ -0,0 +1,118 @@
+"""Tests for StateRollupService."""
+
+import importlib.util
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def load_migration_005():
+    """Load migration 005 module dynamically."""
+    migration_path = Path(__file__).parent.parent.parent.parent / "gao_dev" / "lifecycle" / "migrations" / "005_add_state_tables.py"
+    spec = importlib.util.spec_from_file_location("migration_005", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["migration_005"] = module
+    spec.loader.exec_module(module)
+    return module.Migration005
+
+
+Migration005 = load_migration_005()
+
+from gao_dev.core.services.epic_state_service import EpicStateService
+from gao_dev.core.services.state_engine import StateEngine
+from gao_dev.core.services.state_rollup_service import StateRollupService
+from gao_dev.core.services.story_state_service import StoryStateService
+from gao_dev.lifecycle.migrations.migration_008_epic_feature_index import Migration008
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Database with state tables: auth (epics 1, 2) and billing (epic 3)."""
+    db_path = tmp_path / "documents.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE schema_version (version TEXT PRIMARY KEY, applied_at TEXT NOT NULL, description TEXT)"
+    )
+    conn.commit()
+    Migration005.up(conn)
+    Migration008.up(conn)
+    conn.close()
+
+    engine = StateEngine(db_path)
+    epics = EpicStateService(db_path, engine=engine)
+    stories = StoryStateService(db_path, engine=engine)
+    for epic_num, feature in ((1, "auth"), (2, "auth"), (3, "billing"), (4, None)):
+        epics.create(
+            epic_num=epic_num,
+            title=f"Epic {epic_num}",
+            metadata={"feature": feature} if feature else None,
+        )
+    for story_num, hours in ((1, 3.0), (2, 5.0), (3, None)):
+        stories.create(epic_num=1, story_num=story_num, title="Story", estimate_hours=hours)
+    stories.create(epic_num=3, story_num=1, title="Story", estimate_hours=8.0)
+    stories.complete(epic_num=1, story_num=1, actual_hours=4.0)
+    stories.transition(epic_num=1, story_num=2, new_status="blocked")
+    engine.close()
+    return db_path
+
+
+@pytest.fixture(params=[False, True], ids=["live", "cached"])
+def service(request, db_path):
+    """Rollup service with and without the materialized cache."""
+    service = StateRollupService(db_path, cache_rollups=request.param)
+    yield service
+    service.close()
+
+
+def test_epic_rollups_for_feature(service):
+    """Only the feature's epics are returned, with counts and hours."""
+    epic1, epic2 = service.get_epic_rollups(feature="auth")
+
+    assert (epic1["epic_num"], epic2["epic_num"]) == (1, 2)
+    assert epic1["story_count"] == 3
+    assert (epic1["completed_count"], epic1["blocked_count"], epic1["pending_count"]) == (1, 1, 1)
+    assert (epic1["estimate_hours"], epic1["completed_estimate_hours"]) == (8.0, 3.0)
+    assert epic1["actual_hours"] == 4.0
+    assert epic1["progress_percentage"] == pytest.approx(100 / 3)
+    assert epic2["story_count"] == 0
+    assert epic2["progress_percentage"] == 0.0
+
+
+def test_epic_rollup_by_number(service):
+    """A single epic can be looked up, and a missing one raises."""
+    assert service.get_epic_rollup(3)["feature"] == "billing"
+    with pytest.raises(ValueError):
+        service.get_epic_rollup(99)
+
+
+def test_feature_rollups(service):
+    """Features are aggregated in one grouped query; epics without a feature are ignored."""
+    rollups = service.get_feature_rollups()
+
+    assert set(rollups) == {"auth", "billing"}
+    assert (rollups["auth"]["epic_count"], rollups["auth"]["story_count"]) == (2, 3)
+    assert rollups["billing"]["estimate_hours"] == 8.0
+    assert list(service.get_feature_rollups(["billing"])) == ["billing"]
+
+
+def test_cache_follows_story_changes(db_path):
+    """The cached rollup is refreshed on insert, transition and delete."""
+    service = StateRollupService(db_path, cache_rollups=True)
+    stories = StoryStateService(db_path, engine=service.engine)
+
+    stories.complete(epic_num=1, story_num=3)
+    stories.create(epic_num=2, story_num=1, title="New")
+    stories.delete(epic_num=3, story_num=1)
+
+    rollups = {epic["epic_num"]: epic for epic in service.get_epic_rollups()}
+    assert service.cache_enabled
+    assert rollups[1]["completed_count"] == 2
+    assert rollups[2]["story_count"] == 1
+    assert rollups[3]["story_count"] == 0
+
+    service.disable_cache()
+    assert not service.cache_enabled
+    assert service.get_epic_rollup(1)["completed_count"] == 2
+    service.close()
@@ -7,6 +7,8 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
+
 from gao_dev.core.state import (
     StateTracker,
     MarkdownSyncer,
@@ -14,6 +16,7 @@ from gao_dev.core.state import (
     ConflictResolution,
     SyncError,
     ConflictError,
+    StateTrackerError,
 )
 
 
@@ -41,9 +44,15 @@ def tracker(temp_db):
 
 
 @pytest.fixture
-def syncer(tracker):
+def conflict_log(tmp_path):
+    """Conflict log path inside the test's temp directory."""
+    return tmp_path / "logs" / "sync_conflicts.log"
+
+
+@pytest.fixture
+def syncer(tracker, conflict_log):
     """Create MarkdownSyncer instance."""
-    return MarkdownSyncer(tracker)
+    return MarkdownSyncer(tracker, conflict_log_path=conflict_log)
 
 
 @pytest.fixture
@@ -342,9 +351,11 @@ Body""", encoding="utf-8")
         assert result["status"] == "updated"
         assert syncer.conflict_log_path.exists()
 
-    def test_conflict_strategy_database_wins(self, tracker, sample_markdown):
+    def test_conflict_strategy_database_wins(self, tracker, sample_markdown, conflict_log):
         """Test database_wins conflict resolution."""
-        syncer = MarkdownSyncer(tracker, ConflictResolution.DATABASE_WINS)
+        syncer = MarkdownSyncer(
+            tracker, ConflictResolution.DATABASE_WINS, conflict_log_path=conflict_log
+        )
 
         # Setup: Create story with database values
         tracker.create_epic(1, "Test Epic", "test-feature")
@@ -363,9 +374,11 @@ Body""", encoding="utf-8")
         assert story.status == "done"  # Database value preserved
         assert story.owner == "Bob"  # Database value preserved
 
-    def test_conflict_strategy_markdown_wins(self, tracker, sample_markdown):
+    def test_conflict_strategy_markdown_wins(self, tracker, sample_markdown, conflict_log):
         """Test markdown_wins conflict resolution."""
-        syncer = MarkdownSyncer(tracker, ConflictResolution.MARKDOWN_WINS)
+        syncer = MarkdownSyncer(
+            tracker, ConflictResolution.MARKDOWN_WINS, conflict_log_path=conflict_log
+        )
 
         # Setup: Create story with database values
         tracker.create_epic(1, "Test Epic", "test-feature")
@@ -384,9 +397,9 @@ Body""", encoding="utf-8")
         assert story.status == "pending"  # Markdown value applied
         assert story.owner == "Amelia"  # Markdown value applied
 
-    def test_conflict_strategy_manual(self, tracker, sample_markdown):
+    def test_conflict_strategy_manual(self, tracker, sample_markdown, conflict_log):
         """Test manual conflict resolution raises error."""
-        syncer = MarkdownSyncer(tracker, ConflictResolution.MANUAL)
+        syncer = MarkdownSyncer(tracker, ConflictResolution.MANUAL, conflict_log_path=conflict_log)
 
         # Setup: Create story with conflicting values
         tracker.create_epic(1, "Test Epic", "test-feature")
@@ -516,3 +529,161 @@ Body
         story = tracker.get_story(1, 1)
         assert story.owner is None
         assert story.sprint is None
+
+
+def _write_story(path, epic, story_num, status="pending", body="Body", **extra):
+    """Write a story markdown file with frontmatter."""
+    lines = ["---", f"epic: {epic}", f"story_num: {story_num}", f"title: Story {story_num}"]
+    lines.append(f"status: {status}")
+    lines.extend(f"{key}: {value}" for key, value in extra.items())
+    lines.extend(["---", "", body, ""])
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+class TestIncrementalDirectorySync:
+    """Test manifest-gated, single-transaction directory sync."""
+
+    @pytest.fixture
+    def stories_dir(self, tmp_path, tracker):
+        """Create an epic and a directory with three story files."""
+        tracker.create_epic(1, "Test Epic", "test-feature")
+        stories = tmp_path / "stories"
+        stories.mkdir()
+        for i in range(1, 4):
+            _write_story(stories / f"story-1.{i}.md", 1, i)
+        return stories
+
+    def test_unchanged_files_skipped_without_reading(self, syncer, stories_dir):
+        """Test second sync skips all files after a stat."""
+        first = syncer.sync_directory(stories_dir)
+        assert first.stories_created == 3
+
+        with patch.object(MarkdownSyncer, "_parse_file") as mock_parse:
+            second = syncer.sync_directory(stories_dir)
+
+        mock_parse.assert_not_called()
+        assert second.files_processed == 3
+        assert second.files_skipped == 3
+        assert second.stories_created == 0
+        assert second.stories_updated == 0
+
+    def test_changed_file_resynced(self, syncer, tracker, stories_dir):
+        """Test only the modified file is re-parsed and updated."""
+        syncer.sync_directory(stories_dir)
+        _write_story(stories_dir / "story-1.2.md", 1, 2, body="Changed body text")
+
+        parsed = []
+        original = MarkdownSyncer._parse_file
+
+        def spy(self, item):
+            parsed.append(item.path.name)
+            return original(self, item)
+
+        with patch.object(MarkdownSyncer, "_parse_file", spy):
+            report = syncer.sync_directory(stories_dir)
+
+        assert parsed == ["story-1.2.md"]
+        assert report.stories_updated == 1
+        assert report.files_skipped == 2
+        content = (stories_dir / "story-1.2.md").read_text(encoding="utf-8")
+        assert tracker.get_story(1, 2).content_hash == syncer._calculate_hash(content)
+
+    def test_force_rereads_all_files(self, syncer, stories_dir):
+        """Test force=True bypasses the manifest."""
+        syncer.sync_directory(stories_dir)
+
+        with patch.object(
+            MarkdownSyncer, "_parse_file", side_effect=MarkdownSyncer._parse_file, autospec=True
+        ) as mock_parse:
+            report = syncer.sync_directory(stories_dir, force=True)
+
+        assert mock_parse.call_count == 3
+        assert report.files_skipped == 3  # Content hash unchanged
+
+    def test_story_deleted_from_database_is_recreated(self, syncer, tracker, stories_dir):
+        """Test manifest entries are ignored when the story no longer exists."""
+        syncer.sync_directory(stories_dir)
+        with tracker._get_connection() as conn:
+            conn.execute("DELETE FROM stories WHERE epic_num = 1 AND story_num = 3")
+
+        report = syncer.sync_directory(stories_dir)
+
+        assert report.stories_created == 1
+        assert tracker.get_story(1, 3).title == "Story 3"
+
+    def test_markdown_wins_batch_update(self, tracker, stories_dir, conflict_log):
+        """Test markdown_wins applies status/owner/points in the batch update."""
+        syncer = MarkdownSyncer(
+            tracker, ConflictResolution.MARKDOWN_WINS, conflict_log_path=conflict_log
+        )
+        syncer.sync_directory(stories_dir)
+        _write_story(stories_dir / "story-1.1.md", 1, 1, status="done", owner="Amelia", points=5)
+
+        report = syncer.sync_directory(stories_dir)
+
+        story = tracker.get_story(1, 1)
+        assert report.stories_updated == 1
+        assert story.status == "done"
+        assert story.owner == "Amelia"
+        assert story.points == 5
+        assert tracker.get_epic(1).completed_points == 5
+
+    def test_manual_conflict_reported_per_file(self, tracker, stories_dir, conflict_log):
+        """Test manual-resolution conflicts fail only the conflicting file."""
+        syncer = MarkdownSyncer(tracker, ConflictResolution.MANUAL, conflict_log_path=conflict_log)
+        syncer.sync_directory(stories_dir)
+        tracker.update_story_status(1, 1, "in_progress")
+        _write_story(stories_dir / "story-1.1.md", 1, 1, status="blocked")
+        _write_story(stories_dir / "story-1.2.md", 1, 2, body="New body")
+
+        report = syncer.sync_directory(stories_dir)
+
+        assert len(report.errors) == 1
+        assert "Manual conflict resolution required" in report.errors[0]
+        assert report.stories_updated == 1
+
+    def test_missing_epic_does_not_block_batch(self, syncer, tracker, stories_dir):
+        """Test a story for an unknown epic is reported without aborting others."""
+        _write_story(stories_dir / "story-9.1.md", 9, 1)
+
+        report = syncer.sync_directory(stories_dir)
+
+        assert report.stories_created == 3
+        assert len(report.errors) == 1
+        assert "Epic 9 not found" in report.errors[0]
+
+    def test_duplicate_story_in_batch(self, syncer, tracker, stories_dir):
+        """Test two files for the same story behave like sequential syncs."""
+        _write_story(stories_dir / "story-1.1-copy.md", 1, 1, body="Different body")
+
+        report = syncer.sync_directory(stories_dir)
+
+        assert report.stories_created == 3
+        assert report.stories_updated == 1
+
+    def test_batch_failure_falls_back_to_per_file(self, syncer, tracker, stories_dir):
+        """Test a failed batch transaction falls back to per-file sync."""
+        with patch.object(
+            MarkdownSyncer, "_apply_batch", side_effect=StateTrackerError("boom")
+        ):
+            report = syncer.sync_directory(stories_dir)
+
+        assert report.stories_created == 3
+        assert tracker.get_story(1, 2).title == "Story 2"
+
+    def test_large_directory_single_transaction(self, syncer, tracker, tmp_path):
+        """Test many files are written with a bounded number of connections."""
+        tracker.create_epic(2, "Big Epic", "test-feature")
+        big = tmp_path / "big"
+        big.mkdir()
+        for i in range(1, 201):
+            _write_story(big / f"story-2.{i}.md", 2, i)
+
+        with patch.object(
+            StateTracker, "_get_connection", autospec=True, side_effect=StateTracker._get_connection
+        ) as mock_conn:
+            report = syncer.sync_directory(big)
+
+        assert report.stories_created == 200
+        assert mock_conn.call_count == 2
+        assert len(tracker.get_stories_by_epic(2)) == 200
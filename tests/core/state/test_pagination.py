@@ -0,0 +1,112 @@
+"""Tests for keyset-paginated workflow listings."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from gao_dev.core.state.exceptions import ValidationError
+from gao_dev.core.state.pagination import decode_cursor, encode_cursor
+from gao_dev.core.state.state_tracker import StateTracker
+
+SCHEMA_PATH = Path(__file__).parents[3] / "gao_dev" / "core" / "state" / "schema.sql"
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    """StateTracker over 25 executions, several sharing a started_at."""
+    db_path = tmp_path / "state.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text())
+    rows = []
+    for i in range(25):
+        # Pairs of rows share a timestamp to exercise the id tie-breaker
+        started = f"2025-01-{1 + i // 2:02d}T10:00:00"
+        rows.append((
+            "dev-story" if i % 3 else "prd",
+            "failed" if i % 5 == 0 else "completed",
+            f"amelia-{i}",
+            started,
+            f"output {i}",
+        ))
+    conn.executemany(
+        """
+        INSERT INTO workflow_executions (
+            workflow_name, status, executor, started_at, output
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.commit()
+    conn.close()
+    return StateTracker(db_path)
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_roundtrip(self):
+        """A cursor decodes back to the key it was built from."""
+        cursor = encode_cursor("2025-01-01T10:00:00", 42)
+
+        assert decode_cursor(cursor) == ("2025-01-01T10:00:00", 42)
+        assert "=" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("x", 1)[:-2], "WzEsMl0"])
+    def test_malformed(self, cursor):
+        """Garbage cursors raise ValidationError."""
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor)
+
+
+class TestPageWorkflows:
+    """Tests for StateTracker.page_workflows."""
+
+    def test_pages_cover_everything_once(self, tracker):
+        """Walking the cursors yields every row exactly once, newest first."""
+        seen = []
+        cursor = None
+        while True:
+            page = tracker.page_workflows(7, cursor=cursor)
+            seen.extend(page.workflows)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        keys = [(wf.started_at, wf.id) for wf in seen]
+        assert len(keys) == 25
+        assert keys == sorted(keys, reverse=True)
+        assert keys == [(wf.started_at, wf.id) for wf in tracker.query_workflows()]
+
+    def test_filters_apply_to_pages(self, tracker):
+        """Filters and count_workflows agree."""
+        page = tracker.page_workflows(100, workflow_type="prd", status=["failed"])
+
+        assert {wf.workflow_name for wf in page.workflows} == {"prd"}
+        assert {wf.status for wf in page.workflows} == {"failed"}
+        assert tracker.count_workflows(workflow_type="prd", status=["failed"]) == len(page.workflows)
+        assert page.next_cursor is None
+
+    def test_search(self, tracker):
+        """Search matches the workflow id or name case-insensitively."""
+        assert [wf.workflow_id for wf in tracker.query_workflows(search="AMELIA-12")] == ["amelia-12"]
+        assert tracker.count_workflows(search="PRD") == 9
+
+    def test_listing_omits_result(self, tracker):
+        """Results are only loaded when asked for."""
+        listing = tracker.page_workflows(3)
+        full = tracker.page_workflows(3, include_result=True)
+
+        assert all(wf.result is None for wf in listing.workflows)
+        assert all(wf.result for wf in full.workflows)
+
+    def test_offset(self, tracker):
+        """LIMIT/OFFSET paging matches the full ordering."""
+        everything = tracker.query_workflows()
+
+        assert tracker.query_workflows(limit=5, offset=10) == everything[10:15]
+
+    def test_invalid_limit(self, tracker):
+        """A non-positive page size is rejected."""
+        with pytest.raises(ValidationError):
+            tracker.page_workflows(0)
@@ -0,0 +1,345 @@
+"""Tests for the daily workflow rollup and SQL dashboard aggregates."""
+
+import random
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from gao_dev.core.state.migrations.migration_003_add_workflow_rollups import Migration003
+from gao_dev.core.state.schema_validator import SchemaValidator
+from gao_dev.core.state.state_tracker import StateTracker
+from gao_dev.core.state.workflow_rollup import (
+    AGENT_ROLLUP_TABLE,
+    ERROR_ROLLUP_TABLE,
+    ROLLUP_TABLE,
+    ensure_workflow_rollup,
+    query_workflow_dashboard,
+    workflow_rollup_ready,
+)
+
+SCHEMA_PATH = Path(__file__).parents[3] / "gao_dev" / "core" / "state" / "schema.sql"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a database with the state schema."""
+    path = tmp_path / "state.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA_PATH.read_text())
+    conn.close()
+    return path
+
+
+def connect(db_path):
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def insert(conn, executor, name, status, started, completed=None, epic=1, output=None):
+    conn.execute(
+        """
+        INSERT INTO workflow_executions (
+            workflow_name, epic_num, story_num, status, executor,
+            started_at, completed_at, output
+        ) VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+        """,
+        (name, epic, status, executor, started, completed, output),
+    )
+
+
+def rollup_rows(conn, table=ROLLUP_TABLE):
+    return [
+        tuple(row)
+        for row in conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2, 3")
+    ]
+
+
+def reference_metrics(conn, start_date=None, end_date=None, epic=None):
+    """Straightforward Python computation the SQL version must match."""
+    rows = conn.execute("SELECT * FROM workflow_executions").fetchall()
+    rows = [
+        r for r in rows
+        if (start_date is None or r["started_at"] >= start_date)
+        and (end_date is None or r["started_at"] <= end_date)
+        and (epic is None or r["epic_num"] == epic)
+    ]
+
+    def duration(r):
+        if not (r["started_at"] and r["completed_at"]):
+            return None
+        return (
+            datetime.fromisoformat(r["completed_at"]) - datetime.fromisoformat(r["started_at"])
+        ).total_seconds()
+
+    status_counts = defaultdict(int)
+    types = defaultdict(lambda: {"count": 0, "durations": [], "completed": 0})
+    days = defaultdict(lambda: defaultdict(int))
+    for r in rows:
+        status_counts[r["status"]] += 1
+        types[r["workflow_name"]]["count"] += 1
+        if r["status"] == "completed":
+            types[r["workflow_name"]]["completed"] += 1
+        if duration(r) is not None:
+            types[r["workflow_name"]]["durations"].append(duration(r))
+        if r["status"] in ("completed", "failed", "cancelled"):
+            days[r["started_at"][:10]][r["status"]] += 1
+
+    durations = [d for t in types.values() for d in t["durations"]]
+    return {
+        "total": len(rows),
+        "status": dict(status_counts),
+        "total_duration": round(sum(durations), 2),
+        "types": {
+            name: (t["count"], round(min(t["durations"]), 2) if t["durations"] else 0.0,
+                   round(max(t["durations"]), 2) if t["durations"] else 0.0)
+            for name, t in types.items()
+        },
+        "days": {day: dict(counts) for day, counts in days.items()},
+    }
+
+
+class TestRollupMaintenance:
+    """Triggers keep the rollup in step with workflow_executions."""
+
+    def test_created_and_backfilled(self, db_path):
+        """Existing rows are rolled up when the rollups are first created."""
+        conn = connect(db_path)
+        insert(conn, "amelia-1", "dev", "completed", "2025-01-01T10:00:00", "2025-01-01T10:00:30")
+        insert(conn, "amelia-2", "dev", "completed", "2025-01-01T11:00:00", "2025-01-01T11:01:00")
+        insert(conn, "bob-1", "dev", "failed", "2025-01-01T12:00:00", output="Boom\ntrace")
+
+        assert ensure_workflow_rollup(conn) is True
+        assert ensure_workflow_rollup(conn) is False
+
+        # day, epic, workflow, executions, started, running, completed,
+        # failed, cancelled, timed, total, min, max
+        assert rollup_rows(conn) == [
+            ("2025-01-01", 1, "dev", 3, 0, 0, 2, 1, 0, 2, 90.0, 30.0, 60.0)
+        ]
+        assert rollup_rows(conn, AGENT_ROLLUP_TABLE) == [
+            ("2025-01-01", 1, "amelia", 2, 90.0),
+            ("2025-01-01", 1, "bob", 1, 0.0),
+        ]
+        assert rollup_rows(conn, ERROR_ROLLUP_TABLE) == [("2025-01-01", 1, "Boom", 1)]
+
+    def test_status_transitions_move_counts(self, db_path):
+        """Updates subtract the old row and add the new one."""
+        conn = connect(db_path)
+        ensure_workflow_rollup(conn)
+        insert(conn, "bob-1", "qa", "running", "2025-01-02T09:00:00")
+        insert(conn, "bob-2", "qa", "completed", "2025-01-02T09:00:00", "2025-01-02T09:00:10")
+
+        conn.execute(
+            "UPDATE workflow_executions SET status = 'completed', "
+            "completed_at = '2025-01-02T09:00:40' WHERE executor = 'bob-1'"
+        )
+        assert rollup_rows(conn) == [
+            ("2025-01-02", 1, "qa", 2, 0, 0, 2, 0, 0, 2, 50.0, 10.0, 40.0)
+        ]
+
+        # Re-timing the longest run recomputes the bucket's max
+        conn.execute(
+            "UPDATE workflow_executions SET status = 'failed', output = 'Timeout', "
+            "completed_at = '2025-01-02T09:00:20' WHERE executor = 'bob-1'"
+        )
+        assert rollup_rows(conn) == [
+            ("2025-01-02", 1, "qa", 2, 0, 0, 1, 1, 0, 2, 30.0, 10.0, 20.0)
+        ]
+        assert rollup_rows(conn, ERROR_ROLLUP_TABLE) == [("2025-01-02", 1, "Timeout", 1)]
+
+        conn.execute("DELETE FROM workflow_executions WHERE executor = 'bob-1'")
+        assert rollup_rows(conn) == [
+            ("2025-01-02", 1, "qa", 1, 0, 0, 1, 0, 0, 1, 10.0, 10.0, 10.0)
+        ]
+        assert rollup_rows(conn, ERROR_ROLLUP_TABLE) == []
+
+    def test_output_updates_do_not_touch_rollup(self, db_path):
+        """Progress writes to output of running workflows change nothing."""
+        conn = connect(db_path)
+        ensure_workflow_rollup(conn)
+        insert(conn, "c-1", "dev", "running", "2025-01-02T09:00:00")
+        before = [rollup_rows(conn, table) for table in (ROLLUP_TABLE, ERROR_ROLLUP_TABLE)]
+
+        conn.execute("UPDATE workflow_executions SET output = 'progress' WHERE executor = 'c-1'")
+
+        assert [rollup_rows(conn, table) for table in (ROLLUP_TABLE, ERROR_ROLLUP_TABLE)] == before
+
+    def test_migration_creates_and_backfills(self, db_path):
+        """Migration 003 sets the rollups up ahead of the first request."""
+        conn = connect(db_path)
+        insert(conn, "amelia-1", "dev", "completed", "2025-01-01T10:00:00", "2025-01-01T10:00:30")
+        conn.commit()
+
+        assert Migration003.upgrade(db_path) is True
+        assert Migration003.upgrade(db_path) is True  # idempotent
+
+        assert workflow_rollup_ready(conn)
+        assert rollup_rows(conn) == [
+            ("2025-01-01", 1, "dev", 1, 0, 0, 1, 0, 0, 1, 30.0, 30.0, 30.0)
+        ]
+
+    def test_validator_accepts_rollup_objects(self, db_path):
+        """The lazily created rollup does not make the schema invalid."""
+        conn = connect(db_path)
+        ensure_workflow_rollup(conn)
+        conn.commit()
+        conn.close()
+
+        results = SchemaValidator.validate_schema(db_path)
+
+        assert results["indexes_valid"]
+        assert results["triggers_valid"]
+        assert not any(ROLLUP_TABLE in warning for warning in results["warnings"])
+
+
+class TestDashboardQueries:
+    """SQL aggregates match a row-by-row Python computation."""
+
+    @pytest.fixture
+    def populated(self, db_path):
+        """Random executions across a month, several epics and agents."""
+        rng = random.Random(7)
+        conn = connect(db_path)
+        ensure_workflow_rollup(conn)
+        base = datetime(2025, 3, 1)
+        for i in range(600):
+            started = base + timedelta(minutes=rng.randrange(60 * 24 * 30))
+            status = rng.choice(["running", "started", "completed", "failed", "cancelled"])
+            completed = None
+            if status != "started":
+                completed = (started + timedelta(seconds=rng.randrange(1, 5000))).isoformat()
+            insert(
+                conn,
+                f"{rng.choice(['john', 'amelia', 'bob'])}-{i}",
+                rng.choice(["prd", "dev", "qa", "review"]),
+                status,
+                started.isoformat(),
+                completed,
+                epic=rng.choice([1, 2, 3, None]),
+                output=f"Error {i % 3}\ntrace" if status == "failed" else None,
+            )
+        return conn
+
+    @pytest.mark.parametrize(
+        "start_date,end_date,epic",
+        [
+            (None, None, None),
+            (None, None, 2),
+            ("2025-03-05", "2025-03-20", None),
+            ("2025-03-05T13:30:00.000Z", "2025-03-20T08:15:00.000Z", 1),
+            ("2025-03-10T12:00:00", "2025-03-10T18:00:00", None),
+            ("not-a-date", None, None),
+        ],
+    )
+    def test_matches_reference(self, populated, start_date, end_date, epic):
+        """Summary, per-type and daily figures equal the Python reference."""
+        metrics = query_workflow_dashboard(populated, start_date, end_date, epic)
+        expected = reference_metrics(populated, start_date, end_date, epic)
+
+        summary = metrics["summary"]
+        assert summary["total_workflows"] == expected["total"]
+        for status in ("completed", "failed", "cancelled", "running"):
+            assert summary[status] == expected["status"].get(status, 0)
+        assert summary["pending"] == expected["status"].get("started", 0)
+        assert summary["total_duration"] == pytest.approx(expected["total_duration"], abs=0.1)
+
+        types = {
+            m["workflow_type"]: (m["count"], m["min_duration"], m["max_duration"])
+            for m in metrics["workflow_type_metrics"]
+        }
+        assert types == expected["types"]
+
+        days = {
+            d["date"]: {k: v for k, v in d.items() if k != "date" and v}
+            for d in metrics["workflows_over_time"]
+        }
+        assert days == expected["days"]
+
+    @pytest.mark.parametrize(
+        "start_date,end_date,epic",
+        [(None, None, None), ("2025-03-05T13:30:00", "2025-03-20T08:15:00", 1)],
+    )
+    def test_raw_rows_match_rollups(self, populated, start_date, end_date, epic):
+        """Without rollups the dashboard is computed from raw rows alone."""
+        assert query_workflow_dashboard(
+            populated, start_date, end_date, epic, use_rollups=False
+        ) == query_workflow_dashboard(populated, start_date, end_date, epic)
+
+    def test_top_lists(self, populated):
+        """Longest workflows and common errors are ordered top-N lists."""
+        metrics = query_workflow_dashboard(populated)
+
+        longest = [w["duration"] for w in metrics["longest_workflows"]]
+        assert len(longest) == 10
+        assert longest == sorted(longest, reverse=True)
+        assert all("-" not in w["agent"] for w in metrics["longest_workflows"])
+
+        errors = metrics["failure_analysis"]["common_errors"]
+        assert {e["error_message"] for e in errors} == {"Error 0", "Error 1", "Error 2"}
+        assert sum(e["count"] for e in errors) == metrics["summary"]["failed"]
+
+
+class TestStateTrackerIntegration:
+    """StateTracker maintains and reads the rollup."""
+
+    def test_tracked_workflows_reach_dashboard(self, db_path):
+        """track/update calls are reflected in dashboard metrics."""
+        tracker = StateTracker(db_path)
+        tracker.create_epic(epic_num=1, title="Epic", feature="f")
+        tracker.create_story(epic_num=1, story_num=1, title="Story")
+        tracker.track_workflow_execution("amelia-1", 1, 1, "dev")
+        tracker.track_workflow_execution("amelia-2", 1, 1, "dev")
+        tracker.update_workflow_status("amelia-1", "completed")
+
+        metrics = tracker.get_workflow_dashboard_metrics(epic_num=1)
+
+        assert metrics["summary"]["completed"] == 1
+        assert metrics["summary"]["running"] == 1
+        assert metrics["agent_utilization"][0]["agent"] == "amelia"
+        assert metrics["agent_utilization"][0]["workflow_count"] == 2
+
+    def test_reads_do_not_create_rollups(self, db_path):
+        """Listing, counting and the dashboard run no DDL on read."""
+        conn = connect(db_path)
+        insert(conn, "x-1", "dev", "completed", "2025-01-01T00:00:00", "2025-01-01T00:00:05")
+        conn.commit()
+        tracker = StateTracker(db_path)
+
+        assert [wf.workflow_id for wf in tracker.query_workflows()] == ["x-1"]
+        assert tracker.count_workflows() == 1
+        metrics = tracker.get_workflow_dashboard_metrics()
+
+        assert metrics["summary"]["total_duration"] == 5.0
+        assert not workflow_rollup_ready(conn)
+
+    def test_rebuild_workflow_rollup(self, db_path):
+        """A damaged rollup can be recomputed from the base table."""
+        tracker = StateTracker(db_path)
+        conn = connect(db_path)
+        ensure_workflow_rollup(conn)
+        insert(conn, "x-1", "dev", "completed", "2025-01-01T00:00:00", "2025-01-01T00:00:05")
+        conn.execute(f"DELETE FROM {ROLLUP_TABLE}")
+        conn.commit()
+        conn.close()
+
+        assert tracker.rebuild_workflow_rollup() == 2  # type + agent buckets
+        metrics = tracker.get_workflow_dashboard_metrics()
+
+        assert metrics["summary"]["total_workflows"] == 1
+        assert metrics["summary"]["total_duration"] == 5.0
+
+    def test_query_workflows_epic_and_story_filters(self, db_path):
+        """Graph filters are applied in SQL."""
+        conn = connect(db_path)
+        insert(conn, "a-1", "dev", "running", "2025-01-01T00:00:00", epic=1)
+        insert(conn, "a-2", "dev", "running", "2025-01-01T00:00:00", epic=2)
+        conn.commit()
+        conn.close()
+
+        workflows = StateTracker(db_path).query_workflows(epic_num=2, story_num=1)
+
+        assert [wf.workflow_id for wf in workflows] == ["a-2"]
@@ -0,0 +1,271 @@
+"""Tests for the precompiled catalog cache."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from gao_dev.core import catalog_cache as catalog_module
+from gao_dev.core.agent_config_loader import AgentConfigLoader
+from gao_dev.core.catalog_cache import (
+    CatalogCache,
+    default_catalog_path,
+    get_catalog_cache,
+)
+from gao_dev.core.config_loader import ConfigLoader
+from gao_dev.core.prompt_registry import PromptRegistry
+from gao_dev.core.workflow_registry import WorkflowRegistry
+
+
+def write_old(path: Path, content: str) -> Path:
+    """Write a file and backdate it past the racy mtime window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    old = time.time() - 60
+    os.utime(path, (old, old))
+    return path
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Catalog file location."""
+    return tmp_path / "cache" / "catalog.json"
+
+
+class TestCatalogCache:
+    """Tests for CatalogCache."""
+
+    def test_round_trip_across_instances(self, tmp_path, cache_path):
+        """A flushed catalog serves the next instance without re-parsing."""
+        source = write_old(tmp_path / "a.yaml", "name: a\nitems: [1, 2]\n")
+        first = CatalogCache(cache_path)
+        assert first.get_yaml(source) == {"name": "a", "items": [1, 2]}
+        assert first.flush() is True
+        assert cache_path.exists()
+
+        second = CatalogCache(cache_path)
+        assert second.get_yaml(source) == {"name": "a", "items": [1, 2]}
+        assert second.hits == 1
+        assert second.misses == 0
+        assert second.flush() is False
+
+    def test_changed_file_is_reparsed(self, tmp_path, cache_path):
+        """A size or mtime change invalidates only that file."""
+        changed = write_old(tmp_path / "changed.yaml", "value: 1\n")
+        unchanged = write_old(tmp_path / "unchanged.yaml", "value: 2\n")
+        catalog = CatalogCache(cache_path)
+        catalog.get_yaml(changed)
+        catalog.get_yaml(unchanged)
+        catalog.flush()
+
+        write_old(changed, "value: 100\n")
+        reloaded = CatalogCache(cache_path)
+
+        assert reloaded.get_yaml(changed) == {"value": 100}
+        assert reloaded.get_yaml(unchanged) == {"value": 2}
+        assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+    def test_recent_files_are_not_persisted(self, tmp_path, cache_path):
+        """Files inside the racy mtime window are always re-read."""
+        source = tmp_path / "fresh.md"
+        source.write_text("one", encoding="utf-8")
+        catalog = CatalogCache(cache_path)
+
+        assert catalog.get_text(source) == "one"
+        source.write_text("two", encoding="utf-8")
+        assert catalog.get_text(source) == "two"
+        assert len(catalog) == 0
+
+    def test_get_yaml_returns_copies(self, tmp_path):
+        """Mutating a returned document does not affect the cache."""
+        source = write_old(tmp_path / "a.yaml", "tags: [x]\n")
+        catalog = CatalogCache()
+
+        catalog.get_yaml(source)["tags"].append("y")
+
+        assert catalog.get_yaml(source) == {"tags": ["x"]}
+
+    def test_missing_file_raises_and_drops_entry(self, tmp_path):
+        """Deleted files raise FileNotFoundError and leave the catalog."""
+        source = write_old(tmp_path / "gone.yaml", "a: 1\n")
+        catalog = CatalogCache()
+        catalog.get_yaml(source)
+        source.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            catalog.get_yaml(source)
+        assert len(catalog) == 0
+
+    def test_invalid_yaml_raises(self, tmp_path):
+        """Parse errors propagate and are not cached."""
+        source = write_old(tmp_path / "bad.yaml", "a: [unclosed\n")
+        catalog = CatalogCache()
+
+        with pytest.raises(yaml.YAMLError):
+            catalog.get_yaml(source)
+        assert len(catalog) == 0
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path, cache_path):
+        """An unreadable catalog file starts a fresh catalog."""
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(b"not json")
+        source = write_old(tmp_path / "a.yaml", "a: 1\n")
+
+        catalog = CatalogCache(cache_path)
+
+        assert catalog.get_yaml(source) == {"a": 1}
+        assert catalog.flush() is True
+
+    def test_clear_removes_file(self, tmp_path, cache_path):
+        """clear() drops entries and deletes the catalog file."""
+        catalog = CatalogCache(cache_path)
+        catalog.get_yaml(write_old(tmp_path / "a.yaml", "a: 1\n"))
+        catalog.flush()
+
+        catalog.clear()
+
+        assert len(catalog) == 0
+        assert not cache_path.exists()
+
+    def test_catalog_file_holds_plain_json(self, tmp_path, cache_path):
+        """The catalog is stored as JSON data, not an executable format."""
+        source = write_old(tmp_path / "a.yaml", "name: a\n")
+        catalog = CatalogCache(cache_path)
+        catalog.get_yaml(source)
+        catalog.flush()
+
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+
+        assert payload["entries"][str(source)][2:] == ["yaml", {"name": "a"}]
+
+    def test_documents_json_cannot_represent_stay_in_memory(self, tmp_path, cache_path):
+        """YAML values that would not round-trip through JSON are not persisted."""
+        dated = write_old(tmp_path / "dated.yaml", "released: 2024-01-02\n")
+        plain = write_old(tmp_path / "plain.yaml", "a: 1\n")
+        catalog = CatalogCache(cache_path)
+        released = catalog.get_yaml(dated)["released"]
+        catalog.get_yaml(plain)
+        catalog.flush()
+
+        reloaded = CatalogCache(cache_path)
+
+        assert reloaded.get_yaml(dated)["released"] == released
+        assert reloaded.get_yaml(plain) == {"a": 1}
+        assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+
+class TestCatalogLocation:
+    """Tests for catalog path resolution and sharing."""
+
+    def test_kept_in_user_cache_keyed_by_project(self, tmp_path, monkeypatch):
+        """Catalogs live in the user cache dir, one per resolved project root."""
+        monkeypatch.setenv("GAO_DEV_CACHE_DIR", str(tmp_path / "user-cache"))
+        (tmp_path / "a" / ".gao-dev").mkdir(parents=True)
+        (tmp_path / "b").mkdir()
+
+        path_a = default_catalog_path(tmp_path / "a")
+
+        assert path_a.parent == tmp_path / "user-cache" / "catalogs"
+        assert path_a.suffix == ".json"
+        assert path_a == default_catalog_path(tmp_path / "b" / ".." / "a")
+        assert path_a != default_catalog_path(tmp_path / "b")
+
+    def test_shared_instance_per_path(self, tmp_path, monkeypatch):
+        """Callers for the same project share one catalog."""
+        monkeypatch.setattr(catalog_module, "_catalogs", {})
+
+        assert get_catalog_cache(tmp_path) is get_catalog_cache(tmp_path)
+
+    def test_no_project_root_is_memory_only(self, tmp_path, monkeypatch):
+        """Without a project root nothing is read from or written to disk."""
+        monkeypatch.setattr(catalog_module, "_catalogs", {})
+        monkeypatch.chdir(tmp_path)
+
+        catalog = get_catalog_cache()
+
+        assert catalog.cache_path is None
+        assert catalog is get_catalog_cache(None)
+
+
+class TestRegistryIntegration:
+    """Registries and loaders read through the catalog."""
+
+    def test_workflow_registry_uses_catalog(self, tmp_path, cache_path):
+        """A second registry is served from the catalog file."""
+        config = ConfigLoader(tmp_path)
+        first_catalog = CatalogCache(cache_path)
+        first = WorkflowRegistry(config, catalog=first_catalog)
+        first.index_workflows()
+        assert cache_path.exists()
+        # Documents JSON cannot represent (e.g. integer keys) are re-parsed
+        not_persisted = len(first_catalog) - len(
+            json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
+        )
+
+        catalog = CatalogCache(cache_path)
+        second = WorkflowRegistry(config, catalog=catalog)
+        second.index_workflows()
+
+        assert catalog.misses == not_persisted
+        assert catalog.hits > 0
+        assert second.get_all_workflows().keys() == first.get_all_workflows().keys()
+
+    def test_prompt_registry_uses_catalog(self, tmp_path, cache_path):
+        """Prompts are built from cached documents."""
+        write_old(
+            tmp_path / "prompts" / "greet.yaml",
+            "name: greet\ndescription: Greeting\nuser_prompt: Hi {{who}}\n",
+        )
+        PromptRegistry(
+            tmp_path / "prompts", catalog=CatalogCache(cache_path)
+        ).index_prompts()
+
+        catalog = CatalogCache(cache_path)
+        registry = PromptRegistry(tmp_path / "prompts", catalog=catalog)
+
+        assert registry.get_prompt("greet").render({"who": "Ann"}) == "Hi Ann"
+        assert (catalog.hits, catalog.misses) == (1, 0)
+
+    def test_agent_loader_caches_persona(self, tmp_path, cache_path):
+        """Agent YAML and persona files are both cached."""
+        agents_dir = tmp_path / "agents"
+        write_old(
+            agents_dir / "ann.agent.yaml",
+            "agent:\n  metadata:\n    name: Ann\n    role: Tester\n"
+            "  persona_file: ./ann.md\n  tools: [Read]\n",
+        )
+        write_old(agents_dir / "ann.md", "Ann persona")
+        AgentConfigLoader(agents_dir, catalog=CatalogCache(cache_path)).load_all_agents()
+
+        catalog = CatalogCache(cache_path)
+        configs = AgentConfigLoader(agents_dir, catalog=catalog).load_all_agents()
+
+        assert configs["ann"].persona == "Ann persona"
+        assert (catalog.hits, catalog.misses) == (2, 0)
+
+    def test_checklist_preload_writes_catalog_once(self, tmp_path, cache_path, monkeypatch):
+        """Bulk loading checklists rewrites the catalog file once, not per checklist."""
+        from gao_dev.core.checklists.checklist_loader import ChecklistLoader
+
+        checklist_dir = tmp_path / "checklists"
+        for name in ("one", "two", "three"):
+            write_old(
+                checklist_dir / f"{name}.yaml",
+                f"checklist:\n  name: {name}\n  category: testing\n  version: 1.0.0\n"
+                "  items:\n    - id: item-1\n      text: Check that the thing works\n      severity: high\n",
+            )
+        schema = (
+            Path(__file__).parents[2] / "gao_dev" / "config" / "schemas" / "checklist_schema.json"
+        )
+        catalog = CatalogCache(cache_path)
+        writes = []
+        real_flush = catalog.flush
+        monkeypatch.setattr(catalog, "flush", lambda: writes.append(real_flush()) or writes[-1])
+
+        loaded = ChecklistLoader([checklist_dir], schema, catalog=catalog).preload_checklists()
+
+        assert sorted(loaded) == ["one", "three", "two"]
+        assert writes == [True]
@@ -280,3 +280,28 @@ class TestConfigLoaderWorkflowDefaultsIntegration:
         # Check embedded defaults still present for non-overridden values
         assert "epic_location" in defaults
         assert "dev_story_location" in defaults
+
+
+class TestConfigLoaderYamlCache:
+    """Test reuse of parsed YAML across ConfigLoader instances."""
+
+    def test_instances_do_not_share_mutable_config(self, tmp_path: Path):
+        """Mutating one loader's config does not leak into the next."""
+        first = ConfigLoader(tmp_path)
+        first.defaults["injected"] = True
+
+        assert "injected" not in ConfigLoader(tmp_path).defaults
+
+    def test_changed_user_config_is_reloaded(self, tmp_path: Path):
+        """A rewritten gao-dev.yaml is parsed again."""
+        import os
+
+        config_path = tmp_path / "gao-dev.yaml"
+        config_path.write_text("output_folder: first\n", encoding="utf-8")
+        assert ConfigLoader(tmp_path).user_config["output_folder"] == "first"
+
+        config_path.write_text("output_folder: second\n", encoding="utf-8")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert ConfigLoader(tmp_path).user_config["output_folder"] == "second"
@@ -27,6 +27,11 @@ def git_manager(tmp_path):
     return GitManager(project_path=tmp_path)
 
 
+def iter_lines(output):
+    """Generator over output lines, standing in for _iter_git_output."""
+    yield from output.splitlines()
+
+
 @pytest.fixture
 def mock_run_git_command():
     """Mock the _run_git_command method."""
@@ -535,3 +540,101 @@ class TestQueryEnhancementMethods:
 
         assert len(commits) == 0
         assert commits == []
+
+    def test_get_changed_files_since(self, git_manager, mock_run_git_command):
+        """Test name-status diff parsing."""
+        mock_run_git_command.return_value = (
+            "M\tdocs/stories/story-1.1.md\n"
+            "D\tdocs/epics/epic-2.md\n"
+            "A\tdocs/stories/story-1.3.md\n"
+        )
+
+        changes = git_manager.get_changed_files_since("abc1234")
+
+        assert changes == [
+            {"status": "M", "path": "docs/stories/story-1.1.md"},
+            {"status": "D", "path": "docs/epics/epic-2.md"},
+            {"status": "A", "path": "docs/stories/story-1.3.md"},
+        ]
+        call_args = mock_run_git_command.call_args[0][0]
+        assert "--no-renames" in call_args
+        assert "abc1234" in call_args
+
+    def test_get_changed_files_since_unknown_ref(self, git_manager, mock_run_git_command):
+        """Test unknown ref raises so callers can fall back."""
+        mock_run_git_command.side_effect = subprocess.CalledProcessError(
+            128, "git", stderr="bad revision"
+        )
+
+        with pytest.raises(subprocess.CalledProcessError):
+            git_manager.get_changed_files_since("missing")
+
+    def test_get_last_commits_for_files(self, git_manager):
+        """Test batch lookup keeps the newest commit per file."""
+        output = (
+            "\x00aaa1111aaa|feat(story-1.1): complete login|Amelia|2025-11-09\n"
+            "\n"
+            "docs/a.md\n"
+            "\x00bbb2222bbb|chore: wip|Bob|2025-11-08\n"
+            "\n"
+            "docs/a.md\n"
+            "docs/b.md\n"
+        )
+
+        with patch.object(
+            GitManager, "_iter_git_output", side_effect=lambda args: iter_lines(output)
+        ) as mock_iter:
+            commits = git_manager.get_last_commits_for_files(
+                [Path("docs/a.md"), git_manager.project_path / "docs" / "b.md", Path("docs/c.md")]
+            )
+
+        assert commits["docs/a.md"]["message"] == "feat(story-1.1): complete login"
+        assert commits["docs/a.md"]["sha"] == "aaa1111"
+        assert commits["docs/b.md"]["message"] == "chore: wip"
+        assert "docs/c.md" not in commits
+        assert mock_iter.call_count == 1
+
+    def test_get_last_commits_for_files_stops_when_all_found(self, git_manager):
+        """Test the log is not read past the commit that completes the chunk."""
+        read = []
+
+        def log_lines(args):
+            for line in ["\x00aaa1111aaa|feat: a|Amelia|2025-11-09", "", "docs/a.md",
+                         "\x00bbb2222bbb|chore: old|Bob|2025-11-08", "", "docs/b.md"]:
+                read.append(line)
+                yield line
+
+        with patch.object(GitManager, "_iter_git_output", side_effect=log_lines):
+            commits = git_manager.get_last_commits_for_files([Path("docs/a.md")])
+
+        assert commits["docs/a.md"]["message"] == "feat: a"
+        assert read[-1] == "docs/a.md"
+
+    def test_get_last_commits_for_files_chunks(self, git_manager):
+        """Test pathspecs are split into chunks."""
+        with patch.object(
+            GitManager, "_iter_git_output", side_effect=lambda args: iter_lines("")
+        ) as mock_iter:
+            git_manager.get_last_commits_for_files(
+                [Path(f"docs/{i}.md") for i in range(5)], chunk_size=2
+            )
+
+        assert mock_iter.call_count == 3
+
+    def test_get_last_commits_for_files_in_repo(self, tmp_path):
+        """Test the streamed walk against a real repository."""
+        git = GitManager(project_path=tmp_path)
+        git.init_repo(initial_commit=False)
+        for name, message in (("a.md", "feat: add a"), ("b.md", "feat: add b")):
+            (tmp_path / name).write_text(name)
+            git.add_all()
+            git.commit(message)
+        (tmp_path / "a.md").write_text("changed")
+        git.add_all()
+        git.commit("fix: change a")
+
+        commits = git.get_last_commits_for_files([Path("a.md"), Path("b.md"), Path("c.md")])
+
+        assert commits["a.md"]["message"] == "fix: change a"
+        assert commits["b.md"]["message"] == "feat: add b"
+        assert "c.md" not in commits
@@ -455,3 +455,64 @@ class TestStateCoordinatorFeatureOperations:
         planning_features = coordinator.list_features(status=FeatureStatus.PLANNING)
         assert len(planning_features) == 1
         assert planning_features[0].name == "feature-2"
+
+
+class TestStateCoordinatorTransactions:
+    """Tests for the shared engine and unit of work."""
+
+    def test_services_share_engine(self, coordinator):
+        """All services use the coordinator's engine."""
+        services = [
+            coordinator.epic_service,
+            coordinator.story_service,
+            coordinator.action_service,
+            coordinator.ceremony_service,
+            coordinator.learning_service,
+            coordinator.feature_service,
+        ]
+
+        assert all(service.engine is coordinator.engine for service in services)
+
+    def test_complete_story_commits_once(self, coordinator):
+        """Completing a story and updating its epic is one commit."""
+        coordinator.create_epic(epic_num=1, title="Epic", total_stories=2)
+        coordinator.create_story(epic_num=1, story_num=1, title="Story")
+        coordinator.engine.reset_stats()
+
+        coordinator.complete_story(epic_num=1, story_num=1, auto_update_epic=True)
+
+        stats = coordinator.get_transaction_stats()
+        assert stats["complete_story"]["commits"] == 1
+        assert "autocommit" not in stats
+        assert coordinator.epic_service.get(1)["completed_stories"] == 1
+
+    def test_unit_of_work_rolls_back_across_services(self, coordinator):
+        """A failure rolls back writes made through every service in the unit."""
+        with pytest.raises(RuntimeError):
+            with coordinator.unit_of_work("plan"):
+                coordinator.create_epic(epic_num=7, title="Epic")
+                coordinator.create_action_item(title="Follow up", epic_num=7)
+                raise RuntimeError("abort")
+
+        assert coordinator.get_active_action_items() == []
+        with pytest.raises(ValueError):
+            coordinator.epic_service.get(7)
+        assert coordinator.get_transaction_stats()["plan"]["rollbacks"] == 1
+
+    def test_get_feature_state_aggregates_feature_epics(self, coordinator):
+        """Feature state counts stories of the epics tagged with the feature."""
+        coordinator.create_feature(name="auth", scope=FeatureScope.MVP, scale_level=2)
+        coordinator.create_epic(epic_num=1, title="Login", metadata={"feature": "auth"})
+        coordinator.create_epic(epic_num=2, title="Other", metadata={"feature": "billing"})
+        coordinator.create_story(epic_num=1, story_num=1, title="Form")
+        coordinator.create_story(epic_num=1, story_num=2, title="API")
+        coordinator.create_story(epic_num=2, story_num=1, title="Invoice")
+        coordinator.complete_story(epic_num=1, story_num=1)
+
+        state = coordinator.get_feature_state("auth")
+
+        assert [epic["epic_num"] for epic in state["epics"]] == [1]
+        assert state["epic_summaries"][0]["completed_count"] == 1
+        assert (state["total_stories"], state["completed_stories"]) == (2, 1)
+        assert state["completion_pct"] == 50.0
+        assert coordinator.get_feature_rollups()["billing"]["story_count"] == 1
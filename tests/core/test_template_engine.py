@@ -0,0 +1,48 @@
+"""Tests for the compiled template engine."""
+
+from gao_dev.core.template_engine import CompiledTemplate, compile_template, render_template
+
+
+def test_render_replaces_placeholders():
+    """Test all known placeholders are replaced in one pass."""
+    template = compile_template("Hello {{name}}, {{name}} works on {{project}}.")
+
+    assert template.render({"name": "Alice", "project": "GAO-Dev"}) == (
+        "Hello Alice, Alice works on GAO-Dev."
+    )
+    assert template.variables == frozenset({"name", "project"})
+
+
+def test_render_keeps_unknown_placeholders():
+    """Test placeholders without a value are left unchanged."""
+    assert render_template("{{known}} and {{unknown}}", {"known": 1}) == "1 and {{unknown}}"
+
+
+def test_render_does_not_trim_whitespace():
+    """Test only exact {{name}} placeholders match."""
+    assert render_template("{{ name }} {{name}}", {"name": "x"}) == "{{ name }} x"
+
+
+def test_render_inserts_values_verbatim():
+    """Test values are not re-scanned or regex-escaped."""
+    variables = {"path": "C:\\Users\\dev\\{{name}}", "name": "never"}
+
+    assert render_template("Path: {{path}}", variables) == "Path: C:\\Users\\dev\\{{name}}"
+
+
+def test_render_triple_braces():
+    """Test surrounding braces are kept as literals."""
+    assert render_template("{{{x}}}", {"x": "v"}) == "{v}"
+
+
+def test_render_without_placeholders_returns_source():
+    """Test templates without slots render to their source."""
+    source = "No variables here"
+    assert compile_template(source).render({"unused": 1}) is source
+
+
+def test_compile_template_is_cached():
+    """Test identical source text reuses the compiled template."""
+    source = "Cached {{value}}"
+    assert compile_template(source) is compile_template(source)
+    assert isinstance(compile_template(source), CompiledTemplate)
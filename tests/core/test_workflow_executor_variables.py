@@ -277,6 +277,40 @@ class TestWorkflowExecutorVariableResolution:
         assert "date" in variables
         assert "timestamp" in variables
 
+    def test_resolve_variables_expands_nested_defaults(
+        self,
+        workflow_executor: WorkflowExecutor,
+        tmp_path: Path
+    ):
+        """Test defaults referencing other templated defaults render fully."""
+        workflow_dir = tmp_path / "nested_workflow"
+        workflow_dir.mkdir(parents=True, exist_ok=True)
+
+        workflow = WorkflowInfo(
+            name="nested_test",
+            description="Nested defaults test",
+            phase=1,
+            variables={
+                "output_path": {"default": "{{feature_dir}}/x"},
+                "unknown_path": {"default": "{{missing}}/x"},
+            },
+            required_tools=[],
+            templates={},
+            installed_path=workflow_dir
+        )
+
+        variables = workflow_executor.resolve_variables(
+            workflow, {"feature_name": "auth", "epic": 2}
+        )
+
+        assert variables["feature_dir"] == "docs/features/auth"
+        assert variables["output_path"] == "docs/features/auth/x"
+        assert variables["ceremonies_folder"] == "docs/features/auth/ceremonies"
+        assert variables["unknown_path"] == "{{missing}}/x"
+        assert workflow_executor.render_template(
+            "{{output_path}} {{qa_validation_location}}", variables
+        ) == "docs/features/auth/x docs/features/auth/QA/QA_VALIDATION_EPIC_2.md"
+
 
 class TestWorkflowExecutorVariableResolutionIntegration:
     """Integration tests for variable resolution with real workflows."""
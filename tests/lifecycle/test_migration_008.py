@@ -0,0 +1,85 @@
+"""Tests for Migration 008: Epic feature key index."""
+
+import importlib.util
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+from gao_dev.lifecycle.migrations.migration_008_epic_feature_index import Migration008
+
+
+def load_migration_005():
+    """Load migration 005 module dynamically."""
+    migration_path = (
+        Path(__file__).parent.parent.parent
+        / "gao_dev"
+        / "lifecycle"
+        / "migrations"
+        / "005_add_state_tables.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_005", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["migration_005"] = module
+    spec.loader.exec_module(module)
+    return module.Migration005
+
+
+Migration005 = load_migration_005()
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Database that already applied Migration 005."""
+    conn = sqlite3.connect(str(tmp_path / "documents.db"))
+    conn.execute(
+        "CREATE TABLE schema_version "
+        "(version TEXT PRIMARY KEY, applied_at TEXT NOT NULL, description TEXT)"
+    )
+    Migration005.up(conn)
+    yield conn
+    conn.close()
+
+
+def feature_index_exists(conn):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_epic_state_feature'"
+    ).fetchone() is not None
+
+
+def test_up_adds_index_to_existing_database(conn):
+    """Test the index is created on a database migrated before 008 existed."""
+    assert not feature_index_exists(conn)
+    assert not Migration008.is_applied(conn)
+
+    Migration008.up(conn)
+    Migration008.up(conn)  # idempotent
+
+    assert feature_index_exists(conn)
+    assert Migration008.is_applied(conn)
+
+
+def test_feature_lookup_uses_index(conn):
+    """Test filtering epics by feature key searches the index."""
+    Migration008.up(conn)
+
+    plan = " ".join(
+        row[3]
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT epic_num FROM epic_state e "
+            "WHERE json_extract(e.metadata, '$.feature') = 'auth'"
+        )
+    )
+
+    assert "USING INDEX idx_epic_state_feature" in plan
+
+
+def test_down_removes_index(conn):
+    """Test rollback drops the index and the version record."""
+    Migration008.up(conn)
+
+    Migration008.down(conn)
+
+    assert not feature_index_exists(conn)
+    assert not Migration008.is_applied(conn)
@@ -19,6 +19,7 @@ from gao_dev.lifecycle.models import (
     DocumentState,
     DocumentType,
     RelationshipType,
+    ScanManifestEntry,
 )
 from gao_dev.lifecycle.exceptions import (
     DocumentNotFoundError,
@@ -600,6 +601,145 @@ class TestRelationshipManagement:
 # Error Handling Tests
 
 
+class TestApplyScanBatch:
+    """Tests for the scanner's batched write path."""
+
+    def test_registers_updates_and_records_manifest(self, registry):
+        """Registrations, updates and manifest entries land together."""
+        existing = registry.register_document(
+            path="docs/old.md", doc_type="story", author="john", owner="alice"
+        )
+        entry = ScanManifestEntry("docs/new.md", 10, 1, "abc", "permanent")
+
+        new_ids = registry.apply_scan_batch(
+            registrations=[
+                {"path": "docs/new.md", "doc_type": "prd", "author": "john",
+                 "metadata": {"k": 1}, "content_hash": "abc", "feature": "auth"},
+                {"path": "docs/old.md", "doc_type": "story", "author": "john"},
+            ],
+            updates=[{"id": existing.id, "metadata": {"v": 2}, "content_hash": "def",
+                      "reviewer": "bob"}],
+            manifest=[entry],
+        )
+
+        new_doc = registry.get_document_by_path("docs/new.md")
+        old_doc = registry.get_document(existing.id)
+        assert new_ids == {"docs/new.md": new_doc.id}
+        assert (new_doc.feature, new_doc.content_hash, new_doc.metadata) == ("auth", "abc", {"k": 1})
+        assert (old_doc.owner, old_doc.reviewer, old_doc.metadata) == ("alice", "bob", {"v": 2})
+        assert registry.get_scan_manifest("docs") == {"docs/new.md": entry}
+
+    def test_invalid_type_applies_nothing(self, registry):
+        """A bad registration rejects the whole batch before writing."""
+        with pytest.raises(ValidationError):
+            registry.apply_scan_batch(
+                registrations=[{"path": "x.md", "doc_type": "bogus", "author": "a"}],
+                updates=[],
+                manifest=[ScanManifestEntry("x.md", 1, 1, "h", "temp")],
+            )
+
+        assert registry.get_scan_manifest("") == {}
+
+    def test_removed_paths(self, registry):
+        """Removed paths are dropped from the manifest."""
+        entries = [ScanManifestEntry(f"docs/{n}.md", 1, 1, n, "permanent") for n in "ab"]
+        registry.apply_scan_batch([], [], entries)
+
+        registry.apply_scan_batch([], [], [], removed_paths=["docs/a.md"])
+
+        assert list(registry.get_scan_manifest("docs")) == ["docs/b.md"]
+
+
+class TestGraphQueries:
+    """Tests for recursive graph queries."""
+
+    @pytest.fixture(params=[False, True], ids=["sql", "cached"])
+    def graph_registry(self, request, temp_db):
+        """Registry with a PRD -> arch -> {epic, story} graph plus a cycle and an orphan."""
+        reg = DocumentRegistry(temp_db, cache_relationships=request.param)
+        docs = {
+            name: reg.register_document(
+                path=f"docs/{name}.md",
+                doc_type=doc_type,
+                author="John",
+                state=DocumentState.ACTIVE,
+            )
+            for name, doc_type in [
+                ("prd", "prd"),
+                ("arch", "architecture"),
+                ("epic", "epic"),
+                ("story", "story"),
+                ("orphan", "prd"),
+            ]
+        }
+        reg.add_relationship(docs["prd"].id, docs["arch"].id, RelationshipType.DERIVED_FROM)
+        reg.add_relationship(docs["arch"].id, docs["epic"].id, RelationshipType.DERIVED_FROM)
+        reg.add_relationship(docs["epic"].id, docs["story"].id, RelationshipType.IMPLEMENTS)
+        reg.add_relationship(docs["arch"].id, docs["story"].id, RelationshipType.REFERENCES)
+        # Cycle back to the root must not loop forever
+        reg.add_relationship(docs["story"].id, docs["prd"].id, RelationshipType.REFERENCES)
+        yield reg, {name: doc.id for name, doc in docs.items()}
+        reg.close()
+
+    def test_ancestors_nearest_first(self, graph_registry):
+        """Ancestors are ordered by distance, each listed once."""
+        reg, ids = graph_registry
+
+        ancestors = [d.id for d in reg.get_ancestors(ids["story"])]
+
+        assert ancestors == sorted([ids["epic"], ids["arch"]]) + [ids["prd"]]
+
+    def test_descendants_depth_limit(self, graph_registry):
+        """max_depth bounds the walk."""
+        reg, ids = graph_registry
+
+        assert [d.id for d in reg.get_descendants(ids["prd"], max_depth=1)] == [ids["arch"]]
+        assert [d.id for d in reg.get_descendants(ids["prd"])] == [
+            ids["arch"], ids["epic"], ids["story"]
+        ]
+
+    def test_relationship_type_filter(self, graph_registry):
+        """A type filter applies to every hop."""
+        reg, ids = graph_registry
+
+        derived = reg.get_descendants(ids["prd"], rel_type=RelationshipType.DERIVED_FROM)
+
+        assert [d.id for d in derived] == [ids["arch"], ids["epic"]]
+
+    def test_lineage_sees_new_relationships(self, graph_registry):
+        """Adding a relationship invalidates cached adjacency."""
+        reg, ids = graph_registry
+        reg.get_lineage(ids["orphan"])
+
+        reg.add_relationship(ids["story"], ids["orphan"], RelationshipType.REFERENCES)
+        ancestors, descendants = reg.get_lineage(ids["orphan"])
+
+        assert ids["story"] in {d.id for d in ancestors}
+        assert descendants == []
+
+    def test_orphans(self, graph_registry):
+        """Orphans are documents with no relationships, excluding drafts and temp docs."""
+        reg, ids = graph_registry
+        reg.register_document(path="docs/draft.md", doc_type="prd", author="John")
+        reg.register_document(
+            path="docs/scratch.md",
+            doc_type="prd",
+            author="John",
+            state=DocumentState.ACTIVE,
+            metadata={"5s_classification": "temp"},
+        )
+
+        assert [d.id for d in reg.find_orphaned_documents()] == [ids["orphan"]]
+        assert reg.count_orphaned_documents() == 1
+        assert reg.count_orphaned_documents(exclude_drafts=False, exclude_temp=False) == 3
+
+    def test_missing_document(self, graph_registry):
+        """Traversals from an unknown document raise DocumentNotFoundError."""
+        reg, _ = graph_registry
+
+        with pytest.raises(DocumentNotFoundError):
+            reg.get_ancestors(99999)
+
 class TestErrorHandling:
     """Tests for error handling."""
 
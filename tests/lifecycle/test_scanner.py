@@ -6,6 +6,7 @@ covering directory scanning, exclusion patterns, metadata extraction,
 document type detection, and batch registration.
 """
 
+import os
 import pytest
 import tempfile
 from pathlib import Path
@@ -442,4 +443,103 @@ status: draft
         # Should be same document
         assert doc1.id == doc2.id
         assert result2.new_registered == 0
-        assert result2.existing_updated == 1
+        assert result2.existing_updated == 0
+        assert result2.unchanged_skipped == 1
+
+
+class TestIncrementalScan:
+    """Tests for manifest-based incremental rescans."""
+
+    def test_rescan_skips_unchanged_files_without_reading(self, scanner, temp_docs_dir):
+        """Unchanged files keep their counts and warnings but are not read."""
+        (temp_docs_dir / "My Notes.md").write_text("# Notes")
+        (temp_docs_dir / "PRD_auth_2024-11-05_v1.0.md").write_text("---\ndoc_type: prd\n---\n")
+        first = scanner.scan_directory(temp_docs_dir)
+
+        with patch.object(scanner, "_read_file") as read_file:
+            second = scanner.scan_directory(temp_docs_dir)
+
+        read_file.assert_not_called()
+        assert second.unchanged_skipped == 2
+        assert second.total_scanned == 2
+        assert second.classification_counts == first.classification_counts
+        assert second.naming_compliance_rate == first.naming_compliance_rate
+        assert second.warnings == first.warnings
+
+    def test_touched_file_with_same_content_is_not_updated(self, scanner, temp_docs_dir):
+        """A new mtime with identical content only refreshes the manifest."""
+        doc_path = temp_docs_dir / "doc.md"
+        doc_path.write_text("# Document")
+        scanner.scan_directory(temp_docs_dir)
+        os.utime(doc_path, ns=(0, 10**18))
+
+        result = scanner.scan_directory(temp_docs_dir)
+        manifest = scanner.doc_mgr.registry.get_scan_manifest(str(temp_docs_dir.resolve()))
+
+        assert result.existing_updated == 0
+        assert result.unchanged_skipped == 1
+        assert manifest[str(doc_path.resolve())].mtime_ns == 10**18
+
+    def test_modified_file_with_same_size_is_updated(self, scanner, temp_docs_dir):
+        """Changed content is detected by hash even when the size matches."""
+        doc_path = temp_docs_dir / "doc.md"
+        doc_path.write_text("---\nowner: alice\n---\n")
+        scanner.scan_directory(temp_docs_dir)
+        doc_path.write_text("---\nowner: bobby\n---\n")
+        os.utime(doc_path, ns=(0, 10**18))
+
+        result = scanner.scan_directory(temp_docs_dir)
+        doc = scanner.doc_mgr.registry.get_document_by_path(str(doc_path.resolve()))
+
+        assert result.existing_updated == 1
+        assert doc.owner == "bobby"
+        assert doc.content_hash == scanner.doc_mgr._calculate_content_hash(doc_path)
+
+    def test_deleted_file_leaves_manifest(self, scanner, temp_docs_dir):
+        """Files no longer on disk are dropped from the manifest."""
+        (temp_docs_dir / "keep.md").write_text("# Keep")
+        (temp_docs_dir / "gone.md").write_text("# Gone")
+        scanner.scan_directory(temp_docs_dir)
+        (temp_docs_dir / "gone.md").unlink()
+
+        scanner.scan_directory(temp_docs_dir)
+        manifest = scanner.doc_mgr.registry.get_scan_manifest(str(temp_docs_dir.resolve()))
+
+        assert sorted(Path(p).name for p in manifest) == ["keep.md"]
+
+    def test_sibling_directory_manifest_is_untouched(self, scanner, temp_docs_dir):
+        """Scanning docs does not forget files scanned under docs2."""
+        (temp_docs_dir / "docs").mkdir()
+        (temp_docs_dir / "docs2").mkdir()
+        (temp_docs_dir / "docs" / "a.md").write_text("# A")
+        (temp_docs_dir / "docs2" / "b.md").write_text("# B")
+        scanner.scan_directory(temp_docs_dir)
+
+        scanner.scan_directory(temp_docs_dir / "docs")
+        manifest = scanner.doc_mgr.registry.get_scan_manifest(str(temp_docs_dir.resolve()))
+
+        assert len(manifest) == 2
+
+    def test_parallel_and_sequential_scans_agree(self, doc_manager, temp_docs_dir):
+        """Worker count does not change what gets registered."""
+        for i in range(20):
+            (temp_docs_dir / f"doc{i}.md").write_text(f"---\nfeature: f{i % 3}\n---\n# {i}")
+
+        result = DocumentScanner(doc_manager, max_workers=4).scan_directory(temp_docs_dir)
+        docs = doc_manager.registry.query_documents()
+
+        assert result.new_registered == 20
+        assert sorted(d.feature for d in docs) == sorted(f"f{i % 3}" for i in range(20))
+
+    def test_related_docs_linked_after_batch(self, scanner, temp_docs_dir):
+        """related_docs resolve even when the parent is registered in the same scan."""
+        prd_path = (temp_docs_dir / "PRD.md").resolve()
+        prd_path.write_text("---\ndoc_type: prd\n---\n")
+        story_path = temp_docs_dir / "story.md"
+        story_path.write_text(f"---\nrelated_docs:\n  - {prd_path}\n---\n")
+
+        scanner.scan_directory(temp_docs_dir)
+        registry = scanner.doc_mgr.registry
+        story = registry.get_document_by_path(str(story_path.resolve()))
+
+        assert [doc.path for doc in registry.get_ancestors(story.id)] == [str(prd_path)]
@@ -0,0 +1,112 @@
+"""Benchmark for gao-dev CLI cold start.
+
+Runs the CLI in fresh interpreters, the way CI jobs and git hooks invoke it,
+and uses ``python -X importtime`` to check that top-level invocations do not
+import the subcommand stacks (orchestrator, web server, reporting).
+
+The cold-start budget defaults to CLI_STARTUP_BUDGET_SECONDS and can be
+raised on slow machines with GAO_DEV_CLI_STARTUP_BUDGET.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import pytest
+
+CLI_STARTUP_BUDGET_SECONDS = float(os.environ.get("GAO_DEV_CLI_STARTUP_BUDGET", "1.0"))
+RUNS = 5
+
+# Modules only specific subcommands need
+HEAVY_MODULES = [
+    "gao_dev.orchestrator",
+    "gao_dev.sandbox.reporting",
+    "gao_dev.web",
+    "gao_dev.cli.web_commands",
+    "gao_dev.cli.lifecycle_commands",
+    "fastapi",
+    "matplotlib",
+    "claude_agent_sdk",
+    "anthropic",
+]
+
+CLI_VERSION = "from gao_dev.cli.commands import cli; cli(['--version'])"
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds per module for running code."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def loaded_modules(code: str) -> List[str]:
+    """Modules in sys.modules after running code in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.splitlines()
+
+
+def cold_start_seconds(code: str) -> List[float]:
+    """Wall-clock time of running code in fresh interpreters."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+@pytest.mark.performance
+def test_version_does_not_import_subcommand_stacks():
+    """`gao-dev --version` stays clear of the heavy subcommand dependencies."""
+    times = import_times(CLI_VERSION)
+
+    assert "gao_dev.cli.commands" in times
+    loaded = [module for module in HEAVY_MODULES if module in times]
+    assert loaded == [], f"Imported on --version: {loaded}"
+
+
+@pytest.mark.performance
+def test_subcommand_imports_only_its_own_stack():
+    """Resolving one subcommand does not import the others."""
+    modules = loaded_modules(
+        "from gao_dev.cli.commands import cli; "
+        "import click; cli.get_command(click.Context(cli), 'state')"
+    )
+
+    assert "gao_dev.cli.state_commands" in modules
+    assert "gao_dev.cli.web_commands" not in modules
+    assert "gao_dev.orchestrator" not in modules
+    assert "gao_dev.sandbox.reporting" not in modules
+
+
+@pytest.mark.performance
+def test_cold_start_within_budget():
+    """`gao-dev --version` cold start fits the budget."""
+    timings = cold_start_seconds(CLI_VERSION)
+    best = min(timings)
+
+    print(
+        f"\nCLI cold start (--version): best {best:.3f}s, "
+        f"median {sorted(timings)[len(timings) // 2]:.3f}s "
+        f"(budget {CLI_STARTUP_BUDGET_SECONDS:.2f}s)"
+    )
+    assert best < CLI_STARTUP_BUDGET_SECONDS
@@ -0,0 +1,115 @@
+"""Benchmark for compiled template rendering.
+
+Compares renders/sec of the compiled single-pass engine against the previous
+per-variable substitution on the real workflows/ and prompts/ trees.
+"""
+
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+import yaml
+
+from gao_dev.core.template_engine import PLACEHOLDER_PATTERN, compile_template
+
+PACKAGE_ROOT = Path(__file__).parent.parent.parent / "gao_dev"
+
+
+def legacy_regex_render(template: str, variables: Dict[str, Any]) -> str:
+    """Previous WorkflowExecutor._render_template (one regex per variable)."""
+    rendered = template
+    for key, value in variables.items():
+        pattern = r"\{\{" + re.escape(str(key)) + r"\}\}"
+        replacement = str(value).replace("\\", "\\\\")
+        rendered = re.sub(pattern, replacement, rendered)
+    return rendered
+
+
+def legacy_replace_render(template: str, variables: Dict[str, Any]) -> str:
+    """Previous PromptTemplate.render (one str.replace pass per variable)."""
+    prompt = template
+    for key, value in variables.items():
+        placeholder = f"{{{{{key}}}}}"
+        if placeholder in prompt:
+            prompt = prompt.replace(placeholder, str(value))
+    return prompt
+
+
+def load_workflow_templates() -> List[str]:
+    """All markdown files under workflows/ (instructions and templates)."""
+    return [
+        path.read_text(encoding="utf-8")
+        for path in sorted((PACKAGE_ROOT / "workflows").rglob("*.md"))
+    ]
+
+
+def load_prompt_templates() -> List[str]:
+    """All user/system prompts under prompts/."""
+    texts = []
+    for path in sorted((PACKAGE_ROOT / "prompts").rglob("*.yaml")):
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        texts.extend(
+            data[key] for key in ("user_prompt", "system_prompt") if isinstance(data.get(key), str)
+        )
+    return texts
+
+
+def build_variables(templates: List[str]) -> Dict[str, Any]:
+    """Values for every placeholder used, plus typical unused workflow variables."""
+    names = {name for text in templates for name in PLACEHOLDER_PATTERN.findall(text)}
+    variables: Dict[str, Any] = {f"unused_var_{i}": f"value {i}" for i in range(20)}
+    variables.update({name: f"<{name}>" for name in sorted(names)})
+    return variables
+
+
+def renders_per_second(
+    render: Callable[[str, Dict[str, Any]], str],
+    templates: List[str],
+    variables: Dict[str, Any],
+    min_seconds: float = 0.2,
+) -> float:
+    """Render every template repeatedly and return template renders per second."""
+    renders = 0
+    start = time.perf_counter()
+    while True:
+        for text in templates:
+            render(text, variables)
+        renders += len(templates)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return renders / elapsed
+
+
+def compiled_render(template: str, variables: Dict[str, Any]) -> str:
+    """Current engine (cached compile + single pass)."""
+    return compile_template(template).render(variables)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "tree, loader, legacy",
+    [
+        ("workflows", load_workflow_templates, legacy_regex_render),
+        ("prompts", load_prompt_templates, legacy_replace_render),
+    ],
+)
+def test_compiled_rendering_throughput(tree, loader, legacy):
+    """Compiled rendering produces the same output and is faster than the old loop."""
+    templates = loader()
+    assert templates, f"No templates found under {tree}/"
+    variables = build_variables(templates)
+
+    for text in templates:
+        assert compiled_render(text, variables) == legacy(text, variables)
+
+    legacy_rate = renders_per_second(legacy, templates, variables)
+    compiled_rate = renders_per_second(compiled_render, templates, variables)
+
+    print(
+        f"\n{tree}: {len(templates)} templates, {len(variables)} variables | "
+        f"legacy {legacy_rate:,.0f} renders/sec | compiled {compiled_rate:,.0f} renders/sec | "
+        f"{compiled_rate / legacy_rate:.1f}x"
+    )
+    assert compiled_rate > legacy_rate
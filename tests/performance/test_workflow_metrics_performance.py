@@ -0,0 +1,86 @@
+"""Benchmark for the workflow metrics dashboard query.
+
+Populates 100k workflow executions and times StateTracker's rollup-backed
+dashboard aggregates with the filters the frontend sends.
+"""
+
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from gao_dev.core.state.migrations.migration_003_add_workflow_rollups import Migration003
+from gao_dev.core.state.state_tracker import StateTracker
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / "gao_dev" / "core" / "state" / "schema.sql"
+
+EXECUTIONS = 100_000
+
+
+@pytest.fixture(scope="module")
+def tracker(tmp_path_factory):
+    """StateTracker over a year of synthetic executions."""
+    db_path = tmp_path_factory.mktemp("metrics") / "state.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_PATH.read_text())
+
+    rng = random.Random(42)
+    base = datetime(2025, 1, 1)
+    rows = []
+    for i in range(EXECUTIONS):
+        started = base + timedelta(minutes=rng.randrange(60 * 24 * 365))
+        status = rng.choice(["completed", "completed", "failed", "running", "cancelled"])
+        completed = None
+        if status != "running":
+            completed = (started + timedelta(seconds=rng.randrange(1, 7200))).isoformat()
+        rows.append((
+            rng.choice(["prd", "architecture", "dev-story", "code-review", "qa"]),
+            rng.randrange(1, 6),
+            status,
+            f"{rng.choice(['john', 'winston', 'amelia', 'murat'])}-{i}",
+            started.isoformat(),
+            completed,
+            f"Error {i % 7}\nTraceback" if status == "failed" else None,
+        ))
+    conn.executemany(
+        """
+        INSERT INTO workflow_executions (
+            workflow_name, epic_num, status, executor, started_at, completed_at, output
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+    Migration003.upgrade(db_path)  # Create and backfill the rollups
+    return StateTracker(db_path)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"epic_num": 3},
+        {"start_date": "2025-03-05T10:00:00.000Z", "end_date": "2025-09-01T00:00:00.000Z"},
+    ],
+)
+def test_dashboard_metrics_latency(tracker, filters):
+    """Dashboard aggregates over 100k executions stay interactive."""
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        metrics = tracker.get_workflow_dashboard_metrics(**filters)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    best = min(timings)
+    print(f"\n{filters}: best {best:.1f} ms over {len(timings)} runs")
+
+    assert metrics["summary"]["total_workflows"] > 0
+    assert len(metrics["longest_workflows"]) == 10
+    # Target is 50 ms; leave headroom for slow CI machines
+    assert best < 250
@@ -0,0 +1,333 @@
+"""Tests for the parallel, cached quality pipeline.
+
+Tests QualityPipeline tool planning, structured report parsing, single-pass
+test execution, result caching and QualityTracker.track_all integration.
+"""
+
+import json
+import subprocess
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gao_dev.sandbox.metrics.collector import MetricsCollector
+from gao_dev.sandbox.metrics.quality_pipeline import (
+    QualityPipeline,
+    QualityResults,
+    mypy_error_count,
+    parse_junit_xml,
+    parse_mypy_output,
+    scan_project_tree,
+)
+from gao_dev.sandbox.metrics.quality_tracker import QualityTracker
+
+
+JUNIT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="1" failures="2" skipped="1" tests="10">
+</testsuite></testsuites>
+"""
+
+
+class FakeTools:
+    """Fake subprocess.run that emulates the quality tools."""
+
+    def __init__(self, pytest_cov_installed=True, mypy_json_output=True):
+        self.calls = []
+        self.pytest_cov_installed = pytest_cov_installed
+        self.mypy_json_output = mypy_json_output
+        self._lock = threading.Lock()
+
+    def __call__(self, cmd, **kwargs):
+        with self._lock:
+            self.calls.append(cmd)
+        tool = cmd[0] if cmd[0] != "npx" else cmd[1]
+
+        if tool == "pytest":
+            has_cov = any(arg.startswith("--cov") for arg in cmd)
+            if has_cov and not self.pytest_cov_installed:
+                return Mock(returncode=4, stdout="", stderr="unrecognized arguments")
+            for arg in cmd:
+                if arg.startswith("--junitxml="):
+                    Path(arg.split("=", 1)[1]).write_text(JUNIT_XML)
+                if arg.startswith("--cov-report=json:"):
+                    Path(arg.split("json:", 1)[1]).write_text(
+                        json.dumps({"totals": {"percent_covered": 72.5}})
+                    )
+            return Mock(returncode=1, stdout="", stderr="")
+        if tool == "ruff":
+            findings = [{"code": "F401"}, {"code": "W291"}]
+            return Mock(returncode=1, stdout=json.dumps(findings), stderr="")
+        if tool == "eslint":
+            files = [{"errorCount": 1, "warningCount": 2}]
+            return Mock(returncode=1, stdout=json.dumps(files), stderr="")
+        if tool == "mypy":
+            if not self.mypy_json_output:
+                if "--output=json" in cmd:
+                    usage = "error: unrecognized arguments: --output=json"
+                    return Mock(returncode=2, stdout="", stderr=usage)
+                return Mock(returncode=1, stdout="app.py:1: error: Bad\n", stderr="")
+            lines = [
+                json.dumps({"file": "app.py", "severity": "error"}),
+                json.dumps({"file": "app.py", "severity": "note"}),
+            ]
+            return Mock(returncode=1, stdout="\n".join(lines), stderr="")
+        if tool == "tsc":
+            return Mock(returncode=2, stdout="Found 4 errors.", stderr="")
+        if tool == "bandit":
+            data = {"results": [{"issue_severity": "HIGH"}, {"issue_severity": "LOW"}]}
+            return Mock(returncode=1, stdout=json.dumps(data), stderr="")
+        raise FileNotFoundError(tool)
+
+    def tools_called(self):
+        return [cmd[0] if cmd[0] != "npx" else cmd[1] for cmd in self.calls]
+
+
+@pytest.fixture
+def python_project(tmp_path):
+    """Create a small Python project."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "app.py").write_text("x = 1\n")
+    (project / "test_app.py").write_text("def test_x():\n    assert True\n")
+    return project
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    """Create a pipeline with an isolated cache directory."""
+    return QualityPipeline(cache_dir=tmp_path / "cache")
+
+
+class TestScanProjectTree:
+    """Tests for project tree hashing."""
+
+    def test_ignores_tool_caches(self, python_project):
+        """Tool caches do not change the tree hash."""
+        before, files = scan_project_tree(python_project)
+        (python_project / ".mypy_cache").mkdir()
+        (python_project / ".mypy_cache" / "data.json").write_text("{}")
+        (python_project / ".coverage").write_text("data")
+
+        after, _ = scan_project_tree(python_project)
+
+        assert before == after
+        assert files == ["app.py", "test_app.py"]
+
+    def test_content_change_changes_hash(self, python_project):
+        """Editing a source file changes the tree hash."""
+        before, _ = scan_project_tree(python_project)
+        (python_project / "app.py").write_text("x = 2\n")
+
+        after, _ = scan_project_tree(python_project)
+
+        assert before != after
+
+
+class TestParsers:
+    """Tests for structured report parsers."""
+
+    def test_parse_junit_xml(self, tmp_path):
+        """JUnit counts treat errors as failures and exclude skips from passes."""
+        report = tmp_path / "junit.xml"
+        report.write_text(JUNIT_XML)
+
+        result = parse_junit_xml(report)
+
+        assert result == {"total": 10, "passed": 6, "failed": 3, "skipped": 1}
+
+    def test_parse_junit_xml_invalid(self, tmp_path):
+        """Unparseable reports return None."""
+        report = tmp_path / "junit.xml"
+        report.write_text("not xml")
+
+        assert parse_junit_xml(report) is None
+
+    def test_parse_mypy_json_lines(self):
+        """Only error-severity JSON records are counted."""
+        output = '{"severity": "error"}\n{"severity": "note"}\n{"severity": "error"}'
+        assert parse_mypy_output(output) == 2
+
+    def test_parse_mypy_text_fallback(self):
+        """Plain text output from older mypy versions is still counted."""
+        output = "app.py:1: error: Bad\napp.py:2: note: Hint\n"
+        assert parse_mypy_output(output) == 1
+
+    @pytest.mark.parametrize(
+        "returncode, output, expected",
+        [
+            (0, "", 0),
+            (1, '{"severity": "error"}\n{"severity": "error"}', 2),
+            (2, "mypy: error: unrecognized arguments: --output=json", 1),
+            (2, "Traceback (most recent call last):\nINTERNAL ERROR", 1),
+        ],
+    )
+    def test_mypy_failure_without_errors_is_not_a_pass(self, returncode, output, expected):
+        """A non-zero mypy exit with nothing parsed counts as an error."""
+        assert mypy_error_count(returncode, output) == expected
+
+
+class TestQualityPipeline:
+    """Tests for QualityPipeline.measure."""
+
+    def test_measure_runs_each_tool_once(self, pipeline, python_project):
+        """Tests run once with coverage; applicable tools all run."""
+        fake = FakeTools()
+        with patch("subprocess.run", side_effect=fake):
+            results = pipeline.measure(python_project)
+
+        assert sorted(fake.tools_called()) == ["bandit", "mypy", "pytest", "ruff"]
+        assert results.tests == {"total": 10, "passed": 6, "failed": 3, "skipped": 1}
+        assert results.coverage == 72.5
+        assert results.ruff == {"total": 2, "by_severity": {"error": 1, "warning": 1}}
+        assert results.mypy == {"errors": 1}
+        assert results.bandit == {"total": 2, "by_severity": {"high": 1, "low": 1}}
+        assert results.eslint is None
+        assert results.tsc is None
+        assert results.cached is False
+
+    def test_measure_writes_reports_outside_project(self, pipeline, python_project):
+        """Report files go to a temp dir, not into the project tree."""
+        fake = FakeTools()
+        with patch("subprocess.run", side_effect=fake):
+            pipeline.measure(python_project)
+
+        pytest_cmd = next(cmd for cmd in fake.calls if cmd[0] == "pytest")
+        junit_arg = next(arg for arg in pytest_cmd if arg.startswith("--junitxml="))
+        assert str(python_project) not in junit_arg
+        assert sorted(p.name for p in python_project.iterdir()) == ["app.py", "test_app.py"]
+
+    def test_measure_js_tools(self, pipeline, tmp_path):
+        """eslint and tsc run only for projects that configure them."""
+        project = tmp_path / "web"
+        project.mkdir()
+        (project / "package.json").write_text("{}")
+        (project / "tsconfig.json").write_text("{}")
+
+        fake = FakeTools()
+        with patch("subprocess.run", side_effect=fake):
+            results = pipeline.measure(project)
+
+        assert results.eslint == {"errorCount": 1, "warningCount": 2}
+        assert results.tsc == {"errors": 4}
+        assert "mypy" not in fake.tools_called()
+
+    def test_measure_with_mypy_before_json_output(self, pipeline, python_project):
+        """mypy without --output=json is re-run with plain text output."""
+        fake = FakeTools(mypy_json_output=False)
+        with patch("subprocess.run", side_effect=fake):
+            results = pipeline.measure(python_project)
+
+        assert fake.tools_called().count("mypy") == 2
+        assert results.mypy == {"errors": 1}
+
+    def test_measure_without_pytest_cov(self, pipeline, python_project):
+        """A usage error from missing pytest-cov re-runs tests without coverage."""
+        fake = FakeTools(pytest_cov_installed=False)
+        with patch("subprocess.run", side_effect=fake):
+            results = pipeline.measure(python_project)
+
+        assert fake.tools_called().count("pytest") == 2
+        assert results.tests["total"] == 10
+        assert results.coverage is None
+
+    def test_measure_missing_tools(self, pipeline, python_project):
+        """Missing tools yield empty results rather than errors."""
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            results = pipeline.measure(python_project)
+
+        assert results.tests is None
+        assert results.ruff is None
+        assert results.mypy is None
+
+    def test_measure_timeout(self, pipeline, python_project):
+        """Timed out tools yield empty results."""
+        with patch(
+            "subprocess.run", side_effect=subprocess.TimeoutExpired("pytest", 300)
+        ):
+            results = pipeline.measure(python_project)
+
+        assert results.tests is None
+
+    def test_cache_hit_skips_tools(self, pipeline, python_project):
+        """An unchanged project is served from the cache."""
+        with patch("subprocess.run", side_effect=FakeTools()):
+            first = pipeline.measure(python_project)
+
+        with patch("subprocess.run") as mock_run:
+            second = pipeline.measure(python_project)
+
+        mock_run.assert_not_called()
+        assert second.cached is True
+        assert second.tests == first.tests
+        assert second.tree_hash == first.tree_hash
+
+    def test_cache_miss_after_change(self, pipeline, python_project):
+        """Changing the project invalidates the cached results."""
+        with patch("subprocess.run", side_effect=FakeTools()):
+            pipeline.measure(python_project)
+
+        (python_project / "app.py").write_text("x = 3\n")
+        fake = FakeTools()
+        with patch("subprocess.run", side_effect=fake):
+            results = pipeline.measure(python_project)
+
+        assert results.cached is False
+        assert "pytest" in fake.tools_called()
+
+    def test_force_bypasses_cache(self, pipeline, python_project):
+        """force=True always re-measures."""
+        with patch("subprocess.run", side_effect=FakeTools()):
+            pipeline.measure(python_project)
+
+        fake = FakeTools()
+        with patch("subprocess.run", side_effect=fake):
+            results = pipeline.measure(python_project, force=True)
+
+        assert results.cached is False
+        assert fake.calls
+
+    def test_cache_disabled(self, python_project):
+        """use_cache=False never reads or writes the cache."""
+        pipeline = QualityPipeline(use_cache=False)
+        assert pipeline.cache_dir is None
+
+        fake = FakeTools()
+        with patch("subprocess.run", side_effect=fake):
+            pipeline.measure(python_project)
+            pipeline.measure(python_project)
+
+        assert fake.tools_called().count("pytest") == 2
+
+    def test_results_round_trip(self):
+        """Results survive dictionary serialization."""
+        results = QualityResults(tests={"total": 1, "passed": 1, "failed": 0}, coverage=50.0)
+        assert QualityResults.from_dict(results.to_dict()) == results
+
+
+class TestTrackAll:
+    """Tests for QualityTracker.track_all."""
+
+    def test_track_all_sets_metrics(self, tmp_path, python_project):
+        """track_all records the same metric keys as the track_* methods."""
+        (python_project / "package.json").write_text("{}")
+        collector = MetricsCollector()
+        collector.reset()
+        tracker = QualityTracker(
+            collector=collector, pipeline=QualityPipeline(cache_dir=tmp_path / "cache")
+        )
+
+        with patch("subprocess.run", side_effect=FakeTools()):
+            tracker.track_all(python_project)
+
+        assert collector.get_value("tests_written") == 10
+        assert collector.get_value("tests_passing") == 6
+        assert collector.get_value("test_pass_rate") == 60.0
+        assert collector.get_value("code_coverage") == 72.5
+        assert collector.get_value("linting_errors") == 5
+        assert collector.get_value("linting_by_severity") == {"error": 2, "warning": 3}
+        assert collector.get_value("type_errors_python") == 1
+        assert collector.get_value("type_errors_total") == 1
+        assert collector.get_value("security_vulnerabilities") == 2
+        collector.reset()
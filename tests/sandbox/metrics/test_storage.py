@@ -558,6 +558,91 @@ class TestAggregationQueries:
         assert trends == []
 
 
+    def test_get_metric_trends_moving_average(self, storage):
+        """A window function adds a trailing moving average."""
+        for i in range(4):
+            storage.save_metrics(BenchmarkMetrics(
+                run_id=f"test-run-{i:03d}",
+                timestamp=f"2025-01-{i+1:02d}T10:00:00Z",
+                project_name="test-project",
+                benchmark_name="basic-benchmark",
+                performance=PerformanceMetrics(total_time_seconds=float(10 * (i + 1))),
+            ))
+
+        trends = storage.get_metric_trends("total_time_seconds", moving_average_window=2)
+
+        assert [t["moving_average"] for t in trends] == [10.0, 15.0, 25.0, 35.0]
+        with pytest.raises(ValueError):
+            storage.get_metric_trends("phase_times", moving_average_window=2)
+
+    def test_get_metric_trends_limit_keeps_latest(self, storage):
+        """The limit picks the newest runs, returned oldest first."""
+        for i in range(5):
+            storage.save_metrics(BenchmarkMetrics(
+                run_id=f"test-run-{i:03d}",
+                timestamp=f"2025-01-{i+1:02d}T10:00:00Z",
+                project_name="test-project",
+                benchmark_name="basic-benchmark",
+            ))
+
+        trends = storage.get_metric_trends("rework_count", limit=2)
+
+        assert [t["run_id"] for t in trends] == ["test-run-003", "test-run-004"]
+
+    def test_get_average_metrics_respects_filters(self, storage):
+        """Averages only cover runs matching the filters."""
+        for i, project in enumerate(["alpha", "alpha", "beta"]):
+            storage.save_metrics(BenchmarkMetrics(
+                run_id=f"test-run-{i:03d}",
+                timestamp=f"2025-01-{i+1:02d}T10:00:00Z",
+                project_name=project,
+                benchmark_name="basic-benchmark",
+                quality=QualityMetrics(code_coverage_percentage=float(50 + 20 * i)),
+            ))
+
+        averages = storage.get_average_metrics(project_name="alpha")
+
+        assert averages["code_coverage_percentage"] == pytest.approx(60.0)
+        assert averages["stories_created"] == 0.0
+
+
+class TestGetMetricsBulk:
+    """Tests for batched metric loading."""
+
+    def test_bulk_matches_single_reads(self, storage, sample_metrics):
+        """Bulk results equal get_metrics and keep the requested order."""
+        storage.save_metrics(sample_metrics)
+        storage.save_metrics(BenchmarkMetrics(
+            run_id="test-run-002",
+            timestamp="2025-01-02T10:00:00Z",
+            project_name="test-project",
+            benchmark_name="basic-benchmark",
+        ))
+
+        bulk = storage.get_metrics_bulk(["test-run-002", "missing", "test-run-001"])
+
+        assert list(bulk) == ["test-run-002", "test-run-001"]
+        assert bulk["test-run-001"] == sample_metrics
+        assert bulk["test-run-002"] == storage.get_metrics("test-run-002")
+
+    def test_bulk_chunks_large_requests(self, storage, monkeypatch):
+        """Requests larger than one IN list are split across queries."""
+        monkeypatch.setattr("gao_dev.sandbox.metrics.storage._BULK_CHUNK_SIZE", 3)
+        run_ids = [f"test-run-{i:03d}" for i in range(7)]
+        for i, run_id in enumerate(run_ids):
+            storage.save_metrics(BenchmarkMetrics(
+                run_id=run_id,
+                timestamp=f"2025-01-{i+1:02d}T10:00:00Z",
+                project_name="test-project",
+                benchmark_name="basic-benchmark",
+            ))
+
+        assert list(storage.get_metrics_bulk(run_ids)) == run_ids
+
+    def test_bulk_empty(self, storage):
+        """No run IDs means no query and no results."""
+        assert storage.get_metrics_bulk([]) == {}
+
 class TestIntegration:
     """Integration tests combining multiple operations."""
 
@@ -1,5 +1,9 @@
 """Tests for chart generation."""
 
+import json
+import subprocess
+import sys
+
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -7,6 +11,7 @@ from pathlib import Path
 from gao_dev.sandbox.reporting.chart_generator import (
     ChartGenerator,
     ChartGeneratorError,
+    ChartSpec,
 )
 
 
@@ -140,3 +145,112 @@ class TestChartGenerator:
         except (ChartGeneratorError, ValueError):
             # Or it should raise a clear error
             pass
+
+
+class TestChartRendering:
+    """Test chart caching, output formats and batch rendering."""
+
+    def test_cache_hit(self, tmp_path):
+        """A second render with the same inputs is served from disk."""
+        generator = ChartGenerator(dpi=50, cache_dir=tmp_path)
+        first = generator.generate_test_coverage_gauge(72.0)
+
+        (cached,) = tmp_path.iterdir()
+        cached.write_text("data:image/png;base64,cached")
+
+        assert first.startswith("data:image/png;base64,")
+        assert generator.generate_test_coverage_gauge(72.0) == "data:image/png;base64,cached"
+        assert generator.generate_test_coverage_gauge(73.0) != "data:image/png;base64,cached"
+
+    def test_cache_key_covers_settings(self):
+        """Format and resolution are part of the cache key."""
+        spec = ChartSpec("gauge", {"coverage_percent": 50.0, "title": "Test Coverage"})
+
+        assert ChartGenerator(dpi=50).cache_key(spec) == ChartGenerator(dpi=50).cache_key(spec)
+        assert ChartGenerator(dpi=50).cache_key(spec) != ChartGenerator(dpi=60).cache_key(spec)
+        assert (
+            ChartGenerator(output_format="svg").cache_key(spec)
+            != ChartGenerator().cache_key(spec)
+        )
+
+    def test_svg_format(self):
+        """SVG output is an inlineable data URI."""
+        generator = ChartGenerator(output_format="svg")
+
+        result = generator.generate_phase_duration_chart(["init", "build"], [30.0, 90.0])
+
+        assert result.startswith("data:image/svg+xml;base64,")
+
+    def test_json_format(self):
+        """JSON output carries the series for client-side rendering."""
+        generator = ChartGenerator(output_format="json")
+
+        result = json.loads(generator.generate_comparison_bar_chart(
+            ["Tokens"], [100.0], [80.0], "Baseline", "Candidate"
+        ))
+
+        assert result["type"] == "bar"
+        assert result["labels"] == ["Tokens"]
+        assert result["series"] == [
+            {"name": "Baseline", "values": [100.0]},
+            {"name": "Candidate", "values": [80.0]},
+        ]
+
+    def test_unknown_format(self):
+        """Unsupported formats are rejected up front."""
+        with pytest.raises(ValueError):
+            ChartGenerator(output_format="gif")
+
+    def test_render_many_parallel_matches_sequential(self, tmp_path):
+        """Pooled rendering returns the same charts and skips failures."""
+        specs = {
+            f"gauge_{i}": ChartSpec("gauge", {"coverage_percent": 10.0 * i, "title": "Cov"})
+            for i in range(3)
+        }
+        specs["broken"] = ChartSpec("gauge", {"coverage_percent": "n/a", "title": "Cov"})
+
+        parallel = ChartGenerator(dpi=40, cache_dir=tmp_path / "a").render_many(specs, max_workers=2)
+        sequential = ChartGenerator(dpi=40, cache_dir=tmp_path / "b").render_many(specs, max_workers=1)
+
+        assert list(parallel) == ["gauge_0", "gauge_1", "gauge_2"]
+        assert parallel == sequential
+        assert len(list((tmp_path / "a").iterdir())) == 3
+
+    @pytest.mark.parametrize(
+        "charts, max_workers, cpus, expected",
+        [(1, None, 8, None), (2, None, 8, 2), (5, 16, 4, 4), (5, 1, 8, None)],
+    )
+    def test_render_many_pool_size(
+        self, tmp_path, monkeypatch, charts, max_workers, cpus, expected
+    ):
+        """The pool is capped at charts and CPUs; one chart renders in-process."""
+        pool_sizes = []
+        monkeypatch.setattr("os.cpu_count", lambda: cpus)
+        monkeypatch.setattr(
+            ChartGenerator,
+            "_render_in_pool",
+            lambda self, specs, workers: pool_sizes.append(workers) or {},
+        )
+        specs = {
+            f"gauge_{i}": ChartSpec("gauge", {"coverage_percent": 10.0 * i, "title": "Cov"})
+            for i in range(charts)
+        }
+
+        rendered = ChartGenerator(dpi=40, cache_dir=tmp_path).render_many(
+            specs, max_workers=max_workers
+        )
+
+        assert len(rendered) == charts
+        assert pool_sizes == ([] if expected is None else [expected])
+
+    def test_matplotlib_imported_lazily(self):
+        """Importing the module does not import matplotlib."""
+        code = (
+            "import sys, gao_dev.sandbox.reporting.chart_generator as cg; "
+            "cg.ChartGenerator(); print('matplotlib' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
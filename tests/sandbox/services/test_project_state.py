@@ -330,3 +330,66 @@ class TestGetProject:
 
         with pytest.raises(ProjectNotFoundError):
             state_service.get_project("nonexistent", mock_lifecycle_service)
+
+
+class TestProjectIndex:
+    """Tests for the project registry index."""
+
+    def _write_project(self, state_service, name, status=ProjectStatus.ACTIVE, age=0):
+        project_dir = state_service.projects_dir / name
+        project_dir.mkdir(parents=True)
+        metadata = ProjectMetadata(
+            name=name,
+            created_at=datetime(2026, 1, 1),
+            status=status,
+            last_modified=datetime(2026, 1, 1, 12, 0, age),
+        )
+        state_service.save_metadata(project_dir, metadata)
+        return project_dir
+
+    def test_save_metadata_updates_index(self, state_service):
+        """Saved projects are listed newest first and filterable by status."""
+        self._write_project(state_service, "old-project", age=1)
+        self._write_project(state_service, "new-project", ProjectStatus.COMPLETED, age=2)
+
+        assert [p.name for p in state_service.registry.list_projects()] == [
+            "new-project",
+            "old-project",
+        ]
+        assert [
+            p.name for p in state_service.registry.list_projects(ProjectStatus.ACTIVE)
+        ] == ["old-project"]
+
+    def test_sync_rereads_only_changed_files(self, state_service):
+        """Unchanged metadata files are not parsed again."""
+        self._write_project(state_service, "first-project")
+        project_dir = self._write_project(state_service, "second-project")
+
+        assert state_service.sync_index() == 0
+
+        # Edited outside the service
+        data = yaml.safe_load((project_dir / METADATA_FILENAME).read_text())
+        data["status"] = "failed"
+        (project_dir / METADATA_FILENAME).write_text(yaml.safe_dump(data))
+
+        assert state_service.sync_index() == 1
+        failed = state_service.list_indexed_projects(ProjectStatus.FAILED)
+        assert [p.name for p in failed] == ["second-project"]
+
+    def test_sync_drops_removed_projects(self, state_service):
+        """Projects deleted from disk disappear from the index."""
+        import shutil
+
+        project_dir = self._write_project(state_service, "gone-project")
+        shutil.rmtree(project_dir)
+
+        assert state_service.list_indexed_projects() == []
+
+    def test_reindex_rebuilds_from_files(self, state_service):
+        """reindex recreates the index from the metadata files."""
+        self._write_project(state_service, "first-project")
+        self._write_project(state_service, "second-project")
+        state_service.registry.clear()
+
+        assert state_service.reindex() == 2
+        assert len(state_service.registry.list_projects()) == 2
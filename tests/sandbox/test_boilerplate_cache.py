@@ -0,0 +1,153 @@
+"""Tests for BoilerplateCache using local file:// repositories."""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from gao_dev.sandbox.boilerplate_cache import BoilerplateCache, FETCH_STAMP
+from gao_dev.sandbox.exceptions import GitCloneError, InvalidGitUrlError
+from gao_dev.sandbox.services.boilerplate import BoilerplateService
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def origin(tmp_path):
+    """Boilerplate repository with a main branch and a v1 tag."""
+    repo = tmp_path / "origin"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    (repo / "README.md").write_text("# {{ project_name }}\n")
+    (repo / "src").mkdir()
+    (repo / "src" / "app.py").write_text("print('v1')\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial")
+    _git(repo, "tag", "v1")
+    return repo
+
+
+@pytest.fixture
+def url(origin):
+    return origin.as_uri()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BoilerplateCache(tmp_path / "cache")
+
+
+def _commit_change(origin: Path, content: str) -> str:
+    (origin / "src" / "app.py").write_text(content)
+    _git(origin, "commit", "-q", "-am", "update")
+    return _git(origin, "rev-parse", "HEAD")
+
+
+class TestMaterialize:
+    """Tests for materialize()."""
+
+    def test_first_use_creates_mirror(self, cache, url, tmp_path):
+        """The first materialization is a miss and writes files without .git."""
+        target = tmp_path / "project"
+
+        result = cache.materialize(url, target)
+
+        assert not result.cache_hit
+        assert result.fetched
+        assert result.files == 2
+        assert (target / "src" / "app.py").read_text() == "print('v1')\n"
+        assert not (target / ".git").exists()
+        assert cache.mirror_path(url).is_dir()
+
+    def test_second_use_is_hit_without_fetch(self, cache, url, tmp_path):
+        """A fresh mirror is reused without touching the remote."""
+        cache.materialize(url, tmp_path / "one")
+        result = cache.materialize(url, tmp_path / "two")
+
+        assert result.cache_hit
+        assert not result.fetched
+        assert (tmp_path / "two" / "README.md").exists()
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.refreshes) == (1, 1, 0)
+
+    def test_stale_mirror_is_fetched(self, cache, url, origin, tmp_path):
+        """A mirror older than max_age_seconds is refreshed before use."""
+        cache.materialize(url, tmp_path / "one")
+        head = _commit_change(origin, "print('v2')\n")
+        stamp = cache.mirror_path(url) / FETCH_STAMP
+        old = time.time() - cache.max_age_seconds - 10
+        os.utime(stamp, (old, old))
+
+        result = cache.materialize(url, tmp_path / "two")
+
+        assert result.fetched
+        assert result.commit == head
+        assert (tmp_path / "two" / "src" / "app.py").read_text() == "print('v2')\n"
+        assert cache.stats.refreshes == 1
+
+    def test_fresh_mirror_serves_cached_head(self, cache, url, origin, tmp_path):
+        """Within max_age_seconds the cached commit is used."""
+        first = cache.materialize(url, tmp_path / "one")
+        _commit_change(origin, "print('v2')\n")
+
+        result = cache.materialize(url, tmp_path / "two")
+
+        assert result.commit == first.commit
+
+    def test_missing_ref_triggers_fetch(self, cache, url, origin, tmp_path):
+        """A ref the mirror does not know yet is fetched on demand."""
+        cache.materialize(url, tmp_path / "one")
+        _git(origin, "tag", "v2")
+
+        result = cache.materialize(url, tmp_path / "two", ref="v2")
+
+        assert result.fetched
+        assert cache.stats.refreshes == 1
+
+    def test_ref_selects_tag(self, cache, url, origin, tmp_path):
+        """Files come from the requested ref."""
+        _commit_change(origin, "print('v2')\n")
+
+        cache.materialize(url, tmp_path / "project", ref="v1")
+
+        assert (tmp_path / "project" / "src" / "app.py").read_text() == "print('v1')\n"
+
+    def test_unknown_ref_raises(self, cache, url, tmp_path):
+        with pytest.raises(GitCloneError):
+            cache.materialize(url, tmp_path / "project", ref="does-not-exist")
+
+    def test_invalid_url_raises(self, cache, tmp_path):
+        with pytest.raises(InvalidGitUrlError):
+            cache.materialize("not a url", tmp_path / "project")
+
+    def test_evict_removes_mirror(self, cache, url, tmp_path):
+        cache.materialize(url, tmp_path / "project")
+
+        assert cache.evict(url)
+        assert not cache.mirror_path(url).exists()
+        assert not cache.evict(url)
+
+
+class TestBoilerplateServiceWithCache:
+    """BoilerplateService delegates to the cache when one is configured."""
+
+    def test_clone_boilerplate_uses_cache(self, cache, url, tmp_path):
+        service = BoilerplateService(git_cloner=cache.git_cloner, cache=cache)
+
+        for name in ("one", "two", "three"):
+            target = tmp_path / name
+            target.mkdir()
+            service.clone_boilerplate(url, target)
+            assert (target / "README.md").exists()
+
+        assert (cache.stats.misses, cache.stats.hits) == (1, 2)
@@ -111,3 +111,45 @@ class TestTemplateSubstitutor:
         
         assert success
         assert file.read_text() == "{{VAR}}"
+
+    def test_rollback_uses_single_journal(self, substitutor, temp_project):
+        """Backups go to one journal instead of per-file .bak copies."""
+        (temp_project / "src").mkdir()
+        (temp_project / "src" / "app.py").write_bytes(b"NAME = '__VAR__'\r\n")
+        (temp_project / "notes.md").write_text("no variables here")
+
+        result = substitutor.substitute_variables(
+            temp_project, {"VAR": "App"}, create_backup=True
+        )
+
+        assert result.journal_path == str(temp_project / ".template_substitution.journal")
+        assert list(temp_project.rglob("*.bak")) == []
+        assert (temp_project / "src" / "app.py").read_bytes() == b"NAME = 'App'\r\n"
+
+        assert substitutor.rollback_substitution(temp_project)
+        assert (temp_project / "src" / "app.py").read_bytes() == b"NAME = '__VAR__'\r\n"
+        assert not (temp_project / ".template_substitution.journal").exists()
+
+    def test_single_pass_skips_ignored_dirs_and_reports(self, temp_project):
+        """One walk substitutes, skips node_modules and reports leftovers."""
+        substitutor = TemplateSubstitutor(max_workers=4)
+        (temp_project / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_project / "node_modules" / "pkg" / "index.js").write_text("{{NAME}}")
+        for i in range(10):
+            (temp_project / f"file{i}.md").write_text("{{NAME}} __NAME__ {{OTHER}}")
+
+        result = substitutor.substitute_variables(temp_project, {"NAME": "App"})
+
+        assert result.files_scanned == 10
+        assert result.files_modified == 10
+        assert result.variables_substituted == 20
+        assert result.unsubstituted_variables == ["OTHER"]
+        assert (temp_project / "node_modules" / "pkg" / "index.js").read_text() == "{{NAME}}"
+
+    def test_underscore_variable_inside_braces(self, substitutor, temp_project):
+        """{{__VAR__}} still substitutes the inner variable."""
+        file = temp_project / "test.md"
+        file.write_text("{{__VAR__}}")
+
+        assert substitutor.substitute_in_file(file, {"VAR": "x"}) == 1
+        assert file.read_text() == "{{x}}"
@@ -410,3 +410,81 @@ class TestEdgeCases:
         assert lock2.lock_file.exists()
         lock_data = json.loads(lock2.lock_file.read_text())
         assert lock_data["interface"] == "cli"
+
+
+class TestLockStateCache:
+    """Test cached lock state used by hot-path checks."""
+
+    @staticmethod
+    def _write_other_lock(session_lock, interface="cli", pid=99999):
+        lock_data = {
+            "interface": interface,
+            "mode": "write",
+            "pid": pid,
+            "timestamp": "2025-01-01T00:00:00",
+        }
+        session_lock.lock_file.write_text(json.dumps(lock_data))
+
+    def test_unchanged_lock_file_not_reparsed(self, session_lock):
+        """Test repeated checks reuse cached state while lock file is unchanged."""
+        self._write_other_lock(session_lock)
+
+        with patch("psutil.pid_exists", return_value=True) as mock_pid:
+            for _ in range(5):
+                assert session_lock.is_write_locked_by_other() is True
+                assert session_lock.get_lock_state()["holder"] == "cli"
+
+        mock_pid.assert_called_once_with(99999)
+
+    def test_lock_file_change_refreshes_state(self, session_lock):
+        """Test cached state is refreshed when the lock file changes."""
+        self._write_other_lock(session_lock, interface="cli")
+
+        with patch("psutil.pid_exists", return_value=True):
+            assert session_lock.get_write_lock_holder() == "cli"
+
+            self._write_other_lock(session_lock, interface="web", pid=123456)
+            assert session_lock.get_write_lock_holder() == "web"
+
+            session_lock.lock_file.unlink()
+            assert session_lock.get_write_lock_holder() is None
+
+    def test_ttl_expiry_reprobes_holder(self, temp_project):
+        """Test holder liveness is re-checked after the TTL expires."""
+        session_lock = SessionLock(temp_project, state_ttl=0)
+        self._write_other_lock(session_lock)
+
+        with patch("psutil.pid_exists", return_value=True):
+            assert session_lock.is_write_locked_by_other() is True
+
+        with patch("psutil.pid_exists", return_value=False):
+            assert session_lock.is_write_locked_by_other() is False
+
+    def test_own_acquire_and_release_invalidate_cache(self, session_lock):
+        """Test our own lock changes are visible immediately."""
+        assert session_lock.get_lock_state()["holder"] is None
+
+        session_lock.acquire("web", mode="write")
+        assert session_lock.get_lock_state()["holder"] == "web"
+        assert session_lock.get_write_lock_holder() is None
+
+        session_lock.release()
+        assert session_lock.get_lock_state()["holder"] is None
+
+    def test_get_write_lock_holder_stale_lock(self, session_lock):
+        """Test stale lock reports no holder."""
+        self._write_other_lock(session_lock)
+
+        with patch("psutil.pid_exists", return_value=False):
+            assert session_lock.get_write_lock_holder() is None
+
+    def test_get_write_lock_holder_corrupted_lock(self, session_lock):
+        """Test corrupted lock file reports no holder."""
+        session_lock.lock_file.write_text("not json")
+
+        assert session_lock.get_write_lock_holder() is None
+        assert session_lock.get_lock_state() == {
+            "mode": "write",
+            "holder": None,
+            "timestamp": None,
+        }
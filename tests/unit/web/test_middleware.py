@@ -223,3 +223,45 @@ class TestReadOnlyMiddleware:
             response = client.post("/api/test")
             assert response.status_code == 200
             assert response.json() == {"message": "POST success"}
+
+    def test_cached_lock_state_reused_across_requests(self, client, app):
+        """Test repeated write requests reuse cached lock state."""
+        import json
+
+        lock_data = {
+            "interface": "cli",
+            "mode": "write",
+            "pid": 99999,
+            "timestamp": "2025-01-01T00:00:00",
+        }
+        app.state.session_lock.lock_file.write_text(json.dumps(lock_data))
+
+        with patch("psutil.pid_exists", return_value=True) as mock_pid:
+            for _ in range(3):
+                assert client.post("/api/test").status_code == 423
+
+        mock_pid.assert_called_once_with(99999)
+
+    def test_get_request_does_not_check_lock(self, client, app):
+        """Test safe methods bypass the lock check entirely."""
+        with patch.object(
+            app.state.session_lock, "get_write_lock_holder"
+        ) as mock_holder:
+            response = client.get("/api/test")
+
+        assert response.status_code == 200
+        mock_holder.assert_not_called()
+
+    def test_websocket_passes_through(self, app):
+        """Test WebSocket connections are not subject to the lock check."""
+
+        from fastapi import WebSocket
+
+        @app.websocket("/ws")
+        async def ws_endpoint(websocket: WebSocket):
+            await websocket.accept()
+            await websocket.send_json({"ok": True})
+            await websocket.close()
+
+        with TestClient(app).websocket_connect("/ws") as websocket:
+            assert websocket.receive_json() == {"ok": True}
@@ -0,0 +1,160 @@
+"""Tests for the async database gateway used by web handlers."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from gao_dev.web.config import WebConfig
+from gao_dev.web.db_gateway import DatabaseGateway, get_db_gateway
+from gao_dev.web.server import create_app
+
+
+@pytest.fixture
+def gateway():
+    """Create a gateway and stop its threads afterwards."""
+    gateway = DatabaseGateway(max_concurrency=2)
+    yield gateway
+    gateway.shutdown()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a small database."""
+    path = tmp_path / "test.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO items (name) VALUES (?)", [("a",), ("b",), ("c",)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestDatabaseGateway:
+    """Tests for DatabaseGateway."""
+
+    async def test_fetch_all_and_fetch_one(self, gateway, db_path):
+        """Queries return sqlite3.Row objects."""
+        rows = await gateway.fetch_all(db_path, "SELECT name FROM items ORDER BY id")
+        row = await gateway.fetch_one(db_path, "SELECT name FROM items WHERE id = ?", (2,))
+        missing = await gateway.fetch_one(db_path, "SELECT name FROM items WHERE id = 99")
+
+        assert [r["name"] for r in rows] == ["a", "b", "c"]
+        assert row["name"] == "b"
+        assert missing is None
+
+    async def test_reads_run_off_event_loop(self, gateway):
+        """Blocking reads do not stall other coroutines."""
+        loop_thread = threading.get_ident()
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        def slow_read():
+            time.sleep(0.1)
+            return threading.get_ident()
+
+        worker_thread, _ = await asyncio.gather(gateway.read(slow_read), ticker())
+
+        assert worker_thread != loop_thread
+        assert len(ticks) == 5
+
+    async def test_concurrency_limit(self, gateway):
+        """No more than max_concurrency reads run at once."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def tracked():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(gateway.read(tracked) for _ in range(6)))
+
+        assert peak == 2
+
+    async def test_writes_use_single_thread(self, gateway):
+        """All writes run on the same writer thread."""
+        threads = await asyncio.gather(
+            *(gateway.write(threading.get_ident) for _ in range(5))
+        )
+        assert len(set(threads)) == 1
+
+    async def test_stats_recorded_per_label(self, gateway):
+        """Calls and failures are timed per label."""
+
+        def fail():
+            raise sqlite3.OperationalError("no such table: x")
+
+        await gateway.read(lambda: None, label="ok")
+        await gateway.read(lambda: None, label="ok")
+        with pytest.raises(sqlite3.OperationalError):
+            await gateway.read(fail, label="broken")
+
+        stats = gateway.get_stats()
+        assert stats["ok"]["count"] == 2
+        assert stats["ok"]["errors"] == 0
+        assert stats["broken"]["errors"] == 1
+
+        gateway.reset_stats()
+        assert gateway.get_stats() == {}
+
+    async def test_default_label_is_function_name(self, gateway):
+        """Unlabelled calls are keyed by the callable's name."""
+
+        def load_things():
+            return 1
+
+        await gateway.read(load_things)
+
+        assert "load_things" in gateway.get_stats()
+
+    def test_invalid_concurrency(self):
+        """max_concurrency must be positive."""
+        with pytest.raises(ValueError):
+            DatabaseGateway(max_concurrency=0)
+
+    def test_get_db_gateway_creates_default(self):
+        """Apps without a gateway get one lazily."""
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+
+        gateway = get_db_gateway(request)
+
+        assert get_db_gateway(request) is gateway
+        gateway.shutdown()
+
+
+class TestServerIntegration:
+    """Tests for gateway wiring in create_app."""
+
+    def test_config_limits_and_stats_endpoint(self, tmp_path, monkeypatch):
+        """WebConfig settings reach the gateway and stats are exposed."""
+        monkeypatch.setenv("WEB_DB_MAX_CONCURRENCY", "3")
+        config = WebConfig(frontend_dist_path=str(tmp_path / "frontend" / "dist"))
+        app = create_app(config)
+        app.state.project_root = tmp_path
+        client = TestClient(app)
+
+        # Empty project: no database, no queries
+        assert client.get("/api/kanban/board").status_code == 200
+        response = client.get("/api/health/db")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "max_concurrency": 3,
+            "slow_query_ms": 250.0,
+            "queries": {},
+        }
+        app.state.db_gateway.shutdown()
@@ -0,0 +1,190 @@
+"""Tests for precompressed, cache-friendly static asset serving."""
+
+import asyncio
+import gzip
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from gao_dev.web import static_assets
+from gao_dev.web.config import WebConfig
+from gao_dev.web.server import create_app
+from gao_dev.web.static_assets import (
+    IMMUTABLE_CACHE_CONTROL,
+    parse_accept_encoding,
+    precompress_directory,
+)
+
+SCRIPT = "export const value = 1;\n" * 200
+
+
+@pytest.fixture
+def frontend_dist(tmp_path):
+    """Create a minimal Vite-style build."""
+    dist = tmp_path / "frontend" / "dist"
+    assets = dist / "assets"
+    assets.mkdir(parents=True)
+    (dist / "index.html").write_text("<html>" + "<div></div>" * 200 + "</html>")
+    (assets / "index-AbC123_x.js").write_text(SCRIPT)
+    (assets / "index-AbC123_x.js.map").write_text('{"version": 3}' * 100)
+    (assets / "tiny-Zz99Yy88.css").write_text("a{}")
+    return dist
+
+
+def make_client(frontend_dist, **config_kwargs):
+    """Create a test client serving the build."""
+    config = WebConfig(frontend_dist_path=str(frontend_dist), **config_kwargs)
+    app = create_app(config)
+    return TestClient(app)
+
+
+class TestParseAcceptEncoding:
+    """Tests for Accept-Encoding parsing."""
+
+    def test_orders_by_server_preference(self):
+        """Server preference wins over client header order."""
+        assert parse_accept_encoding("gzip, deflate, br") == ["br", "gzip"]
+
+    def test_respects_zero_quality(self):
+        """q=0 disables an encoding."""
+        assert parse_accept_encoding("gzip;q=0, br") == ["br"]
+
+    def test_wildcard(self):
+        """A wildcard accepts every supported encoding."""
+        assert parse_accept_encoding("*") == ["br", "gzip"]
+
+    def test_missing_header(self):
+        """No header means identity only."""
+        assert parse_accept_encoding(None) == []
+
+
+class TestAssetServing:
+    """Tests for the /assets mount."""
+
+    def test_gzip_negotiation(self, frontend_dist, monkeypatch):
+        """gzip-accepting clients get a compressed body with its own ETag."""
+        monkeypatch.setattr(static_assets, "brotli", None)
+        client = make_client(frontend_dist)
+
+        plain = client.get("/assets/index-AbC123_x.js", headers={"Accept-Encoding": "identity"})
+        compressed = client.get("/assets/index-AbC123_x.js", headers={"Accept-Encoding": "gzip"})
+
+        assert plain.headers.get("content-encoding") is None
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["vary"]
+        assert compressed.text == SCRIPT
+        assert compressed.headers["etag"] != plain.headers["etag"]
+        assert "javascript" in compressed.headers["content-type"]
+
+    def test_compression_runs_off_the_event_loop(self, frontend_dist, monkeypatch):
+        """On-demand compression runs in a worker thread, then is served from memory."""
+        calls = []
+        original = static_assets.compress_bytes
+
+        def compress_bytes(data, encoding):
+            try:
+                asyncio.get_running_loop()
+                calls.append("event loop")
+            except RuntimeError:
+                calls.append("worker thread")
+            return original(data, encoding)
+
+        monkeypatch.setattr(static_assets, "brotli", None)
+        monkeypatch.setattr(static_assets, "compress_bytes", compress_bytes)
+        client = make_client(frontend_dist)
+
+        for _ in range(2):
+            response = client.get(
+                "/assets/index-AbC123_x.js", headers={"Accept-Encoding": "gzip"}
+            )
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.text == SCRIPT
+
+        assert calls == ["worker thread"]
+
+    def test_incompressible_file_falls_back_to_identity(self, frontend_dist, monkeypatch):
+        """A variant that is not smaller is not served."""
+        monkeypatch.setattr(static_assets, "brotli", None)
+        monkeypatch.setattr(static_assets, "compress_bytes", lambda data, encoding: data)
+        client = make_client(frontend_dist)
+
+        response = client.get("/assets/index-AbC123_x.js", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers.get("content-encoding") is None
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert response.text == SCRIPT
+
+    def test_hashed_assets_are_immutable(self, frontend_dist):
+        """Hash-named files are cached for a year."""
+        client = make_client(frontend_dist)
+
+        response = client.get("/assets/tiny-Zz99Yy88.css")
+
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        # Too small to be worth compressing
+        assert response.headers.get("content-encoding") is None
+
+    def test_etag_revalidation(self, frontend_dist):
+        """A matching If-None-Match returns 304 for the negotiated variant."""
+        client = make_client(frontend_dist)
+        first = client.get("/assets/index-AbC123_x.js", headers={"Accept-Encoding": "gzip"})
+
+        second = client.get(
+            "/assets/index-AbC123_x.js",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]},
+        )
+
+        assert second.status_code == 304
+
+    def test_build_time_variant_is_used(self, frontend_dist, monkeypatch):
+        """A .gz sibling written at build time is served as-is."""
+        monkeypatch.setattr(static_assets, "brotli", None)
+        asset = frontend_dist / "assets" / "index-AbC123_x.js"
+        sibling = asset.with_name(asset.name + ".gz")
+        sibling.write_bytes(gzip.compress(b"prebuilt"))
+        os.utime(sibling, (asset.stat().st_mtime + 10,) * 2)
+        client = make_client(frontend_dist)
+
+        response = client.get("/assets/index-AbC123_x.js", headers={"Accept-Encoding": "gzip"})
+
+        assert response.text == "prebuilt"
+
+    def test_source_maps_can_be_disabled(self, frontend_dist):
+        """serve_source_maps=False hides .map files."""
+        enabled = make_client(frontend_dist)
+        disabled = make_client(frontend_dist, serve_source_maps=False)
+
+        assert enabled.get("/assets/index-AbC123_x.js.map").status_code == 200
+        assert disabled.get("/assets/index-AbC123_x.js.map").status_code == 404
+
+
+class TestIndexServing:
+    """Tests for index.html."""
+
+    def test_index_revalidates_with_etag(self, frontend_dist):
+        """index.html is never cached blindly and supports 304."""
+        client = make_client(frontend_dist)
+
+        first = client.get("/")
+        second = client.get("/", headers={"If-None-Match": first.headers["etag"]})
+
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "no-cache"
+        assert first.headers["content-encoding"] == "gzip"
+        assert second.status_code == 304
+
+
+class TestPrecompressDirectory:
+    """Tests for build-time precompression."""
+
+    def test_writes_variants_once(self, frontend_dist, monkeypatch):
+        """Compressible files get siblings; up-to-date siblings are skipped."""
+        monkeypatch.setattr(static_assets, "brotli", None)
+
+        written = precompress_directory(frontend_dist)
+
+        assert written == 3  # index.html, .js, .js.map (the .css is too small)
+        assert (frontend_dist / "assets" / "index-AbC123_x.js.gz").exists()
+        assert not (frontend_dist / "assets" / "tiny-Zz99Yy88.css.gz").exists()
+        assert precompress_directory(frontend_dist) == 0
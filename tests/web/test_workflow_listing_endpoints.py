@@ -0,0 +1,100 @@
+"""Tests for paginated workflow listings and NDJSON export."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from gao_dev.web.config import WebConfig
+from gao_dev.web.server import create_app
+
+SCHEMA_PATH = Path(__file__).parents[2] / "gao_dev" / "core" / "state" / "schema.sql"
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Test client over a project with 12 workflow executions."""
+    gao_dev_dir = tmp_path / ".gao-dev"
+    gao_dev_dir.mkdir()
+    conn = sqlite3.connect(str(gao_dev_dir / "documents.db"))
+    conn.executescript(SCHEMA_PATH.read_text())
+    conn.executemany(
+        """
+        INSERT INTO workflow_executions (
+            workflow_name, status, executor, started_at, completed_at, output
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                "prd" if i % 4 == 0 else "dev-story",
+                "completed",
+                f"john-{i}",
+                f"2025-02-{1 + i:02d}T09:00:00",
+                f"2025-02-{1 + i:02d}T09:30:00",
+                json.dumps({"step": i}),
+            )
+            for i in range(12)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    app = create_app(WebConfig(frontend_dist_path=str(tmp_path / "dist")))
+    app.state.project_root = tmp_path
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_timeline_cursor_pages(client):
+    """The timeline follows next_cursor until has_more is false."""
+    first = client.get("/api/workflows/timeline", params={"limit": 5}).json()
+    ids = [wf["workflow_id"] for wf in first["workflows"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get("/api/workflows/timeline", params={"limit": 5, "cursor": cursor}).json()
+        ids.extend(wf["workflow_id"] for wf in page["workflows"])
+        cursor = page["next_cursor"]
+
+    assert first["total"] == 12
+    assert first["has_more"] is True
+    assert ids == [f"john-{i}" for i in range(11, -1, -1)]
+
+
+def test_timeline_rejects_bad_cursor(client):
+    """A malformed cursor is a client error."""
+    response = client.get("/api/workflows/timeline", params={"cursor": "bogus"})
+
+    assert response.status_code == 400
+
+
+def test_history_pages_in_sql(client):
+    """History page/limit and search are applied by the query."""
+    data = client.get("/api/workflows/history", params={"page": 2, "limit": 5}).json()
+    searched = client.get("/api/workflows/history", params={"search": "PRD"}).json()
+
+    assert [wf["workflow_id"] for wf in data["workflows"]] == [f"john-{i}" for i in range(6, 1, -1)]
+    assert (data["total"], data["pages"], data["page"]) == (12, 3, 2)
+    assert searched["total"] == 3
+
+
+def test_export_streams_ndjson(client):
+    """The bulk export writes one JSON record per line."""
+    response = client.get("/api/workflows/export", params={"workflow_type": "dev-story"})
+    records = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert len(records) == 9
+    assert records[0]["workflow_id"] == "john-11"
+    assert json.loads(records[0]["result"]) == {"step": 11}
+
+
+def test_single_export(client):
+    """A single execution exports as JSON, or NDJSON on request."""
+    data = client.get("/api/workflows/john-3/export").json()
+    line = client.get("/api/workflows/john-3/export", params={"format": "ndjson"}).text
+
+    assert data["workflow_name"] == "dev-story"
+    assert json.loads(line)["workflow_id"] == "john-3"
+    assert client.get("/api/workflows/nobody/export").status_code == 404